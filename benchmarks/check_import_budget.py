@@ -0,0 +1,120 @@
+"""
+Import-time budget for the headless simulation path.
+
+Each module is imported in a fresh interpreter (like a new process or pool
+worker would) and timed. The check fails if an import is over budget or if
+it pulls in matplotlib (which should only load when a plot is requested) or
+numba (which should only load when the compiled kernel first runs).
+
+Examples:
+    python3 benchmarks/check_import_budget.py
+    python3 benchmarks/check_import_budget.py --budget-ms 200 --repeat 10
+"""
+import sys
+import os
+# Add project root to system path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import json
+import subprocess
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules a headless simulation (or a pool worker) may import
+HEADLESS_MODULES = [
+    "components.roulette_wheel",
+    "components.simulation",
+    "components.batch_engine",
+    "components.wheel_bias",
+    "components.spin_log",
+    "components.spin_stream",
+    "components.player_pool",
+    "components.shared_table",
+    "components.instrumentation",
+    "components.observers",
+    "components.checkpoint",
+    "components.jit_engine",
+    "components.process_pool",
+    "components.shared_results",
+    "utils.parameter_sweep",
+    "utils.distributed_sweep",
+    "utils.simulation_service",
+    "utils.experiment_registry",
+    "utils.experiment_catalog",
+    "utils.losing_streaks",
+    "utils.rare_events",
+    "utils.gamblers_ruin",
+    "utils.bias_detection",
+    "utils.spin_log_import",
+    "utils.house_exposure",
+    "utils.strategy_optimizer",
+    "utils.monte_carlo_helpers",
+    "utils.plot_helpers",
+    "utils.strategy_helpers",
+    "utils.sweep_helpers",
+]
+
+# Modules that must not be loaded by any of the above
+FORBIDDEN_MODULES = ["matplotlib", "numba"]
+
+# Default budget per module, in milliseconds (numpy alone is most of it)
+DEFAULT_BUDGET_MS = 200
+
+PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {forbidden!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module, repeat=5):
+    """Best import time (seconds) over `repeat` fresh interpreters, plus forbidden modules loaded"""
+    best, loaded = float('inf'), []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(module=module, forbidden=FORBIDDEN_MODULES)],
+                                cwd=PROJECT_ROOT, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        best = min(best, result['seconds'])
+        loaded = result['loaded']
+    return best, loaded
+
+
+def check_import_budget(modules=HEADLESS_MODULES, budget_ms=DEFAULT_BUDGET_MS, repeat=5):
+    """Print one line per module; return the list of failures"""
+    failures = []
+    print(f"{'MODULE':<32} | {'IMPORT (ms)':>11} | {'BUDGET':>7} | STATUS")
+    print("-" * 72)
+    for module in modules:
+        seconds, loaded = measure_import(module, repeat)
+        problems = []
+        if seconds * 1000 > budget_ms:
+            problems.append("over budget")
+        if loaded:
+            problems.append(f"loads {', '.join(loaded)}")
+        status = "✅" if not problems else "❌ " + "; ".join(problems)
+        print(f"{module:<32} | {seconds * 1000:>11.1f} | {budget_ms:>7} | {status}")
+        if problems:
+            failures.append((module, seconds, loaded))
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check import time of the headless simulation modules.")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module (best is kept)")
+    parser.add_argument("modules", nargs="*", help="modules to check (default: HEADLESS_MODULES)")
+    args = parser.parse_args(argv)
+
+    failures = check_import_budget(args.modules or HEADLESS_MODULES, args.budget_ms, args.repeat)
+    if failures:
+        print(f"\n❌ {len(failures)} module(s) failed the import budget")
+        return 1
+    print("\n✅ All headless imports are within budget, without matplotlib or numba")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
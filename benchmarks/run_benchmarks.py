@@ -0,0 +1,369 @@
+"""
+Micro and macro benchmarks for the simulation core.
+
+Examples:
+    python3 benchmarks/run_benchmarks.py                      # run and compare with baseline.json
+    python3 benchmarks/run_benchmarks.py --save-baseline      # store the current numbers as baseline
+    python3 benchmarks/run_benchmarks.py --filter "micro.*" --threshold 0.10
+    python3 benchmarks/run_benchmarks.py --output results.json
+
+Exits with status 1 if any benchmark is slower than the baseline by more
+than the threshold (0.25 = 25% slower), so it can gate changes in CI.
+Timings depend on the machine, so baseline.json is not committed: create
+it with --save-baseline on the reference commit, on the machine that runs
+the comparison.
+"""
+import sys
+import os
+# Add project root to system path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import contextlib
+import fnmatch
+import io
+import json
+import platform
+import time
+import timeit
+
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel
+from components.player import Player
+from components.game import Game
+from components.simulation import ENGINES, make_spec, run_spec
+from components.spin_stream import SpinStatistics, consume
+from components.observers import Observers, SessionTally
+from components.wheel_bias import sector_bias_weights
+
+BENCHMARK_FOLDER = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_FOLDER, "baseline.json")
+
+# History sizes for Game.run_simulation (spins per game)
+HISTORY_SIZES = [100, 1000, 10000]
+
+# Reduced parameters used to run every registered experiment quickly
+REDUCED_EXPERIMENT = {'num_players': 20, 'num_spins': 200, 'num_runs': 3, 'seed': 1}
+
+# Registered benchmarks: name -> (setup function returning the timed callable, ops per call)
+BENCHMARKS = {}
+
+
+def benchmark(name, ops=1):
+    """Register a benchmark. The decorated function returns the callable to time."""
+    def decorator(setup):
+        BENCHMARKS[name] = (setup, ops)
+        return setup
+    return decorator
+
+
+def make_game(strategy="flat", bet_type="color", table_limit=float('inf')):
+    player = Player(strategy=strategy, initial_bankroll=1000, base_bet=10)
+    player.bet_type = bet_type
+    player.bet_value = "red" if bet_type == "color" else 17
+    return Game(RouletteWheel("european", seed=1), player, table_limit=table_limit)
+
+
+# ---------------------------------------------------------------------------
+# Micro benchmarks: the hot path of one spin
+# ---------------------------------------------------------------------------
+
+@benchmark("micro.wheel_spin", ops=1000)
+def bench_wheel_spin():
+    wheel = RouletteWheel("american", seed=1)
+    spin = wheel.spin
+
+    def run():
+        for _ in range(1000):
+            spin()
+    return run
+
+
+@benchmark("micro.wheel_spin_indices", ops=100000)
+def bench_wheel_spin_indices():
+    wheel = RouletteWheel("american", seed=1)
+    return lambda: wheel.spin_indices(100000)
+
+
+@benchmark("micro.weighted_wheel_spin", ops=1000)
+def bench_weighted_wheel_spin():
+    wheel = RouletteWheel("american", seed=1, weights=sector_bias_weights("american", 17, 4, 1.0))
+    spin = wheel.spin
+
+    def run():
+        for _ in range(1000):
+            spin()
+    return run
+
+
+@benchmark("micro.weighted_wheel_spin_indices", ops=100000)
+def bench_weighted_wheel_spin_indices():
+    wheel = RouletteWheel("american", seed=1, weights=sector_bias_weights("american", 17, 4, 1.0))
+    return lambda: wheel.spin_indices(100000)
+
+
+@benchmark("micro.determine_win_color", ops=1000)
+def bench_determine_win_color():
+    game = make_game()
+    # One wheel, so the inputs cover every pocket (red, black, 0 and 00)
+    wheel = RouletteWheel("american", seed=2)
+    results = [wheel.spin() for _ in range(1000)]
+
+    def run():
+        for result in results:
+            game.determine_win(result, "color", "red")
+    return run
+
+
+@benchmark("micro.determine_win_number", ops=1000)
+def bench_determine_win_number():
+    game = make_game()
+    # One wheel, so the inputs cover every pocket (red, black, 0 and 00)
+    wheel = RouletteWheel("american", seed=2)
+    results = [wheel.spin() for _ in range(1000)]
+
+    def run():
+        for result in results:
+            game.determine_win(result, "number", 17)
+    return run
+
+
+@benchmark("micro.run_spin_flat", ops=1000)
+def bench_run_spin_flat():
+    game = make_game()
+
+    def run():
+        # Keep the history from growing across calls
+        game.history.clear()
+        for _ in range(1000):
+            game.run_spin()
+    return run
+
+
+@benchmark("micro.run_spin_martingale_limit", ops=1000)
+def bench_run_spin_martingale():
+    game = make_game(strategy="martingale", table_limit=1000)
+
+    def run():
+        game.history.clear()
+        for _ in range(1000):
+            game.run_spin()
+    return run
+
+
+def register_run_simulation(num_spins):
+    @benchmark(f"micro.run_simulation_{num_spins}", ops=num_spins)
+    def bench():
+        return lambda: make_game(strategy="martingale", table_limit=1000).run_simulation(num_spins)
+
+
+for _num_spins in HISTORY_SIZES:
+    register_run_simulation(_num_spins)
+
+
+@benchmark("micro.iter_spins_statistics_10000", ops=10000)
+def bench_iter_spins():
+    def run():
+        game = make_game(strategy="martingale", table_limit=1000)
+        consume(game.iter_spins(10000), SpinStatistics())
+    return run
+
+
+# ---------------------------------------------------------------------------
+# Engine benchmarks: the same spec with every engine (ops = player-spins)
+# ---------------------------------------------------------------------------
+
+def register_engine(engine, strategy):
+    spec = make_spec(strategy=strategy, table_limit=1000, num_players=100, num_spins=1000, seed=1)
+
+    @benchmark(f"engine.{engine}.{strategy}", ops=spec['num_players'] * spec['num_spins'])
+    def bench():
+        return lambda: run_spec(spec, ("final",), engine=engine)
+
+
+for _engine in ENGINES:
+    for _strategy in ("flat", "martingale"):
+        register_engine(_engine, _strategy)
+
+
+@benchmark("engine.numpy.martingale.observed", ops=100 * 1000)
+def bench_observed_engine():
+    spec = make_spec(strategy="martingale", table_limit=1000, num_players=100, num_spins=1000, seed=1)
+
+    def run():
+        observers = Observers()
+        SessionTally().register(observers)
+        run_spec(spec, ("final",), engine="numpy", observers=observers)
+    return run
+
+
+@benchmark("engine.shared_table", ops=10000 * 1000)
+def bench_shared_table():
+    from components.shared_table import simulate_table
+    specs = [make_spec(strategy="martingale", table_limit=1000, num_players=5000),
+             make_spec(bet_type="number", bet_value=17, num_players=5000)]
+    return lambda: simulate_table(specs, 1000, seed=1)
+
+
+@benchmark("engine.player_pool", ops=10000 * 1000)
+def bench_player_pool():
+    from components.player_pool import PlayerPool, simulate_pool
+    pool = PlayerPool.sample({"mixed": {'strategy': {'choice': ["flat", "martingale"]}, 'table_limit': 1000,
+                                        'bet': {'choice': [("color", "red"), ("number", 17)]},
+                                        'initial_bankroll': 10 ** 9}}, 10000, seed=1)
+    return lambda: simulate_pool(pool, 1000, seed=1)
+
+
+# ---------------------------------------------------------------------------
+# Macro benchmarks: every registered experiment at reduced size (no plots)
+# ---------------------------------------------------------------------------
+
+def register_experiment_benchmarks():
+    from utils.experiment_registry import EXPERIMENTS, plan_experiments, run_plan, report_plan
+    import utils.experiment_catalog  # noqa: F401  (registers all experiments)
+
+    def register(name):
+        @benchmark(f"experiment.{name}")
+        def bench():
+            def run():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    defaults = EXPERIMENTS[name]['defaults']
+                    reduced = {key: value for key, value in REDUCED_EXPERIMENT.items() if key in defaults}
+                    plan = plan_experiments([name], {'*': reduced})
+                    report_plan(plan, run_plan(plan), {'save_plots': False})
+            return run
+
+    for name in EXPERIMENTS:
+        register(name)
+
+
+register_experiment_benchmarks()
+
+
+# ---------------------------------------------------------------------------
+# Startup benchmarks: fresh interpreter importing the headless core
+# ---------------------------------------------------------------------------
+
+@benchmark("import.headless_core")
+def bench_import_headless_core():
+    import subprocess
+    command = [sys.executable, "-c", "import components.simulation, components.batch_engine"]
+    return lambda: subprocess.run(command, cwd=os.path.dirname(BENCHMARK_FOLDER), check=True)
+
+
+# ---------------------------------------------------------------------------
+# Runner and baseline comparison
+# ---------------------------------------------------------------------------
+
+def time_benchmark(setup, ops, repeat, min_time):
+    """Best and median seconds per op over `repeat` rounds of at least `min_time` seconds"""
+    timer = timeit.Timer(setup())
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    rounds = [timer.timeit(number) / (number * ops) for _ in range(repeat)]
+    return {
+        'best': min(rounds),
+        'median': float(np.median(rounds)),
+        'ops_per_second': 1.0 / min(rounds),
+        'rounds': repeat,
+        'calls_per_round': number,
+    }
+
+
+def run_benchmarks(patterns=("*",), repeat=5, min_time=0.2, verbose=True):
+    """Run every benchmark whose name matches one of the patterns"""
+    results = {}
+    for name, (setup, ops) in BENCHMARKS.items():
+        if not any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+            continue
+        results[name] = time_benchmark(setup, ops, repeat, min_time)
+        if verbose:
+            print(f"{name:<45} {results[name]['best'] * 1e6:>12.3f} µs/op "
+                  f"({results[name]['ops_per_second']:,.0f} ops/s)")
+    return {
+        'meta': {
+            'timestamp': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.platform(),
+        },
+        'benchmarks': results,
+    }
+
+
+def compare_with_baseline(current, baseline, threshold):
+    """
+    Compare best times per op. Returns the list of regressions
+    (name, baseline, current, ratio) slower than 1 + threshold.
+    """
+    regressions = []
+    print(f"\n{'BENCHMARK':<45} | {'BASELINE':>12} | {'CURRENT':>12} | {'CHANGE':>8}")
+    print("-" * 88)
+    for name, result in current['benchmarks'].items():
+        if name not in baseline['benchmarks']:
+            print(f"{name:<45} | {'(new)':>12} | {result['best'] * 1e6:>10.3f}µs |")
+            continue
+        old = baseline['benchmarks'][name]['best']
+        ratio = result['best'] / old
+        flag = "  ⚠️" if ratio > 1 + threshold else ""
+        print(f"{name:<45} | {old * 1e6:>10.3f}µs | {result['best'] * 1e6:>10.3f}µs | {(ratio - 1) * 100:>+7.1f}%{flag}")
+        if ratio > 1 + threshold:
+            regressions.append((name, old, result['best'], ratio))
+    return regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark the roulette simulation core.")
+    parser.add_argument("--filter", action="append", help="glob pattern of benchmarks to run (repeatable)")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    parser.add_argument("--repeat", type=int, default=5, help="timed rounds per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per round")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before a benchmark counts as a regression (0.25 = 25%%)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    if args.list:
+        for name, (_, ops) in BENCHMARKS.items():
+            print(f"{name:<45} ops/call={ops}")
+        return 0
+
+    print("⏱️  ROULETTE BENCHMARKS")
+    print("=" * 60)
+    current = run_benchmarks(args.filter or ["*"], repeat=args.repeat, min_time=args.min_time)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2)
+        print(f"\n📄 Results saved to: {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(current, f, indent=2)
+        print(f"📄 Baseline saved to: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}. Run with --save-baseline to create one.")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare_with_baseline(current, baseline, args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    print(f"\n✅ No regressions above {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel
+from components.game import Game
+from components.observers import OBSERVER_BATCH
+
+# Vectorized NumPy engine: simulates every player of a spec at once.
+# Players use the same per-player seeds and pocket stream as the scalar Game
+# engine, so for a seeded spec both engines give exactly the same bankrolls.
+
+# Payout multiplier per bet type (color pays 1:1, straight-up number 35:1)
+PAYOUTS = {"color": 1, "number": 35}
+
+
+def win_table(wheel_type, bet_type, bet_value):
+    """Boolean array: does the bet win when the ball lands in pocket i?"""
+    wheel = RouletteWheel(wheel_type, seed=0)
+    game = Game(wheel, None)
+    return np.array([game.determine_win(number, bet_type, bet_value) for number in wheel.numbers])
+
+
+def win_probability(wheel_type, bet_type, bet_value, weights=None):
+    """Probability that the bet wins (weights: pocket weights, None for a fair wheel)"""
+    probabilities = RouletteWheel(wheel_type, seed=0, weights=weights).pocket_probabilities()
+    return float(probabilities @ win_table(wheel_type, bet_type, bet_value))
+
+
+def house_edge(wheel_type, bet_type, bet_value, weights=None):
+    """Exact house edge of the bet as a fraction of the stake (negative = player edge)"""
+    p_win = win_probability(wheel_type, bet_type, bet_value, weights)
+    return (1 - p_win) - PAYOUTS.get(bet_type, 35) * p_win
+
+
+def pocket_matrix(wheel_type, seeds, num_spins, weights=None):
+    """(players, spins) matrix of pocket indices, one seeded wheel per player"""
+    pockets = np.empty((len(seeds), num_spins), dtype=np.uint8)
+    for i, seed in enumerate(seeds):
+        pockets[i] = RouletteWheel(wheel_type, seed=seed, weights=weights).spin_indices(num_spins)
+    return pockets
+
+
+def money_dtype(spec):
+    """Use exact integers unless a money parameter has a fractional part"""
+    values = [spec['base_bet'], spec['initial_bankroll']]
+    if spec['table_limit'] != float('inf'):
+        values.append(spec['table_limit'])
+    if not all(float(v).is_integer() for v in values):
+        return np.float64
+    # Amounts too large for int64 fall back to exact (slower) Python ints
+    return np.int64 if all(abs(int(v)) < 2 ** 62 for v in values) else object
+
+
+def simulate_batch(spec, pockets, records=("final",), observers=None):
+    """
+    Simulate all players of a spec on a pre-drawn pocket matrix.
+    Returns a dict of NumPy arrays, one per requested record:
+        final  -> (players,)          paths -> (players, spins + 1)
+        bets   -> (players, spins)    lowest -> (players,)
+    Pass components.observers.Observers to receive the spin events as batches.
+    """
+    dtype = money_dtype(spec)
+    num_players, num_spins = pockets.shape
+    wins = win_table(spec['wheel_type'], spec['bet_type'], spec['bet_value'])[pockets]
+    multiplier = PAYOUTS.get(spec['bet_type'], 35)
+    limit = spec['table_limit']
+
+    if spec['strategy'] == "martingale":
+        bets = martingale_bets(wins, spec['base_bet'], limit, dtype)
+        if bets is None:
+            dtype = object
+            bets = martingale_bets(wins, spec['base_bet'], limit, dtype)
+    else:
+        # Flat betting (Player also treats unknown strategies as flat)
+        bet = spec['base_bet'] if limit == float('inf') else min(spec['base_bet'], limit)
+        bets = np.full((num_players, num_spins), bet, dtype=dtype)
+
+    # Switch to exact Python ints if the running bankroll could overflow int64
+    if dtype == np.int64 and (int(bets.max()) * (multiplier + 1) * num_spins
+                              + abs(int(spec['initial_bankroll'])) >= 2 ** 63):
+        dtype = object
+        bets = bets.astype(object)
+
+    payouts = np.where(wins, bets * multiplier, -bets)
+    paths = np.empty((num_players, num_spins + 1), dtype=dtype)
+    paths[:, 0] = spec['initial_bankroll']
+    paths[:, 1:] = payouts
+    # Add payouts one by one onto the bankroll, in Game's order, so that
+    # fractional (float) money rounds exactly as in the scalar engine
+    np.add.accumulate(paths, axis=1, out=paths)
+    if observers:
+        emit_batch_events(observers, spec, wins, bets, payouts, paths)
+
+    results = {}
+    if "final" in records:
+        results["final"] = paths[:, -1].copy()
+    if "paths" in records:
+        results["paths"] = paths
+    if "bets" in records:
+        results["bets"] = bets
+    if "lowest" in records:
+        results["lowest"] = paths.min(axis=1)
+    return results
+
+
+def emit_batch_events(observers, spec, wins, bets, payouts, paths, batch_rows=OBSERVER_BATCH):
+    """
+    Send the spins of a simulated batch to observers in blocks of whole spins
+    (rows ordered by spin, then player), then one session_end batch.
+    """
+    num_players, num_spins = wins.shape
+    players = np.arange(num_players)
+    block = max(1, batch_rows // max(1, num_players))
+
+    # Step 1: Spins where the intended bet was above the table limit
+    limit_hits = limit_hit_matrix(spec, wins)
+
+    # Step 2: Spin blocks
+    for start in range(0, num_spins, block):
+        stop = min(num_spins, start + block)
+        observers.emit_spins({
+            'player': np.tile(players, stop - start),
+            'spin_number': np.repeat(np.arange(start + 1, stop + 1), num_players),
+            'bet_amount': bets[:, start:stop].T.ravel(),
+            'payout': payouts[:, start:stop].T.ravel(),
+            'bankroll': paths[:, start + 1:stop + 1].T.ravel(),
+            'won': wins[:, start:stop].T.ravel(),
+            'limit_hit': limit_hits[:, start:stop].T.ravel(),
+        })
+
+    # Step 3: Every session ends after the last spin
+    if observers.callbacks['session_end']:
+        final = paths[:, -1]
+        observers.emit_batch("session_end", {'player': players, 'spins': np.full(num_players, num_spins),
+                                             'bankroll': final, 'net': final - spec['initial_bankroll']})
+
+
+def limit_hit_matrix(spec, wins):
+    """(players, spins) booleans: was the intended bet above the table limit (and cut to it)?"""
+    num_players, num_spins = wins.shape
+    limit, base_bet = spec['table_limit'], spec['base_bet']
+    if spec['strategy'] != "martingale" or limit == float('inf'):
+        return np.full((num_players, num_spins), base_bet > limit)
+
+    # Intended bet base_bet * 2^streak is above the limit from `doublings` losses in a row
+    doublings = 0
+    while base_bet * 2 ** doublings <= limit:
+        doublings += 1
+    streaks = np.empty((num_players, num_spins), dtype=np.int64)
+    streak = np.zeros(num_players, dtype=np.int64)
+    for spin in range(num_spins):
+        streaks[:, spin] = streak
+        streak = np.where(wins[:, spin], 0, streak + 1)
+    return streaks >= doublings
+
+
+def martingale_bets(wins, base_bet, limit, dtype):
+    """
+    Actual bet on every spin for Martingale players.
+    Each bet depends on the previous result, so we loop over spins but
+    update every player at once.
+    Returns None if the bets do not fit in int64 (very long losing streaks
+    with no table limit); the caller then retries with exact Python ints.
+    """
+    num_players, num_spins = wins.shape
+    bets = np.empty((num_players, num_spins), dtype=dtype)
+    consecutive_losses = np.zeros(num_players, dtype=np.int64)
+
+    # Beyond `cap` doublings the intended bet is always above the table
+    # limit, so capping the exponent does not change the actual bet
+    cap = None
+    if limit != float('inf'):
+        cap = max(0, int(np.ceil(np.log2(limit / base_bet))))
+    if dtype == np.int64 and (cap is None or cap > 62 - int(base_bet).bit_length()):
+        cap_overflow = 62 - int(base_bet).bit_length()
+    else:
+        cap_overflow = None
+
+    for spin in range(num_spins):
+        exponents = consecutive_losses if cap is None else np.minimum(consecutive_losses, cap)
+        if cap_overflow is not None and exponents.max() > cap_overflow:
+            return None
+
+        # Same doubling rule as Player.process_result: base_bet * 2^losses
+        if dtype == np.int64:
+            intended = np.left_shift(np.int64(base_bet), exponents)
+        elif dtype == object:
+            intended = np.left_shift(np.full(num_players, base_bet, dtype=object), exponents.astype(object))
+        else:
+            intended = base_bet * np.exp2(exponents)
+        bets[:, spin] = intended if limit == float('inf') else np.minimum(intended, limit)
+        consecutive_losses = np.where(wins[:, spin], 0, consecutive_losses + 1)
+
+    return bets
@@ -0,0 +1,175 @@
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from components.spin_stream import consume
+
+# Checkpoints for long simulations, so a crashed or stopped run resumes
+# where it was instead of starting over.
+#
+# A checkpoint is one .npz file: every NumPy array of the state is stored as
+# a binary entry and everything else (RNG state, counters, progress) as one
+# JSON document in the '__checkpoint__' entry, where each array is replaced
+# by a reference {"__array__": name}. Files are written to a temporary file
+# in the same folder, flushed to disk and renamed over the old checkpoint,
+# so a crash during a save leaves the previous checkpoint intact.
+#
+# Checkpoints are taken only where the whole run state is known (between
+# blocks of spins, at chunk boundaries, after a sweep task), and they hold
+# the RNG state, so a resumed run gives exactly the results of an
+# uninterrupted one. Saving more or less often does not change the results.
+# Game histories are not saved: checkpointed games stream their spins to
+# consumers (components.spin_stream) whose state is saved instead.
+
+CHECKPOINT_VERSION = 1
+META_KEY = "__checkpoint__"
+
+# Seconds between checkpoints
+CHECKPOINT_SECONDS = 60
+
+# Spins a checkpointed Game plays between checks of the clock
+GAME_BLOCK = 100000
+
+# Player attributes that change during a session (plus its settings)
+PLAYER_FIELDS = ("bankroll", "strategy", "base_bet", "current_bet", "consecutive_losses", "bet_type", "bet_value")
+
+
+def _split_arrays(value, arrays):
+    """JSON-able copy of value with every ndarray moved into `arrays`"""
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            raise ValueError("Object arrays cannot be checkpointed")
+        name = f"array{len(arrays)}"
+        arrays[name] = value
+        return {'__array__': name}
+    if isinstance(value, dict):
+        return {str(key): _split_arrays(item, arrays) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_split_arrays(item, arrays) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _join_arrays(value, arrays):
+    """Inverse of _split_arrays"""
+    if isinstance(value, dict):
+        if set(value) == {'__array__'}:
+            return arrays[value['__array__']]
+        return {key: _join_arrays(item, arrays) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_join_arrays(item, arrays) for item in value]
+    return value
+
+
+def save_checkpoint(path, state):
+    """Atomically write a state (nested dicts / lists of numbers, strings and arrays)"""
+    arrays = {}
+    document = json.dumps({'version': CHECKPOINT_VERSION, 'state': _split_arrays(state, arrays)})
+    arrays[META_KEY] = np.frombuffer(document.encode("utf-8"), dtype=np.uint8)
+
+    folder = os.path.dirname(os.path.abspath(path))
+    handle, temporary = tempfile.mkstemp(prefix=".checkpoint-", suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(handle, "wb") as file:
+            np.savez(file, **arrays)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def load_checkpoint(path):
+    """The state saved at path, or None if there is no checkpoint"""
+    if not os.path.exists(path):
+        return None
+    with np.load(path, allow_pickle=False) as data:
+        if META_KEY not in data.files:
+            raise ValueError(f"{path} is not a checkpoint")
+        document = json.loads(data[META_KEY].tobytes().decode("utf-8"))
+        if document['version'] != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {document['version']} "
+                             f"(expected {CHECKPOINT_VERSION})")
+        arrays = {name: data[name] for name in data.files if name != META_KEY}
+    return _join_arrays(document['state'], arrays)
+
+
+def check_signature(state, signature, path):
+    """Refuse to resume a checkpoint that belongs to a different run"""
+    saved = json.loads(json.dumps(_split_arrays(signature, {})))
+    if state.get('signature') != saved:
+        raise ValueError(f"{path} is a checkpoint of a different run: {state.get('signature')} != {saved}")
+
+
+# --- Scalar Game ---
+
+def game_state(game):
+    """Progress, wheel and player state of a Game"""
+    return {
+        'spins_played': game.spins_played,
+        'wheel': game.wheel.get_state(),
+        'player': {name: getattr(game.player, name) for name in PLAYER_FIELDS},
+    }
+
+
+def game_signature(game, num_spins):
+    """What makes two Game runs the same run: wheel, seed, player settings, limit and length"""
+    seed = game.wheel.seed
+    if isinstance(seed, np.random.SeedSequence):
+        seed = {'entropy': seed.entropy, 'spawn_key': list(seed.spawn_key)}
+    weights = game.wheel.weights
+    return {
+        'wheel_type': game.wheel.wheel_type,
+        'weights': None if weights is None else weights.tolist(),
+        'seed': seed,
+        'player': {name: getattr(game.player, name) for name in ("strategy", "base_bet", "bet_type", "bet_value")},
+        'table_limit': game.table_limit,
+        'num_spins': num_spins,
+    }
+
+
+def restore_game(game, state):
+    game.spins_played = state['spins_played']
+    game.wheel.set_state(state['wheel'])
+    for name, value in state['player'].items():
+        setattr(game.player, name, value)
+
+
+def run_game(game, num_spins, path, consumers=(), every_seconds=CHECKPOINT_SECONDS, block=GAME_BLOCK):
+    """
+    Play a Game (without history) until it has played num_spins spins,
+    feeding each spin to the consumers, with a checkpoint at path every
+    every_seconds and at the end. If path holds a checkpoint, the game and
+    consumers are restored first and only the remaining spins are played; a
+    finished run's checkpoint is kept, so running again returns at once; a
+    checkpoint of a different game (game_signature) is refused.
+    Consumers are saved through their attributes (numbers, strings, lists,
+    arrays), like SpinStatistics and BankrollSampler. Returns the consumers
+    (one consumer on its own, like consume).
+    """
+    signature = game_signature(game, num_spins)
+    state = load_checkpoint(path)
+    if state is not None:
+        check_signature(state, signature, path)
+        if len(state['consumers']) != len(consumers):
+            raise ValueError(f"{path} was saved with {len(state['consumers'])} consumers, not {len(consumers)}")
+        restore_game(game, state['game'])
+        for consumer, saved in zip(consumers, state['consumers']):
+            vars(consumer).update(saved)
+
+    saved_at = time.perf_counter()
+    while game.spins_played < num_spins:
+        consume(game.iter_spins(min(block, num_spins - game.spins_played)), *consumers)
+        # Always save at the end; otherwise only when the interval has passed
+        if game.spins_played < num_spins and time.perf_counter() - saved_at < every_seconds:
+            continue
+        save_checkpoint(path, {'signature': signature, 'game': game_state(game),
+                               'consumers': [vars(c) for c in consumers]})
+        saved_at = time.perf_counter()
+    return consumers[0] if len(consumers) == 1 else consumers
@@ -0,0 +1,28 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from components.simulation import make_spec, run_spec
+
+print("=== Testing NumPy Batch Engine ===")
+
+# The batch engine must reproduce the scalar Game exactly for the same seed
+specs = [
+    make_spec(strategy="flat", bet_type="number", bet_value=17, wheel_type="american", num_players=20, num_spins=300, seed=1),
+    make_spec(strategy="martingale", table_limit=1000, num_players=20, num_spins=300, seed=2),
+    make_spec(strategy="martingale", wheel_type="triple", num_players=20, num_spins=300, seed=3),
+    # Fractional money: float bankrolls must round exactly as Game adds them
+    make_spec(strategy="flat", base_bet=0.1, num_players=20, num_spins=300, seed=4),
+    make_spec(strategy="martingale", base_bet=0.3, initial_bankroll=100.7, table_limit=40, num_players=20,
+              num_spins=300, seed=5),
+]
+
+for i, spec in enumerate(specs, start=1):
+    records = ("final", "paths", "bets", "lowest")
+    scalar = run_spec(spec, records, engine="scalar")
+    batch = run_spec(spec, records, engine="numpy")
+    print(f"\n{i}. {spec['wheel_type']} {spec['strategy']} {spec['bet_type']}: identical = {scalar == batch}")
+    print(f"   First final bankrolls: {batch['final'][:5]}")
+    assert scalar == batch
+
+print("\n=== Batch Engine Testing Complete! ===")
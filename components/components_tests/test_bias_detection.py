@@ -0,0 +1,67 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import math
+import subprocess
+
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel
+from components.wheel_bias import sector_bias_weights
+from utils.bias_detection import BiasDetector, bias_power_analysis, chi_square_sf, detect_bias
+
+print("=== Testing Bias Detection ===")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Test 1: Chi-square tail against closed forms (df = 1 and 2)
+x = np.array([0.0, 0.5, 3.84, 10.0, 40.0])
+assert np.allclose(chi_square_sf(x, 2), np.exp(-x / 2))
+assert np.allclose(chi_square_sf(x, 1), [math.erfc(math.sqrt(v / 2)) for v in x])
+print("\n1. Chi-square tail matches the closed forms")
+
+# Test 2: A fair wheel is flagged at most alpha of the time, whatever the number of looks
+print("\n2. False alarms on a fair wheel (2000 trials, alpha 5%):")
+options = {'alpha': 0.05, 'first_look': 200, 'look_ratio': 1.2}
+fair = bias_power_analysis("european", None, num_trials=2000, max_spins=20000, seed=1, **options)
+for name, result in fair.items():
+    print(f"   {name}: {result['power']:.2%}")
+    assert result['power'] <= 0.05 + 3 * math.sqrt(0.05 * 0.95 / 2000), name
+
+# Test 3: A biased wheel is found, sooner when the bias is stronger
+print("\n3. Power against a 5-pocket sector bias (300 trials):")
+power = {}
+for strength in (0.15, 0.3):
+    weights = sector_bias_weights("european", 17, 2, strength)
+    biased = bias_power_analysis("european", weights, num_trials=300, max_spins=20000, seed=2, **options)
+    print(f"   +{strength:.0%}: " + ", ".join(f"{name} power {result['power']:.0%}" for name, result in biased.items()))
+    power[strength] = {name: result['power'] for name, result in biased.items()}
+assert all(power[0.3][name] >= 0.9 and power[0.3][name] > power[0.15][name] for name in power[0.3])
+# The sector test looks where a dealer-signature bias is
+assert power[0.15]['sector'] > power[0.15]['chi_square'] + 0.2
+
+# Test 4: Side-by-side trials detect exactly what single streams do
+weights = sector_bias_weights("european", 17, 2, 0.15)
+seeds = np.random.SeedSequence(3).spawn(3)
+single = [detect_bias(RouletteWheel("european", seed=seed, weights=weights), max_spins=20000, chunk_size=777,
+                      **options)['detected_at'] for seed in seeds]
+detector = BiasDetector("european", num_trials=3, max_spins=20000, **options)
+detector.update(np.array([RouletteWheel("european", seed=seed, weights=weights).spin_indices(20000)
+                          for seed in seeds]))
+side_by_side = detector.report()['detected_at']
+print(f"\n4. Sector detections: {side_by_side['sector']}")
+assert all([report[name] for report in single] == side_by_side[name] for name in side_by_side)
+
+# Test 5: Worker processes give the same detections as one process
+command = [sys.executable, "-c",
+           "import sys; sys.path.insert(0, sys.argv[1])\n"
+           "from utils.bias_detection import bias_power_analysis\n"
+           "result = bias_power_analysis('european', None, num_trials=50, max_spins=5000, seed=4, workers=2)\n"
+           "print({name: value['detected_at'].tolist() for name, value in result.items()})", PROJECT_ROOT]
+pooled = subprocess.run(command, capture_output=True, text=True, check=True).stdout.strip()
+single = bias_power_analysis("european", None, num_trials=50, max_spins=5000, seed=4)
+assert pooled == str({name: value['detected_at'].tolist() for name, value in single.items()})
+print("\n5. Two worker processes: identical detections")
+
+print("\n=== Bias Detection Testing Complete! ===")
@@ -0,0 +1,166 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import shutil
+import tempfile
+
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel
+from components.simulation import make_spec, build_game
+from components.game import Game
+from components.player import Player
+from components.spin_log import ReplayWheel, record_spin_log
+from components.spin_stream import SpinStatistics, BankrollSampler
+from components.player_pool import PlayerPool, simulate_pool
+from components.observers import Observers
+from components.checkpoint import save_checkpoint, load_checkpoint, run_game
+from utils.parameter_sweep import run_sweep, grid_cells
+
+print("=== Testing Checkpoints ===")
+folder = tempfile.mkdtemp()
+
+
+class Crash(Exception):
+    pass
+
+
+# Test 1: States round-trip, including arrays, big integers and infinity
+print("\n1. Round trip:")
+path = os.path.join(folder, "state.ckpt")
+state = {'spin': 12, 'limit': float('inf'), 'big': 2 ** 100, 'groups': [["color", "red"]],
+         'arrays': {'bankroll': np.arange(5, dtype=np.int64), 'active': np.array([True, False])}}
+save_checkpoint(path, state)
+loaded = load_checkpoint(path)
+assert loaded['spin'] == 12 and loaded['limit'] == float('inf') and loaded['big'] == 2 ** 100
+assert np.array_equal(loaded['arrays']['bankroll'], state['arrays']['bankroll'])
+assert loaded['arrays']['active'].dtype == bool and load_checkpoint(os.path.join(folder, "missing")) is None
+print(f"   {os.path.getsize(path)} bytes")
+
+# A failed save keeps the previous checkpoint and leaves no temporary file
+try:
+    save_checkpoint(path, {'spin': object()})
+    raise AssertionError("expected a TypeError")
+except TypeError:
+    pass
+assert load_checkpoint(path)['spin'] == 12 and os.listdir(folder) == ["state.ckpt"]
+
+# Test 2: A wheel continues exactly from its saved state
+wheel = RouletteWheel("american", seed=3)
+wheel.spin_indices(1000)
+copy = RouletteWheel("american")
+copy.set_state(wheel.get_state())
+assert np.array_equal(copy.spin_indices(10000), wheel.spin_indices(10000))
+print("\n2. Wheel state restored")
+
+# Test 3: A crashed Game resumes with the results of an uninterrupted run
+print("\n3. Game resume:")
+spec = make_spec(wheel_type="american", strategy="martingale", table_limit=500)
+expected = run_game(build_game(spec, seed=9), 20000, os.path.join(folder, "whole.ckpt"),
+                    [SpinStatistics(1000), BankrollSampler(64)])
+
+
+# Spin on which Crasher fails (consumer attributes are checkpointed, so keep it outside)
+CRASH_AT = {'spin': 13500}
+
+
+class Crasher:
+    """Consumer that fails on spin CRASH_AT['spin']"""
+
+    def update(self, record):
+        if record['spin_number'] == CRASH_AT['spin']:
+            raise Crash()
+
+
+path = os.path.join(folder, "game.ckpt")
+try:
+    run_game(build_game(spec, seed=9), 20000, path, [SpinStatistics(1000), BankrollSampler(64), Crasher()],
+             every_seconds=0, block=1000)
+    raise AssertionError("expected the crash")
+except Crash:
+    pass
+assert load_checkpoint(path)['game']['spins_played'] == 13000
+CRASH_AT['spin'] = None
+stats, sampler, _ = run_game(build_game(spec, seed=9), 20000, path,
+                             [SpinStatistics(1000), BankrollSampler(64), Crasher()], block=1000)
+print(f"   {stats.summary()}")
+assert stats.summary() == expected[0].summary()
+assert sampler.bankrolls == expected[1].bankrolls and sampler.spin_numbers == expected[1].spin_numbers
+
+# A checkpoint of another game (here: other bet and seed) is refused
+other = build_game(make_spec(wheel_type="american", strategy="martingale", table_limit=500, base_bet=50,
+                             bet_type="number", bet_value=17), seed=10)
+try:
+    run_game(other, 20000, path, [SpinStatistics(1000), BankrollSampler(64), Crasher()])
+    raise AssertionError("expected a ValueError")
+except ValueError as error:
+    print(f"   Rejected: {str(error)[:60]}...")
+
+# A Game on a ReplayWheel resumes at its position in the log
+log = record_spin_log(os.path.join(folder, "spins.rsl"), RouletteWheel("european", seed=4), 10000)
+expected = run_game(Game(ReplayWheel(log), Player(strategy="martingale")), 10000, os.path.join(folder, "log.ckpt"),
+                    [SpinStatistics(1000)])
+path = os.path.join(folder, "replay.ckpt")
+CRASH_AT['spin'] = 5500
+try:
+    run_game(Game(ReplayWheel(log), Player(strategy="martingale")), 10000, path, [SpinStatistics(1000), Crasher()],
+             every_seconds=0, block=1000)
+    raise AssertionError("expected the crash")
+except Crash:
+    pass
+CRASH_AT['spin'] = None
+resumed, _ = run_game(Game(ReplayWheel(log), Player(strategy="martingale")), 10000, path,
+                      [SpinStatistics(1000), Crasher()])
+print(f"   Replayed log: net {resumed.summary()['net']}")
+assert resumed.summary() == expected.summary()
+
+# Test 4: A crashed pool resumes with the results of an uninterrupted run
+print("\n4. Pool resume:")
+segments = {"casual": {'win_goal': 100, 'session_spins': {'integers': (20, 300)}},
+            "system": {'strategy': "martingale", 'table_limit': 500, 'stop_loss': 400}}
+pool = PlayerPool.sample(segments, 2000, seed=5)
+expected = simulate_pool(pool, 600, "triple", seed=1, records=("paths",), chunk_size=20000)
+
+observers = Observers()
+
+
+@observers.on("spin", batched=True)
+def crash(batch):
+    if batch['spin_number'].max() >= 450:
+        raise Crash()
+
+
+path = os.path.join(folder, "pool.ckpt")
+try:
+    simulate_pool(pool, 600, "triple", seed=1, records=("paths",), chunk_size=20000, observers=observers,
+                  checkpoint=path, checkpoint_seconds=0)
+    raise AssertionError("expected the crash")
+except Crash:
+    pass
+print(f"   Crashed, checkpoint at spin {load_checkpoint(path)['spin']}")
+results = simulate_pool(pool, 600, "triple", seed=1, records=("paths",), chunk_size=20000, checkpoint=path)
+for name, values in expected.items():
+    assert np.array_equal(results[name], values), name
+
+# A checkpoint of a different run is refused
+try:
+    simulate_pool(pool, 700, "triple", seed=1, records=("paths",), chunk_size=20000, checkpoint=path)
+    raise AssertionError("expected a ValueError")
+except ValueError as error:
+    print(f"\n5. Rejected: {str(error)[:60]}...")
+
+# Test 6: A sweep only simulates the cells its checkpoint is missing
+print("\n6. Sweep resume:")
+cells = grid_cells({'table_limit': [200, 1000], 'wheel_type': ["european", "american", "triple"]})
+base = {'strategy': "martingale", 'num_players': 100, 'num_spins': 200, 'seed': 3}
+expected = run_sweep(cells, base, verbose=False)
+path = os.path.join(folder, "sweep.ckpt")
+run_sweep(cells, base, verbose=False, checkpoint=path)
+saved = load_checkpoint(path)
+saved['done'] = {index: row for index, row in saved['done'].items() if int(index) % 2}
+save_checkpoint(path, saved)
+assert run_sweep(cells, base, checkpoint=path) == expected
+
+shutil.rmtree(folder)
+print("\n=== Checkpoint Testing Complete! ===")
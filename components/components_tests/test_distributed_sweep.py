@@ -0,0 +1,105 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import socket
+import threading
+
+import numpy as np
+
+from components.simulation import make_spec, player_seeds
+from utils.parameter_sweep import grid_cells, run_sweep, SWEEP_METRICS
+from utils.distributed_sweep import (
+    SweepCoordinator,
+    make_tasks,
+    merge_results,
+    run_distributed_sweep,
+    run_worker,
+)
+
+print("=== Testing Distributed Sweeps ===")
+
+cells = grid_cells({'table_limit': [200, 1000], 'wheel_type': ["european", "triple"]})
+base = {'strategy': "martingale", 'num_players': 1000, 'num_spins': 300, 'seed': 6}
+specs = [make_spec(**dict(base, **cell)) for cell in cells]
+
+# Test 1: Player ranges get the seeds of the whole cell
+print("\n1. Player seeds by range:")
+whole = [np.random.default_rng(seed).integers(1 << 30) for seed in player_seeds(specs[0])]
+part = [np.random.default_rng(seed).integers(1 << 30) for seed in player_seeds(specs[0], 300, 700)]
+assert whole[300:700] == part
+tasks = make_tasks(specs, 300)
+print(f"   {len(cells)} cells in {len(tasks)} tasks")
+assert len(tasks) == 2 * 4 and sorted(task['stop'] for task in tasks)[-1] == 1000
+
+# Test 2: Two workers reproduce the single-machine sweep
+print("\n2. Same table as run_sweep:")
+with socket.socket() as probe:
+    probe.bind(("127.0.0.1", 0))
+    address = probe.getsockname()
+# Workers retry until the coordinator listens
+threads = [threading.Thread(target=run_worker, args=(address,)) for _ in range(2)]
+for thread in threads:
+    thread.start()
+expected = run_sweep(cells, base, verbose=False)
+rows = run_distributed_sweep(cells, base, address, players_per_task=300, verbose=False)
+for thread in threads:
+    thread.join()
+for row, reference in zip(rows, expected):
+    for name in SWEEP_METRICS:
+        assert np.isclose(row[name], reference[name], rtol=1e-12), (name, row[name], reference[name])
+print(f"   {[round(row['p_ruin'], 3) for row in rows]}")
+
+# Test 3: The results do not depend on the workers, even when one dies mid-task
+print("\n3. Worker failures:")
+
+
+def distribute(workers, crashes=()):
+    """
+    Run the tasks on worker threads. Before them, one worker per entry of
+    crashes connects and leaves after that many tasks, holding the next one.
+    """
+    coordinator = SweepCoordinator(tasks, port=0, token="secret", task_timeout=30, verbose=False).serve()
+    for number, limit in enumerate(crashes):
+        run_worker(coordinator.address, "secret", f"crash{number}", 5, limit)
+    threads = [threading.Thread(target=run_worker, args=(coordinator.address, "secret", f"w{number}"))
+               for number in range(workers)]
+    for thread in threads:
+        thread.start()
+    results = coordinator.wait(timeout=120)
+    coordinator.close()
+    for thread in threads:
+        thread.join()
+    return merge_results(specs, tasks, results), coordinator
+
+
+one, _ = distribute(1)
+crashed, coordinator = distribute(3, crashes=(1, 0))
+print(f"   {coordinator.reassigned} task(s) handed out again")
+assert coordinator.reassigned == 2 and one == crashed
+
+# Test 4: Wrong tokens are refused
+print("\n4. Tokens:")
+coordinator = SweepCoordinator(tasks, port=0, token="secret", verbose=False).serve()
+try:
+    run_worker(coordinator.address, token="guess")
+    raise AssertionError("expected a ValueError")
+except ValueError as error:
+    print(f"   Rejected: {error}")
+coordinator.close()
+
+# Test 5: A task that fails everywhere stops the sweep instead of looping
+bad = make_tasks([dict(specs[0], wheel_type="bogus")], 1000)
+coordinator = SweepCoordinator(bad, port=0, verbose=False).serve()
+try:
+    run_worker(coordinator.address)
+except ValueError:
+    pass
+try:
+    coordinator.wait(timeout=30)
+    raise AssertionError("expected a RuntimeError")
+except RuntimeError as error:
+    print(f"\n5. Stopped: {str(error)[:60]}...")
+coordinator.close()
+
+print("\n=== Distributed Sweep Testing Complete! ===")
@@ -0,0 +1,81 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+
+from components.simulation import make_spec, player_seeds
+from components.batch_engine import pocket_matrix, simulate_batch
+from utils.gamblers_ruin import solve_gamblers_ruin, duration_distribution, exact_flat_metrics
+from utils.parameter_sweep import cell_metrics, grid_cells, run_sweep
+
+print("=== Testing Gambler's Ruin ===")
+
+
+def simulate(spec):
+    """Seeded batch-engine paths of every player of a spec"""
+    pockets = pocket_matrix(spec['wheel_type'], player_seeds(spec), spec['num_spins'])
+    return simulate_batch(spec, pockets, ("final", "paths", "lowest"))
+
+
+def first_passage(paths, floor, goal):
+    """(ruined, reached goal, spins played) of every path stopped at the floor or the goal"""
+    stopped = (paths <= floor) | (paths >= goal)
+    ended = stopped.any(axis=1)
+    spins = np.where(ended, stopped.argmax(axis=1), paths.shape[1] - 1)
+    final = paths[np.arange(len(paths)), spins]
+    return ended & (final <= floor), ended & (final >= goal), spins
+
+
+# Test 1: Colour bets are the classic walk, with a closed form
+print("\n1. Closed form (red, $50 to $100 in $10 bets):")
+spec = make_spec(base_bet=10, initial_bankroll=50)
+exact = solve_gamblers_ruin(spec, goal=100)
+ratio = (1 - 18 / 37) / (18 / 37)
+closed_form = (ratio ** 10 - ratio ** 5) / (ratio ** 10 - 1)
+print(f"   {exact}, closed form p_ruin {closed_form:.12f}")
+assert abs(exact['p_ruin'] - closed_form) < 1e-12
+
+# Test 2: Ruin, goal and session length agree with seeded players
+print("\n2. Against simulated players:")
+for overrides, goal in (({'base_bet': 10, 'initial_bankroll': 50}, 100),
+                        ({'bet_type': "number", 'bet_value': 17, 'wheel_type': "american", 'base_bet': 10,
+                          'initial_bankroll': 200}, 500)):
+    spec = make_spec(num_players=8000, num_spins=1500, seed=12, **overrides)
+    exact = solve_gamblers_ruin(spec, goal=goal)
+    ruined, reached, spins = first_passage(simulate(spec)['paths'], 0, goal)
+    assert (ruined | reached).all(), "raise num_spins so every session ends"
+    std_error = np.sqrt(exact['p_ruin'] * exact['p_goal'] / len(ruined))
+    print(f"   {spec['bet_type']}: p_ruin exact {exact['p_ruin']:.4f} simulated {ruined.mean():.4f}, "
+          f"spins exact {exact['expected_spins']:.1f} simulated {spins.mean():.1f}")
+    assert abs(ruined.mean() - exact['p_ruin']) < 4 * std_error
+    assert abs(spins.mean() - exact['expected_spins']) < 4 * spins.std() / np.sqrt(len(spins))
+
+# Test 3: The duration distribution adds up
+distribution = duration_distribution(make_spec(base_bet=10, initial_bankroll=50), goal=100, max_spins=5000)
+total = distribution['p_ruin_within'] + distribution['p_goal_within'] + distribution['p_playing']
+assert abs(total - 1) < 1e-9
+print(f"\n3. Duration distribution: ruin {distribution['p_ruin_within']:.6f} + goal "
+      f"{distribution['p_goal_within']:.6f} + playing {distribution['p_playing']:.2e}")
+
+# Test 4: Exact sweep metrics agree with the simulated sweep
+print("\n4. exact_flat_metrics against simulation:")
+base = {'base_bet': 10, 'initial_bankroll': 300, 'num_players': 20000, 'num_spins': 400, 'seed': 13}
+cells = grid_cells({'bet_type': ["color"], 'wheel_type': ["european", "triple"]}) + \
+    [{'bet_type': "number", 'bet_value': 17, 'wheel_type': "american"}]
+simulated = run_sweep(cells, base, verbose=False)
+solved = run_sweep(cells, base, verbose=False, exact=True)
+for cell, row, exact in zip(cells, simulated, solved):
+    spec = make_spec(**dict(base, **cell))
+    assert exact == dict(row, **exact_flat_metrics(spec))
+    results = simulate_batch(spec, pocket_matrix(spec['wheel_type'], player_seeds(spec), spec['num_spins']),
+                             ("final", "lowest"))
+    metrics = cell_metrics(spec, results['final'], results['lowest'])
+    assert metrics == {name: row[name] for name in metrics}
+    for name in ("p_ruin", "p_profit", "p_bankrupt"):
+        assert abs(row[name] - exact[name]) < 4 * np.sqrt(max(exact[name] * (1 - exact[name]), 1e-4) / 20000), name
+    assert abs(row['mean_final'] - exact['mean_final']) < 4 * exact['std_final'] / np.sqrt(20000)
+    print(f"   {cell['wheel_type']} {cell['bet_type']}: p_ruin exact {exact['p_ruin']:.4f} simulated "
+          f"{row['p_ruin']:.4f}, mean final exact {exact['mean_final']:.1f} simulated {row['mean_final']:.1f}")
+
+print("\n=== Gambler's Ruin Testing Complete! ===")
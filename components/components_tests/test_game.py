@@ -1,6 +1,6 @@
 import sys
 import os
-sys.path.insert(0, '/home/elenacg/ADA511/Project/roulette_project')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from components.roulette_wheel import RouletteWheel
 from components.player import Player
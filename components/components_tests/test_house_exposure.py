@@ -0,0 +1,63 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+
+from utils.house_exposure import aggregate, house_risk_profile, risk_measures, spin_distribution
+
+print("=== Testing House Exposure ===")
+
+# Test 1: One spin of $10 on red: the house wins 10 (19/37) or pays 10 (18/37)
+spin = spin_distribution("european", {("color", "red"): 10})
+print(f"\n1. Red $10: start {spin['start']}, step {spin['step']}, pmf {spin['pmf'].tolist()}")
+assert (spin['start'], spin['step'], spin['exact']) == (-10.0, 20.0, True)
+assert np.allclose(spin['pmf'], [18 / 37, 19 / 37])
+
+# Test 2: The FFT power equals repeated convolution
+print("\n2. Aggregation against np.convolve (7 spins):")
+mix = {("color", "red"): 10, ("number", 17): 3, ("color", "black"): 4}
+spin = spin_distribution("american", mix)
+expected = spin['pmf']
+for _ in range(6):
+    expected = np.convolve(expected, spin['pmf'])
+week = aggregate(spin, 7)
+assert week['exact'] and week['start'] == 7 * spin['start'] and week['step'] == spin['step']
+assert np.allclose(week['pmf'], expected, atol=1e-15)
+print(f"   {len(spin['pmf'])} points per spin -> {len(week['pmf'])} points, max error "
+      f"{np.abs(week['pmf'] - expected).max():.1e}")
+
+# Test 3: A coarsened lattice is no longer exact but keeps the mean
+coarse = aggregate(spin, 7, max_points=40)
+exact_risk, coarse_risk = risk_measures(week), risk_measures(coarse)
+print(f"\n3. Coarsened to {len(coarse['pmf'])} points (step {coarse['step']}): mean {coarse_risk['mean']:.6f} "
+      f"vs {exact_risk['mean']:.6f}, std {coarse_risk['std']:.3f} vs {exact_risk['std']:.3f}")
+assert not coarse['exact'] and len(coarse['pmf']) <= 40 and coarse['step'] > spin['step']
+assert abs(coarse_risk['mean'] - exact_risk['mean']) < 1e-9
+# Splitting each mass widens the variance by at most step^2 / 4 per spin
+assert exact_risk['std'] <= coarse_risk['std'] <= np.sqrt(exact_risk['std'] ** 2 + 7 * coarse['step'] ** 2 / 4)
+
+# Test 4: VaR and expected shortfall of a two-point house result, by hand
+# The house wins 10 (98%) or loses 100 (2%)
+two_point = {'start': -100.0, 'step': 110.0, 'pmf': np.array([0.02, 0.98]), 'exact': True}
+risk = risk_measures(two_point, levels=(0.95, 0.99))
+print(f"\n4. Two-point result: {risk}")
+assert np.isclose(risk['mean'], 0.98 * 10 - 0.02 * 100) and np.isclose(risk['p_house_loses'], 0.02)
+assert risk['var'] == {0.95: -10.0, 0.99: 100.0}
+# Worst 5%: the 2% loss of 100 and 3% of the -10 atom
+assert np.isclose(risk['es'][0.95], (0.02 * 100 + 0.03 * -10) / 0.05)
+assert np.isclose(risk['es'][0.99], 100.0)
+
+# Test 5: Shift profile: the mean adds up over the spins
+profile = house_risk_profile("european", {("color", "red"): 10}, spins_per_hour=40, hours_per_shift=8)
+print(f"\n5. Red $10 shift: mean {profile['shift']['mean']:.4f}, 99% VaR {profile['shift']['var'][0.99]}")
+assert np.isclose(profile['shift']['mean'], 320 * 10 / 37) and np.isclose(profile['spin']['mean'], 10 / 37)
+
+# Callers get their own dicts (the cached pmf arrays are shared, read-only)
+profile['shift']['var'][0.99] = -1
+profile['hour']['mean'] = 0
+again = house_risk_profile("european", {("color", "red"): 10})
+assert again['shift']['var'][0.99] != -1 and np.isclose(again['hour']['mean'], 40 * 10 / 37)
+assert again['shift']['pmf'] is profile['shift']['pmf'] and not again['shift']['pmf'].flags.writeable
+
+print("\n=== House Exposure Testing Complete! ===")
@@ -0,0 +1,67 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import tracemalloc
+
+from components.roulette_wheel import RouletteWheel
+from components.player import Player
+from components.game import Game
+from components.instrumentation import Instrumentation
+from components.spin_stream import consume, SpinStatistics
+
+print("=== Testing Instrumentation ===")
+
+# Instrument one game and run 500 spins
+game = Game(RouletteWheel("european", seed=3), Player(strategy="martingale"), table_limit=1000)
+instrumentation = Instrumentation()
+instrumentation.attach(game)
+
+with instrumentation.session():
+    game.run_simulation(500)
+
+summary = instrumentation.summary()
+print(f"\n1. Spins counted: {summary['spins']}")
+print(f"   Phases: {sorted(summary['phases'])}")
+assert summary['spins'] == 500
+assert summary['phases']['strategy']['calls'] == 1000  # place_bet + process_result
+
+# Detaching restores the plain methods (no wrappers left on the instances)
+instrumentation.detach(game)
+print(f"\n2. Detached: run_spin is the class method again: {'run_spin' not in game.__dict__}")
+assert 'run_spin' not in game.__dict__ and 'play_spin' not in game.__dict__ and 'spin' not in game.wheel.__dict__
+
+# An uninstrumented game with the same seed produces the same history
+plain = Game(RouletteWheel("european", seed=3), Player(strategy="martingale"), table_limit=1000)
+plain.run_simulation(500)
+print(f"\n3. Same results with and without instrumentation: {plain.history == game.history}")
+assert plain.history == game.history
+
+# Streamed spins (iter_spins without history) are timed and counted too
+streamed = Game(RouletteWheel("european", seed=3), Player(strategy="martingale"), table_limit=1000)
+stream_instrumentation = Instrumentation()
+stream_instrumentation.attach(streamed)
+with stream_instrumentation.session():
+    consume(streamed.iter_spins(500), SpinStatistics())
+stream_summary = stream_instrumentation.summary()
+print(f"\n4. Streamed spins counted: {stream_summary['spins']}, "
+      f"play_spin calls: {stream_summary['phases']['play_spin']['calls']}")
+assert stream_summary['spins'] == 500 and 'run_spin' not in stream_summary['phases']
+assert stream_summary['phases']['strategy']['calls'] == 1000 and streamed.history == []
+assert streamed.player.bankroll == plain.player.bankroll
+
+# Allocation tracking leaves tracing that the caller started running
+tracemalloc.start()
+tracked = Instrumentation(track_allocations=True)
+with tracked.session():
+    Game(RouletteWheel("european", seed=3), Player(strategy="martingale"), table_limit=1000).run_simulation(500)
+print(f"\n5. Caller's tracing still on: {tracemalloc.is_tracing()}, "
+      f"allocated during the run {tracked.counters['allocated_bytes']:,} bytes")
+assert tracemalloc.is_tracing() and tracked.counters['allocated_bytes'] > 0
+tracemalloc.stop()
+with tracked.session():
+    pass
+assert not tracemalloc.is_tracing()
+
+instrumentation.report()
+print("\n=== Instrumentation Testing Complete! ===")
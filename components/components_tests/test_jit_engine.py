@@ -0,0 +1,53 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import subprocess
+
+from components.simulation import make_spec, run_spec
+from components.jit_engine import JIT_AVAILABLE
+
+print("=== Testing JIT Engine ===")
+print(f"Numba available: {JIT_AVAILABLE}")
+
+# The compiled kernel (or its NumPy fallback) must reproduce the scalar Game exactly
+specs = [
+    make_spec(strategy="flat", bet_type="number", bet_value=17, wheel_type="american", num_players=20, num_spins=300, seed=1),
+    make_spec(strategy="martingale", table_limit=1000, num_players=20, num_spins=300, seed=2),
+    make_spec(strategy="martingale", wheel_type="triple", num_players=20, num_spins=300, seed=3),
+    make_spec(strategy="martingale", base_bet=2.5, table_limit=750.0, num_players=20, num_spins=300, seed=4),
+    # Long losing streaks on a single number overflow int64 -> exact fallback
+    make_spec(strategy="martingale", bet_type="number", bet_value=7, num_players=5, num_spins=400, seed=5),
+    # Fractional money, in the kernel and in its NumPy fallback (no limit -> overflow flag)
+    make_spec(strategy="flat", base_bet=0.1, initial_bankroll=100.7, num_players=20, num_spins=300, seed=6),
+    make_spec(strategy="martingale", base_bet=0.3, bet_type="number", bet_value=7, num_players=5, num_spins=400,
+              seed=7),
+]
+
+for i, spec in enumerate(specs, start=1):
+    records = ("final", "paths", "bets", "lowest")
+    scalar = run_spec(spec, records, engine="scalar")
+    jit = run_spec(spec, records, engine="numba")
+    print(f"\n{i}. {spec['wheel_type']} {spec['strategy']} {spec['bet_type']}: identical = {scalar == jit}")
+    print(f"   First final bankrolls: {jit['final'][:5]}")
+    assert scalar == jit
+
+# Numba loads on the first kernel run, and only then do pools switch to a forkserver
+PROBE = """
+import sys
+from components import jit_engine, process_pool
+from components.simulation import make_spec, run_spec
+with process_pool.process_pool(1) as pool:
+    print("numba" in sys.modules, pool._mp_context.get_start_method())
+run_spec(make_spec(strategy="martingale", num_players=2, num_spins=10, seed=0), engine="numba")
+with process_pool.process_pool(1) as pool:
+    print("numba" in sys.modules, pool._mp_context.get_start_method())
+"""
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+lines = subprocess.run([sys.executable, "-c", PROBE], cwd=root, capture_output=True, text=True,
+                       check=True).stdout.splitlines()
+print(f"\n{len(specs) + 1}. Before / after the first kernel run: {lines}")
+assert lines[0] == "False fork"
+assert lines[1] == ("True forkserver" if JIT_AVAILABLE else "False fork")
+
+print("\n=== JIT Engine Testing Complete! ===")
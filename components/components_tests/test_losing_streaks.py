@@ -0,0 +1,90 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import itertools
+
+import numpy as np
+
+from components.simulation import make_spec, player_seeds
+from components.batch_engine import pocket_matrix, win_table
+from utils.losing_streaks import (longest_losing_streak_distribution, simulated_longest_streaks,
+                                  table_limit_hit_probability)
+
+print("=== Testing Losing Streak Distribution ===")
+
+BETS = [("european", "color", "red"), ("american", "number", 17)]
+
+
+def brute_force_pmf(p_win, num_spins):
+    """P(longest streak == k) by enumerating every win/loss sequence"""
+    pmf = np.zeros(num_spins + 1)
+    for outcomes in itertools.product((True, False), repeat=num_spins):
+        longest = streak = 0
+        for won in outcomes:
+            streak = 0 if won else streak + 1
+            longest = max(longest, streak)
+        wins = sum(outcomes)
+        pmf[longest] += p_win ** wins * (1 - p_win) ** (num_spins - wins)
+    return pmf
+
+
+def dp_pmf(p_win, num_spins):
+    """P(longest streak == k) by dynamic programming over (current streak, longest streak)"""
+    states = np.zeros((num_spins + 1, num_spins + 1))
+    states[0, 0] = 1.0
+    for _ in range(num_spins):
+        after = np.zeros_like(states)
+        # A win ends the current streak; a loss extends it (and maybe the longest)
+        after[0] = p_win * states.sum(axis=0)
+        after[1:] += (1 - p_win) * states[:-1]
+        for streak in range(1, num_spins + 1):
+            # Streaks that became longer than the longest so far
+            row = after[streak]
+            row[streak] += row[:streak].sum()
+            row[:streak] = 0.0
+        states = after
+    return states.sum(axis=0)
+
+
+# Test 1: Exact against every sequence of a few spins
+print("\n1. Against enumeration (12 spins):")
+for wheel_type, bet_type, bet_value in BETS:
+    distribution = longest_losing_streak_distribution(wheel_type, bet_type, bet_value, 12)
+    expected = brute_force_pmf(distribution['p_win'], 12)
+    pmf = np.zeros(13)
+    pmf[:len(distribution['pmf'])] = distribution['pmf']
+    assert np.allclose(pmf, expected, rtol=1e-9, atol=1e-15), (bet_type, pmf, expected)
+    print(f"   {wheel_type} {bet_type}: mean longest streak {distribution['mean']:.4f}")
+
+# Test 2: Exact against the dynamic program over longer runs
+print("\n2. Against dynamic programming (150 spins):")
+for wheel_type, bet_type, bet_value in BETS:
+    distribution = longest_losing_streak_distribution(wheel_type, bet_type, bet_value, 150)
+    expected = dp_pmf(distribution['p_win'], 150)
+    pmf = np.zeros(151)
+    pmf[:len(distribution['pmf'])] = distribution['pmf']
+    assert np.allclose(pmf, expected, rtol=1e-7, atol=1e-15)
+    tail = distribution['at_least']
+    assert np.allclose(tail, expected[::-1].cumsum()[::-1][:len(tail)], rtol=1e-7, atol=1e-15)
+    print(f"   {wheel_type} {bet_type}: P(longest >= 10) = {tail[10]:.6f}")
+
+# Test 3: Simulated players agree with the distribution
+print("\n3. Against simulation (4000 players x 300 spins):")
+for wheel_type, bet_type, bet_value in BETS:
+    spec = make_spec(wheel_type=wheel_type, num_players=4000, num_spins=300, seed=11)
+    longest = simulated_longest_streaks(pocket_matrix(wheel_type, player_seeds(spec), 300),
+                                        win_table(wheel_type, bet_type, bet_value))
+    distribution = longest_losing_streak_distribution(wheel_type, bet_type, bet_value, 300)
+    std_error = longest.std() / np.sqrt(len(longest))
+    print(f"   {wheel_type} {bet_type}: simulated {longest.mean():.3f} vs exact {distribution['mean']:.3f}")
+    assert abs(longest.mean() - distribution['mean']) < 4 * std_error
+
+# Test 4: Table limit hits are streaks of the doublings the limit allows
+# $10 up to $1000 allows 10, 20, ..., 640: the 7th loss in a row asks for $1280
+assert table_limit_hit_probability("european", "color", "red", 200, 10, 1000) == \
+    longest_losing_streak_distribution("european", "color", "red", 199)['at_least'][7]
+assert table_limit_hit_probability("european", "color", "red", 200, 10, float('inf')) == 0.0
+print("\n4. Table limit hit probability from the streak distribution")
+
+print("\n=== Losing Streak Distribution Testing Complete! ===")
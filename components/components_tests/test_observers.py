@@ -0,0 +1,114 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+
+from components.simulation import make_spec, build_game, run_spec
+from components.batch_engine import pocket_matrix, simulate_batch
+from components.player_pool import PlayerPool, simulate_pool, QUIT_REASONS
+from components.shared_table import simulate_table
+from components.observers import Observers, SessionTally
+
+print("=== Testing Spin Observers ===")
+
+spec = make_spec(strategy="martingale", table_limit=300, num_players=25, num_spins=400, seed=8)
+
+# Test 1: Every engine emits the same events
+print("\n1. Same events from every engine:")
+events = {}
+for engine in ("scalar", "numpy", "numba"):
+    observers = Observers()
+    tally = SessionTally().register(observers)
+    hits, ends = [], []
+    observers.on("limit_hit", hits.append)
+    observers.on("session_end", lambda record: ends.append((record['player'], record['bankroll'])))
+    finals = run_spec(spec, ("final",), engine=engine, observers=observers)['final']
+    events[engine] = (tally.summary(), sorted((hit['player'], hit['spin_number']) for hit in hits), sorted(ends))
+    assert [bankroll for _, bankroll in sorted(ends)] == finals
+print(f"   {events['scalar'][0]}")
+assert events['scalar'] == events['numpy'] == events['numba']
+summary = events['scalar'][0]
+assert summary['spins'] == 25 * 400 and summary['sessions'] == 25 and summary['limit_hits'] > 0
+
+# Observed numba runs go through the numpy engine; fractional money included
+fractional = make_spec(strategy="martingale", base_bet=0.3, initial_bankroll=100.7, table_limit=40, num_players=10,
+                       num_spins=300, seed=9)
+observers = Observers()
+SessionTally().register(observers)
+expected = run_spec(fractional, ("paths",), engine="scalar")
+assert all(run_spec(fractional, ("paths",), engine=engine, observers=observers) == expected
+           for engine in ("numpy", "numba"))
+
+# Test 2: Scalar and batched callbacks see the same spins
+print("\n2. Records and batches:")
+game = build_game(spec, seed=3)
+observers = Observers()
+records, batches = [], []
+observers.on("loss", records.append)
+observers.on("loss", batches.append, batched=True)
+observers.attach(game)
+game.run_simulation(200)
+assert records == [dict(spin, player=0) for spin in game.history if spin['result'] == 'lose']
+assert [int(batch['spin_number'][0]) for batch in batches] == [spin['spin_number'] for spin in records]
+assert all(len(batch['player']) == 1 and not batch['won'][0] for batch in batches)
+print(f"   {len(records)} losses in 200 spins")
+
+# Batches cut into records carry a result
+observers = Observers()
+wins = []
+observers.on("win", wins.append)
+simulate_batch(spec, pocket_matrix("european", [1, 2], 50), observers=observers)
+assert wins and all(record['result'] == 'win' and record['payout'] > 0 for record in wins)
+
+# Test 3: Early termination of iter_spins ends the session
+print("\n3. Session end from iter_spins:")
+game = build_game(spec, seed=3)
+observers = Observers()
+ended = []
+observers.on("session_end", ended.append)
+observers.attach(game, player=7)
+for spin in game.iter_spins():
+    if spin['spin_number'] == 30:
+        break
+print(f"   {ended}")
+assert ended == [{'player': 7, 'spins': 30, 'bankroll': game.player.bankroll, 'net': game.player.bankroll - 1000}]
+
+# Test 4: Pool and table events add up to their results
+print("\n4. Pool and shared table:")
+segments = {"casual": {'win_goal': 100, 'session_spins': {'integers': (20, 200)}},
+            "system": {'strategy': "martingale", 'table_limit': 500, 'stop_loss': 400}}
+pool = PlayerPool.sample(segments, 3000, seed=2)
+for run in (lambda observers: simulate_pool(pool, 500, "american", seed=4, observers=observers),
+            lambda observers: simulate_table(pool, 500, seed=4, observers=observers, records=("final",))):
+    observers = Observers()
+    tally = SessionTally().register(observers)
+    nets = np.zeros(len(pool))
+    observers.on("spin", lambda batch: np.add.at(nets, batch['player'], batch['payout']), batched=True)
+    sessions = []
+    observers.on("session_end", sessions.append, batched=True)
+    results = run(observers)
+    players = np.concatenate([batch['player'] for batch in sessions])
+    assert sorted(players.tolist()) == list(range(len(pool)))
+    assert np.array_equal(nets, results['final'] - pool.initial_bankroll)
+    assert tally.spins == results['played'].sum()
+    print(f"   {tally.summary()['spins']:,} spins, quit reasons "
+          f"{dict(zip(QUIT_REASONS, np.bincount(results['reason'], minlength=4).tolist()))}")
+
+# Test 5: Without observers nothing is wrapped
+game = build_game(spec)
+Observers().attach(game)
+assert 'play_spin' in game.__dict__
+Observers().detach(game)
+assert not {'play_spin', 'run_simulation', 'iter_spins'} & set(game.__dict__)
+assert not Observers()
+print("\n5. Detached games run the class methods")
+
+# Test 6: Unknown events are rejected
+try:
+    Observers().on("jackpot", print)
+    raise AssertionError("expected a ValueError")
+except ValueError as error:
+    print(f"\n6. Rejected: {error}")
+
+print("\n=== Spin Observer Testing Complete! ===")
@@ -0,0 +1,88 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import shutil
+import tempfile
+
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel
+from components.simulation import make_spec, build_game
+from components.spin_log import write_spin_log, ReplayWheel
+from components.player_pool import (PlayerPool, simulate_pool, segment_statistics, QUIT_REASONS,
+                                    WIN_GOAL, STOP_LOSS, BROKE, PLAYED_OUT)
+
+print("=== Testing the Player Pool ===")
+
+# Test 1: A pool built from specs plays exactly like one Game per player
+print("\n1. Same bankrolls as Game:")
+specs = [make_spec(strategy="martingale", table_limit=500, num_players=2),
+         make_spec(bet_type="number", bet_value=17, base_bet=5, num_players=2),
+         make_spec(bet_value="black", base_bet=7, num_players=1)]
+pool = PlayerPool.from_specs(specs)
+results = simulate_pool(pool, 1500, "american", seed=4, records=("paths",), leave_when_broke=False)
+# Player j plays every len(pool)-th spin of the wheel's stream, starting at spin j
+stream = RouletteWheel("american", seed=4).spin_indices(1500 * len(pool))
+folder = tempfile.mkdtemp()
+finals = []
+for j, spec in enumerate(spec for spec in specs for _ in range(spec['num_players'])):
+    game = build_game(spec)
+    game.wheel = ReplayWheel(write_spin_log(os.path.join(folder, f"player{j}.rsl"), "american", stream[j::len(pool)]))
+    game.run_simulation(1500)
+    finals.append(game.player.bankroll)
+shutil.rmtree(folder)
+print(f"   Finals: {results['final'].tolist()}")
+assert results['final'].tolist() == finals
+assert np.array_equal(results['paths'][-1], results['final'])
+
+# Test 2: Sampled attributes follow their distributions and segment shares
+print("\n2. Sampling:")
+segments = {
+    "casual": {'share': 3, 'bet': {'choice': [("color", "red"), ("number", 17)], 'p': [0.8, 0.2]},
+               'base_bet': {'choice': [5, 10]}, 'initial_bankroll': {'lognormal': (300, 0.5)},
+               'win_goal': 100, 'session_spins': {'integers': (20, 200)}},
+    "system": {'share': 1, 'strategy': "martingale", 'table_limit': 1000, 'stop_loss': 500,
+               'initial_bankroll': {'uniform': (1000, 3000)}},
+}
+pool = PlayerPool.sample(segments, 20000, seed=1)
+casual = pool.segment == 0
+print(f"   {len(pool):,} players, {casual.sum():,} casual, bets {pool.groups}")
+assert casual.sum() == 15000 and pool.dtype == np.int64
+assert abs(np.mean(pool.group[casual] == pool.groups.index(("number", 17))) - 0.2) < 0.02
+assert set(np.unique(pool.base_bet[casual])) == {5, 10}
+assert pool.session_spins[casual].min() >= 20 and pool.session_spins[casual].max() <= 200
+assert np.all(pool.martingale == ~casual)
+assert abs(np.median(pool.initial_bankroll[casual]) - 300) < 10
+assert PlayerPool.sample(segments, 20000, seed=1).initial_bankroll.tolist() == pool.initial_bankroll.tolist()
+
+# Test 3: Quitting rules
+print("\n3. Quitting rules:")
+results = simulate_pool(pool, 2000, "european", seed=2)
+net = results['final'] - pool.initial_bankroll
+reason = results['reason']
+assert np.all(net[reason == WIN_GOAL] >= 100)
+assert np.all(net[reason == STOP_LOSS] <= -500)
+assert np.all(results['final'] >= 0)
+assert np.all(results['played'][casual & (reason == PLAYED_OUT)] == pool.session_spins[casual & (reason == PLAYED_OUT)])
+assert np.all(results['played'] <= 2000)
+print(f"   Casual quit reasons: {dict(zip(QUIT_REASONS, np.bincount(reason[casual], minlength=4).tolist()))}")
+assert np.all(reason[~casual] != WIN_GOAL) and np.any(reason == BROKE)
+
+# Test 4: Segment statistics add up
+print("\n4. Segment statistics:")
+statistics = segment_statistics(pool, results)
+for name, row in statistics.items():
+    print(f"   {name:<7} net {row['mean_net']:>8.2f} | hold {row['hold']:.2%} | spins {row['mean_spins']:.0f}")
+assert sum(row['players'] for row in statistics.values()) == len(pool)
+assert abs(sum(row['handle'] for row in statistics.values()) - results['wagered'].sum()) < 1e-6
+
+# Test 5: Bad segments are rejected
+for bad in ({"x": {'colour': "red"}}, {"x": {'bet': {'uniform': (0, 1)}}}):
+    try:
+        PlayerPool.sample(bad, 10)
+        raise AssertionError("expected a ValueError")
+    except ValueError as error:
+        print(f"\n5. Rejected: {error}")
+
+print("\n=== Player Pool Testing Complete! ===")
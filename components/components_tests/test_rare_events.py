@@ -0,0 +1,59 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+
+from components.simulation import make_spec, player_seeds
+from components.batch_engine import pocket_matrix, simulate_batch
+from components.observers import Observers
+from utils.rare_events import (TAIL_EVENTS, estimate_tail_probability, limit_hits_score, log_likelihood_ratios,
+                               nominal_loss_probability, simulate_tilted)
+
+print("=== Testing Importance Sampling ===")
+
+spec = make_spec(strategy="martingale", base_bet=10, table_limit=640, num_spins=100)
+
+# Test 1: Limit hits are spins whose intended bet was cut, as reported to observers
+# ($10 doubles to $640 exactly, so a $640 bet is not a hit; the next doubling is)
+pockets = pocket_matrix("european", player_seeds(dict(spec, num_players=500, seed=1)), 100)
+observers = Observers()
+hits = np.zeros(500, dtype=np.int64)
+observers.on("limit_hit", lambda batch: np.add.at(hits, batch['player'], 1), batched=True)
+results = simulate_batch(spec, pockets, ("paths", "bets"), observers=observers)
+assert np.array_equal(limit_hits_score(results, spec), hits)
+print(f"\n1. Limit hits: {hits.sum()} cut bets, {(results['bets'] == 640).sum()} bets of $640")
+
+# Test 2: Likelihood ratios of tilted players average to 1
+print("\n2. Likelihood ratios:")
+nominal = nominal_loss_probability(spec)
+tilt = np.linspace(nominal, 0.8, 8)
+_, losses, visits = simulate_tilted(spec, "loss_multiple", tilt, 40000, np.random.default_rng(2))
+weights = np.exp(log_likelihood_ratios(losses, visits, nominal, tilt))
+std_error = weights.std() / np.sqrt(len(weights))
+print(f"   mean {weights.mean():.4f} ± {std_error:.4f}")
+assert abs(weights.mean() - 1) < 4 * std_error
+
+# Test 3: Estimates of events that are not rare agree with brute force
+print("\n3. Against brute force (40000 players):")
+brute = dict(spec, num_players=40000, seed=3)
+brute_results = simulate_batch(brute, pocket_matrix("european", player_seeds(brute), 100), ("final", "paths"))
+for event, level in (("loss_multiple", 0.5), ("limit_hits", 2)):
+    hits = TAIL_EVENTS[event][0](brute_results, spec) >= level
+    estimate = estimate_tail_probability(spec, event, level, num_players=20000, seed=4)
+    tolerance = 4 * np.hypot(estimate['std_error'], hits.std() / np.sqrt(len(hits)))
+    print(f"   {event} >= {level}: importance sampling {estimate['probability']:.4f} "
+          f"± {estimate['std_error']:.4f}, brute force {hits.mean():.4f}")
+    assert abs(estimate['probability'] - hits.mean()) < tolerance
+    assert estimate['ci_low'] <= estimate['probability'] <= estimate['ci_high']
+
+# Test 4: Unknown events and weighted wheels are refused
+for call in (lambda: estimate_tail_probability(spec, "jackpot", 1),
+             lambda: nominal_loss_probability(dict(spec, wheel_weights=[1.0] * 37))):
+    try:
+        call()
+        raise AssertionError("expected a ValueError")
+    except ValueError as error:
+        print(f"\n4. Rejected: {error}")
+
+print("\n=== Importance Sampling Testing Complete! ===")
@@ -0,0 +1,74 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import csv
+import json
+import re
+import shutil
+import subprocess
+import tempfile
+import urllib.request
+
+from components.simulation import make_spec
+from utils.parameter_sweep import grid_cells, run_sweep
+
+print("=== Testing Roulette Client ===")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+work_dir = tempfile.mkdtemp()
+
+# A warm daemon on a free port
+process = subprocess.Popen([sys.executable, os.path.join(PROJECT_ROOT, "serve_simulations.py"), "--port", "0",
+                            "--workers", "2", "--cache-dir", os.path.join(work_dir, "cache")],
+                           stdout=subprocess.PIPE, text=True)
+port = re.search(r":(\d+) ", process.stdout.readline()).group(1)
+url = f"http://127.0.0.1:{port}"
+
+
+def client(*arguments):
+    command = [sys.executable, os.path.join(PROJECT_ROOT, "roulette_client.py"), "--url", url, "--no-start",
+               "--quiet", *arguments]
+    return subprocess.run(command, capture_output=True, text=True, check=True).stdout
+
+
+# Test 1: The workers were started and warmed up with the daemon
+print("\n1. Warm daemon:")
+health = json.loads(urllib.request.urlopen(url + "/health").read())
+assert health['warm'] and health['workers'] == 2
+print(f"   {client('status').splitlines()[0]}")
+
+# Test 2: Experiments give the report of run_experiments.py
+print("\n2. run:")
+options = ["--set", "seed=8", "--set", "num_players=150", "--no-plots"]
+report = client("run", "mc_flat_*", *options)
+expected = subprocess.run([sys.executable, os.path.join(PROJECT_ROOT, "run_experiments.py"), "mc_flat_*", *options],
+                          capture_output=True, text=True, check=True).stdout
+assert report.strip() and report in expected
+print(f"   {len(report.splitlines())} report lines, as run_experiments.py")
+
+# Test 3: Sweeps give the rows of run_sweep
+print("\n3. sweep:")
+output = os.path.join(work_dir, "sweep.csv")
+client("sweep", "--axis", "table_limit=100,1000", "--axis", "wheel_type=european,triple", "--players", "200",
+       "--spins", "150", "--seed", "9", "--output", output)
+with open(output) as f:
+    rows = list(csv.DictReader(f))
+base = make_spec(strategy="martingale", num_players=200, num_spins=150, seed=9)
+cells = grid_cells({'table_limit': [100, 1000], 'wheel_type': ["european", "triple"]})
+for row, expected_row in zip(rows, run_sweep(cells, base, verbose=False)):
+    for name in ("p_ruin", "mean_final", "p_bankrupt"):
+        assert float(row[name]) == expected_row[name], (row, name)
+assert len(rows) == 4
+print(f"   {len(rows)} cells, as run_sweep")
+
+# Test 4: Without a daemon, --no-start fails cleanly
+result = subprocess.run([sys.executable, os.path.join(PROJECT_ROOT, "roulette_client.py"), "--url",
+                         "http://127.0.0.1:9", "--no-start", "status"], capture_output=True, text=True)
+assert result.returncode != 0 and "No simulation service" in result.stderr
+print("\n4. No daemon: refused with --no-start")
+
+process.terminate()
+process.wait()
+shutil.rmtree(work_dir)
+print("\n=== Roulette Client Testing Complete! ===")
@@ -0,0 +1,88 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+from components.simulation import make_spec, run_spec
+from components.shared_results import SharedArrays, shared_layout, simulate_shared, _fill_rows
+
+print("=== Testing Shared-Memory Results ===")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+spec = make_spec(strategy="martingale", table_limit=500, num_players=90, num_spins=300, seed=4)
+records = ("final", "paths", "bets", "lowest")
+
+# Test 1: Rows written range by range (as pool tasks do) equal the whole run
+print("\n1. Rows filled through shared memory:")
+for engine in ("scalar", "numpy", "numba"):
+    expected = run_spec(spec, records, engine=engine)
+    with SharedArrays(shared_layout(spec, records)) as shared:
+        for start in range(0, 90, 40):
+            _fill_rows(shared.handles(), spec, records, engine, start, min(start + 40, 90))
+        for record in records:
+            assert shared.arrays[record].tolist() == expected[record], (engine, record)
+        name = shared.handles()['paths'][0]
+        print(f"   {engine}: {shared.arrays['paths'].shape} paths in block {name}")
+
+# Closing frees the blocks
+try:
+    shared_memory.SharedMemory(name=name)
+    raise AssertionError("expected the block to be gone")
+except FileNotFoundError:
+    pass
+
+# Test 2: Fractional money is shared as floats; Python-int money is refused
+print("\n2. Dtypes:")
+print(f"   {shared_layout(make_spec(base_bet=2.5), ['final'])}")
+try:
+    shared_layout(make_spec(base_bet=2 ** 70), ["final"])
+    raise AssertionError("expected a ValueError")
+except ValueError as error:
+    print(f"   Rejected: {error}")
+
+# Test 3: Experiments give the same report with worker processes
+print("\n3. run_experiments.py --workers:")
+
+
+def report(*options):
+    command = [sys.executable, os.path.join(PROJECT_ROOT, "run_experiments.py"), "mc_flat_european",
+               "mc_martingale_european", "--set", "seed=3", "--set", "num_players=1200", "--set", "num_spins=200",
+               "--no-plots", *options]
+    return subprocess.run(command, capture_output=True, text=True, check=True).stdout
+
+
+for engine in ("scalar", "numpy"):
+    single = report("--engine", engine)
+    assert single == report("--engine", engine, "--workers", "2")
+    print(f"   {engine}: identical ({len(single.splitlines())} lines)")
+
+# Profiling only sees this process, so it is refused with workers
+refused = subprocess.run([sys.executable, os.path.join(PROJECT_ROOT, "run_experiments.py"), "mc_flat_european",
+                          "--workers", "2", "--profile"], capture_output=True, text=True)
+assert refused.returncode == 2 and "without --workers" in refused.stderr
+print(f"   --profile with --workers rejected: {refused.stderr.splitlines()[-1]}")
+
+# Test 4: By default the players are split evenly over the workers
+class CountingPool(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=4)
+        self.tasks = []
+
+    def submit(self, function, *args):
+        self.tasks.append(args[-2:])
+        return super().submit(function, *args)
+
+
+print("\n4. Default split:")
+expected = run_spec(spec, records, engine="numpy")
+for workers, tasks in ((4, [(0, 23), (23, 46), (46, 69), (69, 90)]), (None, [(0, 90)])):
+    with CountingPool() as pool:
+        arrays = simulate_shared(spec, records, workers=workers, pool=pool)
+    assert pool.tasks == tasks
+    assert all(arrays[record].tolist() == expected[record] for record in records)
+    print(f"   workers={workers}: tasks {pool.tasks}")
+
+print("\n=== Shared-Memory Results Testing Complete! ===")
@@ -0,0 +1,73 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import shutil
+import tempfile
+
+import numpy as np
+
+from components.simulation import make_spec, build_game
+from components.spin_log import write_spin_log, ReplayWheel
+from components.player_pool import group_returns
+from components.shared_table import simulate_table, house_summary
+
+print("=== Testing the Shared Table ===")
+
+specs = [
+    make_spec(wheel_type="american", strategy="martingale", table_limit=500, num_players=3),
+    make_spec(wheel_type="american", bet_type="number", bet_value=17, base_bet=5, num_players=2),
+    make_spec(wheel_type="american", bet_value="black", base_bet=7, num_players=2),
+]
+
+# Test 1: Every player ends where a Game on the same spins ends
+print("\n1. Same bankrolls as one Game per player:")
+results = simulate_table(specs, 2000, seed=3, records=("final", "paths", "lowest"), leave_when_broke=False)
+folder = tempfile.mkdtemp()
+path = write_spin_log(os.path.join(folder, "table.rsl"), "american", results['pockets'])
+finals = []
+for spec in specs:
+    for _ in range(spec['num_players']):
+        game = build_game(spec)
+        game.wheel = ReplayWheel(path)
+        game.run_simulation(2000)
+        finals.append(game.player.bankroll)
+shutil.rmtree(folder)
+print(f"   Finals: {results['final'].tolist()}")
+assert results['final'].tolist() == finals
+assert np.array_equal(results['paths'][-1], results['final'])
+assert np.array_equal(results['lowest'], results['paths'].min(axis=0))
+
+# Test 2: The house wins exactly what the players lose
+print("\n2. House P&L:")
+initial = np.array([spec['initial_bankroll'] for spec in specs for _ in range(spec['num_players'])])
+assert results['house_pnl'].sum() == (initial - results['final']).sum()
+assert results['handle'].sum() == results['group_handle'].sum()
+summary = house_summary(results)
+print(f"   {summary}")
+assert abs(summary['expected_hold'] - 2 / 38) < 1e-12
+
+# Test 3: Exposure is the largest payout over all pockets of the spin's bets
+print("\n3. Exposure:")
+first = simulate_table(specs, 1, seed=3)
+returns = group_returns("american", first['groups'])
+stakes = np.array([3 * 10, 2 * 5, 2 * 7])
+assert first['exposure'][0] == (stakes @ returns).max()
+print(f"   First spin exposure ${first['exposure'][0]:,.0f}")
+
+# Test 4: Players who cannot cover their bet leave the table
+print("\n4. Leaving when broke:")
+broke = simulate_table(make_spec(strategy="martingale", initial_bankroll=100, num_players=50), 3000, seed=1,
+                       records=("final", "lowest"))
+print(f"   Seated after 3,000 spins: {broke['active'][-1]} of 50")
+assert broke['lowest'].min() >= 0
+assert np.all(np.diff(broke['active']) <= 0)
+
+# Test 5: Specs on different wheels cannot share a table
+try:
+    simulate_table([make_spec(wheel_type="european"), make_spec(wheel_type="american")], 10)
+    raise AssertionError("expected a ValueError")
+except ValueError as error:
+    print(f"\n5. Mixed wheels rejected: {error}")
+
+print("\n=== Shared Table Testing Complete! ===")
@@ -0,0 +1,36 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from components.simulation import make_spec, spec_key, run_spec, build_game, spec_from_game
+
+print("=== Testing Simulation Specs ===")
+
+# Two identical specs must share the same key (this is what deduplication uses)
+spec_a = make_spec(wheel_type="american", num_players=5, num_spins=50, seed=7)
+spec_b = make_spec(wheel_type="american", num_players=5, num_spins=50, seed=7)
+print(f"\n1. Identical specs share a key: {spec_key(spec_a) == spec_key(spec_b)}")
+assert spec_key(spec_a) == spec_key(spec_b)
+
+# Running a seeded spec twice gives exactly the same players
+print("\n2. Seeded runs are reproducible:")
+first = run_spec(spec_a, records=("final", "paths", "bets"))
+second = run_spec(spec_b, records=("final", "paths", "bets"))
+print(f"   Final bankrolls: {first['final']}")
+assert first == second
+
+# Paths start at the initial bankroll and end at the final bankroll
+print(f"   Path length: {len(first['paths'][0])} (1 start + {spec_a['num_spins']} spins)")
+assert all(path[-1] == final for path, final in zip(first['paths'], first['final']))
+
+# A game that has already played describes the run from its first spin
+game = build_game(make_spec(strategy="martingale", table_limit=500, initial_bankroll=750), seed=7)
+game.run_simulation(200)
+replay = build_game(spec_from_game(game), seed=7)
+replay.run_simulation(200)
+print(f"\n3. Spec of a played game: starts at ${replay.player.initial_bankroll}, "
+      f"replays to ${replay.player.bankroll} (game: ${game.player.bankroll})")
+assert spec_from_game(game)['initial_bankroll'] == 750
+assert replay.history == game.history
+
+print("\n=== Simulation Testing Complete! ===")
@@ -0,0 +1,115 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import json
+import re
+import shutil
+import subprocess
+import tempfile
+import urllib.error
+import urllib.request
+
+from components.simulation import make_spec, run_spec
+
+print("=== Testing Simulation Service ===")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+cache_dir = tempfile.mkdtemp()
+
+
+def start_service():
+    """Run serve_simulations.py on a free port; returns (process, base url)"""
+    process = subprocess.Popen([sys.executable, os.path.join(PROJECT_ROOT, "serve_simulations.py"), "--port", "0",
+                                "--workers", "2", "--max-running", "1", "--max-queued", "2",
+                                "--players-per-task", "300", "--cache-dir", cache_dir],
+                               stdout=subprocess.PIPE, text=True)
+    port = re.search(r":(\d+) ", process.stdout.readline()).group(1)
+    return process, f"http://127.0.0.1:{port}"
+
+
+def call(method, path, body=None):
+    """(status, headers, body bytes) of one request"""
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url + path, data=data, method=method),
+                                    timeout=120) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as error:
+        return error.code, error.headers, error.read()
+
+
+process, url = start_service()
+
+# Test 1: A spec job streams its progress and returns the results of run_spec
+print("\n1. Spec job:")
+spec = {'strategy': "martingale", 'table_limit': 500, 'num_players': 1000, 'num_spins': 400, 'seed': 5}
+status, _, body = call("POST", "/jobs", {'spec': spec, 'records': ["final", "lowest"]})
+job = json.loads(body)
+assert status == 202 and job['status'] == "queued"
+status, _, body = call("GET", f"/jobs/{job['id']}/events")
+events = [json.loads(line) for line in body.decode("utf-8").splitlines()]
+progress = [event['progress'] for event in events]
+assert events[-1]['status'] == "done" and progress == sorted(progress)
+print(f"   {len(events)} events, progress {progress}")
+
+status, _, body = call("GET", f"/jobs/{job['id']}")
+result = json.loads(body)['result']
+expected = run_spec(make_spec(**spec), ("final", "lowest"), engine="numpy")
+assert result['results'] == expected
+print(f"   {result['summary']}")
+
+# The same job (defaults spelled out, keys reordered) is not run again
+status, _, body = call("POST", "/jobs", {'engine': "numpy", 'spec': dict(reversed(list(spec.items())), bet_type="color"),
+                                         'records': ["lowest", "final"]})
+assert status == 200 and json.loads(body)['id'] == job['id'] and json.loads(body)['deduplicated']
+
+# Test 2: An experiment job renders plots that the service serves
+print("\n2. Experiment job:")
+status, _, body = call("POST", "/jobs", {'experiments': ["mc_flat_european"],
+                                         'config': {'num_players': 20, 'num_spins': 100, 'seed': 1}})
+experiment = json.loads(body)
+call("GET", f"/jobs/{experiment['id']}/events")
+status, _, body = call("GET", f"/jobs/{experiment['id']}")
+plots = json.loads(body)['result']['plots']
+status, headers, image = call("GET", plots[0])
+assert status == 200 and headers['Content-Type'] == "image/png" and image[:4] == b"\x89PNG"
+print(f"   {len(plots)} plots, e.g. {plots[0]} ({len(image):,} bytes)")
+assert call("GET", f"/jobs/{experiment['id']}/plots/..%2Fresult.json")[0] == 404
+
+# Test 3: A full queue answers 429 instead of piling up jobs
+print("\n3. Backpressure:")
+call("POST", "/jobs", {'spec': {'strategy': "martingale", 'num_players': 40000, 'num_spins': 2000}})
+answers = [call("POST", "/jobs", {'spec': {'num_players': 10}}) for _ in range(4)]
+statuses = [status for status, _, _ in answers]
+print(f"   {statuses}")
+assert statuses.count(202) == 2 and statuses.count(429) == 2
+assert all(headers['Retry-After'] for status, headers, _ in answers if status == 429)
+
+# Test 4: Bad requests are refused
+print("\n4. Errors:")
+for method, path, body, code in (("POST", "/jobs", {'spec': {'colour': "red"}}, 400),
+                                 ("POST", "/jobs", {'experiments': ["jackpot"]}, 400),
+                                 ("POST", "/jobs", {'experiments': ["mc_flat_european"],
+                                                    'config': {'num_player': 5}}, 400),
+                                 ("GET", "/jobs/unknown", None, 404),
+                                 ("DELETE", "/jobs", None, 405)):
+    status, _, body = call(method, path, body)
+    assert status == code, (path, status)
+    print(f"   {code}: {json.loads(body)['error'][:60]}")
+
+process.terminate()
+process.wait()
+
+# Test 5: Cached results survive a restart
+process, url = start_service()
+status, _, body = call("POST", "/jobs", {'spec': spec, 'records': ["final", "lowest"]})
+assert status == 200 and json.loads(body)['status'] == "done"
+status, _, body = call("GET", f"/jobs/{job['id']}")
+assert json.loads(body)['result']['results'] == expected
+print("\n5. Results served from the cache after a restart")
+process.terminate()
+process.wait()
+
+shutil.rmtree(cache_dir)
+print("\n=== Simulation Service Testing Complete! ===")
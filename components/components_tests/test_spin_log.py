@@ -0,0 +1,104 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import shutil
+import tempfile
+
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel
+from components.player import Player
+from components.game import Game
+from components.batch_engine import simulate_batch
+from components.simulation import make_spec
+from components.spin_log import (record_spin_log, read_spin_log_header, ReplayWheel,
+                                 SpinLogWriter, replay_pocket_matrix)
+from utils.spin_log_import import iter_spin_chunks
+
+print("=== Testing Spin Logs ===")
+
+folder = tempfile.mkdtemp()
+path = os.path.join(folder, "american.rsl")
+
+# Test 1: Recording a wheel writes one byte per spin after the header
+print("\n1. Recording:")
+record_spin_log(path, RouletteWheel("american", seed=5), 100000, chunk_size=30000)
+header = read_spin_log_header(path)
+print(f"   Header: {header}, file size {os.path.getsize(path):,} bytes")
+assert header['wheel_type'] == "american" and header['num_spins'] == 100000
+
+# Test 2: The replay wheel returns exactly the recorded spins (scalar and bulk mixed)
+print("\n2. Replay:")
+expected = RouletteWheel("american", seed=5).spin_indices(100000)
+replay = ReplayWheel(path)
+scalar = [replay.spin() for _ in range(10)]
+assert scalar == [replay.numbers[i] for i in expected[:10]]
+assert np.array_equal(replay.spin_indices(50000), expected[10:50010])
+assert replay.spin() == replay.numbers[expected[50010]]
+print(f"   Identical to the original wheel, {replay.remaining():,} spins left")
+
+# Test 3: A Game backtested on the log matches the Game on the original wheel
+print("\n3. Backtest a Game:")
+results = []
+for wheel in (RouletteWheel("american", seed=5), ReplayWheel(path)):
+    player = Player(strategy="martingale", initial_bankroll=1000, base_bet=10)
+    player.bet_type, player.bet_value = "color", "red"
+    game = Game(wheel, player, table_limit=500)
+    game.run_simulation(2000)
+    results.append(game.player.bankroll)
+print(f"   Final bankrolls: {results}")
+assert results[0] == results[1]
+
+# Test 4: Batch engine on consecutive stretches of the log
+pockets = replay_pocket_matrix(path, 10, 1000)
+finals = simulate_batch(make_spec(wheel_type="american", num_players=10, num_spins=1000), pockets)['final']
+assert np.array_equal(pockets[1], expected[1000:2000])
+print(f"\n4. Batch replay of 10 players: first finals {finals[:3].tolist()}")
+
+# Test 5: Running past the end fails unless looping
+try:
+    ReplayWheel(path, start=99990).spin_indices(20)
+    raise AssertionError("expected a ValueError")
+except ValueError as error:
+    print(f"\n5. Exhausted log rejected: {error}")
+looped = ReplayWheel(path, start=99990, loop=True).spin_indices(20)
+assert np.array_equal(looped, np.concatenate([expected[99990:], expected[:10]]))
+
+# Test 6: Invalid pocket indices are rejected by the writer
+with SpinLogWriter(os.path.join(folder, "bad.rsl"), "european") as log:
+    try:
+        log.write([0, 37])
+        raise AssertionError("expected a ValueError")
+    except ValueError as error:
+        print(f"\n6. Invalid pockets rejected: {error}")
+
+# A recording that was flushed but never closed replays the spins it wrote
+log = SpinLogWriter(os.path.join(folder, "unclosed.rsl"), "european")
+log.write(expected[:30] % 37)
+log._file.flush()
+unclosed = ReplayWheel(log.path)
+assert read_spin_log_header(log.path)['num_spins'] == 30
+assert np.array_equal(unclosed.spin_indices(30), expected[:30] % 37)
+log.close()
+print("   Unclosed log replays its 30 flushed spins")
+
+# Test 7: Text logs on a single line are read in bounded chunks
+text_path = os.path.join(folder, "spins.txt")
+wheel = RouletteWheel("american", seed=6)
+numbers = [wheel.numbers[i] for i in wheel.spin_indices(5000)]
+with open(text_path, "w") as f:
+    f.write(",".join(str(number) for number in numbers))
+chunks = list(iter_spin_chunks(text_path, "american", chunk_bytes=1000))
+assert [wheel.numbers[i] for i in np.concatenate(chunks)] == numbers and len(chunks) > 10
+print(f"\n7. One-line text log: {len(numbers)} spins in {len(chunks)} chunks")
+with open(text_path, "w") as f:
+    f.write("17," + "1" * 3000)
+try:
+    list(iter_spin_chunks(text_path, "american", chunk_bytes=1000))
+    raise AssertionError("expected a ValueError")
+except ValueError as error:
+    print(f"   Rejected: {error}")
+
+shutil.rmtree(folder)
+print("\n=== Spin Log Testing Complete! ===")
@@ -0,0 +1,83 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import csv
+import io
+import tracemalloc
+
+from components.simulation import make_spec, build_game
+from components.spin_stream import SpinStatistics, BankrollSampler, RecordWriter, consume
+
+print("=== Testing Lazy Spin Streams ===")
+
+spec = make_spec(wheel_type="american", strategy="martingale", table_limit=500)
+
+# Test 1: iter_spins plays the same session as run_simulation
+print("\n1. Same records as run_simulation:")
+eager = build_game(spec, seed=11)
+eager.run_simulation(2000)
+lazy = build_game(spec, seed=11)
+records = list(lazy.iter_spins(2000))
+assert records == eager.history and lazy.history == []
+chunked = build_game(spec, seed=11)
+chunks = list(chunked.iter_spins(2000, chunk_size=300))
+assert [len(chunk) for chunk in chunks] == [300] * 6 + [200]
+assert [record for chunk in chunks for record in chunk] == eager.history
+print(f"   2,000 spins, final bankroll ${records[-1]['bankroll']}")
+
+# Test 2: The consumer decides when to stop; no spin is played ahead of it
+print("\n2. Early termination:")
+game = build_game(spec, seed=11)
+for record in game.iter_spins():
+    if record['bankroll'] < 900:
+        break
+print(f"   Stopped below $900 after {game.spins_played} spins")
+assert game.spins_played == record['spin_number'] and game.player.bankroll == record['bankroll']
+# Resuming continues the same session
+assert next(game.iter_spins())['spin_number'] == game.spins_played
+
+# Test 3: Consumers match the eager history
+print("\n3. Streaming consumers:")
+game = build_game(spec, seed=11)
+file = io.StringIO()
+stats, sampler, writer = consume(game.iter_spins(2000, chunk_size=256),
+                                 SpinStatistics(spec['initial_bankroll']), BankrollSampler(100), RecordWriter(file))
+summary = stats.summary()
+bankrolls = [spec['initial_bankroll']] + [record['bankroll'] for record in eager.history]
+peaks = [max(bankrolls[:i + 1]) for i in range(len(bankrolls))]
+print(f"   {summary}")
+assert summary['spins'] == 2000 and summary['final_bankroll'] == eager.player.bankroll
+assert summary['net'] == eager.player.bankroll - spec['initial_bankroll']
+assert summary['wagered'] == sum(record['bet_amount'] for record in eager.history)
+assert summary['lowest_bankroll'] == min(bankrolls) and summary['peak_bankroll'] == max(bankrolls)
+assert summary['max_drawdown'] == max(p - b for p, b in zip(peaks, bankrolls))
+assert len(sampler.bankrolls) <= 100 and sampler.stride == 32
+assert all(eager.history[n - 1]['bankroll'] == b for n, b in zip(sampler.spin_numbers, sampler.bankrolls))
+rows = list(csv.DictReader(io.StringIO(file.getvalue())))
+assert writer.rows == len(rows) == 2000 and float(rows[-1]['bankroll']) == eager.player.bankroll
+
+# Test 4: until stops the session
+stats = consume(build_game(spec, seed=11).iter_spins(), SpinStatistics(), until=lambda record: record['spin_number'] == 777)
+assert stats.spins == 777
+print(f"\n4. until stopped after {stats.spins} spins")
+
+# Test 5: Long sessions run in bounded memory
+print("\n5. Memory:")
+game = build_game(make_spec(), seed=3)
+tracemalloc.start()
+consume(game.iter_spins(20000), SpinStatistics(), BankrollSampler(256))
+peak = tracemalloc.get_traced_memory()[1]
+tracemalloc.stop()
+print(f"   Peak {peak / 1024:.0f} KiB for 20,000 spins")
+assert peak < 512 * 1024 and game.history == []
+
+# Test 6: Bad arguments
+for bad in ({'num_spins': -1}, {'chunk_size': 0}):
+    try:
+        next(build_game(spec, seed=11).iter_spins(**bad))
+        raise AssertionError("expected a ValueError")
+    except ValueError as error:
+        print(f"\n6. Rejected: {error}")
+
+print("\n=== Lazy Spin Stream Testing Complete! ===")
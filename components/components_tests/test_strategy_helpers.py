@@ -0,0 +1,94 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import matplotlib
+matplotlib.use("Agg")
+
+import numpy as np
+
+from components.simulation import build_game, make_spec, player_seeds
+from components.batch_engine import pocket_matrix, simulate_batch
+from utils.strategy_helpers import analyze_martingale_population, analyze_martingale_risk, combine_population_risk
+
+print("=== Testing Martingale Risk Analysis ===")
+
+
+def sequence_lengths(bets):
+    """Lengths of the doubling sequences of one player (a sequence ends when the bet does not go up)"""
+    lengths = [1]
+    for previous, bet in zip(bets, bets[1:]):
+        if bet > previous:
+            lengths[-1] += 1
+        else:
+            lengths.append(1)
+    return lengths
+
+
+def compare(spec):
+    """Population analysis of a bet matrix vs analyze_martingale_risk on each player's Game"""
+    games = [build_game(spec, seed) for seed in player_seeds(spec)]
+    for game in games:
+        game.run_simulation(spec['num_spins'])
+    bet_matrix = np.array([[spin['bet_amount'] for spin in game.history] for game in games])
+
+    max_bets, bet_counts, lengths = [], {}, {}
+    for game in games:
+        max_bet, counts, bets = analyze_martingale_risk(game)
+        max_bets.append(max_bet)
+        for bet, count in counts.items():
+            bet_counts[bet] = bet_counts.get(bet, 0) + count
+        for length in sequence_lengths(bets):
+            lengths[length] = lengths.get(length, 0) + 1
+    longest = [max(sequence_lengths(row.tolist())) for row in bet_matrix]
+
+    # Small chunks, so sequences are never merged across chunk or row boundaries
+    for chunk_size in (spec['num_players'], 7):
+        analysis = analyze_martingale_population(bet_matrix, chunk_size=chunk_size)
+        assert analysis['num_players'] == spec['num_players']
+        assert analysis['num_spins'] == spec['num_spins']
+        assert analysis['bet_counts'] == bet_counts
+        assert analysis['sequence_lengths'] == lengths
+        assert analysis['max_bets'].tolist() == max_bets
+        assert analysis['longest_sequence'].tolist() == longest
+    return bet_matrix, analysis
+
+
+# Test 1: Same seeded histories, without a table limit
+spec = make_spec(strategy="martingale", base_bet=10, table_limit=None, initial_bankroll=10 ** 6,
+                 num_players=40, num_spins=300, seed=11)
+bets, analysis = compare(spec)
+print(f"\n1. No limit: {sum(analysis['sequence_lengths'].values())} sequences, "
+      f"longest {analysis['longest_sequence'].max()} bets, max bet ${analysis['max_bets'].max():,}")
+
+# Test 2: Capped bets (a bet held at the limit starts a new sequence in both analyses)
+limited = dict(spec, table_limit=160, seed=12)
+limited_bets, analysis = compare(limited)
+assert analysis['max_bets'].max() == 160
+print(f"\n2. $160 limit: {analysis['bet_counts'].get(160, 0)} sequences reach the limit")
+
+# Test 3: The batch engine bets match the Game histories, so its matrix gives the same analysis
+for case, matrix in ((spec, bets), (limited, limited_bets)):
+    pockets = pocket_matrix(case['wheel_type'], player_seeds(case), case['num_spins'])
+    assert np.array_equal(simulate_batch(case, pockets, ("bets",))['bets'], matrix)
+print("\n3. Batch engine bet matrices match the Game histories")
+
+# Test 4: Analyses of separate groups of players combine into the analysis of all of them
+combined = combine_population_risk([analyze_martingale_population(bets[:15]),
+                                    analyze_martingale_population(bets[15:])])
+whole = analyze_martingale_population(bets)
+for key in ('num_players', 'num_spins', 'sequence_lengths', 'bet_counts', 'max_bet_distribution'):
+    assert combined[key] == whole[key], key
+assert np.array_equal(combined['max_bets'], whole['max_bets'])
+print("\n4. Combined chunk analyses equal the whole-population analysis")
+
+# Test 5: Invalid matrices are rejected
+for invalid in (np.zeros(5), np.zeros((3, 0))):
+    try:
+        analyze_martingale_population(invalid)
+        raise AssertionError("expected ValueError")
+    except ValueError:
+        pass
+print("\n5. Invalid bet matrices rejected")
+
+print("\n=== Martingale Risk Analysis Testing Complete! ===")
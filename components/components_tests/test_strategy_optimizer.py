@@ -0,0 +1,72 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+
+from components.batch_engine import pocket_matrix, simulate_batch
+from utils.strategy_optimizer import (EVALUATION_CACHE, apply_session_rules, block_seeds, candidate_metrics,
+                                      candidate_spec, evaluate_candidates, pareto_layers, successive_halving)
+
+print("=== Testing Strategy Optimizer ===")
+
+# Test 1: Session rules stop each player at the first spin that reaches them
+print("\n1. Session rules:")
+paths = np.array([[100, 90, 80, 70, 120],     # stop-loss at spin 3 (70 <= 75)
+                  [100, 110, 130, 90, 95],    # win goal at spin 2 (130 >= 125)
+                  [100, 95, 90, 85, 80],      # plays every spin, touches the ruin level
+                  [100, 100, 100, 100, 100]])
+final, ruined, played = apply_session_rules(paths, 100, stop_loss=25, win_goal=25, ruin_level=85)
+print(f"   final {final.tolist()}, ruined {ruined.tolist()}, played {played.tolist()}")
+assert final.tolist() == [70, 130, 80, 100] and played.tolist() == [3, 2, 4, 4]
+assert ruined.tolist() == [True, False, True, False]
+# Without rules the whole path is played
+final, _, played = apply_session_rules(paths, 100)
+assert final.tolist() == paths[:, -1].tolist() and played.tolist() == [4] * 4
+
+# Test 2: Pareto layers
+points = [(1, 5), (2, 2), (5, 1), (3, 3), (4, 4), (6, 6), (2, 2)]
+layers = pareto_layers(points)
+print(f"\n2. Pareto layers of {points}: {layers.tolist()}")
+assert layers.tolist() == [0, 0, 0, 1, 2, 3, 0]
+
+# Test 3: Block sums equal a direct simulation of the same seeded players
+print("\n3. Candidate evaluation:")
+base = {'initial_bankroll': 500, 'num_spins': 200}
+candidate = {'strategy': "martingale", 'base_bet': 5, 'table_limit': 320, 'stop_loss': 300, 'win_goal': 100}
+EVALUATION_CACHE.clear()
+sums = evaluate_candidates([candidate], base, range(2), 150, seed=7)[0]
+spec = candidate_spec(candidate, base, 300)
+seeds = list(block_seeds(7, 0, 150)) + list(block_seeds(7, 1, 150))
+paths = simulate_batch(spec, pocket_matrix("european", seeds, 200), ("paths",))['paths']
+final, ruined, played = apply_session_rules(paths, 500, 300, 100)
+expected = candidate_metrics((300, final.sum(), (final.astype(float) ** 2).sum(), ruined.sum(), np.sum(final > 500),
+                              played.sum()), 500)
+assert candidate_metrics(sums, 500) == expected
+print(f"   {expected}")
+cached = len(EVALUATION_CACHE)
+evaluate_candidates([candidate], base, range(2), 150, seed=7)
+assert len(EVALUATION_CACHE) == cached == 2
+
+# Test 4: Successive halving keeps the front and spends the budget on the survivors
+print("\n4. Successive halving:")
+candidates = [{'strategy': "flat", 'base_bet': bet, 'win_goal': goal} for bet in (5, 10, 25) for goal in (None, 50)] + \
+             [{'strategy': "martingale", 'base_bet': bet, 'table_limit': limit, 'stop_loss': stop, 'win_goal': goal}
+              for bet in (5, 10) for limit in (160, 640) for stop in (None, 250) for goal in (None, 50)]
+search = successive_halving(candidates, base, block_players=100, eta=3, max_players=900, seed=11, verbose=False)
+print(f"   {search['rounds']} rounds, {len(search['survivors'])} survivors, front "
+      f"{[(row['table_limit'], round(row['expected_loss'], 2), row['p_ruin']) for row in search['front']]}")
+# 22 candidates, then the best third (7), then the best third of those (2)
+assert search['rounds'] == 3
+assert [sum(row['round'] >= r for row in search['candidates']) for r in range(3)] == [22, 7, 2]
+assert all(row['players'] == 900 for row in search['survivors'])
+survivor_points = [(row['expected_loss'], row['p_ruin']) for row in search['survivors']]
+front_points = [(row['expected_loss'], row['p_ruin']) for row in search['front']]
+assert sorted(front_points) == sorted(point for point, layer in zip(survivor_points, pareto_layers(survivor_points))
+                                      if layer == 0)
+# Eliminated candidates were measured on fewer players
+assert all(row['players'] < 900 for row in search['candidates'] if row not in search['survivors'])
+assert successive_halving(candidates, base, block_players=100, eta=3, max_players=900, seed=11,
+                          verbose=False)['front'] == search['front']
+
+print("\n=== Strategy Optimizer Testing Complete! ===")
@@ -0,0 +1,61 @@
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel
+from components.batch_engine import house_edge
+from components.simulation import make_spec, run_spec
+from components.wheel_bias import sector_bias_weights, worn_pocket_weights, bet_edges
+
+print("=== Testing Weighted Wheels ===")
+
+# Test 1: Fair wheels are unchanged (same seeded stream, same house edge)
+print("\n1. Fair wheel:")
+fair = RouletteWheel("european", seed=7).spin_indices(5000)
+uniform = RouletteWheel("european", seed=7, weights=None).spin_indices(5000)
+assert np.array_equal(fair, uniform)
+edge = house_edge("european", "color", "red", weights=[1] * 37)
+print(f"   Red house edge with equal weights: {edge:.4%}")
+assert abs(edge - 1 / 37) < 1e-12
+
+# Test 2: Alias sampling follows the pocket weights
+print("\n2. Sampling frequencies:")
+weights = sector_bias_weights("european", 17, 4, 1.0)
+counts = np.bincount(RouletteWheel("european", seed=1, weights=weights).spin_indices(1000000), minlength=37)
+error = np.abs(counts / 1000000 - weights).max()
+print(f"   Largest frequency error over 1,000,000 spins: {error:.5f}")
+assert error < 0.002
+
+# Test 3: Scalar spins and bulk indices come from the same stream
+print("\n3. Scalar vs bulk:")
+worn = worn_pocket_weights("american", ['00', 5], 3)
+wheel = RouletteWheel("american", seed=2, weights=worn)
+spins = [wheel.spin() for _ in range(300)]
+indices = RouletteWheel("american", seed=2, weights=worn).spin_indices(300)
+assert spins == [wheel.numbers[i] for i in indices]
+print("   300 spins identical")
+
+# Test 4: A biased pocket changes the exact house edge
+print("\n4. House edge on a worn wheel:")
+edges = bet_edges("american", worn)
+print(f"   Straight-up 00: {edges[('number', '00')]:.4%}, straight-up 17: {edges[('number', 17)]:.4%}")
+assert edges[('number', '00')] < 0 < edges[('number', 17)]
+
+# Test 5: Every engine gives the same bankrolls on a weighted wheel
+print("\n5. Engines on a weighted wheel:")
+spec = make_spec(strategy="martingale", table_limit=1000, wheel_weights=weights, num_players=20, num_spins=300, seed=3)
+records = ("final", "paths", "bets", "lowest")
+results = [run_spec(spec, records, engine=engine) for engine in ("scalar", "numpy", "numba")]
+print(f"   identical = {results[0] == results[1] == results[2]}")
+assert results[0] == results[1] == results[2]
+
+# Test 6: Bad weights are rejected
+try:
+    RouletteWheel("european", weights=[1] * 36)
+    raise AssertionError("expected a ValueError")
+except ValueError as error:
+    print(f"\n6. Invalid weights rejected: {error}")
+
+print("\n=== Weighted Wheel Testing Complete! ===")
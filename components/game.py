@@ -9,6 +9,9 @@ class Game:
         
         # List to store history of all spins and results
         self.history = []
+
+        # Spins played so far (iter_spins can play without recording history)
+        self.spins_played = 0
         
         # Define which numbers are red on the roulette wheel
         self.red_numbers = [1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36]
@@ -35,6 +38,12 @@ class Game:
         return False
 
     def run_spin(self):
+        # Play one spin and keep its record in the history
+        spin_record = self.play_spin()
+        self.history.append(spin_record)
+        return spin_record
+
+    def play_spin(self):
         # 1. Player decides how much they WANT to bet
         intended_bet = self.player.place_bet()
         
@@ -59,9 +68,10 @@ class Game:
         # 6. Update player
         self.player.process_result(won, payout)
         
-        # 7. Record history
+        # 7. Build the spin record
+        self.spins_played += 1
         spin_record = {
-            'spin_number': len(self.history) + 1,
+            'spin_number': self.spins_played,
             'spin_result': spin_result,
             'bet_amount': actual_bet,
             'intended_bet': intended_bet,
@@ -71,8 +81,6 @@ class Game:
             'payout': payout,
             'bankroll': self.player.bankroll
         }
-        
-        self.history.append(spin_record)
         return spin_record
 
     def run_simulation(self, num_spins):
@@ -83,4 +91,34 @@ class Game:
             # This lets us see the full mathematical trend and prevents plotting errors.
             self.run_spin()
             
-        return self.history
\ No newline at end of file
+        return self.history
+
+    def iter_spins(self, num_spins=None, chunk_size=None, record_history=False):
+        """
+        Lazily play spins, yielding each spin record (or lists of chunk_size
+        records) as the consumer asks for it. num_spins=None plays until the
+        consumer stops; breaking out of the loop stops the session after the
+        spins already yielded. Records are only kept in self.history when
+        record_history is True, so long sessions run in bounded memory.
+        """
+        if num_spins is not None and num_spins < 0:
+            raise ValueError("num_spins must be non-negative")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        spin = self.run_spin if record_history else self.play_spin
+
+        played = 0
+        chunk = []
+        while num_spins is None or played < num_spins:
+            spin_record = spin()
+            played += 1
+            if chunk_size is None:
+                yield spin_record
+                continue
+            chunk.append(spin_record)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        # Last, shorter chunk
+        if chunk:
+            yield chunk
@@ -0,0 +1,238 @@
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+
+# Opt-in instrumentation for Game and the simulation runner.
+#
+# Nothing here is referenced by Game.run_spin. Instrumentation.attach(game)
+# wraps the game's collaborators (wheel.spin, determine_win, the player's
+# strategy methods, the history list) with timed versions stored on those
+# instances only. A game that is never attached runs the original code, so
+# disabled instrumentation costs nothing.
+#
+# Phases:
+#   rng      -> wheel.spin
+#   win      -> Game.determine_win
+#   strategy -> Player.place_bet + Player.process_result
+#   history   -> appending the spin record
+#   play_spin -> the whole spin (the rest is payout logic and building the record);
+#                every spin goes through it, streamed by iter_spins or recorded
+#   run_spin  -> a recorded spin: play_spin + history
+# The wrappers add a little time of their own, so phase totals are slightly
+# higher than in an uninstrumented run.
+
+
+class TimedHistory(list):
+    """A game history list that times appends and counts the bytes stored"""
+
+    def __init__(self, items, instrumentation):
+        super().__init__(items)
+        self.instrumentation = instrumentation
+
+    def append(self, record):
+        start = time.perf_counter()
+        super().append(record)
+        stats = self.instrumentation
+        stats.phase_times['history'] += time.perf_counter() - start
+        stats.phase_calls['history'] += 1
+        # Approximate size: the record dict plus one list slot
+        stats.counters['history_bytes'] += sys.getsizeof(record) + 8
+
+
+class SamplingProfiler:
+    """
+    Minimal sampling profiler: a background thread looks at the target
+    thread's current stack every `interval` seconds and counts the functions.
+    """
+
+    def __init__(self, interval=0.001, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self.thread_id = self.thread_id or threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                code = frame.f_code
+                self.samples[f"{code.co_name} ({code.co_filename.rsplit('/', 1)[-1]}:{frame.f_lineno})"] += 1
+
+    def top(self, count=10):
+        """Most sampled locations as (location, fraction of samples)"""
+        total = sum(self.samples.values()) or 1
+        return [(location, hits / total) for location, hits in self.samples.most_common(count)]
+
+
+class Instrumentation:
+    def __init__(self, track_allocations=False, sampler=None):
+        # Accumulated seconds and number of calls per phase
+        self.phase_times = defaultdict(float)
+        self.phase_calls = defaultdict(int)
+        # Counters: spins (batch engines), history_bytes, allocated_bytes, allocated_peak
+        self.counters = defaultdict(int)
+        self.wall_time = 0.0
+        # Optional extras: tracemalloc and a sampling profiler
+        # (sampler=True uses SamplingProfiler; any object with start()/stop() works)
+        self.track_allocations = track_allocations
+        self.sampler = SamplingProfiler() if sampler is True else sampler
+        self._started_at = None
+        # Whether start() turned tracemalloc on (then stop() turns it off),
+        # and the traced bytes at start() (allocations are counted from there)
+        self._owns_tracing = False
+        self._traced_at_start = 0
+
+    # --- Timing helpers ---
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block of code as one call of a phase"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[name] += time.perf_counter() - start
+            self.phase_calls[name] += 1
+
+    def timed(self, function, name):
+        """Wrap a function so each call is added to a phase"""
+        phase_times, phase_calls = self.phase_times, self.phase_calls
+        clock = time.perf_counter
+
+        def wrapper(*args, **kwargs):
+            start = clock()
+            result = function(*args, **kwargs)
+            phase_times[name] += clock() - start
+            phase_calls[name] += 1
+            return result
+        return wrapper
+
+    # --- Attaching to a game ---
+
+    def attach(self, game):
+        """Instrument one Game instance (and its wheel and player)"""
+        game.wheel.spin = self.timed(game.wheel.spin, "rng")
+        game.determine_win = self.timed(game.determine_win, "win")
+        game.player.place_bet = self.timed(game.player.place_bet, "strategy")
+        game.player.process_result = self.timed(game.player.process_result, "strategy")
+        game.history = TimedHistory(game.history, self)
+        game.play_spin = self.timed(game.play_spin, "play_spin")
+        game.run_spin = self.timed(game.run_spin, "run_spin")
+        return game
+
+    def detach(self, game):
+        """Remove the wrappers, restoring the class methods"""
+        for owner, attribute in ((game.wheel, 'spin'), (game, 'determine_win'), (game, 'run_spin'),
+                                 (game, 'play_spin'),
+                                 (game.player, 'place_bet'), (game.player, 'process_result')):
+            owner.__dict__.pop(attribute, None)
+        game.history = list(game.history)
+        return game
+
+    # --- Session control ---
+
+    def start(self):
+        if self.track_allocations:
+            # Tracing that was already on belongs to the caller: leave it running
+            self._owns_tracing = not tracemalloc.is_tracing()
+            if self._owns_tracing:
+                tracemalloc.start()
+            self._traced_at_start = tracemalloc.get_traced_memory()[0]
+        if self.sampler is not None:
+            self.sampler.start()
+        self._started_at = time.perf_counter()
+
+    def stop(self):
+        self.wall_time += time.perf_counter() - self._started_at
+        if self.sampler is not None:
+            self.sampler.stop()
+        if self.track_allocations and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            self.counters['allocated_bytes'] += current - self._traced_at_start
+            self.counters['allocated_peak'] = max(self.counters['allocated_peak'], peak - self._traced_at_start)
+            if self._owns_tracing:
+                tracemalloc.stop()
+                self._owns_tracing = False
+
+    @contextmanager
+    def session(self):
+        """with instrumentation.session(): ... (start/stop around a block)"""
+        self.start()
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    # --- Results ---
+
+    def spins(self):
+        # Instrumented games count their play_spin calls (recorded or streamed);
+        # batch engines add their player-spins to the 'spins' counter directly
+        return self.counters['spins'] + self.phase_calls['play_spin']
+
+    def merge(self, other):
+        """Add another instrumentation's totals into this one"""
+        for name, seconds in other.phase_times.items():
+            self.phase_times[name] += seconds
+        for name, calls in other.phase_calls.items():
+            self.phase_calls[name] += calls
+        for name, value in other.counters.items():
+            if name == 'allocated_peak':
+                self.counters[name] = max(self.counters[name], value)
+            else:
+                self.counters[name] += value
+        self.wall_time += other.wall_time
+        if isinstance(other.sampler, SamplingProfiler):
+            if not isinstance(self.sampler, SamplingProfiler):
+                self.sampler = SamplingProfiler()
+            self.sampler.samples.update(other.sampler.samples)
+        return self
+
+    def summary(self):
+        """Plain dict with phase times, counters and throughput"""
+        spins = self.spins()
+        return {
+            'wall_time': self.wall_time,
+            'spins': spins,
+            'spins_per_second': spins / self.wall_time if self.wall_time else 0.0,
+            'phases': {name: {'seconds': self.phase_times[name], 'calls': self.phase_calls[name]}
+                       for name in self.phase_times},
+            'counters': dict(self.counters),
+            'hotspots': self.sampler.top() if isinstance(self.sampler, SamplingProfiler) else [],
+        }
+
+    def report(self, title="INSTRUMENTATION"):
+        """Print a summary table"""
+        summary = self.summary()
+        print(f"\n--- {title} ---")
+        print(f"Wall time: {summary['wall_time']:.3f}s | Spins: {summary['spins']:,} "
+              f"| Throughput: {summary['spins_per_second']:,.0f} spins/s")
+
+        total = summary['wall_time'] or 1.0
+        print(f"{'PHASE':<12} | {'SECONDS':>10} | {'SHARE':>7} | {'CALLS':>12}")
+        for name, phase in sorted(summary['phases'].items(), key=lambda item: -item[1]['seconds']):
+            print(f"{name:<12} | {phase['seconds']:>10.4f} | {phase['seconds'] / total:>6.1%} | {phase['calls']:>12,}")
+
+        counters = summary['counters']
+        if counters.get('history_bytes'):
+            print(f"History stored: {counters['history_bytes'] / 1e6:.2f} MB")
+        if counters.get('allocated_peak'):
+            print(f"Allocations: {counters['allocated_bytes'] / 1e6:.2f} MB retained, "
+                  f"{counters['allocated_peak'] / 1e6:.2f} MB peak")
+        for location, share in summary['hotspots']:
+            print(f"  {share:>6.1%}  {location}")
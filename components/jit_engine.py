@@ -0,0 +1,121 @@
+import importlib.util
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from components.batch_engine import PAYOUTS, money_dtype, simulate_batch, win_table
+from components.process_pool import mark_threads_started
+
+# Optional JIT-compiled engine for path-dependent strategies.
+# Martingale cannot be vectorized over spins (each bet depends on the previous
+# result), so batch_engine loops over spins in Python. With Numba installed,
+# this module compiles the whole player x spin loop instead.
+# Without Numba (or with ROULETTE_DISABLE_JIT=1) every call falls back to
+# batch_engine, and the results are the same either way.
+# Numba itself is imported on the first simulate_jit call, so importing this
+# module stays as cheap as importing batch_engine.
+
+JIT_AVAILABLE = not os.environ.get("ROULETTE_DISABLE_JIT") and importlib.util.find_spec("numba") is not None
+
+# Replaced by numba.prange when the kernel is compiled
+_player_range = range
+
+
+def _spin_kernel(pockets, wins_by_pocket, martingale, base_bet, limit, has_limit, multiplier,
+                 initial_bankroll, exponent_cap, bets, paths, lowest, overflowed):
+    """
+    Simulate every player over its row of pockets (flat or Martingale, with or
+    without a table limit). Fills bets (players, spins), paths (players, spins + 1)
+    and lowest (players,). Players whose Martingale bet would need more than
+    2^62 are flagged in `overflowed` (the caller then uses exact arithmetic).
+    """
+    num_players, num_spins = pockets.shape
+    for player in _player_range(num_players):
+        bankroll = initial_bankroll
+        lowest_bankroll = initial_bankroll
+        consecutive_losses = 0
+        paths[player, 0] = bankroll
+        for spin in range(num_spins):
+            # Player.place_bet: base bet, doubled after every loss for Martingale
+            intended = base_bet
+            if martingale:
+                # Past exponent_cap doublings the bet is always above the table
+                # limit, so capping the exponent does not change the actual bet
+                exponent = min(consecutive_losses, exponent_cap)
+                if exponent > 62:
+                    overflowed[player] = True
+                    break
+                intended = base_bet * (1 << exponent)
+            # Game.run_spin: enforce the table limit
+            bet = min(intended, limit) if has_limit else intended
+
+            if wins_by_pocket[pockets[player, spin]]:
+                bankroll += bet * multiplier
+                consecutive_losses = 0
+            else:
+                bankroll -= bet
+                consecutive_losses += 1
+
+            bets[player, spin] = bet
+            paths[player, spin + 1] = bankroll
+            if bankroll < lowest_bankroll:
+                lowest_bankroll = bankroll
+        lowest[player] = lowest_bankroll
+
+
+@lru_cache(maxsize=None)
+def _compiled_kernel():
+    """_spin_kernel compiled in parallel over players (loaded from Numba's cache when possible)"""
+    global _player_range
+    import numba
+    _player_range = numba.prange
+    return numba.njit(parallel=True, cache=True)(_spin_kernel)
+
+
+def simulate_jit(spec, pockets, records=("final",)):
+    """
+    Same interface and results as batch_engine.simulate_batch, using the
+    compiled kernel when possible.
+    """
+    dtype = money_dtype(spec)
+    if not JIT_AVAILABLE or dtype is object:
+        return simulate_batch(spec, pockets, records)
+
+    num_players, num_spins = pockets.shape
+    limit = spec['table_limit']
+    has_limit = limit != float('inf')
+    multiplier = PAYOUTS.get(spec['bet_type'], 35)
+    base_bet = dtype(spec['base_bet'])
+
+    exponent_cap = num_spins
+    if has_limit:
+        exponent_cap = max(0, int(np.ceil(np.log2(limit / spec['base_bet']))))
+
+    bets = np.empty((num_players, num_spins), dtype=dtype)
+    paths = np.empty((num_players, num_spins + 1), dtype=dtype)
+    lowest = np.empty(num_players, dtype=dtype)
+    overflowed = np.zeros(num_players, dtype=np.bool_)
+
+    kernel = _compiled_kernel()
+    mark_threads_started()
+    kernel(pockets, win_table(spec['wheel_type'], spec['bet_type'], spec['bet_value']),
+           spec['strategy'] == "martingale", base_bet,
+           dtype(limit) if has_limit else base_bet, has_limit, multiplier,
+           dtype(spec['initial_bankroll']), exponent_cap, bets, paths, lowest, overflowed)
+
+    # Fall back to exact Python ints if a bet or bankroll could overflow int64
+    if overflowed.any() or (dtype == np.int64 and int(bets.max()) * (multiplier + 1) * num_spins
+                            + abs(int(spec['initial_bankroll'])) >= 2 ** 63):
+        return simulate_batch(spec, pockets, records)
+
+    results = {}
+    if "final" in records:
+        results["final"] = paths[:, -1].copy()
+    if "paths" in records:
+        results["paths"] = paths
+    if "bets" in records:
+        results["bets"] = bets
+    if "lowest" in records:
+        results["lowest"] = lowest
+    return results
@@ -0,0 +1,233 @@
+import numpy as np
+
+# Observer hooks for spin events.
+#
+#     observers = Observers()
+#     observers.on("limit_hit", lambda record: print(record['spin_number']))
+#     observers.on("session_end", tally.update_sessions, batched=True)
+#
+# Events:
+#   spin        -> every spin a player plays
+#   win / loss  -> the spins the player won / lost
+#   limit_hit   -> spins where the intended bet was cut to the table limit
+#   session_end -> a player's session is over (spins played, final bankroll, net)
+#
+# A callback registered with batched=False receives one record (dict) per
+# event; with batched=True it receives a batch: a dict of equal-length 1-D
+# NumPy arrays, one row per event. Records from Game are copies of the spin
+# record with the player number added; records cut from batches carry the
+# batch fields, plus 'result' for spin events. Batches made from a single
+# Game record have one row.
+#   spin batch fields:    player, spin_number, bet_amount, payout, bankroll, won, limit_hit
+#   session batch fields: player, spins, bankroll, net
+#
+# Sources:
+#   Game                      -> Observers.attach(game) wraps play_spin,
+#                                run_simulation and iter_spins of that
+#                                instance only (like Instrumentation)
+#   run_spec(observers=...)   -> scalar games are attached; the numpy engine
+#                                emits batches of spin blocks (the numba
+#                                engine runs as numpy when observed)
+#   simulate_pool / simulate_table(observers=...) -> one batch per spin
+# Nothing is wrapped or computed for sources without observers, and the
+# pool and table loops only test `if observers` once per spin, so unobserved
+# runs cost the same as before.
+
+EVENTS = ("spin", "win", "loss", "limit_hit", "session_end")
+
+# Largest number of rows in a batch emitted by the numpy engine
+OBSERVER_BATCH = 2 ** 20
+
+
+def batch_from_record(record, player=0):
+    """One-row batch from a Game spin record or a session record"""
+    if 'result' not in record:
+        return {name: np.array([value]) for name, value in dict(record, player=player).items()}
+    return {
+        'player': np.array([player]),
+        'spin_number': np.array([record['spin_number']]),
+        'bet_amount': np.array([record['bet_amount']]),
+        'payout': np.array([record['payout']]),
+        'bankroll': np.array([record['bankroll']]),
+        'won': np.array([record['result'] == 'win']),
+        'limit_hit': np.array([record['intended_bet'] > record['bet_amount']]),
+    }
+
+
+def records_from_batch(batch):
+    """The rows of a batch as record dicts (spin rows also get 'result')"""
+    names = list(batch)
+    records = [dict(zip(names, row)) for row in zip(*(batch[name].tolist() for name in names))]
+    if 'won' in batch:
+        for record in records:
+            record['result'] = 'win' if record['won'] else 'lose'
+    return records
+
+
+def select(batch, mask):
+    """Rows of a batch where mask is True"""
+    return {name: values[mask] for name, values in batch.items()}
+
+
+class Observers:
+    """Registry of spin-event callbacks"""
+
+    def __init__(self):
+        self.callbacks = {event: [] for event in EVENTS}
+
+    def __bool__(self):
+        return any(self.callbacks.values())
+
+    def on(self, event, callback=None, batched=False):
+        """Register callback for event; without a callback, works as a decorator"""
+        if event not in self.callbacks:
+            raise ValueError(f"Unknown event '{event}'. Available: {EVENTS}")
+        if callback is None:
+            return lambda function: self.on(event, function, batched)
+        self.callbacks[event].append((callback, batched))
+        return callback
+
+    def off(self, event, callback):
+        """Remove every registration of callback for event"""
+        self.callbacks[event] = [(f, batched) for f, batched in self.callbacks[event] if f is not callback]
+
+    # --- Dispatch ---
+
+    def emit(self, event, record, player=0):
+        """Send one record to the event's callbacks"""
+        record = dict(record, player=player)
+        for callback, batched in self.callbacks[event]:
+            callback(batch_from_record(record, player) if batched else record)
+
+    def emit_batch(self, event, batch):
+        """Send a batch to the event's callbacks (scalar callbacks get its rows one by one)"""
+        callbacks = self.callbacks[event]
+        if not callbacks or not len(batch['player']):
+            return
+        records = None
+        for callback, batched in callbacks:
+            if batched:
+                callback(batch)
+                continue
+            if records is None:
+                records = records_from_batch(batch)
+            for record in records:
+                callback(record)
+
+    def emit_spin(self, record, player=0):
+        """All events of one Game spin record"""
+        callbacks = self.callbacks
+        if callbacks['spin']:
+            self.emit("spin", record, player)
+        event = "win" if record['result'] == 'win' else "loss"
+        if callbacks[event]:
+            self.emit(event, record, player)
+        if callbacks['limit_hit'] and record['intended_bet'] > record['bet_amount']:
+            self.emit("limit_hit", record, player)
+
+    def emit_spins(self, batch):
+        """All events of a spin batch"""
+        callbacks = self.callbacks
+        self.emit_batch("spin", batch)
+        if callbacks['win']:
+            self.emit_batch("win", select(batch, batch['won']))
+        if callbacks['loss']:
+            self.emit_batch("loss", select(batch, ~batch['won']))
+        if callbacks['limit_hit']:
+            self.emit_batch("limit_hit", select(batch, batch['limit_hit']))
+
+    # --- Attaching to a game ---
+
+    def attach(self, game, player=0):
+        """Emit the events of one Game instance (reported as `player`)"""
+        play_spin, run_simulation, iter_spins = game.play_spin, game.run_simulation, game.iter_spins
+        initial = game.player.bankroll
+
+        def observed_play_spin():
+            record = play_spin()
+            self.emit_spin(record, player)
+            return record
+
+        def end_session():
+            if self.callbacks['session_end']:
+                bankroll = game.player.bankroll
+                self.emit("session_end", {'player': player, 'spins': game.spins_played,
+                                          'bankroll': bankroll, 'net': bankroll - initial}, player)
+
+        def observed_run_simulation(num_spins):
+            history = run_simulation(num_spins)
+            end_session()
+            return history
+
+        def observed_iter_spins(*args, **kwargs):
+            # Also ends the session when the consumer stops early (generator close)
+            try:
+                yield from iter_spins(*args, **kwargs)
+            finally:
+                end_session()
+
+        game.play_spin = observed_play_spin
+        game.run_simulation = observed_run_simulation
+        game.iter_spins = observed_iter_spins
+        return game
+
+    def detach(self, game):
+        """Remove the wrappers, restoring the class methods"""
+        for attribute in ('play_spin', 'run_simulation', 'iter_spins'):
+            game.__dict__.pop(attribute, None)
+        return game
+
+
+class SessionTally:
+    """
+    Totals streamed from the events of any source: spins, wins, limit hits,
+    amount wagered, player net, and per-session outcomes.
+        tally = SessionTally().register(observers)
+    """
+
+    def __init__(self):
+        self.spins = 0
+        self.wins = 0
+        self.limit_hits = 0
+        self.wagered = 0
+        self.net = 0
+        self.max_bet = 0
+        self.sessions = 0
+        self.profitable = 0
+        self.bankrupt = 0
+        self.final_total = 0
+
+    def register(self, observers):
+        observers.on("spin", self.update_spins, batched=True)
+        observers.on("session_end", self.update_sessions, batched=True)
+        return self
+
+    def update_spins(self, batch):
+        self.spins += len(batch['player'])
+        self.wins += int(np.count_nonzero(batch['won']))
+        self.limit_hits += int(np.count_nonzero(batch['limit_hit']))
+        self.wagered += batch['bet_amount'].sum()
+        self.net += batch['payout'].sum()
+        self.max_bet = max(self.max_bet, batch['bet_amount'].max())
+
+    def update_sessions(self, batch):
+        self.sessions += len(batch['player'])
+        self.profitable += int(np.count_nonzero(batch['net'] > 0))
+        self.bankrupt += int(np.count_nonzero(batch['bankroll'] <= 0))
+        self.final_total += batch['bankroll'].sum()
+
+    def summary(self):
+        """Totals as plain Python numbers (rates are 0 before any event)"""
+        return {
+            'spins': int(self.spins),
+            'win_rate': self.wins / self.spins if self.spins else 0.0,
+            'limit_hits': int(self.limit_hits),
+            'wagered': float(self.wagered),
+            'net': float(self.net),
+            'hold': float(-self.net / self.wagered) if self.wagered else 0.0,
+            'max_bet': float(self.max_bet),
+            'sessions': int(self.sessions),
+            'p_profit': self.profitable / self.sessions if self.sessions else 0.0,
+            'p_bankrupt': self.bankrupt / self.sessions if self.sessions else 0.0,
+            'mean_final': float(self.final_total / self.sessions) if self.sessions else 0.0,
+        }
@@ -2,6 +2,8 @@ class Player:
     def __init__(self, initial_bankroll=1000, strategy="flat", base_bet=10):
         # Current money the player has
         self.bankroll = initial_bankroll
+        # Money the player started with (the baseline for profit and loss)
+        self.initial_bankroll = initial_bankroll
         # Betting strategy: "flat" or "martingale" 
         self.strategy = strategy
         # The base amount to bet (for flat betting or martingale starting point)
@@ -0,0 +1,482 @@
+import time
+
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel
+from components.batch_engine import PAYOUTS, win_table
+from components.checkpoint import CHECKPOINT_SECONDS, check_signature, load_checkpoint, save_checkpoint
+
+# A population of players as NumPy arrays (struct of arrays) instead of one
+# Player object each. Every attribute is one array with an entry per player,
+# so bankrolls, stakes, bets and quitting rules can all differ while the
+# whole population is still simulated in one batch.
+#
+# A pool is sampled from segments: named groups of players whose attributes
+# are drawn from distributions. A segment is a dict like DEFAULT_SEGMENT;
+# any attribute can be a constant or a distribution dict:
+#     {'choice': [values], 'p': [probabilities]}   (p optional)
+#     {'uniform': (low, high)}       {'integers': (low, high)}  (high included)
+#     {'normal': (mean, std)}        {'lognormal': (median, sigma)}
+# Sampled money amounts are rounded to whole MONEY_UNITs. Quitting behaviour:
+#   stop_loss     -> leave once the loss reaches this amount (None = never)
+#   win_goal      -> leave once the profit reaches this amount (None = never)
+#   session_spins -> leave after this many spins (None = play every spin)
+# Players also leave when they cannot cover their next bet (leave_when_broke).
+
+DEFAULT_SEGMENT = {
+    'share': 1.0,
+    'strategy': "flat",
+    'bet': ("color", "red"),
+    'base_bet': 10,
+    'initial_bankroll': 1000,
+    'table_limit': None,
+    'stop_loss': None,
+    'win_goal': None,
+    'session_spins': None,
+}
+
+# Attributes rounded to whole money units
+MONEY_FIELDS = ("base_bet", "initial_bankroll", "table_limit", "stop_loss", "win_goal")
+MONEY_UNIT = 1
+
+# Exponent cap for Martingale players with no table limit (float bets)
+MAX_DOUBLINGS = 1000
+
+# session_spins of players who never stop on their own
+NO_SESSION_LIMIT = np.iinfo(np.int64).max
+
+# Why a player left the table (reason array of simulate_pool)
+QUIT_REASONS = ("played out", "win goal", "stop loss", "broke")
+PLAYED_OUT, WIN_GOAL, STOP_LOSS, BROKE = range(4)
+
+# What simulate_pool can record per player besides the summary arrays
+POOL_RECORDS = ("paths",)
+
+# Spins drawn per chunk are limited to about this many pockets
+POOL_CHUNK = 2 ** 22
+
+# The working set is compacted once fewer than this share of it is still playing
+COMPACT_SHARE = 0.75
+
+
+def group_returns(wheel_type, groups):
+    """(groups, pockets) int8 net return per unit staked: +multiplier on a win, -1 on a loss"""
+    table = np.empty((len(groups), len(RouletteWheel(wheel_type, seed=0).numbers)), dtype=np.int8)
+    for g, (bet_type, bet_value) in enumerate(groups):
+        table[g] = np.where(win_table(wheel_type, bet_type, bet_value), PAYOUTS.get(bet_type, 35), -1)
+    return table
+
+
+def sample_values(rng, distribution, size):
+    """`size` draws of a continuous or integer distribution dict"""
+    if len(distribution) != 1:
+        raise ValueError(f"Unknown distribution: {distribution}")
+    kind, parameters = next(iter(distribution.items()))
+    if kind == 'uniform':
+        return rng.uniform(*parameters, size=size)
+    if kind == 'integers':
+        return rng.integers(parameters[0], parameters[1] + 1, size=size)
+    if kind == 'normal':
+        return rng.normal(*parameters, size=size)
+    if kind == 'lognormal':
+        median, sigma = parameters
+        return median * np.exp(sigma * rng.standard_normal(size))
+    raise ValueError(f"Unknown distribution: {kind}")
+
+
+def attribute_array(name, values, groups):
+    """
+    Array form of attribute values: bets become indices into `groups` (new
+    bets are appended), strategies a Martingale flag, money floats (inf =
+    None) and session lengths integers (no limit = int64 max).
+    """
+    if name == 'bet':
+        codes = []
+        for bet in values:
+            bet = tuple(bet)
+            if bet not in groups:
+                groups.append(bet)
+            codes.append(groups.index(bet))
+        return np.array(codes, dtype=np.intp)
+    if name == 'strategy':
+        return np.array([strategy == "martingale" for strategy in values], dtype=bool)
+    if name == 'session_spins':
+        return np.array([NO_SESSION_LIMIT if v is None else max(0, int(v)) for v in values], dtype=np.int64)
+    return np.array([np.inf if v is None else v for v in values], dtype=float)
+
+
+def draw_attribute(rng, name, distribution, size, groups):
+    """`size` draws of one segment attribute in array form (see attribute_array)"""
+    if not isinstance(distribution, dict):
+        return np.repeat(attribute_array(name, [distribution], groups), size)
+    if 'choice' in distribution:
+        options = attribute_array(name, distribution['choice'], groups)
+        return options[rng.choice(len(options), size=size, p=distribution.get('p'))]
+    if name in ('bet', 'strategy'):
+        raise ValueError(f"'{name}' can only be a constant or a choice")
+    values = sample_values(rng, distribution, size)
+    if name == 'session_spins':
+        return np.maximum(0, np.round(values)).astype(np.int64)
+    return values.astype(float)
+
+
+def quit_threshold(initial_bankroll, change, dtype):
+    """
+    initial_bankroll + change in the money dtype. Integer thresholds round
+    away from the start (a $10.50 goal needs $11 of profit) and infinite
+    changes map to the extremes of int64.
+    """
+    finite = np.isfinite(change)
+    threshold = initial_bankroll + np.where(finite, change, 0)
+    if dtype != np.int64:
+        return np.where(finite, threshold, change)
+    result = np.where(change > 0, np.iinfo(np.int64).max, np.iinfo(np.int64).min)
+    rounded = np.where(change > 0, np.ceil(threshold), np.floor(threshold))
+    result[finite] = rounded[finite]
+    return result
+
+
+def segment_counts(shares, num_players):
+    """Split num_players over segments in proportion to their shares (largest remainders)"""
+    shares = np.asarray(shares, dtype=float)
+    if np.any(shares < 0) or shares.sum() <= 0:
+        raise ValueError("Segment shares must be non-negative and not all zero")
+    exact = shares / shares.sum() * num_players
+    counts = np.floor(exact).astype(np.int64)
+    counts[np.argsort(counts - exact)[:num_players - counts.sum()]] += 1
+    return counts
+
+
+class PlayerPool:
+    """
+    Per-player attributes as arrays:
+        segment (index into segment_names), group (index into groups, the
+        distinct (bet_type, bet_value) bets), martingale, base_bet,
+        initial_bankroll, table_limit, cap, stop_loss, win_goal, session_spins
+    Build one with PlayerPool.sample(segments, ...) or PlayerPool.from_specs(specs).
+    """
+
+    def __init__(self, columns, segment_names, groups):
+        self.segment_names = list(segment_names)
+        self.groups = list(groups)
+        self.segment = np.asarray(columns['segment'], dtype=np.intp)
+        self.group = np.asarray(columns['bet'], dtype=np.intp)
+        self.martingale = np.asarray(columns['strategy'], dtype=bool)
+
+        # Step 1: Money as exact integers unless an amount needs floats
+        base_bet, initial_bankroll, table_limit = (np.asarray(columns[name], dtype=float) for name in
+                                                   ("base_bet", "initial_bankroll", "table_limit"))
+        if np.any(base_bet <= 0) or np.any(table_limit <= 0):
+            raise ValueError("Base bets and table limits must be positive")
+        # Flat players never bet above their base bet
+        table_limit = np.where(self.martingale, table_limit, np.minimum(base_bet, table_limit))
+        money = np.concatenate([base_bet, initial_bankroll, table_limit])
+        integral = np.all(np.isfinite(money)) and np.all(money == np.round(money)) and np.all(np.abs(money) < 2 ** 62)
+        self.dtype = np.int64 if integral else np.float64
+        self.base_bet = base_bet.astype(self.dtype)
+        self.initial_bankroll = initial_bankroll.astype(self.dtype)
+        self.table_limit = table_limit.astype(self.dtype)
+        # Beyond `cap` doublings the intended bet is always above the limit
+        with np.errstate(divide='ignore', invalid='ignore'):
+            caps = np.nan_to_num(np.ceil(np.log2(table_limit / base_bet)), posinf=MAX_DOUBLINGS)
+        self.cap = np.where(self.martingale, np.clip(caps, 0, MAX_DOUBLINGS), 0).astype(np.int64)
+
+        # Step 2: Quitting rules (inf / NO_SESSION_LIMIT = never)
+        self.stop_loss = np.asarray(columns['stop_loss'], dtype=float)
+        self.win_goal = np.asarray(columns['win_goal'], dtype=float)
+        self.session_spins = np.asarray(columns['session_spins'], dtype=np.int64)
+        # Bankrolls at which players walk away, in the money dtype so the
+        # per-spin checks need no conversion (unreachable when there is no rule)
+        self.leave_above = quit_threshold(self.initial_bankroll, self.win_goal, self.dtype)
+        self.leave_below = quit_threshold(self.initial_bankroll, -self.stop_loss, self.dtype)
+        self.has_win_goal = bool(np.isfinite(self.win_goal).any())
+        self.has_stop_loss = bool(np.isfinite(self.stop_loss).any())
+        self.has_session_limit = bool((self.session_spins < NO_SESSION_LIMIT).any())
+
+    def __len__(self):
+        return len(self.group)
+
+    def take(self, indices):
+        """A pool of the given players only (same segments and bets)"""
+        pool = object.__new__(PlayerPool)
+        pool.__dict__.update(self.__dict__)
+        for name, value in self.__dict__.items():
+            if isinstance(value, np.ndarray):
+                setattr(pool, name, value[indices])
+        return pool
+
+    @classmethod
+    def from_specs(cls, specs, labels=None):
+        """One segment per simulation spec (components.simulation.make_spec), num_players players each"""
+        specs = [specs] if isinstance(specs, dict) else list(specs)
+        labels = labels or [f"{spec['strategy']} {spec['bet_type']} {spec['bet_value']}" for spec in specs]
+        segments = {}
+        for label, spec in zip(labels, specs):
+            if spec['num_players'] < 0:
+                raise ValueError("num_players must be non-negative")
+            segments[label] = dict(share=spec['num_players'], strategy=spec['strategy'],
+                                   bet=(spec['bet_type'], spec['bet_value']), base_bet=spec['base_bet'],
+                                   initial_bankroll=spec['initial_bankroll'], table_limit=spec['table_limit'])
+        # Constants only, so nothing is random or rounded
+        return cls._build(segments, [spec['num_players'] for spec in specs], rng=None)
+
+    @classmethod
+    def sample(cls, segments, num_players, seed=None):
+        """
+        Draw num_players players from named segments {name: segment dict};
+        players are split over the segments by 'share'.
+        """
+        if not segments:
+            raise ValueError("A pool needs at least one segment")
+        counts = segment_counts([segment.get('share', DEFAULT_SEGMENT['share']) for segment in segments.values()],
+                                num_players)
+        return cls._build(segments, counts, np.random.default_rng(seed))
+
+    @classmethod
+    def _build(cls, segments, counts, rng):
+        groups = []
+        columns = {name: [] for name in DEFAULT_SEGMENT if name != 'share'}
+        columns['segment'] = []
+        for index, ((name, segment), count) in enumerate(zip(segments.items(), counts)):
+            unknown = set(segment) - set(DEFAULT_SEGMENT)
+            if unknown:
+                raise ValueError(f"Unknown segment attributes in {name!r}: {sorted(unknown)}")
+            segment = dict(DEFAULT_SEGMENT, **segment)
+            columns['segment'].append(np.full(count, index, dtype=np.intp))
+            for attribute in DEFAULT_SEGMENT:
+                if attribute == 'share':
+                    continue
+                values = draw_attribute(rng, attribute, segment[attribute], count, groups)
+                if rng is not None and attribute in MONEY_FIELDS:
+                    # Sampled amounts are whole money units (at least one)
+                    finite = np.isfinite(values)
+                    values[finite] = np.maximum(MONEY_UNIT, np.round(values[finite] / MONEY_UNIT) * MONEY_UNIT)
+                columns[attribute].append(values)
+        columns = {name: np.concatenate(parts) for name, parts in columns.items()}
+        return cls(columns, list(segments), groups)
+
+    def start(self):
+        """Fresh per-player state for a session"""
+        bankroll = self.initial_bankroll.copy()
+        return {
+            'bankroll': bankroll,
+            'lowest': bankroll.copy(),
+            'losses': np.zeros(len(self), dtype=np.int64),
+            'active': self.session_spins > 0,
+            'played': np.zeros(len(self), dtype=np.int64),
+            'wagered': np.zeros(len(self), dtype=self.dtype),
+            'reason': np.full(len(self), PLAYED_OUT, dtype=np.int8),
+        }
+
+    def intended_bets(self, state):
+        """What every player wants to bet this spin (exponent capped at self.cap)"""
+        exponents = np.minimum(state['losses'], self.cap)
+        if self.dtype == np.int64:
+            return np.left_shift(self.base_bet, exponents)
+        return self.base_bet * np.exp2(exponents)
+
+    def limit_hits(self, state):
+        """Players whose intended bet this spin is above their table limit (before place_bets)"""
+        return (self.intended_bets(state) > self.table_limit) | (self.martingale & (state['losses'] > self.cap))
+
+    def place_bets(self, state, leave_when_broke=True):
+        """Bets of this spin (0 for players who have left); same doubling rule as Player"""
+        bets = np.minimum(self.intended_bets(state), self.table_limit)
+        if leave_when_broke:
+            broke = state['active'] & (state['bankroll'] < bets)
+            state['reason'][broke] = BROKE
+            state['active'] &= ~broke
+        bets[~state['active']] = 0
+        return bets
+
+    def settle(self, state, bets, returns):
+        """
+        Apply one spin: returns holds each player's net return per unit staked
+        (+multiplier or -1). Updates the state and the quitting rules; returns the payouts.
+        """
+        payouts = bets * returns
+        state['bankroll'] += payouts
+        np.minimum(state['lowest'], state['bankroll'], out=state['lowest'])
+        state['wagered'] += bets
+        state['played'] += state['active']
+        # Consecutive losses (flat players have cap 0, so theirs are never used)
+        state['losses'] += 1
+        state['losses'] *= returns < 0
+
+        # Quitting rules, checked after the spin is settled
+        active = state['active']
+        if self.has_win_goal:
+            leaving = active & (state['bankroll'] >= self.leave_above)
+            state['reason'][leaving] = WIN_GOAL
+            active &= ~leaving
+        if self.has_stop_loss:
+            leaving = active & (state['bankroll'] <= self.leave_below)
+            state['reason'][leaving] = STOP_LOSS
+            active &= ~leaving
+        if self.has_session_limit:
+            active &= state['played'] < self.session_spins
+        return payouts
+
+    def group_returns(self, wheel_type):
+        """(groups, pockets) net return table of the pool's bets"""
+        return group_returns(wheel_type, self.groups)
+
+
+def observe_spin(observers, pool, index, state, seated, playing, hits, bets, payouts):
+    """
+    Emit one spin of a pool to observers. index maps the rows of the state
+    to players, seated / playing are the active flags before and after
+    place_bets and hits the limit_hits taken before it.
+    """
+    if observers.callbacks['spin'] or observers.callbacks['win'] or observers.callbacks['loss'] \
+            or observers.callbacks['limit_hit']:
+        observers.emit_spins({
+            'player': index[playing],
+            'spin_number': state['played'][playing],
+            'bet_amount': bets[playing],
+            'payout': payouts[playing],
+            'bankroll': state['bankroll'][playing],
+            'won': payouts[playing] > 0,
+            'limit_hit': hits[playing],
+        })
+    if observers.callbacks['session_end']:
+        observe_session_end(observers, pool, index, state, seated & ~state['active'])
+
+
+def observe_session_end(observers, pool, index, state, ended):
+    """Emit session_end for the rows in `ended`"""
+    bankroll = state['bankroll'][ended]
+    observers.emit_batch("session_end", {'player': index[ended], 'spins': state['played'][ended],
+                                         'bankroll': bankroll, 'net': bankroll - pool.initial_bankroll[ended]})
+
+
+def save_pool_checkpoint(path, signature, full_state, state, index, spin, wheel, paths):
+    """Save a simulate_pool run between two chunks"""
+    for name, value in state.items():
+        full_state[name][index] = value
+    saved = {'signature': signature, 'state': full_state, 'index': index, 'spin': spin, 'wheel': wheel.get_state()}
+    if paths is not None:
+        saved['paths'] = paths[:spin + 1]
+    save_checkpoint(path, saved)
+
+
+def simulate_pool(pool, num_spins, wheel_type="european", seed=None, weights=None, records=(),
+                  leave_when_broke=True, chunk_size=POOL_CHUNK, observers=None, checkpoint=None,
+                  checkpoint_seconds=CHECKPOINT_SECONDS):
+    """
+    Simulate every player of the pool on an independent wheel, all in one batch.
+    Spins are drawn in chunks of (spins, players) from one seeded wheel, so
+    memory stays bounded. Returns the per-player arrays final, lowest,
+    played, wagered and reason (index into QUIT_REASONS), plus 'paths'
+    ((spins + 1, players)) if requested.
+    Pass components.observers.Observers to receive one event batch per spin.
+    checkpoint: file for components.checkpoint saves at chunk boundaries
+    (every checkpoint_seconds and at the end); an existing checkpoint of the
+    same run is resumed, with the same results as an uninterrupted run.
+    Observers only see the spins played after a resume.
+    """
+    unknown = set(records) - set(POOL_RECORDS)
+    if unknown:
+        raise ValueError(f"Unknown pool records: {sorted(unknown)}")
+    num_players = len(pool)
+    wheel = RouletteWheel(wheel_type, seed=seed, weights=weights)
+    returns = pool.group_returns(wheel_type)
+    flat_returns = returns.ravel()
+
+    full_state = pool.start()
+    paths = None
+    if "paths" in records:
+        paths = np.empty((num_spins + 1, num_players), dtype=pool.dtype)
+        paths[0] = full_state['bankroll']
+
+    # Only players still at the table are simulated (the working set)
+    observed = bool(observers)
+    index = np.flatnonzero(full_state['active'])
+    spin = 0
+    if checkpoint is not None:
+        signature = {'players': num_players, 'groups': pool.groups, 'initial': float(pool.initial_bankroll.sum()),
+                     'num_spins': num_spins, 'wheel_type': wheel_type, 'seed': seed,
+                     'weights': None if wheel.weights is None else wheel.weights.tolist(),
+                     'records': sorted(records), 'leave_when_broke': leave_when_broke, 'chunk_size': chunk_size}
+        saved = load_checkpoint(checkpoint)
+        if saved is not None:
+            check_signature(saved, signature, checkpoint)
+            full_state, index, spin = saved['state'], saved['index'], saved['spin']
+            wheel.set_state(saved['wheel'])
+            if paths is not None:
+                paths[:spin + 1] = saved['paths']
+        saved_at = time.perf_counter()
+    work, state = pool.take(index), {name: value[index] for name, value in full_state.items()}
+    while spin < num_spins and len(index):
+        # Row offset of each player's bet in the flattened return table
+        offsets = work.group * returns.shape[1]
+        size = min(max(1, chunk_size // len(index)), num_spins - spin)
+        for pockets in wheel.spin_indices(size * len(index)).reshape(size, len(index)):
+            if observed:
+                seated, hits = state['active'].copy(), work.limit_hits(state)
+            bets = work.place_bets(state, leave_when_broke)
+            if observed:
+                playing = state['active'].copy()
+            payouts = work.settle(state, bets, flat_returns.take(offsets + pockets))
+            if observed:
+                observe_spin(observers, work, index, state, seated, playing, hits, bets, payouts)
+            spin += 1
+            if paths is not None:
+                paths[spin] = paths[spin - 1]
+                paths[spin, index] = state['bankroll']
+
+        # Compact once a quarter of the working set has left
+        active = state['active']
+        if np.count_nonzero(active) < COMPACT_SHARE * len(index):
+            for name, value in state.items():
+                full_state[name][index] = value
+            keep = np.flatnonzero(active)
+            index, work = index[keep], work.take(keep)
+            state = {name: value[keep] for name, value in state.items()}
+
+        # Checkpoint between chunks, where the whole run state is known
+        if checkpoint is not None and time.perf_counter() - saved_at >= checkpoint_seconds:
+            save_pool_checkpoint(checkpoint, signature, full_state, state, index, spin, wheel, paths)
+            saved_at = time.perf_counter()
+    for name, value in state.items():
+        full_state[name][index] = value
+    if checkpoint is not None:
+        save_pool_checkpoint(checkpoint, signature, full_state, state, index, spin, wheel, paths)
+    if observed and observers.callbacks['session_end']:
+        # Players still seated played out their spins
+        observe_session_end(observers, work, index, state, state['active'])
+    if paths is not None:
+        # Nobody is left: the remaining spins change nothing
+        paths[spin + 1:] = paths[spin]
+
+    results = {name: full_state[name] for name in ('played', 'wagered', 'reason', 'lowest')}
+    results['final'] = full_state['bankroll']
+    if paths is not None:
+        results['paths'] = paths
+    return results
+
+
+def segment_statistics(pool, results):
+    """Per segment: players, mean bankrolls, profit and quit shares, spins played, handle and hold"""
+    statistics = {}
+    for index, name in enumerate(pool.segment_names):
+        members = pool.segment == index
+        count = int(members.sum())
+        if count == 0:
+            continue
+        initial = pool.initial_bankroll[members].astype(float)
+        final = results['final'][members].astype(float)
+        wagered = float(results['wagered'][members].sum(dtype=np.float64))
+        reasons = np.bincount(results['reason'][members], minlength=len(QUIT_REASONS)) / count
+        statistics[name] = {
+            'players': count,
+            'mean_initial': float(initial.mean()),
+            'mean_final': float(final.mean()),
+            'mean_net': float((final - initial).mean()),
+            'p_profit': float(np.mean(final > initial)),
+            'quit_shares': dict(zip(QUIT_REASONS, reasons.tolist())),
+            'mean_spins': float(results['played'][members].mean()),
+            'handle': wagered,
+            'hold': float((initial - final).sum() / wagered) if wagered else 0.0,
+        }
+    return statistics
@@ -0,0 +1,32 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Process pools for the parallel paths (sweeps, experiment plans, shared
+# results, the optimizer, the bias detector, the service...).
+#
+# Pools fork their workers, which is the fastest start-up, unless this
+# process has run the compiled Numba kernel: Numba's parallel threads do not
+# survive fork() (the parent can hang at exit), so from then on the workers
+# are started by a forkserver. components.jit_engine reports the first kernel
+# run through mark_threads_started(); nothing here imports Numba.
+
+_threads_started = False
+
+
+def mark_threads_started():
+    """Called before this process first runs a multithreaded compiled kernel"""
+    global _threads_started
+    _threads_started = True
+
+
+def process_pool(workers, initializer=None, initargs=()):
+    """
+    ProcessPoolExecutor that is safe to open after the compiled kernel ran.
+    initializer(*initargs) runs once in every worker when it starts.
+    """
+    context = None
+    if _threads_started:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=initializer,
+                               initargs=initargs)
@@ -1,17 +1,68 @@
-import random
+import numpy as np
+
+# Pocket indices are drawn from NumPy in fixed-size blocks. Because the scalar
+# spin() and the bulk spin_indices() read from the same block buffer, a seeded
+# wheel produces exactly the same pocket sequence whichever API consumes it.
+SPIN_BLOCK = 4096
+
+
+def build_alias_table(probabilities):
+    """
+    Walker/Vose alias table for O(1) sampling from a discrete distribution.
+    Draw a column i uniformly, then keep it with probability accept[i]
+    or jump to alias[i] otherwise.
+    """
+    size = len(probabilities)
+    scaled = np.asarray(probabilities, dtype=float) * size
+    accept = np.ones(size)
+    alias = np.arange(size, dtype=np.uint8)
+
+    small = [i for i in range(size) if scaled[i] < 1.0]
+    large = [i for i in range(size) if scaled[i] >= 1.0]
+    while small and large:
+        lesser, greater = small.pop(), large.pop()
+        accept[lesser] = scaled[lesser]
+        alias[lesser] = greater
+        # The large column gives away what the small one lacked
+        scaled[greater] -= 1.0 - scaled[lesser]
+        (small if scaled[greater] < 1.0 else large).append(greater)
+    # Leftovers are 1 up to rounding error
+    return accept, alias
+
+
+def _alias_lookup(probabilities):
+    """
+    Alias table laid out for one uniform draw per spin: with x = u * size,
+    column i = floor(x) is kept when x < i + accept[i], so the pocket is
+    choices[2 * i + kept] (choices holds alias[i], i for every column).
+    """
+    accept, alias = build_alias_table(probabilities)
+    columns = np.arange(len(accept))
+    choices = np.stack([alias, columns.astype(np.uint8)], axis=1).ravel()
+    return columns + accept, choices
+
 
 class RouletteWheel:
-    def __init__(self, wheel_type="european"):
+    def __init__(self, wheel_type="european", seed=None, weights=None):
         # Store the type of wheel (european, american, triple)
         self.wheel_type = wheel_type
         # Initialize the numbers based on wheel type
         self.numbers = self._initialize_numbers()
-        
+        # Random generator (seed=None draws fresh entropy from the OS)
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        # Pocket probabilities (None = fair wheel) and their alias table
+        self.weights = self._normalize_weights(weights)
+        self._alias = _alias_lookup(self.weights) if self.weights is not None else None
+        # Buffer of pre-drawn pocket indices and our position inside it
+        self._block = np.empty(0, dtype=np.uint8)
+        self._position = 0
+
     def _initialize_numbers(self):
         # European roulette: numbers 0-36 (37 total)
         if self.wheel_type == "european":
             return list(range(0, 37))  # Creates [0, 1, 2, ..., 36]
-        # American roulette: 0, 00, and 1-36 (38 total)  
+        # American roulette: 0, 00, and 1-36 (38 total)
         elif self.wheel_type == "american":
             return ['0', '00'] + list(range(1, 37))
         # Triple zero roulette: 0, 00, 000, and 1-36 (39 total)
@@ -20,11 +71,81 @@ class RouletteWheel:
         # If invalid wheel type provided, raise an error
         else:
             raise ValueError("Invalid wheel type")
-    
+
+    def _normalize_weights(self, weights):
+        # Accept one weight per pocket (in self.numbers order) or a dict
+        # {pocket: weight} where missing pockets keep weight 1
+        if weights is None:
+            return None
+        if isinstance(weights, dict):
+            unknown = [pocket for pocket in weights if pocket not in self.numbers]
+            if unknown:
+                raise ValueError(f"Unknown pockets in weights: {unknown}")
+            weights = [weights.get(pocket, 1.0) for pocket in self.numbers]
+        weights = np.asarray(weights, dtype=float)
+        if weights.shape != (len(self.numbers),):
+            raise ValueError(f"Expected {len(self.numbers)} pocket weights, got {weights.size}")
+        if np.any(weights < 0) or not np.all(np.isfinite(weights)) or weights.sum() <= 0:
+            raise ValueError("Pocket weights must be finite, non-negative and not all zero")
+        return weights / weights.sum()
+
+    def _refill(self):
+        # Draw the next block of pocket indices (uint8 is enough for 39 pockets)
+        if self._alias is None:
+            self._block = self.rng.integers(0, len(self.numbers), size=SPIN_BLOCK, dtype=np.uint8)
+        else:
+            # Alias method: one uniform draw picks the column and the keep/alias coin
+            thresholds, choices = self._alias
+            draws = self.rng.random(SPIN_BLOCK) * len(self.numbers)
+            columns = draws.astype(np.intp)
+            self._block = choices.take(2 * columns + (draws < thresholds.take(columns)))
+        self._position = 0
+
     def spin(self):
         # Return a random number from the wheel's numbers
-        return random.choice(self.numbers)
-    
+        if self._position >= len(self._block):
+            self._refill()
+        index = self._block[self._position]
+        self._position += 1
+        return self.numbers[index]
+
+    def spin_indices(self, count):
+        """Return the next `count` spins as pocket indices into self.numbers"""
+        result = np.empty(count, dtype=np.uint8)
+        filled = 0
+        while filled < count:
+            if self._position >= len(self._block):
+                self._refill()
+            # Copy as much of the current block as we still need
+            take = min(count - filled, len(self._block) - self._position)
+            result[filled:filled + take] = self._block[self._position:self._position + take]
+            self._position += take
+            filled += take
+        return result
+
+    def get_state(self):
+        """Everything that decides the next spins: generator state and the unread block"""
+        return {
+            'wheel_type': self.wheel_type,
+            'bit_generator': self.rng.bit_generator.state,
+            'block': self._block.copy(),
+            'position': self._position,
+        }
+
+    def set_state(self, state):
+        """Continue exactly where the wheel that produced `state` (get_state) stopped"""
+        if state['wheel_type'] != self.wheel_type:
+            raise ValueError(f"State of a {state['wheel_type']} wheel cannot be set on a {self.wheel_type} wheel")
+        self.rng.bit_generator.state = state['bit_generator']
+        self._block = np.asarray(state['block'], dtype=np.uint8).copy()
+        self._position = int(state['position'])
+
     def get_total_pockets(self):
         # Return the total number of pockets on this wheel
-        return len(self.numbers)
\ No newline at end of file
+        return len(self.numbers)
+
+    def pocket_probabilities(self):
+        # Probability of each pocket (in self.numbers order)
+        if self.weights is None:
+            return np.full(len(self.numbers), 1.0 / len(self.numbers))
+        return self.weights.copy()
\ No newline at end of file
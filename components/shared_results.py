@@ -0,0 +1,157 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from components.simulation import ENGINES, RECORD_TYPES, player_seeds, run_spec
+from components.batch_engine import money_dtype, pocket_matrix, simulate_batch
+
+# Results of process-pool workers, written straight into shared memory.
+#
+# The parent allocates one shared block per record (final, paths, ...) for
+# all players of a spec. Each worker simulates a range of players, attaches
+# to the blocks by name and writes its rows in place; the only things
+# pickled are the block names and shapes going out and a row count coming
+# back. Gathering paths no longer costs a pickle/unpickle of every bankroll,
+# so path-heavy runs scale with the number of cores instead of with the
+# bandwidth of the pool's pipes.
+#
+# Every player keeps its seed (player_seeds), so the results are identical
+# to run_spec with the same engine, whatever the number of workers.
+
+# Players simulated by one pool task
+PLAYERS_PER_TASK = 1000
+
+
+def record_shape(spec, record, num_players=None):
+    """Shape of one record for all players of a spec"""
+    num_players = spec['num_players'] if num_players is None else num_players
+    if record == "paths":
+        return (num_players, spec['num_spins'] + 1)
+    if record == "bets":
+        return (num_players, spec['num_spins'])
+    return (num_players,)
+
+
+class SharedArrays:
+    """
+    NumPy arrays in shared memory, owned (and freed) by the process that
+    creates them. layout: {name: (shape, dtype)}. Use as a context manager,
+    or call close() when the arrays are no longer needed.
+    """
+
+    def __init__(self, layout):
+        self.blocks = {}
+        self.arrays = {}
+        try:
+            for name, (shape, dtype) in layout.items():
+                dtype = np.dtype(dtype)
+                if dtype == object:
+                    raise ValueError(f"'{name}' holds Python objects, which cannot live in shared memory")
+                size = int(np.prod(shape)) * dtype.itemsize
+                # Zero-sized blocks are not allowed
+                block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+                self.blocks[name] = block
+                self.arrays[name] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        except BaseException:
+            self.close()
+            raise
+
+    def handles(self):
+        """What a worker needs to attach: {name: (block name, shape, dtype)}"""
+        return {name: (self.blocks[name].name, array.shape, array.dtype.str) for name, array in self.arrays.items()}
+
+    def close(self):
+        # Views must go before their blocks can be unmapped
+        self.arrays = {}
+        for block in self.blocks.values():
+            block.close()
+            block.unlink()
+        self.blocks = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _fill_rows(handles, spec, records, engine, start, stop):
+    """Pool task: simulate players [start, stop) into the shared arrays"""
+    if engine == "scalar":
+        values = run_spec(spec, records, engine="scalar", players=(start, stop))
+    else:
+        simulate = simulate_batch
+        if engine == "numba":
+            from components.jit_engine import simulate_jit as simulate
+        pockets = pocket_matrix(spec['wheel_type'], player_seeds(spec, start, stop), spec['num_spins'],
+                                spec.get('wheel_weights'))
+        values = simulate(spec, pockets, records)
+
+    blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in handles.values()]
+    arrays = {}
+    try:
+        for (record, (_, shape, dtype)), block in zip(handles.items(), blocks):
+            arrays[record] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+            arrays[record][start:stop] = values[record]
+    finally:
+        arrays.clear()
+        for block in blocks:
+            block.close()
+    return stop - start
+
+
+def simulate_shared(spec, records=("final",), engine="numpy", workers=None, players_per_task=None,
+                    pool=None, out=None):
+    """
+    Simulate the players of a spec on a process pool, ranges of
+    players_per_task players per task, with the results written into shared
+    memory. Returns {record: ndarray}, equal to run_spec with the same engine.
+    pool: an open executor to use (components.process_pool.process_pool);
+    otherwise one with `workers` processes is opened for this call.
+    players_per_task defaults to PLAYERS_PER_TASK, or to an even split of the
+    players over `workers` (the size of `pool`, when one is given) if that is
+    smaller, so that every worker gets a task.
+    out: SharedArrays with the layout of shared_layout() to write into; the
+    returned arrays are then its views (no copy) and the caller closes it.
+    """
+    unknown = set(records) - set(RECORD_TYPES)
+    if unknown:
+        raise ValueError(f"Unknown record types: {sorted(unknown)}")
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Available: {ENGINES}")
+    if players_per_task is None:
+        players_per_task = PLAYERS_PER_TASK
+        if workers:
+            players_per_task = max(1, min(players_per_task, -(-spec['num_players'] // workers)))
+    if players_per_task < 1:
+        raise ValueError("players_per_task must be at least 1")
+
+    shared = out if out is not None else SharedArrays(shared_layout(spec, records))
+    ranges = [(start, min(start + players_per_task, spec['num_players']))
+              for start in range(0, spec['num_players'], players_per_task)]
+    executor = pool
+    try:
+        if executor is None:
+            from components.process_pool import process_pool
+            executor = process_pool(workers)
+        handles = {record: shared.handles()[record] for record in records}
+        futures = [executor.submit(_fill_rows, handles, spec, tuple(records), engine, start, stop)
+                   for start, stop in ranges]
+        for future in futures:
+            future.result()
+        if out is not None:
+            return {record: shared.arrays[record] for record in records}
+        return {record: shared.arrays[record].copy() for record in records}
+    finally:
+        if executor is not None and pool is None:
+            executor.shutdown(cancel_futures=True)
+        if out is None:
+            shared.close()
+
+
+def shared_layout(spec, records=("final",)):
+    """Layout of SharedArrays for the records of a spec"""
+    dtype = money_dtype(spec)
+    if dtype == object:
+        raise ValueError("Bankrolls beyond 64-bit integers cannot be shared; run without workers")
+    return {record: (record_shape(spec, record), dtype) for record in records}
@@ -0,0 +1,160 @@
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel
+from components.batch_engine import house_edge
+from components.player_pool import PlayerPool, group_returns
+from components.player_pool import observe_spin, observe_session_end
+
+# One table, many players: every spin of a single wheel settles the bets of
+# the whole population at once, as a casino floor would.
+# The population is a PlayerPool, or a list of specs
+# (components.simulation.make_spec) where each spec adds num_players
+# identical players (strategy, bet, bankroll, limit).
+#
+# Bets are grouped by (bet_type, bet_value). The net return per unit staked
+# of every player on every pocket is precomputed as one (pockets, players)
+# int8 table (+multiplier on a win, -1 on a loss), so settling a spin is one
+# row gather: payouts = bets * returns[pocket].
+#
+# Per spin the table records, from the house side:
+#   handle    -> total amount wagered
+#   house_pnl -> house win (negative when players win)
+#   exposure  -> worst-case house loss over all pockets for the bets on the
+#                layout, i.e. what the house could have paid out on that spin
+#   active    -> players still at the table
+
+# What simulate_table can record per player (per-spin house records are always kept)
+TABLE_RECORDS = ("final", "paths", "lowest")
+
+
+def table_population(specs):
+    """(wheel_type, wheel_weights, PlayerPool) of a list of specs that share one wheel"""
+    specs = [specs] if isinstance(specs, dict) else list(specs)
+    if not specs:
+        raise ValueError("A table needs at least one spec")
+    wheel_type, weights = specs[0]['wheel_type'], specs[0].get('wheel_weights')
+    for spec in specs:
+        if spec['wheel_type'] != wheel_type or spec.get('wheel_weights') != weights:
+            raise ValueError("All specs at a table must use the same wheel")
+    return wheel_type, weights, PlayerPool.from_specs(specs)
+
+
+def simulate_table(specs, num_spins=None, seed=None, pockets=None, records=("final",), leave_when_broke=True,
+                   wheel_type=None, weights=None, observers=None):
+    """
+    Simulate a shared table: one spin stream settles every player's bet.
+    specs: one spec or a list of specs (same wheel; num_spins defaults to the
+    first spec's), or a PlayerPool played on `wheel_type` / `weights`.
+    Pass `pockets` (1-D pocket indices, e.g. from a ReplayWheel) to play
+    recorded spins instead of a wheel seeded with `seed`.
+    leave_when_broke: a player who cannot cover the next bet leaves the table
+    for good (False lets bankrolls go negative, like Game). A pool's stop-loss,
+    win goal and session length apply as well.
+    Returns a dict with the per-spin house arrays (pockets, handle, house_pnl,
+    exposure, active), the per-group handle and the requested player records.
+    Pass components.observers.Observers to receive one event batch per spin.
+    """
+    unknown = set(records) - set(TABLE_RECORDS)
+    if unknown:
+        raise ValueError(f"Unknown table records: {sorted(unknown)}")
+    if isinstance(specs, PlayerPool):
+        pool, wheel_type = specs, wheel_type or "european"
+    else:
+        wheel_type, weights, pool = table_population(specs)
+        first = specs if isinstance(specs, dict) else specs[0]
+        num_spins = first['num_spins'] if num_spins is None else num_spins
+    if pockets is None:
+        if num_spins is None:
+            raise ValueError("num_spins is needed to play a PlayerPool")
+        pockets = RouletteWheel(wheel_type, seed=seed, weights=weights).spin_indices(num_spins)
+    pockets = np.asarray(pockets)
+    num_spins = len(pockets)
+
+    # Step 1: Per-player return on every pocket, one contiguous row per pocket
+    by_group = group_returns(wheel_type, pool.groups)
+    returns = np.ascontiguousarray(by_group[pool.group].T)
+    num_groups = len(pool.groups)
+
+    state = pool.start()
+    handle = np.zeros(num_spins, dtype=pool.dtype)
+    house_pnl = np.zeros(num_spins, dtype=pool.dtype)
+    exposure = np.zeros(num_spins)
+    seated = np.zeros(num_spins, dtype=np.int64)
+    group_handle = np.zeros(num_groups)
+    paths = None
+    if "paths" in records:
+        paths = np.empty((num_spins + 1, len(pool)), dtype=pool.dtype)
+        paths[0] = state['bankroll']
+
+    observed = bool(observers)
+    players = np.arange(len(pool))
+    for spin in range(num_spins):
+        # Step 2: Bets on the layout (same doubling rule as Player / batch engine)
+        if observed:
+            before, hits = state['active'].copy(), pool.limit_hits(state)
+        bets = pool.place_bets(state, leave_when_broke)
+        seated[spin] = np.count_nonzero(state['active'])
+        if observed:
+            playing = state['active'].copy()
+
+        # Step 3: Settle everyone with one gather of the pocket's return row
+        payouts = pool.settle(state, bets, returns[pockets[spin]])
+        if observed:
+            observe_spin(observers, pool, players, state, before, playing, hits, bets, payouts)
+
+        # Step 4: House side of the spin
+        stakes = np.bincount(pool.group, weights=bets, minlength=num_groups)
+        group_handle += stakes
+        handle[spin] = bets.sum()
+        house_pnl[spin] = -payouts.sum()
+        exposure[spin] = max(0.0, float((stakes @ by_group).max())) if num_groups else 0.0
+        if paths is not None:
+            paths[spin + 1] = state['bankroll']
+    if observed and observers.callbacks['session_end']:
+        observe_session_end(observers, pool, players, state, state['active'])
+
+    results = {
+        'wheel_type': wheel_type,
+        'wheel_weights': weights,
+        'groups': pool.groups,
+        'pockets': pockets,
+        'handle': handle,
+        'house_pnl': house_pnl,
+        'exposure': exposure,
+        'active': seated,
+        'group_handle': group_handle,
+        'played': state['played'],
+        'reason': state['reason'],
+    }
+    if "final" in records:
+        results['final'] = state['bankroll']
+    if "paths" in records:
+        results['paths'] = paths
+    if "lowest" in records:
+        results['lowest'] = state['lowest']
+    return results
+
+
+def house_summary(results):
+    """
+    Totals of a simulate_table run: handle, house win, hold percentage (win /
+    handle), the theoretical hold for the same bet mix, peak exposure and the
+    players still seated at the end.
+    """
+    total_handle = float(np.sum(results['handle'], dtype=np.float64))
+    house_win = float(np.sum(results['house_pnl'], dtype=np.float64))
+    edges = np.array([house_edge(results['wheel_type'], bet_type, bet_value, results['wheel_weights'])
+                      for bet_type, bet_value in results['groups']])
+    expected = float(results['group_handle'] @ edges) if len(edges) else 0.0
+    # Largest fall of the house's running P&L from its previous peak
+    pnl = np.concatenate([[0.0], np.cumsum(results['house_pnl'], dtype=np.float64)])
+    return {
+        'spins': len(results['pockets']),
+        'handle': total_handle,
+        'house_win': house_win,
+        'hold': house_win / total_handle if total_handle else 0.0,
+        'expected_hold': expected / total_handle if total_handle else 0.0,
+        'max_exposure': float(results['exposure'].max()) if len(results['exposure']) else 0.0,
+        'worst_drawdown': float(np.max(np.maximum.accumulate(pnl) - pnl)),
+        'players_left': int(results['active'][-1]) if len(results['active']) else 0,
+    }
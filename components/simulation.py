@@ -0,0 +1,179 @@
+from functools import partial
+
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel
+from components.player import Player
+from components.game import Game
+
+# Every simulation is described by a plain dictionary (a "spec").
+# Two experiments that ask for the same spec can share one simulation run.
+DEFAULT_SPEC = {
+    'wheel_type': "european",
+    'strategy': "flat",
+    'bet_type': "color",
+    'bet_value': "red",
+    'base_bet': 10,
+    'initial_bankroll': 1000,
+    'table_limit': float('inf'),
+    'num_players': 1,
+    'num_spins': 1000,
+    'seed': None,
+    'wheel_weights': None,
+}
+
+# What a simulation can record for each player:
+#   final -> final bankroll
+#   paths -> bankroll after every spin (starting bankroll first)
+#   bets  -> amount actually wagered on every spin
+#   lowest -> lowest bankroll reached during the session (ruin checks)
+RECORD_TYPES = ("final", "paths", "bets", "lowest")
+
+# How a spec can be executed:
+#   scalar -> one Game object per player (the reference implementation)
+#   numpy  -> all players at once with components.batch_engine
+#   numba  -> compiled player x spin loop (components.jit_engine), falls
+#             back to the numpy engine when Numba is not installed
+ENGINES = ("scalar", "numpy", "numba")
+
+
+def make_spec(**overrides):
+    """Build a complete simulation spec from DEFAULT_SPEC plus overrides"""
+    unknown = set(overrides) - set(DEFAULT_SPEC)
+    if unknown:
+        raise ValueError(f"Unknown simulation parameters: {sorted(unknown)}")
+
+    spec = dict(DEFAULT_SPEC)
+    spec.update(overrides)
+
+    # JSON configs cannot express infinity, so None also means "no limit"
+    if spec['table_limit'] is None:
+        spec['table_limit'] = float('inf')
+    # Pocket weights (biased wheel) are stored as a tuple so specs stay hashable
+    if spec['wheel_weights'] is not None:
+        weights = spec['wheel_weights']
+        if isinstance(weights, dict):
+            weights = RouletteWheel(spec['wheel_type'], seed=0, weights=weights).weights
+        spec['wheel_weights'] = tuple(float(w) for w in weights)
+    return spec
+
+
+def spec_key(spec):
+    """Hashable identity of a spec, used to deduplicate simulations"""
+    return tuple(sorted(spec.items()))
+
+
+def player_seeds(spec, start=0, stop=None):
+    """
+    One independent seed per player, derived from the spec seed.
+    start/stop select a range of players; player i always gets the same seed.
+    """
+    stop = spec['num_players'] if stop is None else stop
+    if spec['seed'] is None:
+        return [None] * (stop - start)
+    # Child i of SeedSequence(seed).spawn(n), built directly
+    root = np.random.SeedSequence(spec['seed'])
+    return [np.random.SeedSequence(root.entropy, spawn_key=(i,), pool_size=root.pool_size) for i in range(start, stop)]
+
+
+def build_game(spec, seed=None):
+    """Create the wheel, player and game described by a spec"""
+    wheel = RouletteWheel(spec['wheel_type'], seed=seed, weights=spec.get('wheel_weights'))
+
+    player = Player(strategy=spec['strategy'],
+                    initial_bankroll=spec['initial_bankroll'],
+                    base_bet=spec['base_bet'])
+    player.bet_type = spec['bet_type']
+    player.bet_value = spec['bet_value']
+
+    return Game(wheel, player, table_limit=spec['table_limit'])
+
+
+def spec_from_game(game, num_spins=None, num_players=1):
+    """
+    The spec describing an existing Game (its wheel, player settings and table
+    limit), from its first spin: a game that has already played is described
+    with the bankroll its player started with.
+    """
+    return make_spec(wheel_type=game.wheel.wheel_type,
+                     strategy=game.player.strategy,
+                     bet_type=game.player.bet_type,
+                     bet_value=game.player.bet_value,
+                     base_bet=game.player.base_bet,
+                     initial_bankroll=game.player.initial_bankroll,
+                     table_limit=game.table_limit,
+                     num_players=num_players,
+                     num_spins=num_spins if num_spins is not None else DEFAULT_SPEC['num_spins'],
+                     seed=game.wheel.seed,
+                     wheel_weights=game.wheel.weights)
+
+
+def run_spec(spec, records=("final",), engine="scalar", instrumentation=None, observers=None, players=None,
+             workers=1):
+    """
+    Run every player of a spec with the chosen engine.
+    Returns a dict with one list per requested record type.
+    Seeded specs give identical results with every engine.
+    players: (start, stop) to run only those players, with the results they
+    have in the whole run (results of consecutive ranges concatenate).
+    workers > 1 spreads the players over that many processes, which write
+    their results into shared memory (components.shared_results).
+    Pass a components.instrumentation.Instrumentation to collect phase timings,
+    and components.observers.Observers to receive the spin events (the numba
+    engine runs as numpy when observed, with the same results).
+    """
+    unknown = set(records) - set(RECORD_TYPES)
+    if unknown:
+        raise ValueError(f"Unknown record types: {sorted(unknown)}")
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Available: {ENGINES}")
+    if workers > 1:
+        if instrumentation is not None or observers or players is not None:
+            raise ValueError("Instrumentation, observers and player ranges need workers=1")
+        from components.shared_results import simulate_shared
+        arrays = simulate_shared(spec, records, engine=engine, workers=workers)
+        return {record: arrays[record].tolist() for record in records}
+    seeds = player_seeds(spec, *(players or ()))
+
+    if engine in ("numpy", "numba"):
+        from components.batch_engine import pocket_matrix, simulate_batch
+        if observers:
+            simulate = partial(simulate_batch, observers=observers)
+        elif engine == "numba":
+            from components.jit_engine import simulate_jit as simulate
+        else:
+            simulate = simulate_batch
+        if instrumentation is None:
+            pockets = pocket_matrix(spec['wheel_type'], seeds, spec['num_spins'],
+                                    spec.get('wheel_weights'))
+            arrays = simulate(spec, pockets, records)
+        else:
+            with instrumentation.phase("rng"):
+                pockets = pocket_matrix(spec['wheel_type'], seeds, spec['num_spins'],
+                                        spec.get('wheel_weights'))
+            with instrumentation.phase("batch"):
+                arrays = simulate(spec, pockets, records)
+            instrumentation.counters['spins'] += len(seeds) * spec['num_spins']
+        return {record: arrays[record].tolist() for record in records}
+
+    results = {record: [] for record in records}
+
+    for player, seed in enumerate(seeds, start=players[0] if players else 0):
+        game = build_game(spec, seed=seed)
+        if instrumentation is not None:
+            instrumentation.attach(game)
+        if observers:
+            observers.attach(game, player)
+        game.run_simulation(spec['num_spins'])
+        path = [spec['initial_bankroll']] + [step['bankroll'] for step in game.history]
+
+        if "final" in results:
+            results["final"].append(game.player.bankroll)
+        if "paths" in results:
+            results["paths"].append(path)
+        if "bets" in results:
+            results["bets"].append([step['bet_amount'] for step in game.history])
+        if "lowest" in results:
+            results["lowest"].append(min(path))
+
+    return results
@@ -0,0 +1,186 @@
+import os
+import struct
+
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel, SPIN_BLOCK
+
+# Compact on-disk spin logs for backtesting against recorded spins.
+# A log is a 64-byte header followed by one uint8 pocket index per spin
+# (an index into RouletteWheel(wheel_type).numbers), so a billion spins take
+# 1 GB and can be replayed through numpy.memmap without loading them.
+#
+# Header (little endian): magic, format version, wheel type (ASCII, padded),
+# number of pockets, number of spins. The spin count is written as 0 when a
+# writer opens and patched when it is closed; a log whose header still says 0
+# (the writer never closed) is read up to the end of the file, so an
+# interrupted recording still opens with the spins it managed to flush.
+
+MAGIC = b"RSPINLOG"
+VERSION = 1
+HEADER = struct.Struct("<8sH16sBQ")
+HEADER_SIZE = 64
+
+# Spins drawn per write when recording a wheel
+RECORD_CHUNK = 2 ** 22
+
+
+def read_spin_log_header(path):
+    """Header of a spin log as a dict: wheel_type, num_pockets, num_spins, version"""
+    with open(path, "rb") as file:
+        raw = file.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE or raw[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not a spin log")
+    _, version, wheel_type, num_pockets, num_spins = HEADER.unpack_from(raw)
+    if version != VERSION:
+        raise ValueError(f"Unsupported spin log version {version} (expected {VERSION})")
+    wheel_type = wheel_type.rstrip(b"\0").decode("ascii")
+
+    # Trust the file size over the header if a writer was interrupted
+    # (never closed: count still 0, or closed and then truncated)
+    stored = os.path.getsize(path) - HEADER_SIZE
+    num_spins = stored if num_spins == 0 else min(num_spins, stored)
+    return {'wheel_type': wheel_type, 'num_pockets': num_pockets, 'num_spins': num_spins, 'version': version}
+
+
+class SpinLogWriter:
+    """
+    Append pocket indices to a new spin log:
+        with SpinLogWriter("spins.rsl", "european") as log:
+            log.write(wheel.spin_indices(1000000))
+    """
+
+    def __init__(self, path, wheel_type):
+        self.path = path
+        self.wheel_type = wheel_type
+        self.num_pockets = RouletteWheel(wheel_type, seed=0).get_total_pockets()
+        self.num_spins = 0
+        self._file = open(path, "wb")
+        self._write_header()
+
+    def _write_header(self):
+        header = HEADER.pack(MAGIC, VERSION, self.wheel_type.encode("ascii"), self.num_pockets, self.num_spins)
+        self._file.seek(0)
+        self._file.write(header.ljust(HEADER_SIZE, b"\0"))
+        self._file.seek(0, os.SEEK_END)
+
+    def write(self, pockets):
+        """Append an array of pocket indices (values must be valid for the wheel)"""
+        pockets = np.asarray(pockets)
+        if pockets.size and (pockets.min() < 0 or pockets.max() >= self.num_pockets):
+            raise ValueError(f"Pocket indices must be between 0 and {self.num_pockets - 1}")
+        self._file.write(np.ascontiguousarray(pockets, dtype=np.uint8).tobytes())
+        self.num_spins += pockets.size
+
+    def close(self):
+        if not self._file.closed:
+            self._write_header()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def write_spin_log(path, wheel_type, pockets):
+    """Write a whole array of pocket indices as a spin log"""
+    with SpinLogWriter(path, wheel_type) as log:
+        log.write(pockets)
+    return path
+
+
+def record_spin_log(path, wheel, num_spins, chunk_size=RECORD_CHUNK):
+    """Spin `wheel` num_spins times straight into a spin log (chunked, constant memory)"""
+    with SpinLogWriter(path, wheel.wheel_type) as log:
+        while log.num_spins < num_spins:
+            log.write(wheel.spin_indices(min(chunk_size, num_spins - log.num_spins)))
+    return path
+
+
+def open_spin_log(path):
+    """(header, read-only memmap of the pocket indices)"""
+    header = read_spin_log_header(path)
+    if header['num_spins'] == 0:
+        return header, np.zeros(0, dtype=np.uint8)
+    pockets = np.memmap(path, dtype=np.uint8, mode="r", offset=HEADER_SIZE, shape=(header['num_spins'],))
+    return header, pockets
+
+
+class ReplayWheel(RouletteWheel):
+    """
+    A wheel that replays a spin log instead of drawing random pockets.
+    Works anywhere a RouletteWheel does (Game, spin, spin_indices); the log is
+    read through a memmap, so only the spins in use are paged in.
+    Replaying past the end raises ValueError unless loop=True.
+    """
+
+    def __init__(self, path, start=0, loop=False):
+        header, self.log = open_spin_log(path)
+        super().__init__(header['wheel_type'])
+        if header['num_pockets'] != len(self.numbers):
+            raise ValueError(f"Log has {header['num_pockets']} pockets, {header['wheel_type']} wheel has {len(self.numbers)}")
+        if not 0 <= start <= len(self.log):
+            raise ValueError(f"start must be between 0 and {len(self.log)}")
+        self.path = path
+        self.loop = loop
+        # Position of the next unread spin in the log
+        self.offset = start
+
+    def _read(self, count):
+        """Next `count` spins of the log (wrapping around when looping)"""
+        available = len(self.log) - self.offset
+        if count > available and not self.loop:
+            raise ValueError(f"Spin log exhausted: {count} spins requested, {available} left in {self.path}")
+        if count > 0 and len(self.log) == 0:
+            raise ValueError(f"Spin log {self.path} is empty")
+        parts = []
+        while count > 0:
+            take = min(count, len(self.log) - self.offset)
+            parts.append(np.array(self.log[self.offset:self.offset + take]))
+            self.offset = (self.offset + take) % len(self.log) if self.loop else self.offset + take
+            count -= take
+        return np.concatenate(parts) if len(parts) != 1 else parts[0]
+
+    def _refill(self):
+        # Buffer the next block of the log for spin()
+        size = SPIN_BLOCK if self.loop else min(SPIN_BLOCK, len(self.log) - self.offset)
+        self._block = self._read(max(size, 1))
+        self._position = 0
+
+    def spin_indices(self, count):
+        """Return the next `count` spins as pocket indices (sliced straight from the log)"""
+        # Spins already buffered by spin() come first
+        buffered = self._block[self._position:self._position + count]
+        self._position += len(buffered)
+        if len(buffered) == count:
+            return buffered.copy()
+        return np.concatenate([buffered, self._read(count - len(buffered))])
+
+    def get_state(self):
+        """Wheel state plus the position in the log (and which log)"""
+        return dict(super().get_state(), path=os.path.abspath(self.path), offset=self.offset, loop=self.loop)
+
+    def set_state(self, state):
+        """Continue replaying where the ReplayWheel that produced `state` stopped"""
+        if 'offset' not in state:
+            raise ValueError("State of a random wheel cannot be set on a ReplayWheel")
+        if state['path'] != os.path.abspath(self.path):
+            raise ValueError(f"State replays {state['path']}, not {os.path.abspath(self.path)}")
+        super().set_state(state)
+        self.offset = int(state['offset'])
+        self.loop = bool(state['loop'])
+
+    def remaining(self):
+        """Spins left before the end of the log (buffered spins included)"""
+        return len(self.log) - self.offset + len(self._block) - self._position
+
+
+def replay_pocket_matrix(path, num_players, num_spins, start=0):
+    """(players, spins) pocket matrix for the batch engines: consecutive stretches of the log"""
+    header, pockets = open_spin_log(path)
+    needed = num_players * num_spins
+    if start < 0 or start + needed > header['num_spins']:
+        raise ValueError(f"Log has {header['num_spins']} spins; {needed} needed from spin {start}")
+    return np.array(pockets[start:start + needed]).reshape(num_players, num_spins)
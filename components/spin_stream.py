@@ -0,0 +1,131 @@
+import csv
+
+# Streaming consumers for Game.iter_spins.
+# A consumer sees one spin record at a time through update(record) and keeps
+# only what its analysis needs, so a session of any length runs in bounded
+# memory:
+#     game = build_game(spec)
+#     stats, sampler = consume(game.iter_spins(10 ** 7), SpinStatistics(), BankrollSampler())
+#
+# consume() feeds every record to every consumer in a single pass (chunks
+# from iter_spins(chunk_size=...) are flattened) and can stop the session
+# early with `until`.
+
+# Most bankroll points a BankrollSampler keeps before halving its resolution
+SAMPLE_POINTS = 4096
+
+
+class SpinStatistics:
+    """Running totals of a session: wins, amount wagered, net, bankroll extremes, drawdown, streaks"""
+
+    def __init__(self, initial_bankroll=None):
+        self.spins = 0
+        self.wins = 0
+        self.wagered = 0
+        self.net = 0
+        self.initial_bankroll = initial_bankroll
+        self.final_bankroll = initial_bankroll
+        self.lowest_bankroll = initial_bankroll
+        self.peak_bankroll = initial_bankroll
+        self.max_drawdown = 0
+        self.losing_streak = 0
+        self.longest_losing_streak = 0
+
+    def update(self, record):
+        bankroll = record['bankroll']
+        self.spins += 1
+        self.wagered += record['bet_amount']
+        self.net += record['payout']
+        if record['result'] == 'win':
+            self.wins += 1
+            self.losing_streak = 0
+        else:
+            self.losing_streak += 1
+            self.longest_losing_streak = max(self.longest_losing_streak, self.losing_streak)
+        self.final_bankroll = bankroll
+        if self.peak_bankroll is None:
+            self.lowest_bankroll = self.peak_bankroll = bankroll
+        self.lowest_bankroll = min(self.lowest_bankroll, bankroll)
+        self.peak_bankroll = max(self.peak_bankroll, bankroll)
+        self.max_drawdown = max(self.max_drawdown, self.peak_bankroll - bankroll)
+
+    def summary(self):
+        """The totals as a dict (win rate and hold are 0 before any spin)"""
+        return {
+            'spins': self.spins,
+            'wins': self.wins,
+            'win_rate': self.wins / self.spins if self.spins else 0.0,
+            'wagered': self.wagered,
+            'net': self.net,
+            'hold': -self.net / self.wagered if self.wagered else 0.0,
+            'final_bankroll': self.final_bankroll,
+            'lowest_bankroll': self.lowest_bankroll,
+            'peak_bankroll': self.peak_bankroll,
+            'max_drawdown': self.max_drawdown,
+            'longest_losing_streak': self.longest_losing_streak,
+        }
+
+
+class BankrollSampler:
+    """
+    Bankroll path for plotting in at most max_points points: every stride-th
+    spin is kept, and the stride doubles (dropping every other point) when
+    the buffer is full.
+    """
+
+    def __init__(self, max_points=SAMPLE_POINTS):
+        if max_points < 2:
+            raise ValueError("max_points must be at least 2")
+        self.max_points = max_points
+        self.stride = 1
+        self.spin_numbers = []
+        self.bankrolls = []
+
+    def update(self, record):
+        if record['spin_number'] % self.stride:
+            return
+        if len(self.bankrolls) == self.max_points:
+            self.stride *= 2
+            self.spin_numbers = self.spin_numbers[1::2]
+            self.bankrolls = self.bankrolls[1::2]
+            if record['spin_number'] % self.stride:
+                return
+        self.spin_numbers.append(record['spin_number'])
+        self.bankrolls.append(record['bankroll'])
+
+
+class RecordWriter:
+    """
+    Write spin records as CSV rows (one per spin) to an open text file:
+        with open("session.csv", "w", newline="") as file:
+            consume(game.iter_spins(), RecordWriter(file))
+    """
+
+    FIELDS = ('spin_number', 'spin_result', 'bet_amount', 'intended_bet', 'bet_type', 'bet_value',
+              'result', 'payout', 'bankroll')
+
+    def __init__(self, file, fields=FIELDS):
+        self.writer = csv.DictWriter(file, fieldnames=list(fields), extrasaction="ignore")
+        self.writer.writeheader()
+        self.rows = 0
+
+    def update(self, record):
+        self.writer.writerow(record)
+        self.rows += 1
+
+
+def consume(records, *consumers, until=None):
+    """
+    Feed every record of a stream (records or chunks of records) to each
+    consumer's update(). Stops after the first record for which until(record)
+    is true (with chunks, the game has already played the rest of that
+    chunk). Returns the consumers, or the single consumer when only one is given.
+    """
+    updates = [consumer.update for consumer in consumers]
+    for item in records:
+        for record in (item if isinstance(item, list) else (item,)):
+            for update in updates:
+                update(record)
+            if until is not None and until(record):
+                return consumers[0] if len(consumers) == 1 else consumers
+    return consumers[0] if len(consumers) == 1 else consumers
@@ -0,0 +1,59 @@
+import numpy as np
+
+from components.batch_engine import house_edge
+from components.roulette_wheel import RouletteWheel
+
+# Pocket weights for biased wheels, ready for RouletteWheel(weights=...) or
+# make_spec(wheel_weights=...). Weights are returned in wheel.numbers order.
+#   worn pockets  -> a few pockets come up more often (loose frets, worn slots)
+#   sector bias   -> a dealer signature: the ball tends to land in one arc of
+#                    the wheel, so neighbouring pockets on the physical wheel
+#                    (not neighbouring numbers) share the bias
+
+# Physical order of the pockets, clockwise from zero
+WHEEL_LAYOUTS = {
+    "european": [0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23, 10,
+                 5, 24, 16, 33, 1, 20, 14, 31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26],
+    "american": ['0', 28, 9, 26, 30, 11, 7, 20, 32, 17, 5, 22, 34, 15, 3, 24, 36, 13, 1,
+                 '00', 27, 10, 25, 29, 12, 8, 19, 31, 18, 6, 21, 33, 16, 4, 23, 35, 14, 2],
+}
+
+
+def worn_pocket_weights(wheel_type, pockets, boost):
+    """Every pocket in `pockets` is `boost` times as likely as a normal pocket"""
+    if boost < 0:
+        raise ValueError("boost must be non-negative")
+    return RouletteWheel(wheel_type, seed=0, weights={pocket: boost for pocket in pockets}).weights
+
+
+def sector_bias_weights(wheel_type, center, width, strength):
+    """
+    Dealer-signature bias: pockets within `width` positions of `center` on the
+    physical wheel get extra weight, tapering linearly from 1 + strength at
+    the center to 1 at the edge of the sector.
+    """
+    if wheel_type not in WHEEL_LAYOUTS:
+        raise ValueError(f"No pocket layout for '{wheel_type}'. Available: {sorted(WHEEL_LAYOUTS)}")
+    if width < 0 or strength < 0:
+        raise ValueError("width and strength must be non-negative")
+    layout = WHEEL_LAYOUTS[wheel_type]
+    if center not in layout:
+        raise ValueError(f"Unknown pocket {center!r} for the {wheel_type} wheel")
+
+    # Step 1: Distance of every slot from the center, going either way round
+    size = len(layout)
+    offset = np.arange(size) - layout.index(center)
+    distance = np.minimum(offset % size, -offset % size)
+
+    # Step 2: Linear taper inside the sector
+    boost = 1 + strength * np.clip(1 - distance / (width + 1), 0, None)
+    return RouletteWheel(wheel_type, seed=0, weights=dict(zip(layout, boost))).weights
+
+
+def bet_edges(wheel_type, weights=None):
+    """Exact house edge of every color and straight-up number bet on the (weighted) wheel"""
+    numbers = RouletteWheel(wheel_type, seed=0).numbers
+    edges = {('color', color): house_edge(wheel_type, 'color', color, weights) for color in ('red', 'black')}
+    for number in numbers:
+        edges[('number', number)] = house_edge(wheel_type, 'number', number, weights)
+    return edges
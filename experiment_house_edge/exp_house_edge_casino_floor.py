@@ -0,0 +1,71 @@
+import sys
+import os
+# Add project root to system path to find 'components'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+from components.simulation import make_spec
+from components.shared_table import simulate_table, house_summary
+from utils.plot_helpers import create_house_pnl_plot, get_plot_path
+
+
+def floor_population(wheel_type, num_players, table_limit=1000):
+    """
+    A mixed crowd: flat colour bettors, straight-up bettors spread over all
+    of 1-36, and Martingale players on red and black
+    """
+    share = num_players // 4
+    population = [
+        make_spec(wheel_type=wheel_type, strategy="flat", bet_value="red", num_players=share),
+        make_spec(wheel_type=wheel_type, strategy="flat", bet_value="black", base_bet=25, num_players=share),
+    ]
+    for number in range(1, 37):
+        population.append(make_spec(wheel_type=wheel_type, strategy="flat", bet_type="number", bet_value=number,
+                                    base_bet=5, num_players=share // 36 + (number <= share % 36)))
+    martingale_players = num_players - 3 * share
+    for color, players in (("red", martingale_players // 2), ("black", martingale_players - martingale_players // 2)):
+        population.append(make_spec(wheel_type=wheel_type, strategy="martingale", bet_value=color,
+                                    table_limit=table_limit, num_players=players))
+    return population
+
+
+def run_casino_floor_experiment(num_players=10000, num_spins=5000, seed=2024):
+    """
+    EXPERIMENT: The House Side
+    Thousands of players with different bets share one wheel per variant.
+    Every spin settles the whole table at once; the house P&L, hold
+    percentage and worst-case exposure per spin are compared with the
+    theoretical hold of the same bet mix.
+    """
+    print("🎯 CASINO FLOOR: House P&L of a Shared Table")
+    print("=" * 95)
+    print(f"{num_players:,} players per table, {num_spins:,} spins, players leave when they cannot cover a bet")
+    print(f"\n{'WHEEL':<10} | {'HANDLE':>14} | {'HOUSE WIN':>12} | {'HOLD':>6} | {'THEORY':>6} | "
+          f"{'PEAK EXPOSURE':>13} | {'LEFT':>6} | {'PLAYER-SPINS/S':>14}")
+    print("-" * 95)
+
+    table_results, summaries = {}, {}
+    for wheel_type in ("european", "american", "triple"):
+        start = time.perf_counter()
+        results = simulate_table(floor_population(wheel_type, num_players), num_spins, seed=seed)
+        rate = num_players * num_spins / (time.perf_counter() - start)
+        summary = house_summary(results)
+        table_results[wheel_type], summaries[wheel_type] = results, summary
+        print(f"{wheel_type.title():<10} | ${summary['handle']:>13,.0f} | ${summary['house_win']:>11,.0f} | "
+              f"{summary['hold']:>6.2%} | {summary['expected_hold']:>6.2%} | ${summary['max_exposure']:>12,.0f} | "
+              f"{summary['players_left']:>6,} | {rate:>14,.0f}")
+
+    print("\n(every player at a table sees the same spin, so the house result swings with")
+    print(" single spins much more than the handle alone suggests)")
+
+    current_folder = os.path.dirname(os.path.abspath(__file__))
+    plt = create_house_pnl_plot(table_results, summaries)
+    path = get_plot_path(current_folder, 'casino_floor_house_pnl.png')
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    plt.show()
+    print(f"📊 Plot saved to: {path}")
+
+
+if __name__ == "__main__":
+    run_casino_floor_experiment()
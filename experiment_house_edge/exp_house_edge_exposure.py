@@ -0,0 +1,72 @@
+import sys
+import os
+# Add project root to system path to find 'components'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+import numpy as np
+
+from components.simulation import make_spec
+from components.shared_table import simulate_table
+from utils.house_exposure import house_risk_profile, bet_mix_from_table
+from utils.plot_helpers import create_shift_distribution_plot, get_plot_path
+
+# Stakes on the layout per spin for three kinds of table (about $1,000 handle each)
+BET_MIXES = {
+    "colour only": {("color", "red"): 600, ("color", "black"): 400},
+    "mixed floor": {("color", "red"): 400, ("color", "black"): 300,
+                    **{("number", n): 8 for n in range(1, 37)}},
+    "hot number": {("color", "red"): 500, ("color", "black"): 400, ("number", 17): 100},
+}
+
+
+def run_exposure_experiment(wheel_type="american", spins_per_hour=40, hours_per_shift=8):
+    """
+    EXPERIMENT: House Liability
+    Exact distribution of the house result per spin, hour and shift for
+    three bet mixes with about the same handle, with VaR and expected
+    shortfall. Straight-up bets spread over the layout hedge each other,
+    but a crowd on one number (35:1) carries most of the variance. The
+    hourly numbers are checked against a simulated shared table.
+    """
+    print("🎯 HOUSE LIABILITY: Result Distribution per Spin, Hour and Shift")
+    print("=" * 92)
+    print(f"{wheel_type.title()} wheel, {spins_per_hour} spins per hour, {hours_per_shift}-hour shifts")
+
+    profiles = {}
+    for label, mix in BET_MIXES.items():
+        start = time.perf_counter()
+        profiles[label] = house_risk_profile(wheel_type, mix, spins_per_hour, hours_per_shift)
+        seconds = time.perf_counter() - start
+        print(f"\n{label.upper()} (handle ${sum(mix.values()):,} per spin, computed in {seconds * 1000:.1f} ms)")
+        print(f"  {'PERIOD':<6} | {'MEAN WIN':>10} | {'STD DEV':>10} | {'P(LOSS)':>7} | {'VaR 99%':>10} | "
+              f"{'ES 99%':>10} | {'VaR 99.9%':>10} | {'ES 99.9%':>10}")
+        for period in ("spin", "hour", "shift"):
+            result = profiles[label][period]
+            print(f"  {period:<6} | ${result['mean']:>9,.0f} | ${result['std']:>9,.0f} | {result['p_house_loses']:>7.1%} | "
+                  f"${result['var'][0.99]:>9,.0f} | ${result['es'][0.99]:>9,.0f} | "
+                  f"${result['var'][0.999]:>9,.0f} | ${result['es'][0.999]:>9,.0f}")
+
+    # --- Check: the exact hour against a simulated table with the same mix ---
+    hours = 20000
+    specs = [make_spec(wheel_type=wheel_type, bet_type="color", bet_value="red", base_bet=400),
+             make_spec(wheel_type=wheel_type, bet_type="color", bet_value="black", base_bet=300)]
+    specs += [make_spec(wheel_type=wheel_type, bet_type="number", bet_value=n, base_bet=8) for n in range(1, 37)]
+    table = simulate_table(specs, hours * spins_per_hour, seed=2024, leave_when_broke=False)
+    hourly = table['house_pnl'].reshape(hours, spins_per_hour).sum(axis=1)
+    exact = house_risk_profile(wheel_type, bet_mix_from_table(table), spins_per_hour, hours_per_shift)['hour']
+    print(f"\nCheck (mixed floor, {hours:,} simulated hours): mean ${hourly.mean():,.0f} vs ${exact['mean']:,.0f}, "
+          f"VaR 99% ${-np.quantile(hourly, 0.01):,.0f} vs ${exact['var'][0.99]:,.0f}")
+
+    current_folder = os.path.dirname(os.path.abspath(__file__))
+    plt = create_shift_distribution_plot(profiles, f'House Result per {hours_per_shift}-Hour Shift, '
+                                                   f'{wheel_type.title()} Wheel')
+    path = get_plot_path(current_folder, f'house_exposure_{wheel_type}.png')
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    plt.show()
+    print(f"📊 Plot saved to: {path}")
+
+
+if __name__ == "__main__":
+    run_exposure_experiment()
@@ -0,0 +1,97 @@
+import sys
+import os
+# Add project root to system path to find 'components'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import math
+import time
+
+from components.batch_engine import house_edge
+from components.simulation import make_spec, build_game
+from components.player_pool import PlayerPool, simulate_pool
+from components.spin_stream import SpinStatistics
+from components.checkpoint import run_game, CHECKPOINT_SECONDS
+from utils.parameter_sweep import get_results_path
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Long house-edge validation that can be stopped and resumed from checkpoints.")
+    parser.add_argument("--wheel", action="append", choices=["european", "american", "triple"],
+                        help="wheel to validate (repeatable; default: all three)")
+    parser.add_argument("--engine", default="pool", choices=["pool", "game"],
+                        help="pool: many flat bettors in one batch; game: one scalar Game")
+    parser.add_argument("--spins", type=int, default=10 ** 9, help="total spins (player-spins for the pool)")
+    parser.add_argument("--players", type=int, default=1000, help="players in the pool")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--every", type=float, default=CHECKPOINT_SECONDS, help="seconds between checkpoints")
+    parser.add_argument("--fresh", action="store_true", help="ignore existing checkpoints and start over")
+    return parser
+
+
+def validate_with_pool(wheel_type, num_spins, num_players, seed, checkpoint, every):
+    """(spins, wagered, player loss) of flat red bettors that never leave the table"""
+    spec = make_spec(wheel_type=wheel_type, base_bet=10, initial_bankroll=0, num_players=num_players)
+    pool = PlayerPool.from_specs([spec])
+    results = simulate_pool(pool, num_spins // num_players, wheel_type, seed=seed, leave_when_broke=False,
+                            checkpoint=checkpoint, checkpoint_seconds=every)
+    return int(results['played'].sum()), float(results['wagered'].sum()), -float(results['final'].sum())
+
+
+def validate_with_game(wheel_type, num_spins, seed, checkpoint, every):
+    """(spins, wagered, player loss) of one flat red bettor"""
+    game = build_game(make_spec(wheel_type=wheel_type, base_bet=10, initial_bankroll=0), seed=seed)
+    stats = run_game(game, num_spins, checkpoint, [SpinStatistics(0)], every_seconds=every)
+    return stats.spins, float(stats.wagered), -float(stats.net)
+
+
+def run_long_validation(argv=None):
+    """
+    EXPERIMENT: Long-Run House Edge
+    Plays up to billions of red bets per wheel and compares the observed hold
+    with the theoretical edge. Progress is checkpointed; stopping the script
+    (Ctrl+C, a crash) and running the same command again resumes the run and
+    gives exactly the numbers of an uninterrupted one.
+    """
+    args = build_parser().parse_args(argv)
+    current_folder = os.path.dirname(os.path.abspath(__file__))
+    wheels = args.wheel or ["european", "american", "triple"]
+
+    print(f"🎯 LONG-RUN HOUSE EDGE: {args.spins:,} spins per wheel ({args.engine} engine)")
+    print("=" * 70)
+    print(f"{'WHEEL':<10} | {'HOLD':>8} | {'THEORY':>8} | {'95% CI':>17} | {'SPINS/S':>12} | CHECKPOINT")
+    print("-" * 70)
+
+    for wheel_type in wheels:
+        name = f"long_run_{args.engine}_{wheel_type}_{args.spins}_{args.seed}.ckpt"
+        checkpoint = get_results_path(current_folder, name)
+        resumed = os.path.exists(checkpoint) and not args.fresh
+        if args.fresh and os.path.exists(checkpoint):
+            os.remove(checkpoint)
+
+        start = time.perf_counter()
+        try:
+            if args.engine == "pool":
+                spins, wagered, loss = validate_with_pool(wheel_type, args.spins, args.players, args.seed,
+                                                          checkpoint, args.every)
+            else:
+                spins, wagered, loss = validate_with_game(wheel_type, args.spins, args.seed, checkpoint, args.every)
+        except KeyboardInterrupt:
+            print(f"\n⏸  Interrupted. Run the same command again to resume from {checkpoint}")
+            return
+        seconds = time.perf_counter() - start
+
+        # Each red bet returns +1 or -1 per unit, so its variance is 1 - edge^2
+        edge = house_edge(wheel_type, "color", "red")
+        margin = 1.96 * math.sqrt((1 - edge ** 2) / max(spins, 1))
+        hold = loss / wagered if wagered else 0.0
+        print(f"{wheel_type:<10} | {hold:>8.4%} | {edge:>8.4%} | {hold - margin:>8.4%}-{hold + margin:<8.4%} | "
+              f"{spins / seconds if seconds > 0 else 0:>12,.0f} | {'resumed' if resumed else 'new'}")
+
+    print("\nCheckpoints are kept in results/: running again returns the finished numbers at once "
+          "(--fresh starts over).")
+
+
+if __name__ == "__main__":
+    run_long_validation()
@@ -0,0 +1,112 @@
+import sys
+import os
+# Add project root to system path to find 'components'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel
+from components.batch_engine import PAYOUTS, win_table, simulate_batch
+from components.simulation import make_spec
+from components.spin_log import ReplayWheel, read_spin_log_header, replay_pocket_matrix
+from utils.spin_log_import import import_spin_log
+from utils.bias_detection import detect_bias
+from utils.parameter_sweep import get_results_path
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Run the house-edge checks and strategy backtests on a spin log.")
+    parser.add_argument("log", nargs="?",
+                        help="CSV/text spin log or binary .rsl log (default: a generated demo log)")
+    parser.add_argument("--wheel", default="american", choices=["european", "american", "triple"])
+    parser.add_argument("--column", type=int, help="CSV column holding the pocket (0-based); omit for plain text")
+    parser.add_argument("--delimiter", default=",")
+    parser.add_argument("--skip-rows", type=int, default=0, help="header lines to skip")
+    parser.add_argument("--session", type=int, default=1000, help="spins per backtested session")
+    return parser
+
+
+def write_demo_log(path, wheel_type, num_spins=2000000, seed=2024):
+    """A CSV log like a casino export: timestamp, table, pocket"""
+    wheel = RouletteWheel(wheel_type, seed=seed)
+    tokens = np.array([str(number) for number in wheel.numbers])
+    with open(path, "w") as file:
+        file.write("timestamp,table,pocket\n")
+        for start in range(0, num_spins, 100000):
+            pockets = tokens[wheel.spin_indices(min(100000, num_spins - start))]
+            file.writelines(f"{start + i},T1,{pocket}\n" for i, pocket in enumerate(pockets))
+    return path
+
+
+def run_spin_log_experiment(argv=None):
+    """
+    EXPERIMENT: Historical Spins
+    Imports a spin log into the binary replay format, checks the observed house
+    edge and bias against the wheel, then backtests flat and Martingale bettors
+    on consecutive sessions of the recorded spins.
+    """
+    args = build_parser().parse_args(argv)
+    current_folder = os.path.dirname(os.path.abspath(__file__))
+
+    print("🎯 HISTORICAL SPINS: House Edge & Backtests on a Spin Log")
+    print("=" * 65)
+
+    # --- Step 1: Import (CSV/text -> binary replay log) ---
+    source = args.log
+    column, skip_rows = args.column, args.skip_rows
+    if source is None:
+        source = write_demo_log(get_results_path(current_folder, f"demo_{args.wheel}_spins.csv"), args.wheel)
+        column, skip_rows = 2, 1
+        print(f"No log given, generated a demo log: {source}")
+
+    if source.endswith(".rsl"):
+        binary = source
+    else:
+        binary = get_results_path(current_folder, os.path.splitext(os.path.basename(source))[0] + ".rsl")
+        summary = import_spin_log(source, binary, args.wheel, column=column, delimiter=args.delimiter,
+                                  skip_rows=skip_rows)
+        print(f"Imported {summary['spins']:,} spins in {summary['seconds']:.2f}s "
+              f"({summary['mb_per_second']:.1f} MB/s, {summary['spins_per_second']:,.0f} spins/s) -> {binary}")
+
+    header = read_spin_log_header(binary)
+    wheel_type, num_spins = header['wheel_type'], header['num_spins']
+    print(f"Log: {num_spins:,} spins on a {wheel_type} wheel")
+
+    # --- Step 2: Observed house edge of the standard bets ---
+    pockets = ReplayWheel(binary).spin_indices(num_spins)
+    print(f"\n{'BET':<12} | {'OBSERVED EDGE':>13} | {'FAIR-WHEEL EDGE':>15}")
+    print("-" * 48)
+    for bet_type, bet_value in (("color", "red"), ("color", "black"), ("number", 17)):
+        wins = win_table(wheel_type, bet_type, bet_value)
+        multiplier = PAYOUTS[bet_type]
+        observed = 1 - (multiplier + 1) * wins[pockets].mean()
+        fair = 1 - (multiplier + 1) * wins.mean()
+        print(f"{bet_type + ' ' + str(bet_value):<12} | {observed:>13.2%} | {fair:>15.2%}")
+
+    # --- Step 3: Is the wheel biased? ---
+    report = detect_bias(ReplayWheel(binary), max_spins=num_spins, first_look=min(1000, num_spins))
+    print(f"\nBias tests over {report['spins']:,} spins (alpha {report['alpha']}):")
+    for name, spins in report['detected_at'].items():
+        verdict = f"flagged after {spins:,} spins" if spins is not None else "no bias detected"
+        print(f"  {name:<11} {verdict} (final p = {report['p_values'][name]:.3g})")
+
+    # --- Step 4: Backtest strategies on consecutive sessions ---
+    sessions = num_spins // args.session
+    if sessions == 0:
+        print(f"\nLog too short for a {args.session}-spin session; skipping the backtest.")
+        return
+    session_pockets = replay_pocket_matrix(binary, sessions, args.session)
+    print(f"\nBacktest: {sessions:,} sessions of {args.session:,} recorded spins, $10 on red, $1,000 bankroll")
+    for strategy, table_limit in (("flat", None), ("martingale", 1000)):
+        spec = make_spec(wheel_type=wheel_type, strategy=strategy, table_limit=table_limit,
+                         num_players=sessions, num_spins=args.session)
+        results = simulate_batch(spec, session_pockets, ("final", "lowest"))
+        final = np.asarray(results['final'], dtype=float)
+        print(f"  {strategy:<10} mean final ${final.mean():,.0f} | P(profit) {np.mean(final > 1000):.1%} | "
+              f"P(bankroll hit $0) {np.mean(np.asarray(results['lowest']) <= 0):.1%}")
+
+
+if __name__ == "__main__":
+    run_spin_log_experiment()
@@ -8,7 +8,6 @@ from components.game import Game
 from utils.plot_helpers import create_single_wheel_plot, THEORETICAL_EDGES
 from utils.monte_carlo_helpers import get_plot_path
 import numpy as np
-import matplotlib.pyplot as plt
 
 def run_triple_experiment():
     """Detailed analysis for Triple Zero Roulette"""
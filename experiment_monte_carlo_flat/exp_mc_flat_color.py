@@ -9,7 +9,6 @@ from components.game import Game
 # Import the plotting function for comparing 3 wheels and the path helper
 from utils.monte_carlo_helpers import create_three_wheel_comparison, get_plot_path
 import numpy as np
-import matplotlib.pyplot as plt
 
 def run_color_simulation(wheel_type, num_players, num_spins):
     """
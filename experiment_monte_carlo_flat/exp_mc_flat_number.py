@@ -9,7 +9,6 @@ from components.game import Game
 # Import the same plotting tools
 from utils.monte_carlo_helpers import create_three_wheel_comparison, get_plot_path
 import numpy as np
-import matplotlib.pyplot as plt
 
 def run_number_simulation(wheel_type, num_players, num_spins):
     """
@@ -0,0 +1,76 @@
+import sys
+import os
+# Ensure we can find the components folder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel
+from components.player import Player
+from components.game import Game
+from components.simulation import spec_from_game, player_seeds
+from components.batch_engine import pocket_matrix, simulate_batch
+from utils.gamblers_ruin import solve_gamblers_ruin, duration_distribution
+from utils.monte_carlo_helpers import create_duration_plot, get_plot_path
+
+
+def simulated_first_passage(spec, floor, goal):
+    """Simulated P(ruin before goal) and mean session length (players stop at the first of the two)"""
+    pockets = pocket_matrix(spec['wheel_type'], player_seeds(spec), spec['num_spins'])
+    paths = np.asarray(simulate_batch(spec, pockets, ("paths",))['paths'], dtype=float)[:, 1:]
+
+    never = spec['num_spins']
+    ruined_at = np.where((paths <= floor).any(axis=1), (paths <= floor).argmax(axis=1), never)
+    goal_at = np.where((paths >= goal).any(axis=1), (paths >= goal).argmax(axis=1), never)
+    finished = np.minimum(ruined_at, goal_at) < never
+    return np.mean(ruined_at < goal_at), np.mean(np.minimum(ruined_at, goal_at)[finished] + 1), finished.mean()
+
+
+def run_flat_ruin_analysis(start_bankroll=500, goal=1000, floor=0, num_players=10000, seed=2024):
+    """
+    Gambler's ruin for flat $10 bettors who stop at `goal` or at `floor`:
+    exact ruin probability, expected session length and duration distribution,
+    cross-checked against simulated players.
+    """
+    print("🎯 GAMBLER'S RUIN: Flat Betting with a Goal")
+    print("=" * 65)
+    print(f"Start ${start_bankroll:,} | Goal ${goal:,} | Ruin at ${floor:,} | Bet $10")
+
+    print(f"\n{'WHEEL':<10} | {'BET':<7} | {'P(RUIN) EXACT':>13} | {'P(RUIN) SIM':>11} | "
+          f"{'E[SPINS] EXACT':>14} | {'E[SPINS] SIM':>12}")
+    print("-" * 85)
+
+    distributions = {}
+    for wheel_type in ["european", "american", "triple"]:
+        for bet_type, bet_value in (("color", "red"), ("number", 17)):
+            # Describe the configuration with the usual Player/Game objects
+            player = Player(strategy="flat", initial_bankroll=start_bankroll, base_bet=10)
+            player.bet_type = bet_type
+            player.bet_value = bet_value
+            game = Game(RouletteWheel(wheel_type, seed=seed), player)
+
+            exact = solve_gamblers_ruin(spec_from_game(game), floor=floor, goal=goal)
+            distribution = duration_distribution(spec_from_game(game), floor=floor, goal=goal)
+            if wheel_type == "european":
+                distributions[f'European {bet_type}'] = distribution
+
+            # Long enough sessions that (almost) every simulated player stops
+            horizon = int(np.searchsorted(np.cumsum(distribution['ruin'] + distribution['goal']), 0.9999)) + 1
+            spec = spec_from_game(game, num_spins=horizon, num_players=num_players)
+            simulated_ruin, simulated_spins, finished = simulated_first_passage(spec, floor, goal)
+
+            print(f"{wheel_type.title():<10} | {bet_type:<7} | {exact['p_ruin']:>13.4f} | {simulated_ruin:>11.4f} | "
+                  f"{exact['expected_spins']:>14.1f} | {simulated_spins:>12.1f}")
+
+    print("\n(simulated sessions are cut at the 99.99% quantile of the exact duration)")
+
+    current_folder = os.path.dirname(os.path.abspath(__file__))
+    plt = create_duration_plot(distributions, start_bankroll, goal, floor)
+    path = get_plot_path(current_folder, 'flat_gamblers_ruin.png')
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    plt.show()
+    print(f"📊 Plot saved to: {path}")
+
+
+if __name__ == "__main__":
+    run_flat_ruin_analysis()
@@ -3,9 +3,8 @@ import os
 # Ensure we can find the components folder
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from components.roulette_wheel import RouletteWheel
-from components.player import Player
-from components.game import Game
+from components.simulation import make_spec
+from components.shared_results import simulate_shared
 # Import all necessary plotting functions from our shared utility
 from utils.monte_carlo_helpers import (
     create_distribution_comparison, 
@@ -13,38 +12,22 @@ from utils.monte_carlo_helpers import (
     get_plot_path
 )
 import numpy as np
-import matplotlib.pyplot as plt
 
 def run_simulation_paths(wheel_type, bet_type, num_players, num_spins):
     """
-    Runs simulation and returns the FULL history for every player.
-    This history is needed for the Path Plots (full trajectory) 
-    and the Histogram (final value).
+    Runs simulation and returns the FULL bankroll path of every player, as a
+    players x spins+1 array. The paths are needed for the Path Plots (full
+    trajectory) and the Histogram (final value).
+    Players still run as Games, split evenly over every core; the workers
+    write the paths into shared memory.
     """
-    all_histories = []
-    
     print(f"  ... Simulating {bet_type} bets ({num_players} players)...")
-    
-    for _ in range(num_players):
-        wheel = RouletteWheel(wheel_type)
-        player = Player(strategy="flat", initial_bankroll=1000, base_bet=10)
-        player.bet_type = bet_type 
-        
-        # Configure specific bet
-        if bet_type == "color":
-            player.bet_value = "red"  # Payout 1:1 [cite: 172]
-        else:
-            player.bet_value = 17     # Payout 35:1 [cite: 191]
-            
-        game = Game(wheel, player)
-        game.run_simulation(num_spins)
-        
-        # Extract the bankroll at every step for this specific player
-        # We start with 1000, then append the result of every spin
-        player_path = [1000] + [step['bankroll'] for step in game.history]
-        all_histories.append(player_path)
-        
-    return all_histories
+
+    spec = make_spec(wheel_type=wheel_type, strategy="flat", bet_type=bet_type,
+                     bet_value="red" if bet_type == "color" else 17,
+                     initial_bankroll=1000, base_bet=10,
+                     num_players=num_players, num_spins=num_spins)
+    return simulate_shared(spec, ("paths",), engine="scalar", workers=os.cpu_count())["paths"]
 
 def run_triple_experiment():
     wheel_type = "triple"
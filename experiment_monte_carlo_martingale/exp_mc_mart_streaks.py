@@ -0,0 +1,68 @@
+import sys
+import os
+# 1. Add project root to system path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.simulation import make_spec, player_seeds
+from components.batch_engine import pocket_matrix, win_table
+from utils.losing_streaks import (
+    longest_losing_streak_distribution,
+    simulated_longest_streaks,
+    doublings_before_limit,
+    table_limit_hit_probability
+)
+from utils.monte_carlo_helpers import create_streak_distribution_plot, get_plot_path
+
+# Table limits compared without simulating (base bet $10)
+TABLE_LIMITS = [250, 500, 1000, 2500, 5000, 10000]
+
+
+def run_streak_analysis(num_players=10000, num_spins=1000, base_bet=10, seed=2024):
+    """
+    Exact longest-losing-streak distribution for each wheel (red/black bets),
+    checked against simulated players, and the chance that a Martingale
+    player hits each table limit.
+    """
+    print("🎯 MARTINGALE FAILURE POINT: Longest Losing Streak")
+    print("=" * 65)
+
+    wheel_types = ["european", "american", "triple"]
+    distributions = {}
+    simulated = {}
+
+    # --- Step 1: Exact distribution vs simulation ---
+    print(f"{'WHEEL':<10} | {'EXACT MEAN':>10} | {'SIMULATED MEAN':>14} | {'P(>=10) EXACT':>13} | {'P(>=10) SIM':>11}")
+    print("-" * 72)
+    for wheel_type in wheel_types:
+        distributions[wheel_type] = longest_losing_streak_distribution(wheel_type, "color", "red", num_spins)
+
+        spec = make_spec(wheel_type=wheel_type, num_players=num_players, num_spins=num_spins, seed=seed)
+        pockets = pocket_matrix(wheel_type, player_seeds(spec), num_spins)
+        simulated[wheel_type] = simulated_longest_streaks(pockets, win_table(wheel_type, "color", "red"))
+
+        exact_tail = distributions[wheel_type]['at_least'][10]
+        simulated_tail = (simulated[wheel_type] >= 10).mean()
+        print(f"{wheel_type.title():<10} | {distributions[wheel_type]['mean']:>10.3f} | "
+              f"{simulated[wheel_type].mean():>14.3f} | {exact_tail:>13.4f} | {simulated_tail:>11.4f}")
+
+    # --- Step 2: Table-limit scenarios (no simulation needed) ---
+    print(f"\n--- P(Martingale hits the table limit within {num_spins} spins, base bet ${base_bet}) ---")
+    print(f"{'LIMIT':>8} | {'LOSSES':>6} | " + " | ".join(f"{w.upper():>9}" for w in wheel_types))
+    print("-" * 48)
+    for limit in TABLE_LIMITS:
+        probabilities = [table_limit_hit_probability(w, "color", "red", num_spins, base_bet, limit)
+                         for w in wheel_types]
+        print(f"${limit:>7,} | {doublings_before_limit(base_bet, limit):>6} | "
+              + " | ".join(f"{p:>9.4f}" for p in probabilities))
+
+    # --- Step 3: Plot ---
+    current_folder = os.path.dirname(os.path.abspath(__file__))
+    plt = create_streak_distribution_plot(distributions, simulated, num_players, num_spins)
+    path = get_plot_path(current_folder, 'martingale_longest_streaks.png')
+    plt.savefig(path, dpi=300, bbox_inches='tight')
+    plt.show()
+    print(f"📊 Plot saved to: {path}")
+
+
+if __name__ == "__main__":
+    run_streak_analysis()
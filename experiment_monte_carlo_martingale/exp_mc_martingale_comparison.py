@@ -11,7 +11,6 @@ from utils.monte_carlo_helpers import (
     get_plot_path
 )
 import numpy as np
-import matplotlib.pyplot as plt
 
 def run_simulation_batch(wheel_type, num_players, num_spins, table_limit, start_bankroll):
     """
@@ -6,24 +6,24 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from components.roulette_wheel import RouletteWheel
 from components.player import Player
 from components.game import Game
+from components.observers import Observers, SessionTally
 # Import our plotting tools
 from utils.monte_carlo_helpers import (
     create_bankroll_path_plot, 
     create_martingale_histogram, 
     get_plot_path
 )
-import numpy as np
-import matplotlib.pyplot as plt
 
-def run_martingale_simulation(wheel_type, num_players, num_spins, table_limit, start_bankroll):
+def run_martingale_simulation(wheel_type, num_players, num_spins, table_limit, start_bankroll, observers=None):
     """
     Runs Martingale simulation using the Game class's built-in limit enforcement.
+    Each game reports its spin events to `observers` (components.observers.Observers).
     """
     all_histories = []
     
     print(f"  ... Simulating {wheel_type.upper()} Martingale (Max Bet ${table_limit})...")
     
-    for _ in range(num_players):
+    for player_number in range(num_players):
         wheel = RouletteWheel(wheel_type)
         
         # Configure Martingale Player
@@ -33,6 +33,8 @@ def run_martingale_simulation(wheel_type, num_players, num_spins, table_limit, s
         
         # *** CRITICAL: Pass the table_limit to the Game ***
         game = Game(wheel, player, table_limit=table_limit)
+        if observers is not None:
+            observers.attach(game, player_number)
         
         game.run_simulation(num_spins)
         
@@ -57,7 +59,10 @@ def run_triple_martingale():
     print("=" * 60)
     
     # --- Step 1: Run Simulation ---
-    histories = run_martingale_simulation(wheel_type, num_players, num_spins, TABLE_LIMIT, START_BANKROLL)
+    # The analytics are tallied from the spin events while the games run
+    observers = Observers()
+    tally = SessionTally().register(observers)
+    histories = run_martingale_simulation(wheel_type, num_players, num_spins, TABLE_LIMIT, START_BANKROLL, observers)
     
     # --- Step 2: Generate Path Plot (The "Elevator Drops") ---
     print("\nGenerating Path Plot...")
@@ -82,16 +87,19 @@ def run_triple_martingale():
     # --- Step 4: Analytics ---
     print(f"\n--- ANALYTICS ({wheel_type.title()}) ---")
     print(f"Table Limit: ${TABLE_LIMIT}")
-    print(f"Avg Final Bankroll: ${np.mean(final_bankrolls):.2f}")
+    stats = tally.summary()
+    print(f"Avg Final Bankroll: ${stats['mean_final']:.2f}")
     
-    # Survivors vs. Bankrupt
-    winners = sum(1 for x in final_bankrolls if x > START_BANKROLL)
-    bankrupt = sum(1 for x in final_bankrolls if x <= 0)
-    bleeding = sum(1 for x in final_bankrolls if 0 < x <= START_BANKROLL)
+    # Survivors: profit (> Start), Bankrupt: lost the entire bankroll (<= 0),
+    # Bleeding: lost money but still alive (0 < x <= Start)
+    winners = tally.profitable
+    bankrupt = tally.bankrupt
+    bleeding = tally.sessions - winners - bankrupt
     
     print(f"Profitable Players: {winners}/{num_players} ({winners/num_players*100:.1f}%)")
     print(f"Bankrupt Players (<=0): {bankrupt}/{num_players} ({bankrupt/num_players*100:.1f}%)")
     print(f"Losing but Surviving: {bleeding}/{num_players} ({bleeding/num_players*100:.1f}%)")
+    print(f"Bets Cut by the Table Limit: {tally.limit_hits:,} of {tally.spins:,} spins ({tally.limit_hits/tally.spins*100:.2f}%)")
 
     # Mathematical Verification
     # Triple House Edge is 7.69% (0.0769)
@@ -11,7 +11,6 @@ from utils.strategy_helpers import (
     analyze_martingale_risk
 )
 from utils.monte_carlo_helpers import get_plot_path 
-import matplotlib.pyplot as plt
 
 # (Helpers included below main function to match structure)
 
@@ -83,6 +82,7 @@ def run_american_strategy_comparison():
     fig = create_enhanced_strategy_plot(flat_bankrolls, martingale_bankrolls, martingale_bets, num_spins, wheel_type)
     enhanced_path = get_plot_path(current_folder, 'strategy_comparison_american_enhanced.png')
     fig.savefig(enhanced_path, dpi=300, bbox_inches='tight')
+    import matplotlib.pyplot as plt  # loaded only when we plot
     plt.show()
     
     plt_original = create_strategy_plot(flat_bankrolls, martingale_bankrolls, num_spins, wheel_type)
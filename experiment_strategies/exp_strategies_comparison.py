@@ -9,7 +9,6 @@ from components.game import Game
 # 2. Import the helper we just added
 from utils.strategy_helpers import create_strategy_comparison_bar_plot
 from utils.monte_carlo_helpers import get_plot_path 
-import matplotlib.pyplot as plt
 
 def run_all_strategy_comparison():
     """
@@ -77,6 +76,7 @@ def run_all_strategy_comparison():
     
     path = get_plot_path(current_folder, 'strategy_comparison_all_types.png')
     fig.savefig(path, dpi=300, bbox_inches='tight')
+    import matplotlib.pyplot as plt  # loaded only when we plot
     plt.show()
     print(f"📊 Saved to {path}")
 
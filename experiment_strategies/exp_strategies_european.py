@@ -13,7 +13,6 @@ from utils.strategy_helpers import (
 )
 # Import shared path helper
 from utils.monte_carlo_helpers import get_plot_path 
-import matplotlib.pyplot as plt
 
 def run_european_strategy_comparison():
     """
@@ -103,6 +102,7 @@ def run_european_strategy_comparison():
     fig = create_enhanced_strategy_plot(flat_bankrolls, martingale_bankrolls, martingale_bets, num_spins, wheel_type)
     enhanced_path = get_plot_path(current_folder, 'strategy_comparison_european_enhanced.png')
     fig.savefig(enhanced_path, dpi=300, bbox_inches='tight')
+    import matplotlib.pyplot as plt  # loaded only when we plot
     plt.show()
     
     # Create original plot
@@ -9,7 +9,6 @@ from components.game import Game
 # Use shared path helper
 from utils.monte_carlo_helpers import get_plot_path 
 import numpy as np
-import matplotlib.pyplot as plt
 
 def run_strategy_monte_carlo():
     """
@@ -73,6 +72,7 @@ def run_strategy_monte_carlo():
 
     # Plotting
     print("\nGenerating Histogram Comparison...")
+    import matplotlib.pyplot as plt  # loaded only when we plot
     plt.figure(figsize=(12, 6))
     
     # Create bins based on all data
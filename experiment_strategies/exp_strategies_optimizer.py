@@ -0,0 +1,83 @@
+import sys
+import os
+# Add project root to system path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import itertools
+
+from utils.strategy_optimizer import successive_halving
+from utils.strategy_helpers import create_pareto_front_plot, get_plot_path
+
+
+def parse_values(text, cast=int):
+    """'5,10,none' -> [5, 10, None]"""
+    return [None if token.lower() == "none" else cast(token) for token in text.split(",")]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Search Martingale settings for the best loss / ruin trade-off.")
+    parser.add_argument("--wheels", default="european,american,triple")
+    parser.add_argument("--table-limit", type=int, default=1000)
+    parser.add_argument("--bankroll", type=int, default=1000)
+    parser.add_argument("--spins", type=int, default=1000, help="maximum spins per session")
+    parser.add_argument("--base-bets", default="1,2,5,10,25")
+    parser.add_argument("--stop-losses", default="none,200,500,800", help="walk-away loss amounts (none = never)")
+    parser.add_argument("--win-goals", default="none,50,100,250,500", help="walk-away profit amounts (none = never)")
+    parser.add_argument("--block", type=int, default=200, help="players in the first round")
+    parser.add_argument("--eta", type=int, default=3, help="keep 1/eta of the candidates each round")
+    parser.add_argument("--max-players", type=int, default=16200, help="players per candidate in the last round")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--engine", default="numba", choices=["numpy", "numba"])
+    parser.add_argument("--seed", type=int, default=2024, help="shared seed (common random numbers)")
+    return parser
+
+
+def run_strategy_optimizer(argv=None):
+    """
+    Martingale base bet x stop-loss x win goal, raced with successive halving
+    on common random numbers, for every wheel at one table limit.
+    """
+    args = build_parser().parse_args(argv)
+    current_folder = os.path.dirname(os.path.abspath(__file__))
+
+    candidates = [{'strategy': "martingale", 'base_bet': bet, 'stop_loss': stop_loss, 'win_goal': win_goal}
+                  for bet, stop_loss, win_goal in itertools.product(parse_values(args.base_bets),
+                                                                    parse_values(args.stop_losses),
+                                                                    parse_values(args.win_goals))]
+    base = {'table_limit': args.table_limit, 'initial_bankroll': args.bankroll, 'num_spins': args.spins}
+
+    print("🎯 STRATEGY OPTIMIZER: Martingale Loss vs Ruin Risk")
+    print("=" * 70)
+    print(f"{len(candidates)} candidates | table limit ${args.table_limit:,} | bankroll ${args.bankroll:,} | "
+          f"up to {args.spins:,} spins")
+
+    results = {}
+    for wheel_type in args.wheels.split(","):
+        print(f"\n--- {wheel_type.upper()} ---")
+        results[wheel_type] = successive_halving(candidates, dict(base, wheel_type=wheel_type),
+                                                 block_players=args.block, eta=args.eta,
+                                                 max_players=args.max_players, seed=args.seed,
+                                                 workers=args.workers, engine=args.engine)
+        front = results[wheel_type]['front']
+        print(f"\n  Pareto front ({front[0]['players']:,} players each):")
+        print(f"  {'BASE BET':>8} | {'STOP-LOSS':>9} | {'WIN GOAL':>8} | {'E[LOSS]':>9} | {'P(RUIN)':>8} | "
+              f"{'P(PROFIT)':>9} | {'SPINS':>6}")
+        for row in front:
+            stop_loss = f"${row['stop_loss']:,}" if row['stop_loss'] is not None else "none"
+            win_goal = f"${row['win_goal']:,}" if row['win_goal'] is not None else "none"
+            print(f"  {'$' + format(row['base_bet'], ','):>8} | {stop_loss:>9} | {win_goal:>8} | "
+                  f"${row['expected_loss']:>8,.2f} | {row['p_ruin']:>8.2%} | {row['p_profit']:>9.1%} | "
+                  f"{row['mean_spins']:>6.0f}")
+
+    fig = create_pareto_front_plot(results, args.table_limit)
+    path = get_plot_path(current_folder, 'strategy_optimizer_pareto.png')
+    fig.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"\n📊 Plot saved to: {path}")
+
+    import matplotlib.pyplot as plt  # loaded only when we plot
+    plt.show()
+
+
+if __name__ == "__main__":
+    run_strategy_optimizer()
@@ -0,0 +1,61 @@
+import sys
+import os
+# 1. Add project root to system path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.simulation import make_spec, player_seeds
+from components.batch_engine import pocket_matrix
+from components.jit_engine import simulate_jit
+from utils.strategy_helpers import (
+    analyze_martingale_population,
+    combine_population_risk,
+    print_population_risk,
+    create_population_risk_plot
+)
+# Import shared path helper
+from utils.monte_carlo_helpers import get_plot_path
+
+# Players simulated (and analyzed) at a time; bounds memory for big populations
+CHUNK_PLAYERS = 10000
+
+
+def run_population_risk(wheel_type="european", num_players=100000, num_spins=1000, table_limit=None, seed=2024):
+    """
+    Martingale risk across a whole population of players.
+    Every chunk of players is simulated with the batch engine and its bet
+    matrix is analyzed in one pass (no per-player Python loop).
+    """
+    print(f"🎯 MARTINGALE POPULATION RISK - {wheel_type.upper()} Roulette")
+    print("=" * 65)
+
+    spec = make_spec(wheel_type=wheel_type, strategy="martingale", table_limit=table_limit,
+                     num_players=num_players, num_spins=num_spins, seed=seed)
+    seeds = player_seeds(spec)
+    print(f"Simulating {num_players:,} players, {num_spins:,} spins each (seed {seed})...")
+
+    # --- Step 1: Simulate and analyze chunk by chunk ---
+    analyses = []
+    for start in range(0, num_players, CHUNK_PLAYERS):
+        pockets = pocket_matrix(wheel_type, seeds[start:start + CHUNK_PLAYERS], num_spins)
+        bets = simulate_jit(spec, pockets, ("bets",))['bets']
+        analyses.append(analyze_martingale_population(bets))
+    analysis = combine_population_risk(analyses)
+
+    # --- Step 2: Analytics ---
+    print("\n--- POPULATION RISK ---")
+    print_population_risk(analysis, spec['table_limit'])
+
+    # --- Step 3: Plot ---
+    current_folder = os.path.dirname(os.path.abspath(__file__))
+    fig = create_population_risk_plot(analysis, wheel_type)
+    path = get_plot_path(current_folder, f'population_risk_{wheel_type}.png')
+    fig.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"📊 Plot saved to: {path}")
+    import matplotlib.pyplot as plt  # loaded only when we plot
+    plt.show()
+
+    return analysis
+
+
+if __name__ == "__main__":
+    run_population_risk()
@@ -0,0 +1,83 @@
+import sys
+import os
+# Add project root to system path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+from components.player_pool import PlayerPool, simulate_pool, segment_statistics
+from utils.strategy_helpers import create_segment_plot, get_plot_path
+
+# A casino's mix of players: who they are, what they bet and when they leave
+SEGMENTS = {
+    "casual": {
+        'share': 0.6,
+        'bet': {'choice': [("color", "red"), ("color", "black"), ("number", 17), ("number", 7)],
+                'p': [0.4, 0.4, 0.1, 0.1]},
+        'base_bet': {'choice': [5, 10, 25], 'p': [0.5, 0.35, 0.15]},
+        'initial_bankroll': {'lognormal': (300, 0.6)},
+        'win_goal': {'choice': [None, 100, 250]},
+        'session_spins': {'integers': (40, 240)},
+    },
+    "system": {
+        'share': 0.25,
+        'strategy': "martingale",
+        'bet': {'choice': [("color", "red"), ("color", "black")]},
+        'base_bet': {'choice': [5, 10]},
+        'initial_bankroll': {'lognormal': (1500, 0.5)},
+        'table_limit': 1000,
+        'win_goal': {'choice': [100, 200, 500]},
+    },
+    "high roller": {
+        'share': 0.15,
+        'bet': {'choice': [("number", n) for n in range(1, 37)]},
+        'base_bet': {'lognormal': (100, 0.5)},
+        'initial_bankroll': {'lognormal': (20000, 0.7)},
+        'stop_loss': {'uniform': (5000, 15000)},
+        'session_spins': {'integers': (200, 1000)},
+    },
+}
+
+
+def run_segment_experiment(num_players=200000, num_spins=1000, seed=2024):
+    """
+    EXPERIMENT: Who Loses What
+    One heterogeneous population (bankrolls, stakes, bets, strategies and
+    quitting rules all vary) simulated in one batch per wheel, then
+    summarized per player segment.
+    """
+    print("🎯 PLAYER SEGMENTS: A Heterogeneous Population in One Batch")
+    print("=" * 100)
+    pool = PlayerPool.sample(SEGMENTS, num_players, seed=seed)
+    print(f"{len(pool):,} players in {len(pool.segment_names)} segments, {len(pool.groups)} different bets, "
+          f"up to {num_spins:,} spins")
+
+    statistics_by_wheel = {}
+    for wheel_type in ("european", "american", "triple"):
+        start = time.perf_counter()
+        results = simulate_pool(pool, num_spins, wheel_type, seed=seed)
+        seconds = time.perf_counter() - start
+        statistics = segment_statistics(pool, results)
+        statistics_by_wheel[wheel_type] = statistics
+
+        print(f"\n--- {wheel_type.upper()} ({results['played'].sum() / seconds:,.0f} player-spins/s) ---")
+        print(f"{'SEGMENT':<12} | {'PLAYERS':>8} | {'BANKROLL':>9} | {'MEAN NET':>9} | {'P(PROFIT)':>9} | "
+              f"{'SPINS':>6} | {'HOLD':>6} | {'LEFT BROKE':>10} | {'HIT GOAL':>8} | {'STOP-LOSS':>9}")
+        for name, row in statistics.items():
+            quits = row['quit_shares']
+            print(f"{name:<12} | {row['players']:>8,} | ${row['mean_initial']:>8,.0f} | ${row['mean_net']:>8,.0f} | "
+                  f"{row['p_profit']:>9.1%} | {row['mean_spins']:>6.0f} | {row['hold']:>6.2%} | "
+                  f"{quits['broke']:>10.1%} | {quits['win goal']:>8.1%} | {quits['stop loss']:>9.1%}")
+
+    current_folder = os.path.dirname(os.path.abspath(__file__))
+    fig = create_segment_plot(statistics_by_wheel)
+    path = get_plot_path(current_folder, 'player_segments.png')
+    fig.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"\n📊 Plot saved to: {path}")
+
+    import matplotlib.pyplot as plt  # loaded only when we plot
+    plt.show()
+
+
+if __name__ == "__main__":
+    run_segment_experiment()
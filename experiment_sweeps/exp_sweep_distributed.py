@@ -0,0 +1,97 @@
+import sys
+import os
+# Add project root to system path to find 'components'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+
+from utils.parameter_sweep import parse_axis, grid_cells, get_results_path, write_results_table, SWEEP_METRICS
+from utils.distributed_sweep import (
+    run_distributed_sweep,
+    run_worker,
+    parse_address,
+    DEFAULT_PORT,
+    PLAYERS_PER_TASK,
+)
+
+# Default question: ruin probability over table limit x base bet x wheel
+DEFAULT_AXES = [
+    "table_limit=250,500,1000,2500,5000",
+    "base_bet=5,10,25",
+    "wheel_type=european,american,triple",
+]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Run a parameter sweep on several machines: one coordinator, any number of workers.")
+    modes = parser.add_subparsers(dest="mode", required=True)
+
+    coordinator = modes.add_parser("coordinator", help="hand out the sweep and collect the results")
+    coordinator.add_argument("--listen", default=f"127.0.0.1:{DEFAULT_PORT}", metavar="HOST:PORT",
+                             help="address workers connect to (0.0.0.0:PORT accepts other machines)")
+    coordinator.add_argument("--local-workers", type=int, default=0,
+                             help="worker processes to start on this machine")
+    coordinator.add_argument("--axis", action="append", metavar="NAME=V1,V2,...",
+                             help="swept parameter and its values (repeatable)")
+    coordinator.add_argument("--strategy", default="martingale")
+    coordinator.add_argument("--players", type=int, default=10000)
+    coordinator.add_argument("--spins", type=int, default=1000)
+    coordinator.add_argument("--seed", type=int, default=2024, help="shared seed (common random numbers)")
+    coordinator.add_argument("--engine", default="numpy", choices=["numpy", "numba"])
+    coordinator.add_argument("--players-per-task", type=int, default=PLAYERS_PER_TASK)
+    coordinator.add_argument("--metric", default="p_ruin", choices=SWEEP_METRICS)
+    coordinator.add_argument("--name", default="distributed", help="prefix of the output files")
+
+    worker = modes.add_parser("worker", help="run tasks for a coordinator")
+    worker.add_argument("address", metavar="HOST:PORT", help="address of the coordinator")
+
+    for mode in (coordinator, worker):
+        mode.add_argument("--token", default=os.environ.get("ROULETTE_SWEEP_TOKEN"),
+                          help="shared secret of the cluster (default: $ROULETTE_SWEEP_TOKEN)")
+    return parser
+
+
+def run_coordinator(args):
+    """
+    EXPERIMENT: Distributed Parameter Sweep
+    Same cells and metrics as the single-machine sweep, simulated by the
+    workers that connect; the table is identical whatever the workers do.
+    """
+    current_folder = os.path.dirname(os.path.abspath(__file__))
+    axes = dict(parse_axis(text) for text in (args.axis or DEFAULT_AXES))
+
+    print(f"🎯 DISTRIBUTED SWEEP: {args.strategy.title()} - {args.metric}")
+    print("=" * 60)
+    for name, values in axes.items():
+        print(f"  • {name}: {values}")
+
+    # --- Step 1: Simulate every cell on the cluster ---
+    base = {'strategy': args.strategy, 'num_players': args.players, 'num_spins': args.spins, 'seed': args.seed}
+    rows = run_distributed_sweep(grid_cells(axes), base, parse_address(args.listen), args.local_workers,
+                                 engine=args.engine, players_per_task=args.players_per_task, token=args.token)
+
+    # --- Step 2: Tidy results table ---
+    table_path = get_results_path(current_folder, f"{args.name}_sweep.csv")
+    write_results_table(rows, table_path)
+    print(f"📄 Results table saved to: {table_path}")
+
+    # --- Step 3: Analytics ---
+    ranked = sorted(rows, key=lambda row: row[args.metric])
+    print(f"\n📊 ANALYTICS ({args.metric}):")
+    for label, row in (("Lowest", ranked[0]), ("Highest", ranked[-1])):
+        cell = ", ".join(f"{name}={row[name]}" for name in axes)
+        print(f"   {label:<8} {row[args.metric]:.4f}  ({cell})")
+
+
+def run_distributed_sweep_experiment(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.mode == "worker":
+        finished = run_worker(parse_address(args.address), token=args.token)
+        print(f"Worker finished {finished} task(s)")
+    else:
+        run_coordinator(args)
+
+
+if __name__ == "__main__":
+    run_distributed_sweep_experiment()
@@ -0,0 +1,105 @@
+import sys
+import os
+# 1. Add project root to system path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+
+from utils.parameter_sweep import (
+    parse_axis,
+    grid_cells,
+    latin_hypercube_cells,
+    run_sweep,
+    get_results_path,
+    write_results_table,
+    SWEEP_METRICS
+)
+from utils.sweep_helpers import create_sweep_heatmap, create_sweep_contour
+from utils.monte_carlo_helpers import get_plot_path
+
+# Default question: ruin probability as a function of
+# table limit x base bet x starting bankroll x wheel
+DEFAULT_AXES = [
+    "table_limit=250,500,1000,2500,5000",
+    "base_bet=5,10,25",
+    "initial_bankroll=500,1000,2000",
+    "wheel_type=european,american,triple",
+]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Sweep Martingale parameters and plot the ruin probability.")
+    parser.add_argument("--axis", action="append", metavar="NAME=V1,V2,...",
+                        help="swept parameter and its values (repeatable); defaults to the ruin question axes")
+    parser.add_argument("--lhs", type=int, metavar="N",
+                        help="draw N Latin hypercube samples instead of the full grid")
+    parser.add_argument("--strategy", default="martingale")
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--spins", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=2024, help="shared seed (common random numbers)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--engine", default="numpy", choices=["numpy", "numba", "scalar"])
+    parser.add_argument("--exact", action="store_true",
+                        help="solve flat-betting cells exactly (gambler's ruin) instead of simulating them")
+    parser.add_argument("--checkpoint", action="store_true",
+                        help="save finished cells to results/ and resume an interrupted sweep from them")
+    parser.add_argument("--metric", default="p_ruin", choices=SWEEP_METRICS)
+    parser.add_argument("--x", default="table_limit", help="parameter on the x axis of the plots")
+    parser.add_argument("--y", default="base_bet", help="parameter on the y axis of the plots")
+    parser.add_argument("--facet", default="wheel_type", help="one plot panel per value of this parameter")
+    parser.add_argument("--name", default="martingale_ruin", help="prefix of the output files")
+    return parser
+
+
+def run_martingale_ruin_sweep(argv=None):
+    args = build_parser().parse_args(argv)
+    current_folder = os.path.dirname(os.path.abspath(__file__))
+
+    axes = dict(parse_axis(text) for text in (args.axis or DEFAULT_AXES))
+    if args.lhs:
+        cells = latin_hypercube_cells(axes, args.lhs, seed=args.seed)
+    else:
+        cells = grid_cells(axes)
+
+    print(f"🎯 PARAMETER SWEEP: {args.strategy.title()} - {args.metric}")
+    print("=" * 60)
+    for name, values in axes.items():
+        print(f"  • {name}: {values}")
+
+    # --- Step 1: Simulate every cell ---
+    base = {'strategy': args.strategy, 'num_players': args.players, 'num_spins': args.spins, 'seed': args.seed}
+    checkpoint = get_results_path(current_folder, f"{args.name}_sweep.ckpt") if args.checkpoint else None
+    rows = run_sweep(cells, base=base, workers=args.workers, engine=args.engine, exact=args.exact,
+                     checkpoint=checkpoint)
+
+    # --- Step 2: Tidy results table ---
+    table_path = get_results_path(current_folder, f"{args.name}_sweep.csv")
+    write_results_table(rows, table_path)
+    print(f"📄 Results table saved to: {table_path}")
+
+    # --- Step 3: Heatmap (grid sweeps) and contour plots ---
+    facet = args.facet if args.facet in axes else None
+    if not args.lhs:
+        fig = create_sweep_heatmap(rows, args.x, args.y, args.metric, facet=facet)
+        path = get_plot_path(current_folder, f"{args.name}_heatmap.png")
+        fig.savefig(path, dpi=300, bbox_inches='tight')
+        print(f"📊 Heatmap saved to: {path}")
+
+    if len({row[args.x] for row in rows}) > 2 and len({row[args.y] for row in rows}) > 2:
+        fig = create_sweep_contour(rows, args.x, args.y, args.metric, facet=facet)
+        path = get_plot_path(current_folder, f"{args.name}_contour.png")
+        fig.savefig(path, dpi=300, bbox_inches='tight')
+        print(f"📊 Contour plot saved to: {path}")
+    import matplotlib.pyplot as plt  # loaded only when we plot
+    plt.show()
+
+    # --- Step 4: Analytics ---
+    best = min(rows, key=lambda row: row[args.metric])
+    worst = max(rows, key=lambda row: row[args.metric])
+    print(f"\n--- ANALYTICS ({len(rows)} cells) ---")
+    print(f"Lowest {args.metric}: {best[args.metric]:.3f} at " + ", ".join(f"{k}={best[k]}" for k in axes))
+    print(f"Highest {args.metric}: {worst[args.metric]:.3f} at " + ", ".join(f"{k}={worst[k]}" for k in axes))
+
+
+if __name__ == "__main__":
+    run_martingale_ruin_sweep()
@@ -0,0 +1,211 @@
+"""
+Thin client of the simulation daemon (serve_simulations.py).
+
+The daemon keeps warm worker processes with the simulation core, the
+experiment catalog and matplotlib already imported. This client only uses
+the standard library, so a run costs an interpreter start-up (no numpy or
+matplotlib import) plus the simulation itself. If no daemon answers on a
+local address, one is started in the background and kept for later runs.
+
+Examples:
+    python3 roulette_client.py run all --set seed=42 --no-plots
+    python3 roulette_client.py run "mc_martingale_*" --set num_players=200 --output-dir plots
+    python3 roulette_client.py sweep --axis table_limit=250,1000 --axis wheel_type=european,triple --output ruin.csv
+    python3 roulette_client.py status
+"""
+import argparse
+import csv
+import fnmatch
+import json
+import os
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+DEFAULT_URL = os.environ.get("ROULETTE_SERVICE_URL", "http://127.0.0.1:8642")
+
+# Seconds to wait for a daemon started by the client
+START_SECONDS = 120
+
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "serve_simulations.py")
+
+
+class ServiceError(Exception):
+    pass
+
+
+def call(url, method="GET", body=None, timeout=60):
+    """Decoded JSON answer of the service; waits and retries while the queue is full (429)"""
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    while True:
+        request = urllib.request.Request(url, data=data, method=method,
+                                         headers={'Content-Type': "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as error:
+            if error.code in (429, 503):
+                time.sleep(float(error.headers.get('Retry-After', 1)))
+                continue
+            raise ServiceError(json.loads(error.read()).get('error', str(error)))
+
+
+def ensure_service(url, start=True, workers=None):
+    """Health of the daemon at url, starting a local one if needed"""
+    try:
+        return call(url + "/health", timeout=5)
+    except (urllib.error.URLError, ConnectionError):
+        address = urllib.parse.urlsplit(url)
+        if not start or address.hostname not in ("127.0.0.1", "localhost"):
+            raise ServiceError(f"No simulation service at {url} (start it with serve_simulations.py)")
+
+    command = [sys.executable, SERVER_SCRIPT, "--host", address.hostname, "--port", str(address.port or 80)]
+    if workers:
+        command += ["--workers", str(workers)]
+    print(f"Starting the simulation daemon on {url}...", file=sys.stderr)
+    # A session of its own, so the daemon outlives this client
+    subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                     start_new_session=True)
+    deadline = time.monotonic() + START_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            return call(url + "/health", timeout=5)
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.2)
+    raise ServiceError(f"The simulation daemon did not start within {START_SECONDS}s")
+
+
+def wait_for_job(url, job, quiet=False):
+    """Follow a job's progress stream; returns the finished job"""
+    with urllib.request.urlopen(f"{url}/jobs/{job['id']}/events") as stream:
+        for line in stream:
+            event = json.loads(line)
+            if not quiet:
+                filled = int(event['progress'] * 30)
+                print(f"\r[{'#' * filled}{' ' * (30 - filled)}] {event['progress']:>4.0%} {event['status']:<8}",
+                      end="", file=sys.stderr, flush=True)
+    if not quiet:
+        print(file=sys.stderr)
+    finished = call(f"{url}/jobs/{job['id']}")
+    if finished['status'] == "failed":
+        raise ServiceError(finished['error'])
+    return finished
+
+
+def submit(url, request, quiet=False):
+    job = call(url + "/jobs", "POST", request)
+    if job.get('deduplicated') and not quiet:
+        print(f"Job {job['id']} already submitted ({job['status']}), sharing its results", file=sys.stderr)
+    return wait_for_job(url, job, quiet)
+
+
+def parse_value(text):
+    """Parse a --set value as JSON when possible (numbers, null...), else keep the string"""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def run_experiments(args):
+    experiments = call(args.url + "/experiments")
+    names = []
+    for pattern in args.experiments:
+        matches = list(experiments) if pattern == "all" else fnmatch.filter(experiments, pattern)
+        if not matches:
+            raise ServiceError(f"No experiment matches '{pattern}'. Available: {sorted(experiments)}")
+        names.extend(name for name in matches if name not in names)
+
+    config = {}
+    for assignment in args.set:
+        key, _, value = assignment.partition("=")
+        config[key] = parse_value(value)
+
+    job = submit(args.url, {'experiments': names, 'config': config, 'engine': args.engine,
+                            'plots': not args.no_plots}, args.quiet)
+    print(job['result']['report'], end="")
+
+    for plot in job['result']['plots']:
+        if args.output_dir is None:
+            print(f"📊 {args.url}{plot}")
+            continue
+        os.makedirs(args.output_dir, exist_ok=True)
+        path = os.path.join(args.output_dir, plot.rsplit("/", 1)[-1])
+        urllib.request.urlretrieve(args.url + plot, path)
+        print(f"📊 Plot saved to: {path}")
+
+
+def run_sweep(args):
+    base = {'strategy': args.strategy, 'num_players': args.players, 'num_spins': args.spins, 'seed': args.seed}
+    sweep = {'axes': args.axis, 'base': base, 'lhs': args.lhs}
+    rows = submit(args.url, {'sweep': sweep, 'engine': args.engine}, args.quiet)['result']['rows']
+
+    names = [text.partition("=")[0] for text in args.axis]
+    print(" | ".join(f"{name:>12}" for name in names) + f" | {args.metric:>10}")
+    for row in rows:
+        print(" | ".join(f"{str(row[name]):>12}" for name in names) + f" | {row[args.metric]:>10.4f}")
+
+    if args.output:
+        with open(args.output, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"📄 Results table saved to: {args.output}")
+
+
+def show_status(args):
+    health = call(args.url + "/health")
+    print(f"Simulation daemon {args.url}: pid {health['pid']}, up {health['uptime']:.0f}s, "
+          f"{health['workers']} {'warm ' if health['warm'] else ''}workers")
+    print(f"Jobs: {health['queued']} queued, {health['running']} running, {health['done']} done, "
+          f"{health['failed']} failed")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Send experiments and sweeps to the simulation daemon.")
+    parser.add_argument("--url", default=DEFAULT_URL, help="daemon address (default: $ROULETTE_SERVICE_URL)")
+    parser.add_argument("--no-start", action="store_true", help="fail instead of starting a local daemon")
+    parser.add_argument("--workers", type=int, help="worker processes of a daemon started by this client")
+    parser.add_argument("--quiet", action="store_true", help="no progress bar")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run registered experiments (like run_experiments.py)")
+    run.add_argument("experiments", nargs="+", help="experiment names or glob patterns ('all' for every one)")
+    run.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                     help="override a parameter for every selected experiment that has it")
+    run.add_argument("--engine", default="numpy", choices=["scalar", "numpy", "numba"])
+    run.add_argument("--no-plots", action="store_true", help="skip rendering plots")
+    run.add_argument("--output-dir", help="download the plots here (default: print their URLs)")
+
+    sweep = commands.add_parser("sweep", help="run a parameter sweep (like exp_sweep_martingale_ruin.py)")
+    sweep.add_argument("--axis", action="append", required=True, metavar="NAME=V1,V2,...",
+                       help="swept parameter and its values (repeatable)")
+    sweep.add_argument("--lhs", type=int, metavar="N", help="N Latin hypercube samples instead of the grid")
+    sweep.add_argument("--strategy", default="martingale")
+    sweep.add_argument("--players", type=int, default=1000)
+    sweep.add_argument("--spins", type=int, default=1000)
+    sweep.add_argument("--seed", type=int, default=2024, help="shared seed (common random numbers)")
+    sweep.add_argument("--engine", default="numpy", choices=["scalar", "numpy", "numba"])
+    sweep.add_argument("--metric", default="p_ruin",
+                       choices=["mean_final", "std_final", "mean_loss", "p_profit", "p_ruin", "p_bankrupt"])
+    sweep.add_argument("--output", help="CSV file for the results table")
+
+    commands.add_parser("status", help="show the daemon's workers and jobs")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.url = args.url.rstrip("/")
+    try:
+        ensure_service(args.url, start=not args.no_start, workers=args.workers)
+        {'run': run_experiments, 'sweep': run_sweep, 'status': show_status}[args.command](args)
+    except ServiceError as error:
+        raise SystemExit(f"❌ {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Single entry point for every experiment.
+
+Examples:
+    python3 run_experiments.py --list
+    python3 run_experiments.py mc_flat_european mc_flat_color
+    python3 run_experiments.py "mc_martingale_*" --set num_players=200 --set seed=42
+    python3 run_experiments.py --config my_experiments.json --no-plots
+    python3 run_experiments.py "mc_flat_*" --set seed=1 --workers 8
+
+A config file is JSON of the form:
+    {
+        "defaults": {"seed": 42},
+        "experiments": {"mc_flat_european": {"num_players": 500}, "house_edge_comparison": {}}
+    }
+"""
+import argparse
+import fnmatch
+import json
+import os
+import sys
+
+# Add project root to system path (so the script works from any folder)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.experiment_registry import EXPERIMENTS, plan_experiments, run_plan, report_plan
+from components.simulation import ENGINES
+import utils.experiment_catalog  # noqa: F401  (registers all experiments)
+
+
+def parse_value(text):
+    """Parse a --set value as JSON when possible (numbers, null...), else keep the string"""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def select_experiments(patterns):
+    """Expand names and glob patterns ('all' selects everything) in registry order"""
+    selected = []
+    for pattern in patterns:
+        matches = list(EXPERIMENTS) if pattern == "all" else fnmatch.filter(EXPERIMENTS, pattern)
+        if not matches:
+            raise SystemExit(f"No experiment matches '{pattern}'. Use --list to see them.")
+        selected.extend(name for name in matches if name not in selected)
+    return selected
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Run roulette experiments with shared simulations.")
+    parser.add_argument("experiments", nargs="*", help="experiment names or glob patterns ('all' for every one)")
+    parser.add_argument("--list", action="store_true", help="list the registered experiments and exit")
+    parser.add_argument("--config", help="JSON file with 'experiments' and optional 'defaults'")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                        help="override a parameter for every selected experiment that has it")
+    parser.add_argument("--no-plots", action="store_true", help="skip generating plot files")
+    parser.add_argument("--show", action="store_true", help="open each plot window after saving")
+    parser.add_argument("--output-dir", help="save plots here instead of each experiment folder")
+    parser.add_argument("--engine", default="scalar", choices=ENGINES,
+                        help="simulation engine (seeded results are identical with every engine)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="spread the players over worker processes (same results, shared-memory transfer)")
+    parser.add_argument("--profile", action="store_true",
+                        help="time each phase (rng, win, strategy, history, plotting) and print a summary")
+    parser.add_argument("--profile-allocations", action="store_true", help="also trace allocations (slower)")
+    parser.add_argument("--profile-sampler", action="store_true", help="also run the sampling profiler")
+    parser.add_argument("--dry-run", action="store_true", help="print the simulation plan without running it")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers > 1 and (args.profile or args.profile_allocations or args.profile_sampler):
+        parser.error("--profile options instrument the simulations in this process; use them without --workers")
+
+    if args.list:
+        for name, experiment in EXPERIMENTS.items():
+            print(f"{name:<28} {experiment['description']}")
+        print("\nStandalone scripts (run them directly):")
+        for script, description in utils.experiment_catalog.STANDALONE_SCRIPTS.items():
+            print(f"  {script:<62} {description}")
+        return
+
+    overrides = {}
+    names = list(args.experiments)
+    if args.config:
+        with open(args.config) as f:
+            config = json.load(f)
+        overrides['*'] = dict(config.get('defaults', {}))
+        for name, values in config.get('experiments', {}).items():
+            overrides[name] = dict(values)
+            names.append(name)
+
+    for assignment in args.set:
+        key, _, value = assignment.partition("=")
+        overrides.setdefault('*', {})[key] = parse_value(value)
+
+    if not names:
+        parser.print_help()
+        return
+
+    try:
+        plan = plan_experiments(select_experiments(names), overrides)
+    except ValueError as error:
+        parser.error(str(error))
+
+    requested = sum(len(experiment['labels']) for experiment in plan['experiments'])
+    print(f"🎯 {len(plan['experiments'])} experiments need {requested} simulations "
+          f"({len(plan['simulations'])} unique)")
+    if args.dry_run:
+        for entry in plan['simulations'].values():
+            users = ", ".join(f"{name}:{label}" for name, label in entry['users'])
+            print(f"  • {entry['spec']} -> {sorted(entry['records'])} used by {users}")
+        return
+
+    profile = None
+    if args.profile or args.profile_allocations or args.profile_sampler:
+        profile = {'track_allocations': args.profile_allocations, 'sampler': args.profile_sampler or None}
+    results = run_plan(plan, engine=args.engine, profile=profile, workers=args.workers)
+    report_plan(plan, results, {
+        'folder': args.output_dir,
+        'save_plots': not args.no_plots,
+        'show_plots': args.show,
+    })
+
+
+if __name__ == "__main__":
+    main()
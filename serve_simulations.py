@@ -0,0 +1,61 @@
+"""
+Local HTTP/JSON service that runs simulation jobs (see utils/simulation_service.py).
+It is meant to stay up: its worker processes start once, already warm, and
+roulette_client.py (or curl) sends it jobs.
+
+Examples:
+    python3 serve_simulations.py
+    python3 serve_simulations.py --port 8642 --workers 6 --max-queued 32
+
+    curl -X POST localhost:8642/jobs -d '{"spec": {"strategy": "martingale", "num_players": 5000, "seed": 1}}'
+    curl -X POST localhost:8642/jobs -d '{"experiments": ["mc_flat_european"], "config": {"seed": 42}}'
+    curl localhost:8642/jobs/<id>/events
+    curl localhost:8642/jobs/<id>
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+# Add project root to system path (so the script works from any folder)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.simulation_service import (
+    run_service,
+    DEFAULT_CACHE_DIR,
+    DEFAULT_PORT,
+    MAX_CONNECTIONS,
+    MAX_QUEUED,
+    PLAYERS_PER_TASK,
+)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Serve simulation jobs over HTTP/JSON.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (keep it local or trusted)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, help="simulation processes (default: CPU count - 1)")
+    parser.add_argument("--max-running", type=int, help="jobs run at the same time (default: --workers)")
+    parser.add_argument("--max-queued", type=int, default=MAX_QUEUED,
+                        help="jobs waiting to start before submissions get 429")
+    parser.add_argument("--max-connections", type=int, default=MAX_CONNECTIONS)
+    parser.add_argument("--players-per-task", type=int, default=PLAYERS_PER_TASK)
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="finished results and plots")
+    parser.add_argument("--cold", action="store_true",
+                        help="start workers on demand instead of warming them all up front")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        asyncio.run(run_service(host=args.host, port=args.port, workers=args.workers,
+                                max_running=args.max_running, max_queued=args.max_queued,
+                                max_connections=args.max_connections, players_per_task=args.players_per_task,
+                                cache_dir=args.cache_dir, warm=not args.cold))
+    except KeyboardInterrupt:
+        print("\nService stopped")
+
+
+if __name__ == "__main__":
+    main()
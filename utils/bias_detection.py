@@ -0,0 +1,252 @@
+import math
+
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel
+from components.wheel_bias import WHEEL_LAYOUTS
+
+# Online detection of a biased wheel from a stream of spins.
+# The detector keeps pocket counts only, so memory does not grow with the
+# stream. Chunks of pocket indices are counted with np.bincount, and at a
+# geometric schedule of looks (n = first_look * look_ratio^j spins) it tests
+# the counts against the fair wheel with:
+#   chi_square -> Pearson chi-square goodness of fit (k - 1 degrees of freedom)
+#   g_test     -> likelihood-ratio G statistic (same reference distribution)
+#   sector     -> largest z-score of any arc of `sector_width` neighbouring
+#                 pockets on the physical wheel (dealer signature), Bonferroni
+#                 corrected over the arcs
+# Looking many times inflates false alarms, so alpha is split evenly over the
+# looks (Bonferroni): the chance that a fair wheel is ever flagged within
+# max_spins stays below alpha for each statistic.
+#
+# The detector runs any number of independent streams (trials) side by side,
+# which is how the power analysis evaluates hundreds of detectors at once.
+
+STATISTICS = ("chi_square", "g_test", "sector")
+
+# Spins held in memory at a time (over all trials)
+DEFAULT_CHUNK = 2 ** 22
+
+
+def chi_square_sf(x, df):
+    """P(X >= x) for X ~ chi-square with integer df (closed-form series, vectorized)"""
+    half = np.maximum(np.asarray(x, dtype=float), 0.0) / 2
+    log_half = np.log(np.where(half > 0, half, 1.0))
+    terms = np.arange(df // 2)
+    if df % 2 == 0:
+        # exp(-x/2) * sum_{i < df/2} (x/2)^i / i!
+        powers = terms
+        total = 0.0
+    else:
+        # erfc(sqrt(x/2)) + exp(-x/2) * sum_{i < (df-1)/2} (x/2)^(i+1/2) / Gamma(i + 3/2)
+        powers = terms + 0.5
+        total = np.vectorize(math.erfc)(np.sqrt(half))
+    log_gamma = np.array([math.lgamma(p + 1) for p in powers])
+    log_terms = powers * log_half[..., None] - log_gamma - half[..., None]
+    log_terms = np.where((half[..., None] == 0) & (powers > 0), -np.inf, log_terms)
+    return np.minimum(1.0, total + np.exp(log_terms).sum(axis=-1))
+
+
+def normal_sf(z):
+    """P(Z >= z) for a standard normal Z (vectorized)"""
+    return 0.5 * np.vectorize(math.erfc)(np.asarray(z, dtype=float) / math.sqrt(2))
+
+
+def look_schedule(max_spins, first_look=1000, look_ratio=1.1):
+    """Spin counts at which the statistics are evaluated (always ending at max_spins)"""
+    if max_spins < 1 or first_look < 1 or look_ratio <= 1:
+        raise ValueError("Need max_spins >= 1, first_look >= 1 and look_ratio > 1")
+    looks = [min(first_look, max_spins)]
+    while looks[-1] < max_spins:
+        looks.append(min(max_spins, max(looks[-1] + 1, int(looks[-1] * look_ratio))))
+    return np.array(looks, dtype=np.int64)
+
+
+def sector_matrix(wheel_type, sector_width):
+    """(arcs, pockets) 0/1 matrix: arc i covers sector_width neighbouring pockets starting at slot i"""
+    numbers = RouletteWheel(wheel_type, seed=0).numbers
+    if wheel_type not in WHEEL_LAYOUTS or not 1 <= sector_width < len(numbers):
+        return None
+    slots = [numbers.index(pocket) for pocket in WHEEL_LAYOUTS[wheel_type]]
+    arcs = np.zeros((len(slots), len(slots)))
+    for start in range(len(slots)):
+        for step in range(sector_width):
+            arcs[start, slots[(start + step) % len(slots)]] = 1.0
+    return arcs
+
+
+class BiasDetector:
+    """
+    Streaming goodness-of-fit tests against a reference wheel (fair by default).
+    Feed pocket indices with update(): a 1-D array for one stream, or a
+    (trials, spins) matrix for independent streams advancing together.
+    """
+
+    def __init__(self, wheel_type="european", num_trials=1, alpha=0.001, max_spins=10 ** 9,
+                 first_look=1000, look_ratio=1.1, sector_width=5, reference=None):
+        self.wheel_type = wheel_type
+        wheel = RouletteWheel(wheel_type, seed=0, weights=reference)
+        self.reference = wheel.pocket_probabilities()
+        self.num_pockets = wheel.get_total_pockets()
+        self.num_trials = num_trials
+        self.max_spins = max_spins
+        self.looks = look_schedule(max_spins, first_look, look_ratio)
+        self.alpha = alpha
+        # Bonferroni over the looks keeps the overall false-alarm rate below alpha
+        self.alpha_per_look = alpha / len(self.looks)
+
+        self.arcs = sector_matrix(wheel_type, sector_width)
+        self.sector_width = sector_width
+        self.statistics = STATISTICS if self.arcs is not None else STATISTICS[:2]
+
+        self.counts = np.zeros((num_trials, self.num_pockets), dtype=np.int64)
+        self.spins = 0
+        self._next_look = 0
+        # Spins at which each statistic first flagged each trial (-1 = not yet)
+        self.detected_at = {name: np.full(num_trials, -1, dtype=np.int64) for name in self.statistics}
+        self.last_p_values = {}
+
+    def update(self, pockets):
+        """Count a chunk of pocket indices; returns True once every trial is flagged by every statistic"""
+        pockets = np.asarray(pockets)
+        if pockets.ndim == 1:
+            pockets = pockets[None, :]
+        if pockets.shape[0] != self.num_trials:
+            raise ValueError(f"Expected {self.num_trials} streams, got {pockets.shape[0]}")
+        # Each trial counts into its own block of num_pockets bins
+        offsets = (np.arange(self.num_trials) * self.num_pockets)[:, None]
+
+        position = 0
+        width = pockets.shape[1]
+        while position < width and self.spins < self.max_spins:
+            # Step 1: Count up to the next look (or the end of the chunk)
+            stop = min(width, position + int(self.looks[self._next_look]) - self.spins)
+            segment = pockets[:, position:stop]
+            if self.num_trials == 1:
+                self.counts[0] += np.bincount(segment[0], minlength=self.num_pockets)
+            else:
+                flat = (segment + offsets).ravel()
+                self.counts += np.bincount(flat, minlength=self.counts.size).reshape(self.counts.shape)
+            self.spins += stop - position
+            position = stop
+
+            # Step 2: Test at the look
+            if self.spins == self.looks[self._next_look]:
+                self._look()
+                self._next_look = min(self._next_look + 1, len(self.looks) - 1)
+        return self.finished()
+
+    def finished(self):
+        """Every trial flagged by every statistic, or max_spins reached"""
+        if self.spins >= self.max_spins:
+            return True
+        return all(np.all(detected >= 0) for detected in self.detected_at.values())
+
+    def test_statistics(self):
+        """Current statistics and p-values for every trial: {name: (statistic, p_value)}"""
+        n = self.counts.sum(axis=1).astype(float)
+        expected = n[:, None] * self.reference
+        observed = self.counts.astype(float)
+        df = self.num_pockets - 1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            chi_square = np.where(expected > 0, (observed - expected) ** 2 / expected, 0.0).sum(axis=1)
+            g = 2 * np.where(observed > 0, observed * np.log(observed / expected), 0.0).sum(axis=1)
+
+        results = {
+            'chi_square': (chi_square, chi_square_sf(chi_square, df)),
+            'g_test': (g, chi_square_sf(g, df)),
+        }
+        if self.arcs is not None:
+            # One-sided: an arc that comes up too often
+            share = self.arcs @ self.reference
+            with np.errstate(divide='ignore', invalid='ignore'):
+                z = (observed @ self.arcs.T - n[:, None] * share) / np.sqrt(n[:, None] * share * (1 - share))
+            z_max = np.nan_to_num(z, nan=0.0).max(axis=1)
+            results['sector'] = (z_max, np.minimum(1.0, len(self.arcs) * normal_sf(z_max)))
+        return results
+
+    def _look(self):
+        results = self.test_statistics()
+        for name in self.statistics:
+            _, p_values = results[name]
+            self.last_p_values[name] = p_values
+            newly = (self.detected_at[name] < 0) & (p_values < self.alpha_per_look)
+            self.detected_at[name][newly] = self.spins
+
+    def report(self):
+        """Summary dict: spins seen, per-statistic detection spins (None = not detected) and p-values"""
+        detections = {name: [int(s) if s >= 0 else None for s in self.detected_at[name]]
+                      for name in self.statistics}
+        return {
+            'wheel_type': self.wheel_type,
+            'spins': self.spins,
+            'alpha': self.alpha,
+            'looks': int(np.searchsorted(self.looks, self.spins, side='right')),
+            'detected_at': detections,
+            'p_values': {name: values.tolist() for name, values in self.last_p_values.items()},
+        }
+
+
+def detect_bias(wheel, max_spins=10 ** 9, chunk_size=DEFAULT_CHUNK, **detector_options):
+    """
+    Spin `wheel` in chunks until every statistic flags it (or max_spins).
+    Returns BiasDetector.report() for the single stream.
+    """
+    detector = BiasDetector(wheel.wheel_type, max_spins=max_spins, **detector_options)
+    while not detector.finished():
+        detector.update(wheel.spin_indices(min(chunk_size, max_spins - detector.spins)))
+    report = detector.report()
+    report['detected_at'] = {name: spins[0] for name, spins in report['detected_at'].items()}
+    report['p_values'] = {name: values[0] for name, values in report['p_values'].items()}
+    return report
+
+
+def _power_task(task):
+    """Worker: run a group of independent detector trials side by side"""
+    wheel_type, weights, seeds, max_spins, chunk_size, detector_options = task
+    wheels = [RouletteWheel(wheel_type, seed=seed, weights=weights) for seed in seeds]
+    detector = BiasDetector(wheel_type, num_trials=len(wheels), max_spins=max_spins, **detector_options)
+    width = max(1, chunk_size // len(wheels))
+    pockets = np.empty((len(wheels), width), dtype=np.uint8)
+    while not detector.finished():
+        size = min(width, max_spins - detector.spins)
+        for row, wheel in enumerate(wheels):
+            pockets[row, :size] = wheel.spin_indices(size)
+        detector.update(pockets[:, :size])
+    return {name: detected for name, detected in detector.detected_at.items()}
+
+
+def bias_power_analysis(wheel_type, weights, num_trials=200, max_spins=10 ** 7, seed=None, workers=1,
+                        chunk_size=DEFAULT_CHUNK, **detector_options):
+    """
+    Power of the detector against a wheel with pocket `weights` (None = fair
+    wheel, which measures the false-alarm rate instead).
+    Trials run side by side in each worker process. Returns per statistic the
+    detection spins of every trial (-1 = never), the power (share detected
+    within max_spins) and the median / 90% quantile of the detection time.
+    """
+    if num_trials < 1:
+        raise ValueError("num_trials must be at least 1")
+    seeds = np.random.SeedSequence(seed).spawn(num_trials)
+    groups = max(1, min(workers, num_trials))
+    tasks = [(wheel_type, weights, list(part), max_spins, chunk_size, detector_options)
+             for part in np.array_split(np.array(seeds, dtype=object), groups)]
+
+    if workers <= 1:
+        task_results = list(map(_power_task, tasks))
+    else:
+        from components.process_pool import process_pool
+        with process_pool(workers) as executor:
+            task_results = list(executor.map(_power_task, tasks))
+
+    results = {}
+    for name in task_results[0]:
+        detected_at = np.concatenate([task[name] for task in task_results])
+        found = detected_at[detected_at >= 0]
+        results[name] = {
+            'detected_at': detected_at,
+            'power': float(np.mean(detected_at >= 0)),
+            'median_spins': float(np.median(found)) if len(found) else None,
+            'q90_spins': float(np.quantile(found, 0.9)) if len(found) else None,
+        }
+    return results
@@ -0,0 +1,394 @@
+import json
+import os
+import socket
+import struct
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from components.simulation import make_spec, player_seeds
+from components.batch_engine import pocket_matrix, simulate_batch
+
+# Sweeps spread over several machines.
+#
+# A coordinator cuts the sweep into tasks: the cells that share a pocket
+# stream (wheel, weights, spins, seed) times a range of players. Workers
+# connect to it over TCP, pull one task at a time and send back a small
+# accumulator per cell (player count, sums, event counts). When a worker
+# disconnects or goes silent its task is handed to another worker.
+#
+# Player i of a cell always plays with the same seed (player_seeds), the task
+# ranges do not depend on the number of workers, and accumulators of
+# integer-valued bankrolls are exact integer sums, so the results are the
+# same however the work was spread (and equal to run_sweep on the same seed).
+#
+# Messages are JSON objects preceded by their length (4 bytes, big endian).
+# Nothing is unpickled, but the coordinator runs whatever specs it is given
+# to its workers: only listen on networks you trust, and pass a token so
+# stray connections are refused.
+
+DEFAULT_PORT = 5617
+
+# Players per task; fixed so the cut never depends on the cluster
+PLAYERS_PER_TASK = 1000
+
+# Seconds a worker may take for one task before it counts as dead
+TASK_TIMEOUT = 600
+
+# Seconds an idle worker waits before asking again (tasks may come back)
+WAIT_SECONDS = 0.2
+
+# Seconds a worker keeps trying to reach the coordinator
+CONNECT_SECONDS = 30
+
+_HEADER = struct.Struct(">I")
+
+
+def send_message(connection, message):
+    data = json.dumps(message).encode("utf-8")
+    connection.sendall(_HEADER.pack(len(data)) + data)
+
+
+def _receive_exactly(connection, size):
+    data = bytearray()
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed")
+        data.extend(chunk)
+    return bytes(data)
+
+
+def receive_message(connection):
+    (size,) = _HEADER.unpack(_receive_exactly(connection, _HEADER.size))
+    return json.loads(_receive_exactly(connection, size).decode("utf-8"))
+
+
+def parse_address(text):
+    """'host:port' (or ':port') -> (host, port)"""
+    host, _, port = text.rpartition(":")
+    if not port.isdigit():
+        raise ValueError(f"Invalid address '{text}'. Use host:port")
+    return host or "127.0.0.1", int(port)
+
+
+# --- Accumulators ---
+
+def _total(values):
+    # Python ints are exact whatever the order; floats fall back to float sums
+    return sum(values) if all(isinstance(v, int) for v in values) else float(sum(values))
+
+
+def cell_accumulator(spec, final, lowest, ruin_level=0):
+    """Mergeable summary of some players of one cell"""
+    final = np.asarray(final)
+    lowest = np.asarray(lowest)
+    values = final.tolist()
+    return {
+        'count': len(values),
+        'sum': _total(values),
+        'sum_squares': _total([v * v for v in values]),
+        'profit': int(np.count_nonzero(final > spec['initial_bankroll'])),
+        'ruin': int(np.count_nonzero(lowest <= ruin_level)),
+        'bankrupt': int(np.count_nonzero(final <= 0)),
+    }
+
+
+def merge_accumulators(first, second):
+    return {key: first[key] + second[key] for key in first}
+
+
+def accumulator_metrics(spec, accumulator):
+    """The SWEEP_METRICS of a cell from its merged accumulator"""
+    count = accumulator['count']
+    total = accumulator['sum']
+    # Exact for integers: n * sum(x^2) - sum(x)^2 = n^2 * variance
+    spread = count * accumulator['sum_squares'] - total * total
+    mean = total / count
+    return {
+        'mean_final': float(mean),
+        'std_final': float(np.sqrt(max(spread, 0) / count ** 2)),
+        'mean_loss': float(spec['initial_bankroll'] - mean),
+        'p_profit': accumulator['profit'] / count,
+        'p_ruin': accumulator['ruin'] / count,
+        'p_bankrupt': accumulator['bankrupt'] / count,
+    }
+
+
+# --- Tasks ---
+
+def make_tasks(specs, players_per_task=PLAYERS_PER_TASK):
+    """
+    Cells that share a pocket stream, cut into ranges of players.
+    Task ids follow the cell and player order, which is also the merge order.
+    """
+    if players_per_task < 1:
+        raise ValueError("players_per_task must be at least 1")
+    groups = {}
+    for index, spec in enumerate(specs):
+        stream = json.dumps([spec['wheel_type'], spec.get('wheel_weights'), spec['num_players'],
+                             spec['num_spins'], spec['seed']])
+        groups.setdefault(stream, []).append(index)
+
+    tasks = []
+    for cells in groups.values():
+        num_players = specs[cells[0]]['num_players']
+        for start in range(0, num_players, players_per_task):
+            tasks.append({'id': len(tasks), 'cells': cells, 'specs': [specs[i] for i in cells],
+                          'start': start, 'stop': min(start + players_per_task, num_players)})
+    return tasks
+
+
+def run_task(task, engine="numpy", ruin_level=0):
+    """Worker: the accumulators of one task, one per cell"""
+    simulate = simulate_batch
+    if engine == "numba":
+        from components.jit_engine import simulate_jit as simulate
+    elif engine != "numpy":
+        raise ValueError(f"Distributed sweeps run the numpy or numba engine, not '{engine}'")
+
+    first = task['specs'][0]
+    seeds = player_seeds(first, task['start'], task['stop'])
+    pockets = pocket_matrix(first['wheel_type'], seeds, first['num_spins'], first.get('wheel_weights'))
+    accumulators = []
+    for spec in task['specs']:
+        results = simulate(spec, pockets, ("final", "lowest"))
+        accumulators.append(cell_accumulator(spec, results['final'], results['lowest'], ruin_level))
+    return accumulators
+
+
+# --- Coordinator ---
+
+class SweepCoordinator:
+    """
+    Hands out tasks to the workers that connect and collects their results.
+    Call serve() to start accepting workers and wait() for the results.
+    """
+
+    def __init__(self, tasks, host="127.0.0.1", port=DEFAULT_PORT, engine="numpy", ruin_level=0, token=None,
+                 task_timeout=TASK_TIMEOUT, verbose=True):
+        self.tasks = {task['id']: task for task in tasks}
+        self.engine = engine
+        self.ruin_level = ruin_level
+        self.token = token
+        self.task_timeout = task_timeout
+        self.verbose = verbose
+
+        self.pending = deque(sorted(self.tasks))
+        self.running = {}
+        self.results = {}
+        self.error = None
+        self.workers = 0
+        self.reassigned = 0
+        self.lock = threading.Lock()
+        self.finished = threading.Event()
+        if not self.tasks:
+            self.finished.set()
+
+        self.server = socket.create_server((host, port))
+        self.address = self.server.getsockname()[:2]
+
+    def serve(self):
+        """Accept workers in a background thread"""
+        threading.Thread(target=self._accept, daemon=True).start()
+        return self
+
+    def wait(self, timeout=None):
+        """Results by task id once every task is done (None on timeout)"""
+        if not self.finished.wait(timeout):
+            return None
+        if self.error is not None:
+            raise RuntimeError(self.error)
+        return self.results
+
+    def close(self):
+        self.server.close()
+
+    def _accept(self):
+        while True:
+            try:
+                connection, _ = self.server.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._serve_worker, args=(connection,), daemon=True).start()
+
+    def _next_message(self, worker):
+        with self.lock:
+            if self.finished.is_set():
+                return {'type': "done"}
+            if not self.pending:
+                # Everything is handed out, but a busy worker may still die
+                return {'type': "wait", 'seconds': WAIT_SECONDS}
+            task_id = self.pending.popleft()
+            self.running[task_id] = worker
+            return {'type': "task", 'task': self.tasks[task_id], 'engine': self.engine,
+                    'ruin_level': self.ruin_level}
+
+    def _serve_worker(self, connection):
+        task_id = None
+        worker = None
+        connection.settimeout(self.task_timeout)
+        try:
+            hello = receive_message(connection)
+            if hello.get('type') != "hello" or hello.get('token') != self.token:
+                send_message(connection, {'type': "error", 'error': "Unknown worker or wrong token"})
+                return
+            with self.lock:
+                self.workers += 1
+                worker = f"{hello.get('name')}#{self.workers}"
+            if self.verbose:
+                print(f"   + worker {worker}")
+
+            while True:
+                message = self._next_message(worker)
+                send_message(connection, message)
+                if message['type'] == "done":
+                    return
+                if message['type'] == "task":
+                    task_id = message['task']['id']
+                reply = receive_message(connection)
+                if reply.get('type') == "result":
+                    self._finish(reply['id'], reply['accumulators'])
+                    task_id = None
+                elif reply.get('type') == "failed":
+                    # The same task would fail on every worker: stop the sweep
+                    self.error = f"Task {task_id} failed on {worker}: {reply['error']}"
+                    task_id = None
+                    self.finished.set()
+        except (OSError, ValueError, ConnectionError):
+            pass
+        finally:
+            connection.close()
+            if task_id is not None:
+                self._requeue(task_id, worker)
+
+    def _finish(self, task_id, accumulators):
+        with self.lock:
+            self.running.pop(task_id, None)
+            # A task that was handed out twice is deterministic; keep the first answer
+            self.results.setdefault(task_id, accumulators)
+            if len(self.results) == len(self.tasks):
+                self.finished.set()
+
+    def _requeue(self, task_id, worker):
+        with self.lock:
+            if task_id in self.results or self.running.get(task_id) != worker:
+                return
+            del self.running[task_id]
+            self.pending.appendleft(task_id)
+            self.reassigned += 1
+        if self.verbose:
+            print(f"   ! worker {worker} lost, task {task_id} handed out again")
+
+
+def merge_results(specs, tasks, results):
+    """Per-cell accumulators merged in task order -> metrics in cell order"""
+    merged = [None] * len(specs)
+    for task in sorted(tasks, key=lambda task: task['id']):
+        for cell, accumulator in zip(task['cells'], results[task['id']]):
+            merged[cell] = accumulator if merged[cell] is None else merge_accumulators(merged[cell], accumulator)
+    return [accumulator_metrics(spec, accumulator) for spec, accumulator in zip(specs, merged)]
+
+
+# --- Worker ---
+
+def run_worker(address, token=None, name=None, connect_seconds=CONNECT_SECONDS, max_tasks=None):
+    """
+    Connect to a coordinator at address (host, port) and run its tasks until
+    it has none left. Returns the number of tasks finished.
+    max_tasks: leave after that many tasks, without answering the next one
+    (a stand-in for a worker that dies mid-task).
+    """
+    deadline = time.monotonic() + connect_seconds
+    while True:
+        try:
+            connection = socket.create_connection(tuple(address))
+            break
+        except OSError:
+            # The coordinator may not be listening yet
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(WAIT_SECONDS)
+
+    finished = 0
+    with connection:
+        send_message(connection, {'type': "hello", 'token': token,
+                                  'name': name or f"{socket.gethostname()}:{os.getpid()}"})
+        while True:
+            try:
+                message = receive_message(connection)
+            except ConnectionError:
+                # Coordinator gone (it stops once every task is done)
+                return finished
+            if message['type'] == "done":
+                return finished
+            if message['type'] == "error":
+                raise ValueError(f"Coordinator refused the worker: {message['error']}")
+            if message['type'] == "wait":
+                time.sleep(message['seconds'])
+                send_message(connection, {'type': "ready"})
+                continue
+            if max_tasks is not None and finished >= max_tasks:
+                return finished
+
+            try:
+                accumulators = run_task(message['task'], message['engine'], message['ruin_level'])
+            except Exception as error:
+                send_message(connection, {'type': "failed", 'error': f"{type(error).__name__}: {error}"})
+                raise
+            send_message(connection, {'type': "result", 'id': message['task']['id'],
+                                      'accumulators': accumulators})
+            finished += 1
+
+
+# --- Sweep ---
+
+def run_distributed_sweep(cells, base=None, address=("127.0.0.1", 0), local_workers=0, engine="numpy",
+                          ruin_level=0, players_per_task=PLAYERS_PER_TASK, token=None,
+                          task_timeout=TASK_TIMEOUT, verbose=True):
+    """
+    Simulate every cell (dict of spec overrides on top of `base`) on the
+    workers that connect to address; port 0 picks a free port. local_workers
+    starts that many worker processes on this machine (a stand-in cluster, or
+    extra hands next to remote workers). Returns the rows of run_sweep.
+    """
+    if engine not in ("numpy", "numba"):
+        raise ValueError(f"Distributed sweeps run the numpy or numba engine, not '{engine}'")
+    base = dict(base or {})
+    if base.get('seed') is None:
+        # Every worker must derive the same player seeds
+        base['seed'] = int(np.random.SeedSequence().entropy % 2 ** 32)
+    specs = [make_spec(**dict(base, **cell)) for cell in cells]
+    tasks = make_tasks(specs, players_per_task)
+
+    coordinator = SweepCoordinator(tasks, address[0], address[1], engine=engine, ruin_level=ruin_level,
+                                   token=token, task_timeout=task_timeout, verbose=verbose)
+    host, port = coordinator.address
+    if verbose:
+        print(f"Coordinating {len(specs)} cells in {len(tasks)} tasks, workers connect to {host}:{port} "
+              f"(seed {base['seed']})")
+
+    pool = None
+    try:
+        coordinator.serve()
+        if local_workers > 0:
+            from components.process_pool import process_pool
+            pool = process_pool(local_workers)
+            # Local workers connect through the loopback, like remote ones. The
+            # coordinator is already listening, so a refused connection means
+            # the sweep finished before the worker started (connect_seconds=0)
+            local_host = "127.0.0.1" if host in ("0.0.0.0", "::", "") else host
+            for number in range(local_workers):
+                pool.submit(run_worker, (local_host, port), token, f"local{number}", 0)
+        results = coordinator.wait()
+    finally:
+        coordinator.close()
+        if pool is not None:
+            pool.shutdown()
+
+    if verbose and coordinator.reassigned:
+        print(f"   {coordinator.reassigned} task(s) handed out again after losing a worker")
+    metrics = merge_results(specs, tasks, results)
+    return [dict(spec, **row) for spec, row in zip(specs, metrics)]
@@ -0,0 +1,428 @@
+import os
+import numpy as np
+
+from components.simulation import make_spec
+from utils.experiment_registry import register_experiment
+from utils.plot_helpers import create_single_wheel_plot, create_comparison_plot, THEORETICAL_EDGES
+from utils.monte_carlo_helpers import (
+    create_bankroll_path_plot,
+    create_distribution_comparison,
+    create_three_wheel_comparison,
+    create_martingale_histogram,
+    create_martingale_comparison,
+    get_plot_path
+)
+from utils.strategy_helpers import (
+    create_strategy_plot,
+    create_enhanced_strategy_plot,
+    create_strategy_comparison_bar_plot,
+    analyze_martingale_population,
+    print_population_risk,
+    create_population_risk_plot
+)
+
+# Declarative versions of the experiment_* scripts.
+# Each entry declares the simulations it needs; the registry runs every unique
+# simulation once and hands the results to the report functions below.
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WHEEL_TYPES = ["european", "american", "triple"]
+
+# Scripts that are not in the registry: they do not simulate independent
+# players from a spec (exact solvers, a shared table, heterogeneous pools,
+# importance sampling, sweeps...) or they have a command line of their own
+# (log files, checkpoints, coordinator/worker). Run them directly.
+STANDALONE_SCRIPTS = {
+    "experiment_house_edge/exp_house_edge_bias_detection.py": "Spins needed to detect a dealer-signature bias",
+    "experiment_house_edge/exp_house_edge_casino_floor.py": "House P&L, hold and exposure of a shared table",
+    "experiment_house_edge/exp_house_edge_exposure.py": "Exact house result per spin, hour and shift (VaR, ES)",
+    "experiment_house_edge/exp_house_edge_long_run.py": "Billion-spin house edge validation with checkpoints",
+    "experiment_house_edge/exp_house_edge_spin_log.py": "Backtest on an imported spin log",
+    "experiment_monte_carlo_flat/exp_mc_flat_ruin.py": "Exact gambler's ruin for flat bets with a goal",
+    "experiment_monte_carlo_martingale/exp_mc_mart_rare_events.py": "Martingale tail risk by importance sampling",
+    "experiment_monte_carlo_martingale/exp_mc_mart_streaks.py": "Exact longest-losing-streak distribution",
+    "experiment_strategies/exp_strategies_optimizer.py": "Successive-halving search for session rules",
+    "experiment_strategies/exp_strategies_segments.py": "Heterogeneous player segments in one batch",
+    "experiment_sweeps/exp_sweep_martingale_ruin.py": "Martingale ruin over a parameter grid",
+    "experiment_sweeps/exp_sweep_distributed.py": "Parameter sweep over TCP workers",
+}
+
+
+def experiment_folder(name):
+    return os.path.join(PROJECT_ROOT, name)
+
+
+def save_plot(output, filename, build_plot):
+    """Build, save and (optionally) show a plot unless plots are disabled"""
+    if not output.get('save_plots', True):
+        return
+    plot = build_plot()
+    path = get_plot_path(output['folder'], filename)
+    plot.savefig(path, dpi=300, bbox_inches='tight')
+    print(f"📊 Plot saved to: {path}")
+
+    import matplotlib.pyplot as plt
+    if output.get('show_plots', False):
+        plt.show()
+    plt.close('all')
+
+
+def flat_spec(config, wheel_type, bet_type="color", num_players=None, num_spins=None):
+    """Flat $10 bettor on red (color) or on 17 (number)"""
+    return make_spec(wheel_type=wheel_type, strategy="flat", bet_type=bet_type,
+                     bet_value="red" if bet_type == "color" else 17,
+                     initial_bankroll=config['start_bankroll'],
+                     num_players=num_players or config['num_players'],
+                     num_spins=num_spins or config['num_spins'],
+                     seed=config['seed'])
+
+
+def martingale_spec(config, wheel_type, table_limit=None):
+    """Martingale bettor on red, base bet $10"""
+    return make_spec(wheel_type=wheel_type, strategy="martingale",
+                     initial_bankroll=config['start_bankroll'],
+                     table_limit=table_limit,
+                     num_players=config['num_players'],
+                     num_spins=config['num_spins'],
+                     seed=config['seed'])
+
+
+# ---------------------------------------------------------------------------
+# Experiment 1: House Edge
+# ---------------------------------------------------------------------------
+
+def house_edges(final_bankrolls, config):
+    """Experimental house edge (%) of each run"""
+    total_wagered = config['num_spins'] * 10
+    return [(config['start_bankroll'] - final) / total_wagered * 100 for final in final_bankrolls]
+
+
+def register_house_edge(wheel_type):
+    defaults = {'num_runs': 20, 'num_spins': 100000, 'start_bankroll': 10000, 'seed': None}
+
+    def simulations(config):
+        spec = flat_spec(config, wheel_type, num_players=config['num_runs'])
+        return {'runs': (spec, ["final"])}
+
+    @register_experiment(f"house_edge_{wheel_type}", experiment_folder("experiment_house_edge"),
+                         defaults, simulations)
+    def report(results, config, output):
+        """House edge distribution for a single wheel"""
+        edges = house_edges(results['runs']['final'], config)
+        for run, edge in enumerate(edges, start=1):
+            print(f"Run {run:2d}: Experimental edge = {edge:.2f}%")
+
+        print(f"\n--- STATISTICAL SUMMARY ({wheel_type.upper()}) ---")
+        print(f"Average experimental edge: {np.mean(edges):.2f}%")
+        print(f"Theoretical edge: {THEORETICAL_EDGES[wheel_type]}%")
+        print(f"Standard deviation: {np.std(edges):.2f}%")
+        print(f"Range: {min(edges):.2f}% to {max(edges):.2f}%")
+
+        save_plot(output, f'{wheel_type}_house_edge.png',
+                  lambda: create_single_wheel_plot(edges, wheel_type, config['num_runs'], config['num_spins']))
+
+
+def house_edge_basic_simulations(config):
+    return {wheel_type: (flat_spec(config, wheel_type, num_players=1), ["final"]) for wheel_type in WHEEL_TYPES}
+
+
+@register_experiment("house_edge_basic", experiment_folder("experiment_house_edge"),
+                     {'num_spins': 100000, 'start_bankroll': 10000, 'seed': None},
+                     house_edge_basic_simulations)
+def report_house_edge_basic(results, config, output):
+    """House edge of one long run per wheel against theory (text only)"""
+    for wheel_type in WHEEL_TYPES:
+        final_bankroll = results[wheel_type]['final'][0]
+        total_wagered = config['num_spins'] * 10
+        total_loss = config['start_bankroll'] - final_bankroll
+        experimental_edge = house_edges([final_bankroll], config)[0]
+        error = abs(THEORETICAL_EDGES[wheel_type] - experimental_edge)
+
+        print(f"\nResults for {wheel_type.upper()} roulette:")
+        print(f"  • Total amount wagered: ${total_wagered:,}")
+        print(f"  • Final bankroll: ${final_bankroll:,}")
+        print(f"  • Total loss: ${total_loss:,}")
+        print(f"  • Experimental house edge: {experimental_edge:.2f}%")
+        print(f"  • Theoretical house edge: {THEORETICAL_EDGES[wheel_type]:.2f}%")
+        print(f"  • Error: {error:.2f}%")
+        print("  ✅ PASS: Experimental results match theory!" if error < 0.5
+              else "  ⚠️  WARNING: Results differ from theory")
+
+
+def house_edge_comparison_simulations(config):
+    return {wheel_type: (flat_spec(config, wheel_type, num_players=config['num_runs']), ["final"])
+            for wheel_type in WHEEL_TYPES}
+
+
+@register_experiment("house_edge_comparison", experiment_folder("experiment_house_edge"),
+                     {'num_runs': 15, 'num_spins': 50000, 'start_bankroll': 10000, 'seed': None},
+                     house_edge_comparison_simulations)
+def report_house_edge_comparison(results, config, output):
+    """House edge across all three wheel types"""
+    all_results = {}
+    for wheel_type in WHEEL_TYPES:
+        edges = house_edges(results[wheel_type]['final'], config)
+        all_results[wheel_type] = edges
+        print(f"{wheel_type.upper():<10} Average: {np.mean(edges):.2f}% (Theoretical: {THEORETICAL_EDGES[wheel_type]}%)")
+
+    save_plot(output, 'all_house_edges_comparison.png',
+              lambda: create_comparison_plot(all_results, config['num_runs'], config['num_spins']))
+
+
+# ---------------------------------------------------------------------------
+# Experiment 3: Flat Betting Monte Carlo
+# ---------------------------------------------------------------------------
+
+def print_bet_statistics(label, finals, config):
+    print(f"\n{label}:")
+    print(f"  • Average Bankroll: ${np.mean(finals):.2f}")
+    print(f"  • Standard Deviation: ${np.std(finals):.2f}")
+    print(f"  • Best Winner: ${max(finals):,}")
+    print(f"  • Worst Loser: ${min(finals):,}")
+    print(f"  • Players Profitable: {sum(1 for x in finals if x > config['start_bankroll'])}/{config['num_players']}")
+
+
+def register_mc_flat(wheel_type):
+    defaults = {'num_players': 1000, 'num_spins': 1000, 'start_bankroll': 1000, 'seed': None}
+
+    def simulations(config):
+        return {bet_type: (flat_spec(config, wheel_type, bet_type), ["final", "paths"])
+                for bet_type in ("color", "number")}
+
+    @register_experiment(f"mc_flat_{wheel_type}", experiment_folder("experiment_monte_carlo_flat"),
+                         defaults, simulations)
+    def report(results, config, output):
+        """Color vs number flat betting paths and distributions for a single wheel"""
+        color_finals = results['color']['final']
+        number_finals = results['number']['final']
+
+        print(f"--- ANALYTICS RESULTS ({config['num_players']} Players) ---")
+        print_bet_statistics("COLOR BETS (Low Volatility)", color_finals, config)
+        print_bet_statistics("NUMBER BETS (High Volatility)", number_finals, config)
+
+        expected_final = config['start_bankroll'] - config['num_spins'] * 10 * THEORETICAL_EDGES[wheel_type] / 100
+        print(f"\nTheoretical Expected Final Bankroll: ${expected_final:.2f}")
+
+        for bet_type in ("color", "number"):
+            save_plot(output, f"{wheel_type}_paths_{bet_type}.png",
+                      lambda: create_bankroll_path_plot(results[bet_type]['paths'], bet_type,
+                                                        wheel_type, config['num_spins']))
+        save_plot(output, f"{wheel_type}_histogram_comparison.png",
+                  lambda: create_distribution_comparison(color_finals, number_finals, config['num_players'],
+                                                         config['num_spins'], wheel_type))
+
+
+def register_mc_flat_bet_comparison(bet_type):
+    defaults = {'num_players': 1000, 'num_spins': 1000, 'start_bankroll': 1000, 'seed': None}
+
+    def simulations(config):
+        return {wheel_type: (flat_spec(config, wheel_type, bet_type), ["final"]) for wheel_type in WHEEL_TYPES}
+
+    @register_experiment(f"mc_flat_{bet_type}", experiment_folder("experiment_monte_carlo_flat"),
+                         defaults, simulations)
+    def report(results, config, output):
+        """Flat betting outcome distributions compared across all wheels"""
+        print(f"{'METRIC':<20} | {'EUROPEAN':<15} | {'AMERICAN':<15} | {'TRIPLE':<15}")
+        print("-" * 80)
+        finals = [results[wheel_type]['final'] for wheel_type in WHEEL_TYPES]
+        print(f"{'Avg End Bankroll':<20} | " + " | ".join(f"${np.mean(f):<14.2f}" for f in finals))
+        print(f"{'Std Deviation':<20} | " + " | ".join(f"${np.std(f):<14.0f}" for f in finals))
+        wins = [sum(1 for x in f if x > config['start_bankroll']) for f in finals]
+        print(f"{'Profitable Players':<20} | " + " | ".join(f"{w:<15}" for w in wins))
+
+        save_plot(output, f"comparison_all_wheels_{bet_type}.png",
+                  lambda: create_three_wheel_comparison(*finals, config['num_players'], config['num_spins'],
+                                                        bet_type=bet_type.title()))
+
+
+# ---------------------------------------------------------------------------
+# Experiment 4: Martingale Monte Carlo with Table Limits
+# ---------------------------------------------------------------------------
+
+MARTINGALE_DEFAULTS = {'num_players': 1000, 'num_spins': 1000, 'start_bankroll': 1000,
+                       'table_limit': 1000, 'seed': None}
+
+
+def register_mc_martingale(wheel_type):
+    def simulations(config):
+        return {'martingale': (martingale_spec(config, wheel_type, config['table_limit']), ["final", "paths"])}
+
+    @register_experiment(f"mc_martingale_{wheel_type}", experiment_folder("experiment_monte_carlo_martingale"),
+                         MARTINGALE_DEFAULTS, simulations)
+    def report(results, config, output):
+        """Martingale with a table limit on a single wheel"""
+        finals = results['martingale']['final']
+        num_players = config['num_players']
+
+        winners = sum(1 for x in finals if x > config['start_bankroll'])
+        bankrupt = sum(1 for x in finals if x <= 0)
+        bleeding = sum(1 for x in finals if 0 < x <= config['start_bankroll'])
+
+        print(f"Table Limit: ${config['table_limit']}")
+        print(f"Avg Final Bankroll: ${np.mean(finals):.2f}")
+        print(f"Profitable Players: {winners}/{num_players} ({winners/num_players*100:.1f}%)")
+        print(f"Bankrupt Players (<=0): {bankrupt}/{num_players} ({bankrupt/num_players*100:.1f}%)")
+        print(f"Losing but Surviving: {bleeding}/{num_players} ({bleeding/num_players*100:.1f}%)")
+
+        save_plot(output, f"{wheel_type}_martingale_paths.png",
+                  lambda: create_bankroll_path_plot(results['martingale']['paths'], "color", wheel_type,
+                                                    config['num_spins'], strategy_label="Martingale Strategy"))
+        save_plot(output, f"{wheel_type}_martingale_hist.png",
+                  lambda: create_martingale_histogram(finals, num_players, config['num_spins'], wheel_type))
+
+
+def mc_martingale_comparison_simulations(config):
+    return {wheel_type: (martingale_spec(config, wheel_type, config['table_limit']), ["final"])
+            for wheel_type in WHEEL_TYPES}
+
+
+@register_experiment("mc_martingale_comparison", experiment_folder("experiment_monte_carlo_martingale"),
+                     MARTINGALE_DEFAULTS, mc_martingale_comparison_simulations)
+def report_mc_martingale_comparison(results, config, output):
+    """Martingale survival compared across all wheels"""
+    finals = [results[wheel_type]['final'] for wheel_type in WHEEL_TYPES]
+
+    print(f"{'METRIC':<20} | {'EUROPEAN':<15} | {'AMERICAN':<15} | {'TRIPLE':<15}")
+    print("-" * 90)
+    print(f"{'Avg End Bankroll':<20} | " + " | ".join(f"${np.mean(f):<14.0f}" for f in finals))
+    survivors = [sum(1 for x in f if x > config['start_bankroll']) for f in finals]
+    print(f"{'Survivors':<20} | " + " | ".join(f"{s:<15}" for s in survivors))
+    crashes = [sum(1 for x in f if x <= 0) for f in finals]
+    print(f"{'Bankrupt (<=0)':<20} | " + " | ".join(f"{c:<15}" for c in crashes))
+
+    save_plot(output, "comparison_martingale_survival.png",
+              lambda: create_martingale_comparison(*finals, config['num_players']))
+
+
+# ---------------------------------------------------------------------------
+# Experiment 2: Strategy Comparison (infinite money, no table limit)
+# ---------------------------------------------------------------------------
+
+STRATEGY_DEFAULTS = {'num_players': 1, 'num_spins': 5000, 'start_bankroll': 1000, 'seed': None}
+
+
+def strategy_simulations(config, wheel_types):
+    simulations = {}
+    for wheel_type in wheel_types:
+        simulations[(wheel_type, "flat")] = (flat_spec(config, wheel_type), ["final", "paths", "bets"])
+        simulations[(wheel_type, "martingale")] = (martingale_spec(config, wheel_type), ["final", "paths", "bets"])
+    return simulations
+
+
+def register_strategies(wheel_type):
+    @register_experiment(f"strategies_{wheel_type}", experiment_folder("experiment_strategies"),
+                         STRATEGY_DEFAULTS, lambda config: strategy_simulations(config, [wheel_type]))
+    def report(results, config, output):
+        """Flat vs Martingale bankroll and bet progression for a single player"""
+        flat = results[(wheel_type, "flat")]
+        martingale = results[(wheel_type, "martingale")]
+        start = config['start_bankroll']
+
+        for label, result in (("FLAT BETTING", flat), ("MARTINGALE", martingale)):
+            final = result['final'][0]
+            print(f"{label}:")
+            print(f"  • Final bankroll: ${final:,}")
+            print(f"  • Total loss: ${start - final:,}")
+            print(f"  • Loss percentage: {(start - final) / start * 100:.1f}%")
+        print(f"  • Maximum bet placed: ${max(martingale['bets'][0]):,}")
+
+        # Paths include the starting bankroll; the strategy plots expect per-spin values
+        flat_bankrolls = flat['paths'][0][1:]
+        martingale_bankrolls = martingale['paths'][0][1:]
+        martingale_bets = martingale['bets'][0]
+
+        save_plot(output, f'strategy_comparison_{wheel_type}_enhanced.png',
+                  lambda: create_enhanced_strategy_plot(flat_bankrolls, martingale_bankrolls, martingale_bets,
+                                                        config['num_spins'], wheel_type))
+        save_plot(output, f'strategy_comparison_{wheel_type}_original.png',
+                  lambda: create_strategy_plot(flat_bankrolls, martingale_bankrolls, config['num_spins'], wheel_type))
+
+
+@register_experiment("strategies_comparison", experiment_folder("experiment_strategies"),
+                     STRATEGY_DEFAULTS, lambda config: strategy_simulations(config, WHEEL_TYPES))
+def report_strategies_comparison(results, config, output):
+    """Flat vs Martingale final bankrolls across all wheels"""
+    start = config['start_bankroll']
+    all_results = {}
+    for wheel_type in WHEEL_TYPES:
+        flat_final = results[(wheel_type, "flat")]['final'][0]
+        martingale_final = results[(wheel_type, "martingale")]['final'][0]
+        all_results[wheel_type] = {
+            'flat_final': flat_final,
+            'martingale_final': martingale_final,
+            'flat_loss': start - flat_final,
+            'martingale_loss': start - martingale_final,
+            'martingale_max_bet': max(results[(wheel_type, "martingale")]['bets'][0]),
+        }
+
+    print(f"{'Roulette':<12} | {'Strategy':<12} | {'Final ($)':<12} | {'Loss ($)':<12} | {'Max Bet ($)':<12}")
+    print("-" * 90)
+    for wheel_type, res in all_results.items():
+        print(f"{wheel_type.title():<12} | Flat         | {res['flat_final']:<12,} | {res['flat_loss']:<12,} | 10")
+        print(f"{'':<12} | Martingale   | {res['martingale_final']:<12,} | {res['martingale_loss']:<12,} | {res['martingale_max_bet']:,}")
+
+    save_plot(output, 'strategy_comparison_all_types.png',
+              lambda: create_strategy_comparison_bar_plot(all_results))
+
+
+def strategies_monte_carlo_simulations(config):
+    return {
+        'flat': (flat_spec(config, "european"), ["final"]),
+        'martingale': (martingale_spec(config, "european"), ["final"]),
+    }
+
+
+@register_experiment("strategies_monte_carlo", experiment_folder("experiment_strategies"),
+                     {'num_players': 100, 'num_spins': 1000, 'start_bankroll': 1000, 'seed': None},
+                     strategies_monte_carlo_simulations)
+def report_strategies_monte_carlo(results, config, output):
+    """Flat vs Martingale outcome distributions (European, no table limit)"""
+    flat_results = results['flat']['final']
+    martingale_results = results['martingale']['final']
+
+    for label, finals in (("FLAT BETTING", flat_results), ("MARTINGALE", martingale_results)):
+        print(f"{label}:")
+        print(f"  • Average Final: ${np.mean(finals):.2f}")
+        print(f"  • Std Dev: ${np.std(finals):.2f}")
+        print(f"  • Max Win: ${max(finals):.2f}")
+        print(f"  • Max Loss: ${min(finals):.2f}")
+
+    def build_plot():
+        import matplotlib.pyplot as plt
+        plt.figure(figsize=(12, 6))
+        all_data = flat_results + martingale_results
+        bins = np.linspace(min(all_data), max(all_data), 50)
+        plt.hist(flat_results, bins=bins, alpha=0.6, label='Flat Betting', color='blue', edgecolor='black')
+        plt.hist(martingale_results, bins=bins, alpha=0.5, label='Martingale', color='red', edgecolor='black')
+        plt.axvline(x=config['start_bankroll'], color='green', linestyle='--', label='Start ($1000)')
+        plt.title(f'Distribution of Outcomes: Flat vs Martingale\n'
+                  f'({config["num_players"]} Players, {config["num_spins"]} Spins, European Wheel)')
+        plt.xlabel('Final Bankroll ($)')
+        plt.ylabel('Frequency')
+        plt.legend()
+        plt.grid(True, alpha=0.3)
+        return plt
+
+    save_plot(output, 'strategy_monte_carlo.png', build_plot)
+
+
+@register_experiment("strategies_population_risk", experiment_folder("experiment_strategies"),
+                     {'num_players': 10000, 'num_spins': 1000, 'start_bankroll': 1000, 'seed': 2024},
+                     lambda config: {'martingale': (martingale_spec(config, "european"), ["bets"])})
+def report_strategies_population_risk(results, config, output):
+    """Martingale doubling sequences and bet levels across a population (European, no table limit)"""
+    analysis = analyze_martingale_population(results['martingale']['bets'])
+    print_population_risk(analysis)
+
+    save_plot(output, 'population_risk_european.png',
+              lambda: create_population_risk_plot(analysis, "european"))
+
+
+for _wheel_type in WHEEL_TYPES:
+    register_house_edge(_wheel_type)
+    register_mc_flat(_wheel_type)
+    register_mc_martingale(_wheel_type)
+    register_strategies(_wheel_type)
+
+for _bet_type in ("color", "number"):
+    register_mc_flat_bet_comparison(_bet_type)
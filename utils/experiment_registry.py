@@ -0,0 +1,153 @@
+from components.simulation import run_spec, spec_key
+from components.instrumentation import Instrumentation
+
+# All known experiments, keyed by name (filled by register_experiment)
+EXPERIMENTS = {}
+
+
+def register_experiment(name, folder, defaults, simulations, description=""):
+    """
+    Decorator that registers an experiment's report function.
+
+    - defaults:    dict of configurable parameters (num_players, num_spins...)
+    - simulations: function(config) -> {label: (spec, records)}
+    - the decorated report function is called as report(results, config, output)
+      where results maps each label to its simulation output
+    """
+    def decorator(report):
+        if name in EXPERIMENTS:
+            raise ValueError(f"Experiment '{name}' is already registered")
+        EXPERIMENTS[name] = {
+            'name': name,
+            'folder': folder,
+            'defaults': dict(defaults),
+            'simulations': simulations,
+            'report': report,
+            'description': description or (report.__doc__ or "").strip(),
+        }
+        return report
+    return decorator
+
+
+def resolve_config(name, overrides=None):
+    """Experiment defaults updated with user overrides"""
+    if name not in EXPERIMENTS:
+        raise ValueError(f"Unknown experiment '{name}'. Available: {sorted(EXPERIMENTS)}")
+    config = dict(EXPERIMENTS[name]['defaults'])
+    for key, value in (overrides or {}).items():
+        if key not in config:
+            raise ValueError(f"Experiment '{name}' has no parameter '{key}'")
+        config[key] = value
+    return config
+
+
+def plan_experiments(names, overrides=None):
+    """
+    Collect the simulations needed by every requested experiment.
+
+    Identical specs are merged into a single entry whose records are the union
+    of what each experiment asked for, so each one is simulated only once.
+    `overrides` maps experiment name -> config overrides ('*' applies to all).
+    A '*' override must be a parameter of at least one requested experiment.
+    """
+    overrides = overrides or {}
+    plan = {'experiments': [], 'simulations': {}}
+
+    known = set()
+    for name in names:
+        # Global overrides only apply to the parameters an experiment has
+        defaults = EXPERIMENTS[name]['defaults'] if name in EXPERIMENTS else {}
+        known.update(defaults)
+        config_overrides = {key: value for key, value in overrides.get('*', {}).items() if key in defaults}
+        config_overrides.update(overrides.get(name, {}))
+        config = resolve_config(name, config_overrides)
+
+        labels = {}
+        for label, (spec, records) in EXPERIMENTS[name]['simulations'](config).items():
+            key = spec_key(spec)
+            entry = plan['simulations'].setdefault(key, {'spec': spec, 'records': set(), 'users': []})
+            entry['records'].update(records)
+            entry['users'].append((name, label))
+            labels[label] = key
+
+        plan['experiments'].append({'name': name, 'config': config, 'labels': labels})
+
+    unused = sorted(set(overrides.get('*', {})) - known)
+    if unused:
+        raise ValueError(f"No requested experiment has the parameter(s) {unused}")
+    return plan
+
+
+def run_plan(plan, engine="scalar", verbose=True, profile=None, workers=1):
+    """
+    Run every unique simulation of a plan once. Returns {key: results}
+    `profile` (dict of Instrumentation options, e.g. {} or {'sampler': True})
+    turns on instrumentation; the data is kept in plan['instrumentation'].
+    workers > 1 spreads the players of each simulation over processes
+    (one pool for the whole plan, results through shared memory); bankrolls
+    too big for 64-bit integers still run in this process. Profiling needs
+    workers=1 (the instrumentation only sees this process).
+    """
+    if workers > 1 and profile is not None:
+        raise ValueError("Profiling needs workers=1")
+    results = {}
+    if profile is not None:
+        plan['instrumentation'] = {}
+    total = len(plan['simulations'])
+    pool = None
+    if workers > 1:
+        from components.process_pool import process_pool
+        from components.batch_engine import money_dtype
+        from components.shared_results import simulate_shared
+        pool = process_pool(workers)
+
+    try:
+        for i, (key, entry) in enumerate(plan['simulations'].items(), start=1):
+            spec = entry['spec']
+            if verbose:
+                shared = f" (shared by {len(entry['users'])})" if len(entry['users']) > 1 else ""
+                print(f"[{i}/{total}] {spec['wheel_type']} {spec['strategy']} {spec['bet_type']} "
+                      f"- {spec['num_players']} players x {spec['num_spins']:,} spins{shared}")
+            if pool is not None and money_dtype(spec) != object:
+                arrays = simulate_shared(spec, sorted(entry['records']), engine=engine, workers=workers,
+                                         pool=pool)
+                results[key] = {record: values.tolist() for record, values in arrays.items()}
+            elif profile is None:
+                results[key] = run_spec(spec, records=sorted(entry['records']), engine=engine)
+            else:
+                instrumentation = Instrumentation(**profile)
+                with instrumentation.session():
+                    results[key] = run_spec(spec, records=sorted(entry['records']), engine=engine,
+                                            instrumentation=instrumentation)
+                plan['instrumentation'][key] = instrumentation
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return results
+
+
+def report_plan(plan, results, output=None):
+    """Fan simulation results out to each experiment's analytics and plots"""
+    output = output or {}
+    for experiment in plan['experiments']:
+        registered = EXPERIMENTS[experiment['name']]
+        experiment_results = {label: results[key] for label, key in experiment['labels'].items()}
+
+        print("\n" + "=" * 60)
+        print(f"📋 {experiment['name']}")
+        print("=" * 60)
+        report_output = dict(output, folder=output.get('folder') or registered['folder'])
+
+        if 'instrumentation' not in plan:
+            registered['report'](experiment_results, experiment['config'], report_output)
+            continue
+
+        # Per-experiment summary: its simulations (shared ones count for every
+        # experiment that uses them) plus the time spent on analytics and plots
+        summary = Instrumentation()
+        for key in experiment['labels'].values():
+            summary.merge(plan['instrumentation'][key])
+        with summary.session(), summary.phase("plotting"):
+            registered['report'](experiment_results, experiment['config'], report_output)
+        summary.report(f"INSTRUMENTATION ({experiment['name']})")
@@ -0,0 +1,211 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from components.batch_engine import PAYOUTS, win_probability
+
+# Exact gambler's ruin for flat bettors.
+# In units of one bet a flat bettor is a random walk: +m with probability p
+# (m = 1 for colors, 35 for a number) and -1 with probability q. With a ruin
+# floor and an optional win goal:
+#   - ruin probability and expected session length solve a banded linear
+#     system (one step down, m steps up), solved in O(states * m);
+#   - the duration distribution propagates the walk spin by spin.
+# Results are memoized per walk (p, m, start, goal), so every Player/Game
+# configuration that maps to the same walk is solved once.
+
+# Stop propagating the duration distribution once this much mass is left
+DURATION_TOLERANCE = 1e-12
+# Hard cap on the spins propagated when no horizon is given
+MAX_DURATION_SPINS = 10 ** 6
+
+
+def flat_walk(spec, floor=0, goal=None):
+    """
+    Random-walk form of a flat bettor: (p_win, multiplier, start, goal_state).
+    State j means the bankroll is between floor + (j - 1) bets (excluded) and
+    floor + j bets (included); state 0 is ruin (bankroll <= floor) and states
+    >= goal_state mean the bankroll reached the goal (goal_state is None without a goal).
+    """
+    if spec['strategy'] == "martingale":
+        raise ValueError("The exact ruin solver only covers flat betting")
+    bet = min(spec['base_bet'], spec['table_limit'])
+    if bet <= 0:
+        raise ValueError("The bet must be positive")
+    if goal is not None and goal <= floor:
+        raise ValueError("The goal must be above the ruin floor")
+
+    p_win = win_probability(spec['wheel_type'], spec['bet_type'], spec['bet_value'], spec.get('wheel_weights'))
+    multiplier = PAYOUTS.get(spec['bet_type'], 35)
+    margin = spec['initial_bankroll'] - floor
+    start = max(0, math.ceil(margin / bet))
+
+    goal_state = None
+    if goal is not None:
+        # Bankroll in state j is floor + (j - 1) * bet + offset
+        offset = margin - (start - 1) * bet
+        goal_state = max(start, 1 + math.ceil((goal - floor - offset) / bet))
+    return p_win, multiplier, start, goal_state
+
+
+@lru_cache(maxsize=None)
+def _solve_absorption(p_win, multiplier, start, goal_state):
+    """
+    Ruin probability and expected duration from every transient state 1..goal_state - 1.
+    Banded Gaussian elimination: each row has one entry below the diagonal
+    (the loss) and one m steps above it (the win), and the matrix is an
+    M-matrix, so no pivoting is needed.
+    """
+    q = 1.0 - p_win
+    size = goal_state - 1
+    # band[j, k] = coefficient of x_{j+k} in row j (rows are states 1..size)
+    band = np.zeros((size, multiplier + 1))
+    band[:, 0] = 1.0
+    band[:, multiplier] = -p_win
+    rhs = np.zeros((size, 2))
+    rhs[0, 0] = q       # a loss from state 1 is ruin (ruin probability system)
+    rhs[:, 1] = 1.0     # every spin adds one to the duration (expected duration system)
+
+    # Step 1: Forward elimination of the single sub-diagonal (-q)
+    for row in range(1, size):
+        factor = -q / band[row - 1, 0]
+        band[row, :multiplier] -= factor * band[row - 1, 1:]
+        rhs[row] -= factor * rhs[row - 1]
+
+    # Step 2: Back substitution (states >= goal_state are 0 in both systems)
+    solution = np.zeros((size + multiplier, 2))
+    for row in range(size - 1, -1, -1):
+        solution[row] = (rhs[row] - band[row, 1:] @ solution[row + 1:row + multiplier + 1]) / band[row, 0]
+    return solution[:size].copy()
+
+
+def solve_gamblers_ruin(spec, floor=0, goal=None):
+    """
+    Exact outcome of a flat bettor who plays until ruin (bankroll <= floor)
+    or until the bankroll reaches `goal` (None: play until ruin).
+    Returns p_ruin, p_goal and expected_spins (unlimited session length).
+    """
+    p_win, multiplier, start, goal_state = flat_walk(spec, floor, goal)
+    if start == 0:
+        return {'p_ruin': 1.0, 'p_goal': 0.0, 'expected_spins': 0.0}
+    if goal_state is not None and start >= goal_state:
+        return {'p_ruin': 0.0, 'p_goal': 1.0, 'expected_spins': 0.0}
+
+    if goal_state is None:
+        # One step down at a time: with negative drift ruin is certain and
+        # Wald's identity gives the expected duration
+        drift = multiplier * p_win - (1 - p_win)
+        if drift > 0:
+            raise ValueError("With a positive edge the player may never be ruined; give a goal")
+        expected = start / -drift if drift < 0 else float('inf')
+        return {'p_ruin': 1.0, 'p_goal': 0.0, 'expected_spins': expected}
+
+    p_ruin, expected = _solve_absorption(p_win, multiplier, start, goal_state)[start - 1]
+    return {'p_ruin': float(p_ruin), 'p_goal': float(1 - p_ruin), 'expected_spins': float(expected)}
+
+
+@lru_cache(maxsize=None)
+def _propagate_duration(p_win, multiplier, start, goal_state, max_spins):
+    """
+    P(ruin at spin t) and P(goal at spin t) for t = 1..T by forward propagation.
+    Without a goal, only states a ruin can still be reached from are tracked
+    (above max_spins + 1 the player cannot be ruined within max_spins spins).
+    """
+    q = 1.0 - p_win
+    top = goal_state - 1 if goal_state is not None else max_spins + 1
+    limit = max_spins if max_spins is not None else MAX_DURATION_SPINS
+
+    # mass[j] = P(in state j and still playing), states 1..top
+    mass = np.zeros(top + 1)
+    mass[start] = 1.0
+    ruin, goal = [], []
+    for _ in range(limit):
+        ruin.append(q * mass[1])
+        # Wins from states within m of the goal (or above the tracked states)
+        goal.append(p_win * mass[max(1, top + 1 - multiplier):].sum())
+
+        moved = np.zeros_like(mass)
+        moved[1:top] = q * mass[2:]
+        moved[1 + multiplier:] += p_win * mass[1:top + 1 - multiplier]
+        mass = moved
+        if max_spins is None and mass.sum() < DURATION_TOLERANCE:
+            break
+
+    ruin, goal = np.array(ruin), np.array(goal)
+    for values in (ruin, goal):
+        values.setflags(write=False)  # shared by every caller through the cache
+    return ruin, goal, float(mass.sum())
+
+
+def duration_distribution(spec, floor=0, goal=None, max_spins=None):
+    """
+    Distribution of the session length of a flat bettor.
+    Returns, for t = 1..T: ruin[t-1] = P(ruined at spin t), goal[t-1] =
+    P(goal reached at spin t), plus the totals within the T spins and the
+    probability of still playing after them. Without a goal, max_spins
+    defaults to the spec's num_spins and "goal" counts players who can no
+    longer be ruined within the horizon.
+    """
+    p_win, multiplier, start, goal_state = flat_walk(spec, floor, goal)
+    if goal_state is None and max_spins is None:
+        max_spins = spec['num_spins']
+
+    if start == 0 or (goal_state is not None and start >= goal_state):
+        ruin, goal_mass, playing = np.zeros(0), np.zeros(0), 0.0
+        p_ruin_within, p_goal_within = (1.0, 0.0) if start == 0 else (0.0, 1.0)
+    elif goal_state is None and start > max_spins:
+        # Too far above the floor to be ruined within the session
+        ruin, goal_mass, playing = np.zeros(max_spins), np.zeros(max_spins), 1.0
+        p_ruin_within, p_goal_within = 0.0, 0.0
+    else:
+        ruin, goal_mass, playing = _propagate_duration(p_win, multiplier, start, goal_state, max_spins)
+        p_ruin_within, p_goal_within = float(ruin.sum()), float(goal_mass.sum())
+        if goal_state is None:
+            # Escaping above the tracked states is not a goal; those players are still playing
+            playing += p_goal_within
+            p_goal_within = 0.0
+
+    return {
+        'spins': np.arange(1, len(ruin) + 1),
+        'ruin': ruin,
+        'goal': goal_mass if goal_state is not None else np.zeros(len(ruin)),
+        'p_ruin_within': p_ruin_within,
+        'p_goal_within': p_goal_within,
+        'p_playing': playing,
+    }
+
+
+def binomial_pmf(num_trials, p):
+    """P(W = k), k = 0..num_trials, for W ~ Binomial(num_trials, p)"""
+    k = np.arange(num_trials + 1)
+    log_factorials = np.array([math.lgamma(i + 1) for i in k])
+    log_pmf = (log_factorials[-1] - log_factorials - log_factorials[::-1]
+               + k * math.log(p) + (num_trials - k) * math.log1p(-p))
+    return np.exp(log_pmf)
+
+
+def exact_flat_metrics(spec, ruin_level=0):
+    """
+    Exact (population) values of the sweep metrics for a flat bettor playing
+    spec['num_spins'] spins: the final bankroll is binomial in the number of
+    wins and the ruin probability is a first passage within the session.
+    """
+    p_win, multiplier, _, _ = flat_walk(spec, floor=ruin_level)
+    bet = min(spec['base_bet'], spec['table_limit'])
+    num_spins = spec['num_spins']
+    start = spec['initial_bankroll']
+
+    # Final bankroll after W wins: start + bet * ((m + 1) W - N)
+    pmf = binomial_pmf(num_spins, p_win)
+    finals = start + bet * ((multiplier + 1) * np.arange(num_spins + 1) - num_spins)
+    mean = float(pmf @ finals)
+
+    return {
+        'mean_final': mean,
+        'std_final': float(np.sqrt(pmf @ (finals - mean) ** 2)),
+        'mean_loss': float(start - mean),
+        'p_profit': float(pmf[finals > start].sum()),
+        'p_ruin': duration_distribution(spec, floor=ruin_level, max_spins=num_spins)['p_ruin_within'],
+        'p_bankrupt': float(pmf[finals <= 0].sum()),
+    }
@@ -0,0 +1,202 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel
+from components.player_pool import group_returns
+
+# Distribution of the house's net result for a bet mix, per spin and summed
+# over an hour or a shift of spins.
+# A bet mix is the total stake on each bet of the layout in one spin:
+#     {("color", "red"): 5000, ("number", 17): 250, ...}
+# Every bet is settled by the same pocket, so the house result of one spin is
+# exactly one value per pocket (stakes x returns), with the pocket's
+# probability. Spins are independent, so the result of n spins is the n-fold
+# convolution of that distribution, done with one FFT power.
+#
+# Distributions live on a lattice: result = start + step * i with probability
+# pmf[i]. With integer stakes the per-spin lattice step is the gcd of the
+# results, so n-spin distributions are exact (up to FFT rounding). When the
+# lattice would exceed max_points the step is widened and each mass is split
+# between its two neighbouring lattice points, which keeps the mean exact and
+# widens the variance by at most step^2 / 4 per spin ('exact' is then False).
+#
+# The last PROFILE_CACHE_SIZE profiles are cached per (wheel, weights, bet
+# mix, spins per hour, hours per shift); callers get their own copy of the
+# dicts, and the cached arrays are read-only.
+
+# Largest lattice (points) of an aggregated distribution
+MAX_POINTS = 2 ** 22
+
+# Profiles kept by the cache (each one holds up to 3 arrays of MAX_POINTS)
+PROFILE_CACHE_SIZE = 8
+
+# Default confidence levels for VaR / expected shortfall
+RISK_LEVELS = (0.95, 0.99, 0.999)
+
+
+def normalize_mix(mix):
+    """Hashable bet mix: ((bet_type, bet_value, stake), ...) in a fixed order, zero stakes dropped"""
+    items = mix.items() if isinstance(mix, dict) else mix
+    merged = {}
+    for (bet_type, bet_value), stake in items:
+        if stake < 0:
+            raise ValueError("Stakes must be non-negative")
+        if stake:
+            merged[(bet_type, bet_value)] = merged.get((bet_type, bet_value), 0) + stake
+    if not merged:
+        raise ValueError("The bet mix has no stakes")
+    return tuple(sorted(((t, v, s) for (t, v), s in merged.items()), key=repr))
+
+
+def bet_mix_from_table(results):
+    """Average stake per bet and spin of a components.shared_table run"""
+    spins = max(1, len(results['pockets']))
+    return {bet: float(handle) / spins for bet, handle in zip(results['groups'], results['group_handle'])}
+
+
+def spin_distribution(wheel_type, mix, weights=None, resolution=1.0):
+    """
+    Exact distribution of the house result of one spin of the bet mix.
+    Returns a lattice dict: start, step, pmf (index i <-> start + i * step), exact.
+    """
+    mix = normalize_mix(mix)
+    returns = group_returns(wheel_type, [(bet_type, bet_value) for bet_type, bet_value, _ in mix])
+    stakes = np.array([stake for _, _, stake in mix], dtype=float)
+    # House wins what the players lose
+    results = -(stakes @ returns)
+    probabilities = RouletteWheel(wheel_type, seed=0, weights=weights).pocket_probabilities()
+
+    # Step 1: Lattice step (gcd of integer results, else the resolution)
+    low = results.min()
+    offsets = results - low
+    if np.all(offsets == np.round(offsets)) and np.all(np.abs(offsets) < 2 ** 53):
+        step = float(np.gcd.reduce(offsets.astype(np.int64))) or 1.0
+    else:
+        step = float(resolution)
+
+    # Step 2: Pocket probabilities on the lattice (split when between points)
+    return lattice_from_points(results, probabilities, low, step)
+
+
+def lattice_from_points(values, probabilities, start, step):
+    """Put point masses on the lattice start + i * step, splitting mass linearly between neighbours"""
+    position = (np.asarray(values, dtype=float) - start) / step
+    lower = np.floor(position + 1e-9).astype(np.int64)
+    fraction = np.clip(position - lower, 0.0, 1.0)
+    exact = bool(np.all(fraction < 1e-9))
+    fraction[fraction < 1e-9] = 0.0
+    size = int(lower.max()) + 2
+    pmf = (np.bincount(lower, (1 - fraction) * probabilities, minlength=size)
+           + np.bincount(lower + 1, fraction * probabilities, minlength=size))
+    if not np.any(fraction):
+        pmf = pmf[:-1]
+    return {'start': float(start), 'step': float(step), 'pmf': pmf, 'exact': exact}
+
+
+def coarsen(distribution, factor):
+    """Same distribution on a lattice `factor` times wider (mean preserved)"""
+    if factor == 1:
+        return distribution
+    pmf = distribution['pmf']
+    values = distribution['start'] + distribution['step'] * np.arange(len(pmf))
+    coarse = lattice_from_points(values, pmf, distribution['start'], distribution['step'] * factor)
+    coarse['exact'] = coarse['exact'] and distribution['exact']
+    return coarse
+
+
+def aggregate(distribution, num_spins, max_points=MAX_POINTS):
+    """
+    Distribution of the sum of num_spins independent copies (FFT power).
+    The lattice is widened first if the result would exceed max_points.
+    """
+    if num_spins < 1:
+        raise ValueError("num_spins must be at least 1")
+    if num_spins == 1:
+        return distribution
+
+    # Step 1: Widen the lattice until n * (points - 1) + 1 fits
+    factor = 1
+    width = len(distribution['pmf']) - 1
+    while num_spins * (math.ceil(width / factor) + 1) + 1 > max_points:
+        factor = max(factor + 1, math.ceil(factor * num_spins * (width / factor + 1) / max_points))
+    distribution = coarsen(distribution, factor)
+    pmf = distribution['pmf']
+
+    # Step 2: n-fold convolution as the n-th power of the transform
+    size = num_spins * (len(pmf) - 1) + 1
+    fft_size = 1 << (size - 1).bit_length()
+    total = np.fft.irfft(np.fft.rfft(pmf, fft_size) ** num_spins, fft_size)[:size]
+    # Rounding noise can leave tiny negative masses
+    np.clip(total, 0.0, None, out=total)
+    total /= total.sum()
+
+    return {
+        'start': distribution['start'] * num_spins,
+        'step': distribution['step'],
+        'pmf': total,
+        'exact': distribution['exact'],
+    }
+
+
+def risk_measures(distribution, levels=RISK_LEVELS):
+    """
+    Mean, standard deviation, P(house loses) and, for each level, the
+    value-at-risk and expected shortfall of the house loss (positive = loss).
+    """
+    pmf = distribution['pmf']
+    # Losses in increasing order
+    losses = -(distribution['start'] + distribution['step'] * np.arange(len(pmf)))[::-1]
+    probabilities = pmf[::-1]
+    mean = float(probabilities @ -losses)
+    variance = float(probabilities @ (losses + mean) ** 2)
+    cumulative = np.cumsum(probabilities)
+
+    var, es = {}, {}
+    for level in levels:
+        # VaR: smallest loss with P(loss <= VaR) >= level
+        index = min(int(np.searchsorted(cumulative, level - 1e-12)), len(losses) - 1)
+        value = losses[index]
+        tail = probabilities[index + 1:] @ losses[index + 1:]
+        # Part of the VaR atom belongs to the tail so that the tail has mass 1 - level
+        es[level] = float((tail + value * (cumulative[index] - level)) / (1 - level))
+        var[level] = float(value)
+
+    return {
+        'mean': mean,
+        'std': math.sqrt(variance),
+        'p_house_loses': float(probabilities[losses > 0].sum()),
+        'var': var,
+        'es': es,
+    }
+
+
+@lru_cache(maxsize=PROFILE_CACHE_SIZE)
+def _house_risk_profile(wheel_type, weights, mix, spins_per_hour, hours_per_shift, levels, max_points):
+    stakes = {(bet_type, bet_value): stake for bet_type, bet_value, stake in mix}
+    spin = spin_distribution(wheel_type, stakes, weights)
+    hour = aggregate(spin, spins_per_hour, max_points)
+    shift = aggregate(hour, hours_per_shift, max_points)
+
+    profile = {}
+    for name, distribution in (("spin", spin), ("hour", hour), ("shift", shift)):
+        distribution['pmf'].setflags(write=False)  # shared by every caller through the cache
+        profile[name] = dict(distribution, **risk_measures(distribution, levels))
+    return profile
+
+
+def house_risk_profile(wheel_type, mix, spins_per_hour=40, hours_per_shift=8, weights=None,
+                       levels=RISK_LEVELS, max_points=MAX_POINTS):
+    """
+    House result distribution of a bet mix per spin, hour and shift.
+    Returns {'spin' | 'hour' | 'shift': lattice dict + risk_measures()}.
+    Cached per profile: the dicts are copies, the pmf arrays are shared and read-only.
+    """
+    if spins_per_hour < 1 or hours_per_shift < 1:
+        raise ValueError("Need spins_per_hour >= 1 and hours_per_shift >= 1")
+    if weights is not None:
+        weights = tuple(RouletteWheel(wheel_type, seed=0, weights=weights).weights)
+    profile = _house_risk_profile(wheel_type, weights, normalize_mix(mix), int(spins_per_hour),
+                                  int(hours_per_shift), tuple(levels), int(max_points))
+    return {name: dict(period, var=dict(period['var']), es=dict(period['es'])) for name, period in profile.items()}
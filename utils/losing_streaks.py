@@ -0,0 +1,180 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from components.batch_engine import win_table
+
+# Exact distribution of the longest losing streak in N spins.
+# A Martingale player fails (hits the table limit or runs out of money) at the
+# first streak of k consecutive losses, so P(longest streak >= k) is the
+# failure probability of a limit that allows k - 1 doublings.
+#
+# For one threshold k, A_n = P(no streak of k losses in n spins) satisfies
+#     A_n = A_{n-1} - p q^k A_{n-k-1}        (p = win probability, q = 1 - p)
+# (the new streak starts right after a win). That is O(N) time per k with a
+# window of the last k + 1 values, so O(N * k) over all thresholds up to k.
+
+# Tail probabilities below this are treated as zero
+TAIL_TOLERANCE = 1e-18
+
+
+def loss_probability(wheel_type, bet_type, bet_value):
+    """(p_win, p_loss) of one bet on a fair wheel"""
+    p_win = float(np.mean(win_table(wheel_type, bet_type, bet_value)))
+    return p_win, 1.0 - p_win
+
+
+def _streak_group(p_win, ks, num_spins):
+    """
+    A_N and B_N = 1 - A_N for every threshold in ks at once.
+    All thresholds advance in blocks of min(ks) + 1 spins: inside a block
+    every A_{n-k-1} is already known, so a block is one cumulative sum.
+    B is accumulated separately so that small tail probabilities stay accurate.
+    """
+    ks = np.asarray(ks)
+    block = int(ks.min()) + 1
+    window = int(ks.max()) + 1
+    rates = p_win * (1.0 - p_win) ** ks  # p q^k, chance a streak completes right after a win
+
+    # history[j] holds A_{n0 - window + j}. Before the first spin A_{-1} = 1/p
+    # stands for "a streak may start at spin 1" (no win needed before it).
+    history = np.zeros((window, len(ks)))
+    history[-1] = 1.0 / p_win
+    last_a = np.ones(len(ks))
+    last_b = np.zeros(len(ks))
+    rows = np.arange(block)[:, None] + (window - ks - 1)[None, :]
+    columns = np.arange(len(ks))[None, :]
+
+    for start in range(0, num_spins + 1, block):
+        completed = rates * np.cumsum(history[rows, columns], axis=0)
+        values_a = last_a - completed
+        values_b = last_b + completed
+
+        if start + block > num_spins:
+            return values_a[num_spins - start], values_b[num_spins - start]
+        if values_a[-1].max() < 1e-300:
+            # Every threshold is certain to be reached before N spins
+            return np.zeros(len(ks)), np.ones(len(ks))
+
+        last_a, last_b = values_a[-1], values_b[-1]
+        history = np.concatenate([history[block:], np.maximum(values_a, 0.0)])
+
+
+def streak_probabilities(p_win, ks, num_spins):
+    """
+    P(longest losing streak in num_spins spins >= k) for every k in ks.
+    Thresholds are grouped by size (k0..2k0) so each group shares a block length.
+    """
+    ks = np.asarray(ks, dtype=np.int64)
+    if np.any(ks < 0):
+        raise ValueError("Streak lengths must be non-negative")
+    q = 1.0 - p_win
+    at_least = np.zeros(len(ks))
+    at_least[ks == 0] = 1.0
+    if p_win <= 0:
+        at_least[ks <= num_spins] = 1.0
+        return at_least
+    if q <= 0:
+        return at_least
+
+    todo = np.flatnonzero((ks > 0) & (ks <= num_spins))
+    order = todo[np.argsort(ks[todo])]
+    while len(order):
+        k0 = ks[order[0]]
+        group = order[ks[order] <= 2 * k0 + 1]
+        order = order[len(group):]
+        _, at_least[group] = _streak_group(p_win, ks[group], num_spins)
+    return np.clip(at_least, 0.0, 1.0)
+
+
+@lru_cache(maxsize=None)
+def longest_losing_streak_distribution(wheel_type, bet_type, bet_value, num_spins):
+    """
+    Exact distribution of the longest losing streak over num_spins spins.
+    Cached per (wheel, bet, N); the returned arrays are read-only.
+    Returns a dict with:
+      - streaks: k = 0, 1, ..., max_streak
+      - pmf: P(longest streak == k)
+      - at_least: P(longest streak >= k)
+      - mean: expected longest streak
+    """
+    if num_spins < 0:
+        raise ValueError("num_spins must be non-negative")
+    p_win, q = loss_probability(wheel_type, bet_type, bet_value)
+
+    # Thresholds that matter: below k_low at least one streak of k is certain
+    # (to double precision), above k_high the union bound (1 + N p) q^k is negligible
+    k_high = num_spins if q > 0 else 0
+    if 0 < q < 1:
+        k_high = min(num_spins, math.ceil(math.log(TAIL_TOLERANCE / (1 + num_spins * p_win)) / math.log(q)))
+    k_low = 1
+    while 0 < q < 1 and k_low < k_high:
+        # A_N <= (1 - p q^k)^floor(N / (k + 1)): disjoint windows of "win, k losses"
+        if (num_spins // (k_low + 1)) * math.log1p(-p_win * q ** k_low) > -745:
+            break
+        k_low += 1
+
+    # at_least[k] for k = 0 .. k_high + 1 (streaks past k_high are impossible or negligible)
+    streaks = np.arange(k_high + 2)
+    at_least = np.ones(len(streaks))
+    at_least[k_low:k_high + 1] = streak_probabilities(p_win, streaks[k_low:k_high + 1], num_spins)
+    at_least[-1] = 0.0
+
+    pmf = np.clip(at_least[:-1] - at_least[1:], 0.0, 1.0)
+    streaks = streaks[:-1]
+    for values in (streaks, pmf, at_least):
+        values.setflags(write=False)
+
+    return {
+        'wheel_type': wheel_type,
+        'bet_type': bet_type,
+        'num_spins': num_spins,
+        'p_win': p_win,
+        'streaks': streaks,
+        'pmf': pmf,
+        'at_least': at_least[:-1],
+        'mean': float(np.sum(at_least[1:])),
+    }
+
+
+def doublings_before_limit(base_bet, table_limit):
+    """Losses in a row after which the Martingale bet would exceed the table limit"""
+    if base_bet <= 0:
+        raise ValueError("base_bet must be positive")
+    if table_limit == float('inf'):
+        return None
+    losses = 0
+    while base_bet * 2 ** losses <= table_limit:
+        losses += 1
+    return losses
+
+
+def table_limit_hit_probability(wheel_type, bet_type, bet_value, num_spins, base_bet, table_limit):
+    """
+    Probability that a Martingale player has to bet more than the table limit
+    at least once in num_spins spins (no simulation needed).
+    The bet at spin t only depends on the spins before it, so this is
+    P(longest streak in the first num_spins - 1 spins >= doublings_before_limit).
+    """
+    losses = doublings_before_limit(base_bet, table_limit)
+    if losses is None or num_spins < 1:
+        return 0.0
+    distribution = longest_losing_streak_distribution(wheel_type, bet_type, bet_value, num_spins - 1)
+    if losses >= len(distribution['at_least']):
+        return 0.0
+    return float(distribution['at_least'][losses])
+
+
+def simulated_longest_streaks(pockets, wins_by_pocket):
+    """Longest losing streak of every player from a (players, spins) pocket matrix"""
+    losses = ~np.asarray(wins_by_pocket)[pockets]
+    num_players, num_spins = losses.shape
+
+    # Run-length encode the losses: run id increases at every win
+    padded = np.zeros((num_players, num_spins + 1), dtype=bool)
+    padded[:, 1:] = losses
+    # Length of the current losing run at each spin = spin index - index of the last win
+    index = np.arange(num_spins + 1)
+    last_win = np.maximum.accumulate(np.where(padded, 0, index), axis=1)
+    return (index - last_win).max(axis=1)
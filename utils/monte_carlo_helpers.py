@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 import numpy as np
 import os
 
@@ -12,6 +11,8 @@ def create_bankroll_path_plot(histories, bet_type, wheel_type, num_spins, strate
     """
     Plots the trajectory of every player and the average trend.
     """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
     plt.figure(figsize=(12, 7))
     
     data = np.array(histories)
@@ -51,6 +52,8 @@ def create_distribution_comparison(color_results, number_results, num_players, n
     Compare distributions of Color Bets vs Number Bets
     This visualizes RISK (Variance).
     """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
     plt.figure(figsize=(14, 8))
     
     # Create common bins for the histogram
@@ -82,6 +85,8 @@ def create_three_wheel_comparison(euro_data, amer_data, trip_data, num_players,
     """
     Overlays histograms of all 3 wheels to show the 'Shift' in expected value.
     """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
     plt.figure(figsize=(12, 7))
     
     # Create common bins so the bars align perfectly
@@ -123,6 +128,8 @@ def create_martingale_histogram(final_bankrolls, num_players, num_spins, wheel_t
     Special histogram for Martingale.
     Highlights the split between 'Small Winners' and 'Big Losers'.
     """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
     plt.figure(figsize=(12, 7))
     
     # Martingale creates a wide range of negative values, so we need dynamic bins
@@ -149,6 +156,8 @@ def create_martingale_comparison(euro_data, amer_data, trip_data, num_players):
     Overlays histograms of all 3 wheels for Martingale.
     Shows how the 'Bankrupt' pile grows as House Edge increases.
     """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
     plt.figure(figsize=(12, 7))
     
     # Determine range based on all data (some players lose $5000+, some win $1000)
@@ -171,4 +180,91 @@ def create_martingale_comparison(euro_data, amer_data, trip_data, num_players):
     plt.legend()
     plt.grid(True, alpha=0.3)
     
-    return plt
\ No newline at end of file
+    return plt
+
+def create_streak_distribution_plot(distributions, simulated, num_players, num_spins):
+    """
+    Exact longest-losing-streak distribution of each wheel (lines) against
+    the simulated streaks of num_players players (bars).
+    distributions: {wheel_type: longest_losing_streak_distribution(...)}
+    simulated: {wheel_type: longest streak of every simulated player}
+    """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
+    colors = {'european': 'blue', 'american': 'orange', 'triple': 'green'}
+    plt.figure(figsize=(12, 7))
+
+    width = 0.8 / len(distributions)
+    for i, (wheel_type, distribution) in enumerate(distributions.items()):
+        color = colors.get(wheel_type, 'gray')
+        streaks = distribution['streaks']
+        observed = np.bincount(simulated[wheel_type], minlength=len(streaks))[:len(streaks)] / num_players
+        plt.bar(streaks + (i - (len(distributions) - 1) / 2) * width, observed, width,
+                color=color, alpha=0.4, label=f'{wheel_type.title()} (simulated)')
+        plt.plot(streaks, distribution['pmf'], color=color, marker='o', markersize=3, linewidth=2,
+                 label=f'{wheel_type.title()} (exact)')
+
+    upper = max(np.max(simulated[wheel_type]) for wheel_type in simulated) + 3
+    plt.xlim(0, upper)
+    plt.xlabel('Longest Losing Streak (spins)')
+    plt.ylabel('Probability')
+    plt.title(f'Longest Losing Streak in {num_spins:,} Spins\n'
+              f'Exact Distribution vs {num_players:,} Simulated Players')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+
+    return plt
+
+
+def create_tail_probability_plot(estimates, x_label, num_spins, table_limit):
+    """
+    Rare-event tail curves with 95% confidence intervals (log scale).
+    estimates: {wheel_type: [estimate_tail_probability(...) dicts, one per level]}
+    """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
+    colors = {'european': 'blue', 'american': 'orange', 'triple': 'green'}
+    plt.figure(figsize=(12, 7))
+
+    for wheel_type, rows in estimates.items():
+        levels = [row['level'] for row in rows]
+        probabilities = np.array([row['probability'] for row in rows])
+        errors = [probabilities - [row['ci_low'] for row in rows],
+                  np.array([row['ci_high'] for row in rows]) - probabilities]
+        plt.errorbar(levels, probabilities, yerr=errors, color=colors.get(wheel_type, 'gray'), marker='o',
+                     linewidth=2, capsize=4, label=f'{wheel_type.title()}')
+
+    plt.yscale('log')
+    plt.xlabel(x_label)
+    plt.ylabel('Probability (95% CI)')
+    plt.title(f'Martingale Tail Risk (Importance Sampling)\n'
+              f'Table Limit ${table_limit:,} | {num_spins:,} Spins per Player')
+    plt.legend()
+    plt.grid(True, which='both', alpha=0.3)
+
+    return plt
+
+
+def create_duration_plot(distributions, start_bankroll, goal, floor):
+    """
+    Exact session-length distributions of flat bettors who stop at the goal or at ruin.
+    distributions: {label: duration_distribution(...)}
+    """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
+    plt.figure(figsize=(12, 7))
+    for (label, distribution), color in zip(distributions.items(), ['blue', 'orange', 'green', 'purple']):
+        spins = distribution['spins']
+        plt.plot(spins, np.cumsum(distribution['ruin']), color=color, linewidth=2,
+                 label=f'{label}: ruined by spin t')
+        plt.plot(spins, np.cumsum(distribution['goal']), color=color, linewidth=2, linestyle='--',
+                 label=f'{label}: goal reached by spin t')
+
+    plt.xscale('log')
+    plt.xlabel('Spin Number')
+    plt.ylabel('Cumulative Probability')
+    plt.title(f"Gambler's Ruin (Exact): Start ${start_bankroll:,}, Goal ${goal:,}, Ruin at ${floor:,}")
+    plt.legend()
+    plt.grid(True, which='both', alpha=0.3)
+
+    return plt
@@ -0,0 +1,228 @@
+import csv
+import itertools
+import json
+import os
+import time
+
+import numpy as np
+
+from components.simulation import DEFAULT_SPEC, make_spec, player_seeds, run_spec
+from components.batch_engine import pocket_matrix, simulate_batch
+from components.checkpoint import CHECKPOINT_SECONDS, check_signature, load_checkpoint, save_checkpoint
+
+# Parameter sweeps over Game/Player settings.
+# Every cell of a sweep is a simulation spec. All cells share one seed, so
+# cells on the same wheel see exactly the same spins (common random numbers):
+# differences between cells come from the parameters, not from luck.
+
+# Metrics computed for every cell (one row of the results table)
+SWEEP_METRICS = ("mean_final", "std_final", "mean_loss", "p_profit", "p_ruin", "p_bankrupt")
+
+
+def parse_axis(text):
+    """Parse 'name=v1,v2,...' into (name, [values]); values are JSON when possible"""
+    name, _, raw_values = text.partition("=")
+    if name not in DEFAULT_SPEC or not raw_values:
+        raise ValueError(f"Invalid axis '{text}'. Use name=v1,v2 with a name from {sorted(DEFAULT_SPEC)}")
+
+    values = []
+    for token in raw_values.split(","):
+        try:
+            values.append(json.loads(token))
+        except json.JSONDecodeError:
+            values.append(token)
+    return name, values
+
+
+def grid_cells(axes):
+    """Every combination of the axis values: {name: [values]} -> list of dicts"""
+    names = list(axes)
+    return [dict(zip(names, combo)) for combo in itertools.product(*(axes[name] for name in names))]
+
+
+def latin_hypercube_cells(axes, num_samples, seed=None):
+    """
+    Latin hypercube sample of the axes.
+    Numeric axes are treated as ranges [min(values), max(values)] (integers stay
+    integers); other axes are categorical and their values are stratified evenly.
+    """
+    rng = np.random.default_rng(seed)
+    columns = {}
+
+    for name, values in axes.items():
+        # One point in each of num_samples equal strata, in random order
+        strata = (rng.permutation(num_samples) + rng.random(num_samples)) / num_samples
+        numeric = all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)
+
+        if numeric and len(values) > 1:
+            low, high = min(values), max(values)
+            points = low + strata * (high - low)
+            if all(isinstance(v, int) for v in values):
+                columns[name] = [int(round(p)) for p in points]
+            else:
+                columns[name] = [float(p) for p in points]
+        else:
+            columns[name] = [values[int(u * len(values))] for u in strata]
+
+    return [{name: columns[name][i] for name in axes} for i in range(num_samples)]
+
+
+def cell_metrics(spec, final, lowest, ruin_level=0):
+    """Summary statistics of one cell from its final and lowest bankrolls"""
+    final = np.asarray(final, dtype=float)
+    lowest = np.asarray(lowest, dtype=float)
+    return {
+        'mean_final': float(final.mean()),
+        'std_final': float(final.std()),
+        'mean_loss': float(spec['initial_bankroll'] - final.mean()),
+        'p_profit': float(np.mean(final > spec['initial_bankroll'])),
+        # Ruin: the bankroll touched the ruin level at some point of the session
+        'p_ruin': float(np.mean(lowest <= ruin_level)),
+        'p_bankrupt': float(np.mean(final <= 0)),
+    }
+
+
+def _run_sweep_task(task):
+    """
+    Worker: simulate a chunk of cells that share one pocket stream.
+    The pockets are drawn once and reused by every cell in the chunk.
+    """
+    indexed_specs, engine, ruin_level = task
+    first = indexed_specs[0][1]
+    pockets = None
+    simulate = simulate_batch
+    if engine == "numba":
+        from components.jit_engine import simulate_jit as simulate
+    if engine in ("numpy", "numba"):
+        pockets = pocket_matrix(first['wheel_type'], player_seeds(first), first['num_spins'],
+                                first.get('wheel_weights'))
+
+    rows = []
+    for index, spec in indexed_specs:
+        if pockets is not None:
+            results = simulate(spec, pockets, ("final", "lowest"))
+        else:
+            results = run_spec(spec, ("final", "lowest"), engine=engine)
+        rows.append((index, cell_metrics(spec, results['final'], results['lowest'], ruin_level)))
+    return rows
+
+
+def schedule_tasks(specs, workers):
+    """
+    Group cells by pocket stream (wheel, weights, players, spins, seed) so each stream is
+    drawn once per task, then split big groups so every worker gets work.
+    """
+    groups = {}
+    for index, spec in enumerate(specs):
+        stream = (spec['wheel_type'], spec.get('wheel_weights'), spec['num_players'], spec['num_spins'],
+                  spec['seed'])
+        groups.setdefault(stream, []).append((index, spec))
+
+    target_tasks = max(1, workers * 2)
+    tasks = []
+    for cells in groups.values():
+        chunks = max(1, min(len(cells), round(target_tasks * len(cells) / len(specs))))
+        size = -(-len(cells) // chunks)
+        tasks.extend(cells[i:i + size] for i in range(0, len(cells), size))
+    return tasks
+
+
+def run_sweep(cells, base=None, workers=1, engine="numpy", ruin_level=0, verbose=True, exact=False,
+              checkpoint=None, checkpoint_seconds=CHECKPOINT_SECONDS):
+    """
+    Simulate every cell (dict of spec overrides on top of `base`).
+    Returns the tidy results: one dict per cell with every spec parameter
+    plus the SWEEP_METRICS columns.
+    With exact=True, flat-betting cells are solved exactly (utils.gamblers_ruin)
+    instead of simulated; their metrics are population values, not sample ones.
+    checkpoint: file where finished cells are saved (components.checkpoint)
+    every checkpoint_seconds and at the end. Rerunning the same sweep only
+    simulates the missing cells, with the same results, for any worker count.
+    """
+    base = dict(base or {})
+    if base.get('seed') is None:
+        # Common random numbers need one shared seed; draw it once if missing
+        base['seed'] = int(np.random.SeedSequence().entropy % 2 ** 32)
+    specs = [make_spec(**dict(base, **cell)) for cell in cells]
+    metrics = [None] * len(specs)
+
+    simulated = list(range(len(specs)))
+    if exact:
+        from utils.gamblers_ruin import exact_flat_metrics
+        simulated = [i for i, spec in enumerate(specs) if spec['strategy'] == "martingale"]
+        for index in sorted(set(range(len(specs))) - set(simulated)):
+            metrics[index] = exact_flat_metrics(specs[index], ruin_level)
+
+    # Cells finished by an earlier run of the same sweep (keyed by cell number)
+    done = {}
+    if checkpoint is not None:
+        signature = {'specs': specs, 'engine': engine, 'ruin_level': ruin_level, 'exact': exact}
+        saved = load_checkpoint(checkpoint)
+        if saved is not None:
+            check_signature(saved, signature, checkpoint)
+            done = {int(index): row for index, row in saved['done'].items()}
+    pending = [i for i in range(len(simulated)) if simulated[i] not in done]
+
+    tasks = schedule_tasks([specs[simulated[i]] for i in pending], workers) if pending else []
+    if verbose:
+        solved = len(specs) - len(simulated)
+        print(f"Sweeping {len(specs)} cells in {len(tasks)} tasks on {workers} worker(s) (seed {base['seed']})"
+              + (f", {solved} solved exactly" if solved else "")
+              + (f", {len(simulated) - len(pending)} resumed from {checkpoint}" if done else ""))
+
+    jobs = [(task, engine, ruin_level) for task in tasks]
+    saved_at = time.perf_counter()
+    pool = None
+    if workers > 1 and jobs:
+        # Imported here so single-process sweeps (and workers) skip it
+        from components.process_pool import process_pool
+        pool = process_pool(workers)
+    try:
+        task_results = pool.map(_run_sweep_task, jobs) if pool is not None else map(_run_sweep_task, jobs)
+        # Tasks number their cells within `pending`; collect them by cell number
+        for finished, rows in enumerate(task_results, start=1):
+            for index, row in rows:
+                done[simulated[pending[index]]] = row
+            if checkpoint is not None and (finished == len(jobs)
+                                           or time.perf_counter() - saved_at >= checkpoint_seconds):
+                save_checkpoint(checkpoint, {'signature': signature, 'done': done})
+                saved_at = time.perf_counter()
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    # Put every cell's metrics back in the original cell order
+    for index, row in done.items():
+        metrics[index] = row
+
+    return [dict(spec, **row) for spec, row in zip(specs, metrics)]
+
+
+def get_results_path(folder, filename):
+    results_dir = os.path.join(folder, "results")
+    os.makedirs(results_dir, exist_ok=True)
+    return os.path.join(results_dir, filename)
+
+
+def write_results_table(rows, path):
+    """Write sweep rows as a CSV table (one row per cell)"""
+    columns = list(DEFAULT_SPEC) + list(SWEEP_METRICS)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def read_results_table(path):
+    """Read a table written by write_results_table (values parsed back from text)"""
+    rows = []
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            parsed = {}
+            for key, value in row.items():
+                try:
+                    parsed[key] = json.loads(value)
+                except json.JSONDecodeError:
+                    parsed[key] = float(value) if value in ("inf", "-inf") else value
+            rows.append(parsed)
+    return rows
@@ -1,5 +1,4 @@
 import os
-import matplotlib.pyplot as plt
 import numpy as np
 
 # Define color schemes for different roulette types
@@ -37,6 +36,8 @@ def create_single_wheel_plot(experimental_edges, wheel_type, num_runs, num_spins
     """
     Create a distribution plot for a single wheel type with custom colors
     """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
     colors = COLOR_SCHEMES[wheel_type]
     theoretical_edge = THEORETICAL_EDGES[wheel_type]
     
@@ -91,6 +92,8 @@ def create_comparison_plot(all_results, num_runs, num_spins):
     """
     Create a comparison plot for all three wheel types
     """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
     plt.figure(figsize=(14, 8))
     
     # Plot each wheel type
@@ -118,4 +121,96 @@ def create_comparison_plot(all_results, num_runs, num_spins):
     plt.grid(True, alpha=0.3)
     plt.tight_layout()
     
-    return plt
\ No newline at end of file
+    return plt
+
+def create_detection_power_plot(analyses, wheel_type, max_spins, num_trials):
+    """
+    Share of trials in which each statistic has flagged the biased wheel by spin n.
+    analyses: {label: bias_power_analysis(...)}
+    """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
+    statistics = list(next(iter(analyses.values())))
+    fig, axes = plt.subplots(1, len(statistics), figsize=(6 * len(statistics), 6), sharey=True)
+    spins = np.unique(np.geomspace(100, max_spins, 200).astype(np.int64))
+
+    for ax, name in zip(np.atleast_1d(axes), statistics):
+        for label, analysis in analyses.items():
+            detected_at = analysis[name]['detected_at']
+            found = np.sort(detected_at[detected_at >= 0])
+            ax.plot(spins, np.searchsorted(found, spins, side='right') / len(detected_at),
+                    linewidth=2, label=label)
+        ax.set_xscale('log')
+        ax.set_xlabel('Spins Observed')
+        ax.set_title(name.replace('_', ' ').title())
+        ax.grid(True, which='both', alpha=0.3)
+    np.atleast_1d(axes)[0].set_ylabel('Share of Trials Detected (Power)')
+    np.atleast_1d(axes)[0].legend()
+    fig.suptitle(f'Bias Detection Power: {wheel_type.title()} Wheel ({num_trials} trials per bias)')
+    plt.tight_layout()
+
+    return plt
+
+def create_house_pnl_plot(table_results, summaries):
+    """
+    House side of a shared table per wheel: running house win against the
+    theoretical hold, and the worst-case exposure of every spin.
+    table_results / summaries: {wheel_type: simulate_table(...)} / {wheel_type: house_summary(...)}
+    """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
+    fig, (ax_pnl, ax_exposure) = plt.subplots(2, 1, figsize=(12, 10), sharex=True)
+    for wheel_type, results in table_results.items():
+        colors = COLOR_SCHEMES[wheel_type]
+        spins = np.arange(1, len(results['pockets']) + 1)
+        handle = np.cumsum(results['handle'], dtype=np.float64)
+        ax_pnl.plot(spins, np.cumsum(results['house_pnl'], dtype=np.float64), color=colors["primary"],
+                    linewidth=1.5, label=f'{wheel_type.title()} (hold {summaries[wheel_type]["hold"]:.2%})')
+        ax_pnl.plot(spins, handle * summaries[wheel_type]['expected_hold'], color=colors["theoretical"],
+                    linestyle='--', linewidth=1.5,
+                    label=f'{wheel_type.title()} theoretical ({summaries[wheel_type]["expected_hold"]:.2%})')
+        ax_exposure.plot(spins, results['exposure'], color=colors["secondary"], linewidth=0.8,
+                         label=f'{wheel_type.title()} (peak ${summaries[wheel_type]["max_exposure"]:,.0f})')
+
+    ax_pnl.set_ylabel('Cumulative House Win ($)')
+    ax_pnl.set_title('Shared Table: House P&L vs Theoretical Hold')
+    ax_pnl.legend()
+    ax_pnl.grid(True, alpha=0.3)
+    ax_exposure.set_xlabel('Spin')
+    ax_exposure.set_ylabel('Worst-Case Payout on the Spin ($)')
+    ax_exposure.set_title('Per-Spin House Exposure')
+    ax_exposure.legend()
+    ax_exposure.grid(True, alpha=0.3)
+    plt.tight_layout()
+
+    return plt
+
+def create_shift_distribution_plot(profiles, title):
+    """
+    Cumulative distribution of the house result per shift for each bet mix,
+    with the 99% VaR marked.
+    profiles: {label: house_risk_profile(...)}
+    """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
+    fig, ax = plt.subplots(figsize=(12, 7))
+    low, high = [], []
+    for label, profile in profiles.items():
+        shift = profile['shift']
+        values = shift['start'] + shift['step'] * np.arange(len(shift['pmf']))
+        cumulative = np.cumsum(shift['pmf'])
+        line, = ax.plot(values, cumulative, linewidth=2, label=label)
+        ax.axvline(-shift['var'][0.99], color=line.get_color(), linestyle='--', linewidth=1)
+        # Show the central 99.9% of every distribution (the lattices span far wider)
+        low.append(values[np.searchsorted(cumulative, 0.0005)])
+        high.append(values[min(np.searchsorted(cumulative, 0.9995), len(values) - 1)])
+    ax.axvline(0, color='black', linewidth=1)
+    ax.set_xlim(min(low), max(high))
+    ax.set_xlabel('House Result per Shift ($)')
+    ax.set_ylabel('P(House Result <= x)')
+    ax.set_title(title + ' (dashed: 99% VaR)')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    plt.tight_layout()
+
+    return plt
@@ -0,0 +1,201 @@
+import math
+
+import numpy as np
+
+from components.batch_engine import limit_hit_matrix, simulate_batch, win_table
+from utils.losing_streaks import doublings_before_limit
+
+# Importance sampling for rare Martingale disasters.
+# Plain Monte Carlo needs ~100 / p players to see a p = 1e-6 event a hundred
+# times. Instead, players are simulated on a tilted wheel where losses come up
+# more often while a losing streak is running (loss probability q'_j after j
+# losses in a row), and every player is reweighted by the likelihood ratio
+#     w = prod over spins of (q / q'_j if lost, p / p'_j if won)
+# (p, q nominal win/loss probabilities). E[w * 1{event}] under the tilted wheel
+# is exactly the nominal probability, so the estimate is unbiased. The q'_j are
+# chosen by the cross-entropy method on independent pilot runs.
+
+# Players simulated at a time (bounds memory of the bet matrices)
+CHUNK_PLAYERS = 10000
+
+# Streak states tilted separately when there is no table limit
+DEFAULT_STREAK_STATES = 12
+
+# z-value of the two-sided 95% confidence interval
+Z_95 = 1.959963984540054
+
+
+def loss_multiple_score(results, spec):
+    """Loss as a multiple of the starting bankroll (10 = lost 10x the bankroll)"""
+    return (spec['initial_bankroll'] - np.asarray(results['final'], dtype=float)) / spec['initial_bankroll']
+
+
+def limit_hits_score(results, spec):
+    """
+    Spins where the intended bet was above the table limit (the Martingale
+    progression was capped). A bet that merely equals the limit is not a hit.
+    """
+    # Every win raises the bankroll and every loss lowers it
+    wins = np.diff(np.asarray(results['paths']), axis=1) > 0
+    return limit_hit_matrix(spec, wins).sum(axis=1)
+
+
+# Tail events: name -> (score function, records it needs). The event is score >= level.
+TAIL_EVENTS = {
+    "loss_multiple": (loss_multiple_score, ("final",)),
+    "limit_hits": (limit_hits_score, ("paths",)),
+}
+
+
+def tilted_pocket_probabilities(wins_by_pocket, loss_probability):
+    """Pocket probabilities with total loss probability `loss_probability` (uniform within wins/losses)"""
+    wins_by_pocket = np.asarray(wins_by_pocket, dtype=bool)
+    num_wins = wins_by_pocket.sum()
+    if num_wins == 0 or num_wins == len(wins_by_pocket):
+        raise ValueError("The bet must have both winning and losing pockets to tilt the wheel")
+    if not 0 < loss_probability < 1:
+        raise ValueError("loss_probability must be between 0 and 1")
+    return np.where(wins_by_pocket, (1 - loss_probability) / num_wins,
+                    loss_probability / (len(wins_by_pocket) - num_wins))
+
+
+def nominal_loss_probability(spec):
+    """Loss probability of one spin on the fair wheel"""
+    if spec.get('wheel_weights') is not None:
+        # The tilt draws pockets uniformly within wins and losses
+        raise ValueError("Importance sampling only supports fair (unweighted) wheels")
+    return 1.0 - float(np.mean(win_table(spec['wheel_type'], spec['bet_type'], spec['bet_value'])))
+
+
+def default_num_states(spec):
+    """Streak states of the tilt: every doubling up to the table limit, plus one"""
+    losses = doublings_before_limit(spec['base_bet'], spec['table_limit'])
+    return (losses if losses is not None else DEFAULT_STREAK_STATES) + 1
+
+
+def simulate_tilted(spec, event, tilt, num_players, rng):
+    """
+    Simulate num_players players on a wheel whose loss probability depends on
+    the current losing streak: tilt[j] after j losses in a row (the last entry
+    covers longer streaks). Pockets are drawn spin by spin, then the batch
+    engine plays them with the exact Game rules.
+    Returns (scores, loss_counts, visit_counts); the counts are (players, states).
+    """
+    score, records = TAIL_EVENTS[event]
+    tilt = np.asarray(tilt, dtype=float)
+    wins_by_pocket = win_table(spec['wheel_type'], spec['bet_type'], spec['bet_value'])
+    winning = np.flatnonzero(wins_by_pocket).astype(np.uint8)
+    losing = np.flatnonzero(~wins_by_pocket).astype(np.uint8)
+    num_states = len(tilt)
+
+    scores, loss_counts, visit_counts = [], [], []
+    for start in range(0, num_players, CHUNK_PLAYERS):
+        size = min(CHUNK_PLAYERS, num_players - start)
+        rows = np.arange(size)
+        pockets = np.empty((size, spec['num_spins']), dtype=np.uint8)
+        streak = np.zeros(size, dtype=np.int64)
+        losses = np.zeros((size, num_states), dtype=np.int64)
+        visits = np.zeros((size, num_states), dtype=np.int64)
+
+        for spin in range(spec['num_spins']):
+            # Step 1: Win or lose with the probability of the current streak state
+            lost = rng.random(size) < tilt[streak]
+            visits[rows, streak] += 1
+            losses[rows, streak] += lost
+            # Step 2: Any pocket of the drawn outcome (pockets are equally likely within it)
+            pockets[:, spin] = np.where(lost, losing[rng.integers(len(losing), size=size)],
+                                        winning[rng.integers(len(winning), size=size)])
+            streak = np.where(lost, np.minimum(streak + 1, num_states - 1), 0)
+
+        scores.append(score(simulate_batch(spec, pockets, records), spec))
+        loss_counts.append(losses)
+        visit_counts.append(visits)
+    return np.concatenate(scores), np.concatenate(loss_counts), np.concatenate(visit_counts)
+
+
+def log_likelihood_ratios(loss_counts, visit_counts, nominal, tilt):
+    """log(nominal / tilted probability) of each player's spins from its per-state counts"""
+    tilt = np.asarray(tilt, dtype=float)
+    win_counts = visit_counts - loss_counts
+    return loss_counts @ np.log(nominal / tilt) + win_counts @ np.log((1 - nominal) / (1 - tilt))
+
+
+def cross_entropy_tilt(spec, event, level, num_players=2000, num_states=None, elite_fraction=0.1,
+                       max_iterations=20, rng=None):
+    """
+    Cross-entropy choice of the streak-dependent loss probabilities.
+    Each round raises an intermediate level to the elite quantile of the scores
+    and sets every state's loss probability to the (weighted) loss frequency of
+    the elite players in that state, until the elite reach the target level.
+    Returns (tilt, pilot players simulated).
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    nominal = nominal_loss_probability(spec)
+    tilt = np.full(num_states or default_num_states(spec), nominal)
+
+    for iteration in range(1, max_iterations + 1):
+        scores, losses, visits = simulate_tilted(spec, event, tilt, num_players, rng)
+        threshold = min(level, np.quantile(scores, 1 - elite_fraction))
+        elite = scores >= threshold
+
+        # Likelihood ratios of the elite players, rescaled to avoid underflow
+        log_weights = log_likelihood_ratios(losses[elite], visits[elite], nominal, tilt)
+        weights = np.exp(log_weights - log_weights.max())
+        weighted_visits = weights @ visits[elite]
+        updated = np.divide(weights @ losses[elite], weighted_visits,
+                            out=tilt.copy(), where=weighted_visits > 0)
+        tilt = np.clip(updated, 0.001, 0.999)
+        if threshold >= level:
+            break
+    return tilt, iteration * num_players
+
+
+def estimate_tail_probability(spec, event, level, num_players=100000, tilt=None, pilot_players=2000, seed=None):
+    """
+    Unbiased importance-sampling estimate of P(score >= level) for one player of `spec`.
+    The tilt is found by cross_entropy_tilt on pilot players unless given;
+    pilot players never enter the estimate. Returns a dict with the estimate,
+    its standard error, a 95% confidence interval and the simulation cost
+    compared to plain Monte Carlo at the same relative error.
+    """
+    if event not in TAIL_EVENTS:
+        raise ValueError(f"Unknown event '{event}'. Available: {sorted(TAIL_EVENTS)}")
+    if num_players < 2:
+        raise ValueError("num_players must be at least 2")
+    pilot_seed, sample_seed = np.random.SeedSequence(seed).spawn(2)
+    nominal = nominal_loss_probability(spec)
+    pilot_used = 0
+    if tilt is None:
+        tilt, pilot_used = cross_entropy_tilt(spec, event, level, pilot_players,
+                                              rng=np.random.default_rng(pilot_seed))
+
+    # --- Step 1: Tilted players and their likelihood ratios ---
+    scores, losses, visits = simulate_tilted(spec, event, tilt, num_players, np.random.default_rng(sample_seed))
+    weights = np.where(scores >= level, np.exp(log_likelihood_ratios(losses, visits, nominal, tilt)), 0.0)
+
+    # --- Step 2: Estimate, standard error and 95% confidence interval ---
+    probability = float(weights.mean())
+    std_error = float(weights.std(ddof=1) / math.sqrt(num_players))
+    relative_error = std_error / probability if probability > 0 else float('inf')
+
+    # Plain Monte Carlo needs (1 - p) / (p * RE^2) players for the same relative error
+    spins_used = (num_players + pilot_used) * spec['num_spins']
+    brute_force_spins = float('inf')
+    if 0 < probability and relative_error > 0:
+        brute_force_spins = (1 - probability) / (probability * relative_error ** 2) * spec['num_spins']
+
+    return {
+        'event': event,
+        'level': level,
+        'probability': probability,
+        'std_error': std_error,
+        'ci_low': max(0.0, probability - Z_95 * std_error),
+        'ci_high': probability + Z_95 * std_error,
+        'relative_error': relative_error,
+        'hits': int(np.count_nonzero(weights)),
+        'nominal_loss_probability': nominal,
+        'tilt': np.asarray(tilt, dtype=float),
+        'spins_used': spins_used,
+        'brute_force_spins': brute_force_spins,
+        'speedup': brute_force_spins / spins_used,
+    }
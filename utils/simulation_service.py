@@ -0,0 +1,543 @@
+import asyncio
+import contextlib
+import hashlib
+import io
+import json
+import os
+import signal
+import time
+import uuid
+from urllib.parse import unquote
+
+from components.simulation import ENGINES, RECORD_TYPES, make_spec, player_seeds, run_spec
+from utils.experiment_registry import EXPERIMENTS, plan_experiments
+from utils.parameter_sweep import grid_cells, latin_hypercube_cells, parse_axis, run_sweep
+import utils.experiment_catalog  # noqa: F401  (registers all experiments)
+
+# Local HTTP/JSON service that runs simulation jobs for analysts.
+#
+# A job is one simulation spec (components.simulation), a list of registered
+# experiments (utils.experiment_catalog) or a parameter sweep
+# (utils.parameter_sweep). Jobs wait in a bounded queue; a few job runners
+# split each one into pool tasks (ranges of players, an experiment's unique
+# simulations plus its report, or groups of sweep cells) and run them on a
+# process pool, so the event loop only moves bytes and the box stays
+# responsive. When the queue is full, submissions get 429 and Retry-After.
+#
+# The service is meant to stay up as a daemon: its workers are started
+# once, import the simulation core, the catalog and matplotlib and load the
+# Numba kernel (warm_worker), so a job pays neither interpreter start-up nor
+# imports. roulette_client.py is the thin client that sends jobs to it.
+#
+# Seeded jobs are deterministic, so a job's id is a hash of its normalized
+# request: submitting a job that is queued, running or finished returns the
+# existing one instead of running it again, and finished results (with their
+# plots) are cached on disk and served after a restart. Unseeded jobs are
+# always run.
+#
+# Endpoints:
+#   GET  /health                      queue and worker status
+#   GET  /experiments                 registered experiments and their defaults
+#   POST /jobs                        submit {"spec": {...}, "records": [...], "engine": "numpy"}
+#                                     or {"experiments": [...], "config": {...}, "engine": ..., "plots": true}
+#                                     or {"sweep": {"axes": ["name=v1,v2", ...], "base": {...}, "lhs": N}}
+#   GET  /jobs                        every known job (without results)
+#   GET  /jobs/<id>                   status, progress and (when done) the result
+#   GET  /jobs/<id>/events            progress as a stream of JSON lines until the job ends
+#   GET  /jobs/<id>/plots/<file>      a plot rendered by an experiment job
+#
+# The HTTP side is deliberately small (one request per connection, JSON
+# bodies, no TLS): bind it to localhost or a trusted network.
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_DIR = os.path.join(PROJECT_ROOT, "results", "service")
+DEFAULT_PORT = 8642
+
+# Jobs waiting to start; more submissions are refused with 429
+MAX_QUEUED = 64
+
+# Open connections (event streams included); more are refused with 503
+MAX_CONNECTIONS = 256
+
+# Largest request body and header block, in bytes
+MAX_BODY = 1 << 20
+MAX_HEADER = 1 << 14
+
+# Seconds a client has to send its request
+REQUEST_TIMEOUT = 10
+
+# Players per pool task of a spec job
+PLAYERS_PER_TASK = 1000
+
+# Sweep cells per pool task (cells on one wheel still share their spins)
+CELLS_PER_TASK = 8
+
+# Largest number of values (players x recorded spins) a spec job may return
+MAX_RESULT_VALUES = 10 ** 7
+
+STATUSES = ("queued", "running", "done", "failed")
+
+REASONS = {200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 429: "Too Many Requests", 500: "Internal Server Error",
+           503: "Service Unavailable"}
+
+
+class RequestError(Exception):
+    """An HTTP error answered to the client"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# --- Jobs ---
+
+def normalize_job(request):
+    """
+    Validated, complete version of a submitted job (raises ValueError).
+    Equal requests normalize to equal jobs, whatever their defaults or key order.
+    """
+    if not isinstance(request, dict):
+        raise ValueError("A job is a JSON object")
+    engine = request.get('engine', "numpy")
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Available: {ENGINES}")
+
+    if 'spec' in request:
+        spec = make_spec(**request['spec'])
+        # Jobs travel as JSON, which has no infinity: no limit is None (as in make_spec)
+        if spec['table_limit'] == float('inf'):
+            spec['table_limit'] = None
+        records = sorted(set(request.get('records', ["final"])))
+        unknown = set(records) - set(RECORD_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown record types: {sorted(unknown)}")
+        values = spec['num_players'] * (spec['num_spins'] + 1 if set(records) & {"paths", "bets"} else 1)
+        if values > MAX_RESULT_VALUES:
+            raise ValueError(f"The job would return {values:,} values (limit {MAX_RESULT_VALUES:,}); "
+                             f"ask for fewer players, spins or records")
+        return {'kind': "spec", 'spec': spec, 'records': records, 'engine': engine}
+
+    if 'experiments' in request:
+        names = list(request['experiments'])
+        unknown = [name for name in names if name not in EXPERIMENTS]
+        if not names or unknown:
+            raise ValueError(f"Unknown experiments {unknown}. Available: {sorted(EXPERIMENTS)}")
+        # Resolve the configs now, so bad parameters are refused at submission
+        plan = plan_experiments(names, {'*': dict(request.get('config', {}))})
+        configs = {experiment['name']: experiment['config'] for experiment in plan['experiments']}
+        return {'kind': "experiments", 'experiments': names, 'configs': configs, 'engine': engine,
+                'plots': bool(request.get('plots', True))}
+
+    if 'sweep' in request:
+        sweep = dict(request['sweep'])
+        axes = sweep.get('axes') or {}
+        if isinstance(axes, list):
+            axes = dict(parse_axis(text) for text in axes)
+        if not axes:
+            raise ValueError("A sweep needs 'axes': {name: [values]} or ['name=v1,v2', ...]")
+        base = dict(sweep.get('base', {}))
+        if base.get('seed') is None:
+            # Every group of cells must use the same seed (common random numbers)
+            base['seed'] = int(uuid.uuid4().int % 2 ** 32)
+        if sweep.get('lhs'):
+            cells = latin_hypercube_cells(axes, int(sweep['lhs']), seed=base['seed'])
+        else:
+            cells = grid_cells(axes)
+        # Refuse bad parameters at submission
+        for cell in cells:
+            make_spec(**dict(base, **cell))
+        return {'kind': "sweep", 'cells': cells, 'base': base, 'engine': engine,
+                'ruin_level': sweep.get('ruin_level', 0)}
+
+    raise ValueError("A job needs a 'spec', a list of 'experiments' or a 'sweep'")
+
+
+def is_seeded(job):
+    if job['kind'] == "spec":
+        return job['spec']['seed'] is not None
+    if job['kind'] == "sweep":
+        # normalize_job gives every sweep a seed
+        return True
+    # Experiments without a seed parameter do not draw random numbers
+    return all(config.get('seed', 0) is not None for config in job['configs'].values())
+
+
+def job_id(job):
+    """Hash of the normalized job (seeded jobs) or a fresh id (unseeded ones)"""
+    if not is_seeded(job):
+        return uuid.uuid4().hex[:16]
+    text = json.dumps(job, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def warm_worker():
+    """
+    Pool initializer: everything a job may need, imported (and compiled)
+    once per worker instead of once per job.
+    """
+    # Worker processes have no display
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    import matplotlib.pyplot  # noqa: F401  (experiment reports draw plots)
+    from components.batch_engine import pocket_matrix
+    from components.jit_engine import simulate_jit
+
+    # Load the Numba kernel from its cache (or compile it) before the first job
+    spec = make_spec(strategy="martingale", num_players=2, num_spins=10, seed=0)
+    simulate_jit(spec, pocket_matrix(spec['wheel_type'], player_seeds(spec), spec['num_spins']))
+
+
+def run_spec_task(spec, records, engine, players):
+    """Pool task: one range of players of a spec job"""
+    return run_spec(spec, records, engine=engine, players=players)
+
+
+def run_report_task(job, results, folder):
+    """
+    Pool task: the analytics and plots of an experiment job.
+    Returns the printed report and the names of the plot files.
+    """
+    # Worker processes have no display
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    from utils.experiment_registry import report_plan
+
+    plan = plan_experiments(job['experiments'], {name: config for name, config in job['configs'].items()})
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        report_plan(plan, dict(zip(plan['simulations'], results)),
+                    {'folder': folder, 'save_plots': job['plots'], 'show_plots': False})
+    plots_dir = os.path.join(folder, "plots")
+    plots = sorted(os.listdir(plots_dir)) if os.path.isdir(plots_dir) else []
+    return output.getvalue(), plots
+
+
+def run_sweep_task(cells, base, engine, ruin_level):
+    """Pool task: one group of sweep cells"""
+    return run_sweep(cells, base, engine=engine, ruin_level=ruin_level, verbose=False)
+
+
+def spec_summary(spec, results):
+    """Headline numbers of a spec job"""
+    if "final" not in results or not results["final"]:
+        return {}
+    finals = results["final"]
+    mean = sum(finals) / len(finals)
+    return {
+        'players': len(finals),
+        'mean_final': mean,
+        'mean_loss': spec['initial_bankroll'] - mean,
+        'p_profit': sum(final > spec['initial_bankroll'] for final in finals) / len(finals),
+        'p_bankrupt': sum(final <= 0 for final in finals) / len(finals),
+    }
+
+
+# --- Service ---
+
+class SimulationService:
+    """
+    The job queue, runners and HTTP handlers. start() opens the process pool
+    and the listening socket; serve_forever() runs until cancelled.
+    warm=True starts every worker (running warm_worker) before serving.
+    """
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, workers=None, cache_dir=DEFAULT_CACHE_DIR,
+                 max_queued=MAX_QUEUED, max_running=None, max_connections=MAX_CONNECTIONS,
+                 players_per_task=PLAYERS_PER_TASK, warm=True):
+        self.host = host
+        self.port = port
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.cache_dir = cache_dir
+        self.max_queued = max_queued
+        self.max_running = max_running or self.workers
+        self.players_per_task = players_per_task
+        self.warm = warm
+        self.started = None
+
+        self.jobs = {}
+        self.changed = {}
+        self.queue = None
+        self.connections = asyncio.Semaphore(max_connections)
+        self.pool = None
+        self.server = None
+        self.runners = []
+
+    async def start(self):
+        from components.process_pool import process_pool
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.queue = asyncio.Queue(self.max_queued)
+        self.pool = process_pool(self.workers, initializer=warm_worker if self.warm else None)
+        if self.warm:
+            # One task per worker at once makes the pool start all of them now
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*(loop.run_in_executor(self.pool, os.getpid) for _ in range(self.workers)))
+        self.started = time.time()
+        self.runners = [asyncio.create_task(self._run_jobs()) for _ in range(self.max_running)]
+        self.server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                 limit=MAX_HEADER)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for runner in self.runners:
+            runner.cancel()
+        await asyncio.gather(*self.runners, return_exceptions=True)
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    async def serve_forever(self):
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    # --- Job state ---
+
+    def _update(self, job, **fields):
+        """Change a job and wake up its event streams"""
+        job.update(fields, updated=time.time())
+        self.changed[job['id']].set()
+        self.changed[job['id']] = asyncio.Event()
+
+    def _job_folder(self, identifier):
+        return os.path.join(self.cache_dir, identifier)
+
+    def _load_cached(self, identifier):
+        path = os.path.join(self._job_folder(identifier), "result.json")
+        if not os.path.exists(path):
+            return None
+        with open(path) as file:
+            return json.load(file)
+
+    def _save_result(self, job):
+        folder = self._job_folder(job['id'])
+        os.makedirs(folder, exist_ok=True)
+        temporary = os.path.join(folder, "result.json.tmp")
+        with open(temporary, "w") as file:
+            json.dump(job, file)
+        os.replace(temporary, os.path.join(folder, "result.json"))
+
+    def submit(self, request):
+        """(status code, job) for a submitted request; raises RequestError"""
+        try:
+            normalized = normalize_job(request)
+        except (ValueError, TypeError) as error:
+            raise RequestError(400, str(error))
+        identifier = job_id(normalized)
+
+        # Identical seeded job queued, running or done: share it
+        if identifier in self.jobs and self.jobs[identifier]['status'] != "failed":
+            return 200, dict(self.jobs[identifier], deduplicated=True)
+        cached = self._load_cached(identifier) if is_seeded(normalized) else None
+        if cached is not None:
+            self.jobs[identifier] = cached
+            self.changed[identifier] = asyncio.Event()
+            return 200, dict(cached, deduplicated=True)
+
+        if self.queue.full():
+            raise RequestError(429, f"{self.queue.qsize()} jobs are waiting; try again later")
+        job = {'id': identifier, 'status': "queued", 'progress': 0.0, 'request': normalized,
+               'submitted': time.time(), 'updated': time.time()}
+        self.jobs[identifier] = job
+        self.changed[identifier] = asyncio.Event()
+        self.queue.put_nowait(identifier)
+        return 202, job
+
+    async def _run_jobs(self):
+        while True:
+            identifier = await self.queue.get()
+            job = self.jobs[identifier]
+            self._update(job, status="running", started=time.time())
+            try:
+                if job['request']['kind'] == "spec":
+                    result = await self._run_spec_job(job)
+                elif job['request']['kind'] == "sweep":
+                    result = await self._run_sweep_job(job)
+                else:
+                    result = await self._run_experiment_job(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                self._update(job, status="failed", error=f"{type(error).__name__}: {error}")
+            else:
+                job['result'] = result
+                if is_seeded(job['request']):
+                    # Written by a thread: big results would stall the event loop
+                    await asyncio.get_running_loop().run_in_executor(None, self._save_result,
+                                                                     dict(job, status="done", progress=1.0))
+                self._update(job, status="done", progress=1.0, finished=time.time())
+            finally:
+                self.queue.task_done()
+
+    async def _run_tasks(self, job, tasks, weight=1.0):
+        """Run pool tasks (function, *arguments), updating the progress; results in task order"""
+        loop = asyncio.get_running_loop()
+        futures = [loop.run_in_executor(self.pool, *task) for task in tasks]
+        start = job['progress']
+        pending = set(futures)
+        while pending:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            self._update(job, progress=start + weight * (len(futures) - len(pending)) / len(futures))
+        return [future.result() for future in futures]
+
+    async def _run_spec_job(self, job):
+        request = job['request']
+        spec = make_spec(**request['spec'])
+        ranges = [(start, min(start + self.players_per_task, spec['num_players']))
+                  for start in range(0, spec['num_players'], self.players_per_task)]
+        parts = await self._run_tasks(job, [(run_spec_task, spec, request['records'], request['engine'], players)
+                                            for players in ranges])
+        results = {record: [value for part in parts for value in part[record]] for record in request['records']}
+        return {'summary': spec_summary(spec, results), 'results': results}
+
+    async def _run_experiment_job(self, job):
+        request = job['request']
+        plan = plan_experiments(request['experiments'], dict(request['configs']))
+        tasks = [(run_spec, entry['spec'], sorted(entry['records']), request['engine'])
+                 for entry in plan['simulations'].values()]
+        # Simulations are most of the work; the report is the last step
+        results = await self._run_tasks(job, tasks, weight=0.9)
+        report, plots = (await self._run_tasks(job, [(run_report_task, request, results,
+                                                      self._job_folder(job['id']))], weight=0.1))[0]
+        return {'report': report, 'plots': [f"/jobs/{job['id']}/plots/{name}" for name in plots]}
+
+    async def _run_sweep_job(self, job):
+        request = job['request']
+        cells = request['cells']
+        groups = [cells[start:start + CELLS_PER_TASK] for start in range(0, len(cells), CELLS_PER_TASK)]
+        parts = await self._run_tasks(job, [(run_sweep_task, group, request['base'], request['engine'],
+                                             request['ruin_level']) for group in groups])
+        rows = [row for part in parts for row in part]
+        # No limit is None in JSON (as in make_spec)
+        return {'rows': [dict(row, table_limit=None) if row['table_limit'] == float('inf') else row
+                         for row in rows]}
+
+    # --- HTTP ---
+
+    async def _handle_connection(self, reader, writer):
+        if self.connections.locked():
+            await self._respond(writer, 503, {'error': "Too many connections; try again later"})
+            return
+        async with self.connections:
+            try:
+                method, path, body = await asyncio.wait_for(self._read_request(reader), REQUEST_TIMEOUT)
+                await self._route(writer, method, path, body)
+            except RequestError as error:
+                await self._respond(writer, error.status, {'error': str(error)})
+            except (asyncio.LimitOverrunError, ValueError):
+                await self._respond(writer, 400, {'error': "Malformed HTTP request"})
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                # Client too slow or gone: nothing to answer
+                pass
+            finally:
+                writer.close()
+                with contextlib.suppress(ConnectionError):
+                    await writer.wait_closed()
+
+    async def _read_request(self, reader):
+        head = await reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        method, target, _ = lines[0].split(" ", 2)
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length', 0))
+        if length > MAX_BODY:
+            raise RequestError(413, f"Request bodies are limited to {MAX_BODY} bytes")
+        body = await reader.readexactly(length) if length else b""
+        return method, unquote(target.split("?", 1)[0]), body
+
+    async def _route(self, writer, method, path, body):
+        parts = [part for part in path.split("/") if part]
+        if method == "GET" and parts == ["health"]:
+            counts = {status: sum(job['status'] == status for job in self.jobs.values()) for status in STATUSES}
+            await self._respond(writer, 200, dict(counts, status="ok", workers=self.workers, warm=self.warm,
+                                                  max_queued=self.max_queued, pid=os.getpid(),
+                                                  uptime=time.time() - self.started))
+        elif method == "GET" and parts == ["experiments"]:
+            await self._respond(writer, 200, {name: {'description': experiment['description'],
+                                                     'defaults': experiment['defaults']}
+                                              for name, experiment in EXPERIMENTS.items()})
+        elif parts == ["jobs"] and method == "POST":
+            try:
+                request = json.loads(body or b"null")
+            except json.JSONDecodeError as error:
+                raise RequestError(400, f"Invalid JSON: {error}")
+            status, job = self.submit(request)
+            await self._respond(writer, status, without_result(job))
+        elif parts == ["jobs"] and method == "GET":
+            await self._respond(writer, 200, [without_result(job) for job in self.jobs.values()])
+        elif parts[:1] == ["jobs"] and len(parts) >= 2 and method == "GET":
+            job = self.jobs.get(parts[1])
+            if job is None:
+                job = self._load_cached(parts[1])
+                if job is None:
+                    raise RequestError(404, f"No job '{parts[1]}'")
+            if len(parts) == 2:
+                await self._respond(writer, 200, job)
+            elif parts[2:] == ["events"]:
+                await self._stream_events(writer, job)
+            elif parts[2] == "plots" and len(parts) == 4:
+                await self._send_plot(writer, job, parts[3])
+            else:
+                raise RequestError(404, f"Unknown path {path}")
+        elif parts[:1] in (["health"], ["experiments"], ["jobs"]):
+            raise RequestError(405, f"{method} is not allowed on {path}")
+        else:
+            raise RequestError(404, f"Unknown path {path}")
+
+    async def _stream_events(self, writer, job):
+        """One JSON line per change of the job, until it is done or failed"""
+        writer.write(self._head(200, "application/x-ndjson"))
+        while True:
+            changed = self.changed.get(job['id'])
+            writer.write(json.dumps(without_result(job)).encode("utf-8") + b"\n")
+            await writer.drain()
+            if job['status'] in ("done", "failed") or changed is None:
+                return
+            await changed.wait()
+
+    async def _send_plot(self, writer, job, name):
+        # Only files the job listed, so paths cannot leave its folder
+        listed = [url.rsplit("/", 1)[-1] for url in (job.get('result') or {}).get('plots', [])]
+        if name not in listed:
+            raise RequestError(404, f"Job {job['id']} has no plot '{name}'")
+        with open(os.path.join(self._job_folder(job['id']), "plots", name), "rb") as file:
+            data = file.read()
+        writer.write(self._head(200, "image/png", len(data)) + data)
+        await writer.drain()
+
+    def _head(self, status, content_type, length=None):
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}", f"Content-Type: {content_type}", "Connection: close"]
+        if length is not None:
+            lines.append(f"Content-Length: {length}")
+        if status in (429, 503):
+            lines.append("Retry-After: 1")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _respond(self, writer, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        writer.write(self._head(status, "application/json", len(data)) + data)
+        with contextlib.suppress(ConnectionError):
+            await writer.drain()
+
+
+def without_result(job):
+    return {key: value for key, value in job.items() if key != 'result'}
+
+
+async def run_service(**options):
+    """Start a SimulationService and serve until cancelled (Ctrl+C)"""
+    service = await SimulationService(**options).start()
+    print(f"🎯 Simulation service on http://{service.host}:{service.port} "
+          f"({service.workers} {'warm ' if service.warm else ''}worker processes, cache in {service.cache_dir})",
+          flush=True)
+    serving = asyncio.ensure_future(service.serve_forever())
+    # SIGTERM stops the service like Ctrl+C, shutting the process pool down cleanly
+    with contextlib.suppress(NotImplementedError):
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, serving.cancel)
+    with contextlib.suppress(asyncio.CancelledError):
+        await serving
@@ -0,0 +1,174 @@
+import time
+
+import numpy as np
+
+from components.roulette_wheel import RouletteWheel
+from components.spin_log import SpinLogWriter
+
+# Import casino spin logs written as CSV or plain text.
+# Files are read in large byte chunks (cut at the last line break) and each
+# chunk is tokenized with NumPy instead of line by line in Python:
+#   - plain text: every run of digits is one spin ("17 0 00\n5,36,...")
+#   - CSV:        only field `column` of each line is a spin (0-based)
+# A token maps to a pocket index of the wheel by its digits *and* its length,
+# so '0', '00' and '000' stay distinct, just as RouletteWheel._initialize_numbers
+# keeps them distinct. Tokens the wheel does not have are errors (with line number).
+
+# Bytes read per chunk
+IMPORT_CHUNK = 2 ** 26
+
+# Byte codes after translation: digits become 0-9, the rest one of these
+OTHER, SEPARATOR, NEWLINE, DELIMITER = 10, 11, 12, 13
+CODES = 14
+
+# Longest valid token ('000' or a two-digit number both fit)
+MAX_TOKEN_LENGTH = 3
+
+
+def byte_codes(column=None, delimiter=b","):
+    """bytes.translate table: digit value for digits, otherwise OTHER / SEPARATOR / NEWLINE / DELIMITER"""
+    codes = bytearray([OTHER] * 256)
+    for value, digit in enumerate(b"0123456789"):
+        codes[digit] = value
+    # Whitespace and quotes never belong to a token
+    for byte in b' \t\r"\'\n':
+        codes[byte] = SEPARATOR
+    if column is None:
+        # Plain text: commas and semicolons also separate spins
+        for byte in b",;":
+            codes[byte] = SEPARATOR
+    else:
+        codes[ord("\n")] = NEWLINE
+        codes[ord(delimiter)] = DELIMITER
+    return bytes(codes)
+
+
+def token_lookup(wheel_type):
+    """
+    Pocket index of a token from its length and first three byte codes
+    (flattened (length, c0, c1, c2) table, -1 when the token is not a pocket).
+    Codes past the end of a token can be anything, so every value is filled in.
+    """
+    lookup = np.full((MAX_TOKEN_LENGTH + 2, CODES, CODES, CODES), -1, dtype=np.int16)
+    for index, number in enumerate(RouletteWheel(wheel_type, seed=0).numbers):
+        digits = [int(d) for d in str(number)]
+        lookup[(len(digits), *digits)] = index
+    return lookup.ravel()
+
+
+def parse_spin_tokens(data, lookup, codes, column=None):
+    """
+    Pocket indices of every spin in `data` (bytes made of whole lines).
+    Returns (indices, first_bad) where first_bad is None or (byte offset, token)
+    of the first token that is not a pocket of the wheel.
+    """
+    # Three padding bytes so the first three codes of every token can be read
+    translated = np.frombuffer(data.translate(codes) + bytes([SEPARATOR] * 3), dtype=np.uint8)
+    in_token = translated[:len(data)] <= OTHER
+    if column is not None:
+        # CSV: the field number of a byte is the delimiters seen since its line started
+        delimiters_seen = np.cumsum(translated[:len(data)] == DELIMITER, dtype=np.int32)
+        newline = translated[:len(data)] == NEWLINE
+        line_start = np.concatenate([[0], delimiters_seen[newline]]).astype(np.int32)
+        in_token &= delimiters_seen - line_start[np.cumsum(newline, dtype=np.int32) - newline] == column
+
+    # Step 1: Token boundaries (+1 where a token starts, -1 just after it ends)
+    edges = np.diff(in_token.view(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    if starts.size == 0:
+        return np.zeros(0, dtype=np.uint8), None
+    lengths = np.minimum(np.flatnonzero(edges == -1) - starts, MAX_TOKEN_LENGTH + 1)
+
+    # Step 2: One table lookup on (length, first three codes)
+    key = lengths.astype(np.int32) * CODES
+    for offset in range(3):
+        key += translated.take(starts + offset)
+        if offset < 2:
+            key *= CODES
+    indices = lookup.take(key)
+
+    bad = np.flatnonzero(indices < 0)
+    if bad.size:
+        offset = int(starts[bad[0]])
+        end = offset + 1
+        while end < len(data) and in_token[end]:
+            end += 1
+        return indices[:bad[0]].astype(np.uint8), (offset, data[offset:end].decode("latin-1"))
+    return indices.astype(np.uint8), None
+
+
+def iter_spin_chunks(path, wheel_type, column=None, delimiter=",", skip_rows=0, chunk_bytes=IMPORT_CHUNK):
+    """
+    Yield arrays of pocket indices from a CSV/text spin log, one per chunk.
+    Memory use is bounded by chunk_bytes whatever the file size: chunks are
+    cut at line breaks (plain text: at any separator), and a CSV line or text
+    token longer than chunk_bytes raises ValueError.
+    Raises ValueError at the first token the wheel does not have.
+    """
+    lookup = token_lookup(wheel_type)
+    codes = byte_codes(column, delimiter.encode("ascii"))
+    with open(path, "rb") as file:
+        for _ in range(skip_rows):
+            file.readline()
+        line = skip_rows + 1
+        pending = b""
+        while True:
+            block = file.read(chunk_bytes)
+            data = pending + block
+            if not block:
+                pending = b""
+            else:
+                # Keep the unfinished last line for the next chunk
+                cut = data.rfind(b"\n") + 1
+                if cut == 0 and column is None:
+                    # Plain text on one line ("17,0,5,..."): cut after the last separator instead
+                    cut = data.translate(codes).rfind(bytes([SEPARATOR])) + 1
+                if cut == 0:
+                    if len(data) > chunk_bytes:
+                        unit = "token" if column is None else "line"
+                        raise ValueError(f"{path}, line {line}: a {unit} is longer than chunk_bytes ({chunk_bytes})")
+                    pending = data
+                    continue
+                data, pending = data[:cut], data[cut:]
+
+            indices, bad = parse_spin_tokens(data, lookup, codes, column)
+            if bad is not None:
+                offset, token = bad
+                bad_line = line + data.count(b"\n", 0, offset)
+                raise ValueError(f"{path}, line {bad_line}: '{token}' is not a pocket of the {wheel_type} wheel")
+            line += data.count(b"\n")
+            if indices.size:
+                yield indices
+            if not block:
+                return
+
+
+def import_spin_log(source, destination, wheel_type, column=None, delimiter=",", skip_rows=0,
+                    chunk_bytes=IMPORT_CHUNK):
+    """
+    Convert a CSV/text spin log into the binary replay format (components.spin_log).
+    Returns a summary dict: spins, bytes read, seconds, throughput and pocket counts.
+    """
+    start = time.perf_counter()
+    counts = np.zeros(RouletteWheel(wheel_type, seed=0).get_total_pockets(), dtype=np.int64)
+    bytes_read = 0
+    with SpinLogWriter(destination, wheel_type) as log:
+        for indices in iter_spin_chunks(source, wheel_type, column, delimiter, skip_rows, chunk_bytes):
+            log.write(indices)
+            counts += np.bincount(indices, minlength=len(counts))
+        num_spins = log.num_spins
+    with open(source, "rb") as file:
+        bytes_read = file.seek(0, 2)
+    seconds = time.perf_counter() - start
+
+    return {
+        'source': source,
+        'destination': destination,
+        'wheel_type': wheel_type,
+        'spins': num_spins,
+        'bytes': bytes_read,
+        'seconds': seconds,
+        'spins_per_second': num_spins / seconds if seconds > 0 else float('inf'),
+        'mb_per_second': bytes_read / 2 ** 20 / seconds if seconds > 0 else float('inf'),
+        'pocket_counts': counts,
+    }
@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 import numpy as np
 import os
 
@@ -31,6 +30,8 @@ def create_enhanced_strategy_plot(flat_history, martingale_history, martingale_b
     """
     Create an enhanced dual-panel plot showing both bankroll and betting patterns
     """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
     colors = STRATEGY_COLORS[wheel_type]
     
     # Create figure with two subplots
@@ -74,6 +75,8 @@ def create_strategy_plot(flat_history, martingale_history, num_spins, wheel_type
     """
     Original single-panel plot (keep for compatibility)
     """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
     colors = STRATEGY_COLORS[wheel_type]
     
     plt.figure(figsize=(12, 8))
@@ -127,10 +130,149 @@ def analyze_martingale_risk(game_martingale):
     return max_bet, bet_counts, martingale_bets
 
 
+def count_values(values):
+    """{value: occurrences} of a NumPy array (keys as plain Python numbers)"""
+    levels, counts = np.unique(values, return_counts=True)
+    return dict(zip(levels.tolist(), counts.tolist()))
+
+
+def analyze_martingale_population(bet_matrix, chunk_size=10000):
+    """
+    Population version of analyze_martingale_risk for a (players, spins) bet matrix.
+
+    The bets of each player are run-length encoded into doubling sequences
+    (a new sequence starts whenever the bet does not go up), exactly like
+    analyze_martingale_risk, but for every player at once. Players are
+    processed in chunks of `chunk_size` rows to bound the temporary memory.
+
+    Returns a dict with:
+      - sequence_lengths: {bets in one doubling sequence: number of sequences}
+      - longest_sequence: longest doubling sequence of each player (array)
+      - max_bets: maximum bet of each player (array)
+      - max_bet_distribution: {maximum bet: number of players}
+      - bet_counts: {bet level: sequences reaching it}, summed over players
+    """
+    bets = np.asarray(bet_matrix)
+    if bets.ndim != 2 or bets.shape[1] == 0:
+        raise ValueError("bet_matrix must be a (players, spins) matrix with at least one spin")
+
+    analyses = []
+    for start in range(0, len(bets), chunk_size):
+        chunk = bets[start:start + chunk_size]
+        num_players, num_spins = chunk.shape
+
+        # Step 1: Mark where a doubling sequence starts (first spin, or bet did not increase)
+        starts = np.ones(chunk.shape, dtype=bool)
+        starts[:, 1:] = chunk[:, 1:] <= chunk[:, :-1]
+
+        # Step 2: Run lengths from the start positions (row starts always split runs)
+        positions = np.flatnonzero(starts)
+        lengths = np.diff(np.append(positions, chunk.size))
+        longest = np.zeros(num_players, dtype=np.int64)
+        np.maximum.at(longest, positions // num_spins, lengths)
+
+        # Step 3: Bets inside one sequence strictly increase, so every bet is a
+        # unique level of its sequence: counting bets = counting sequences per level
+        analyses.append({
+            'num_spins': num_spins,
+            'sequence_lengths': count_values(lengths),
+            'longest_sequence': longest,
+            'max_bets': chunk.max(axis=1),
+            'bet_counts': count_values(chunk),
+        })
+
+    return combine_population_risk(analyses)
+
+
+def combine_population_risk(analyses):
+    """Merge analyses of disjoint groups of players (e.g. simulated in chunks)"""
+    sequence_lengths, bet_counts = {}, {}
+    for analysis in analyses:
+        for length, count in analysis['sequence_lengths'].items():
+            sequence_lengths[length] = sequence_lengths.get(length, 0) + count
+        for bet, count in analysis['bet_counts'].items():
+            bet_counts[bet] = bet_counts.get(bet, 0) + count
+
+    max_bets = np.concatenate([analysis['max_bets'] for analysis in analyses])
+    return {
+        'num_players': len(max_bets),
+        'num_spins': analyses[0]['num_spins'],
+        'sequence_lengths': dict(sorted(sequence_lengths.items())),
+        'longest_sequence': np.concatenate([analysis['longest_sequence'] for analysis in analyses]),
+        'max_bets': max_bets,
+        'max_bet_distribution': count_values(max_bets),
+        'bet_counts': dict(sorted(bet_counts.items())),
+    }
+
+
+def print_population_risk(analysis, table_limit=None):
+    """Print the population risk summary from analyze_martingale_population"""
+    num_players = analysis['num_players']
+    total_sequences = sum(analysis['sequence_lengths'].values())
+
+    print(f"Players: {num_players:,} | Spins: {analysis['num_spins']:,} | Doubling sequences: {total_sequences:,}")
+    print(f"  • Median max bet: ${np.median(analysis['max_bets']):,.0f}")
+    print(f"  • Largest max bet: ${max(analysis['max_bet_distribution']):,}")
+    print(f"  • Longest sequence: {analysis['longest_sequence'].max()} bets "
+          f"(median per player: {np.median(analysis['longest_sequence']):.0f})")
+    if table_limit is not None and table_limit != float('inf'):
+        capped = int(np.sum(analysis['max_bets'] >= table_limit))
+        print(f"  • Players who hit the ${table_limit:,} table limit: {capped:,} ({capped / num_players * 100:.1f}%)")
+
+    print(f"\n{'MAX BET':>12} | {'PLAYERS':>10} | {'SHARE':>7}")
+    print("-" * 36)
+    for bet, players in analysis['max_bet_distribution'].items():
+        print(f"${bet:>11,} | {players:>10,} | {players / num_players * 100:>6.2f}%")
+
+
+def create_population_risk_plot(analysis, wheel_type, strategy_label="Martingale"):
+    """
+    Dual-panel plot of a population analysis: distribution of doubling
+    sequence lengths (top) and bet levels reached (bottom)
+    """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
+    colors = STRATEGY_COLORS[wheel_type]
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
+
+    # TOP PANEL: How long the doubling sequences get
+    lengths = list(analysis['sequence_lengths'])
+    ax1.bar(lengths, list(analysis['sequence_lengths'].values()), color=colors["martingale"], alpha=0.7,
+            edgecolor='black', label='Doubling sequences')
+    ax1.set_xlabel('Bets in One Doubling Sequence')
+    ax1.set_ylabel('Number of Sequences')
+    ax1.set_yscale('log')  # Long sequences are exponentially rare
+    ax1.set_title(f'{strategy_label} Risk Across the Population: {wheel_type.upper()} Roulette\n'
+                  f'({analysis["num_players"]:,} Players, {analysis["num_spins"]:,} Spins)')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+
+    # BOTTOM PANEL: Sequences reaching each bet level vs players whose max bet it was
+    levels = list(analysis['bet_counts'])
+    positions = np.arange(len(levels))
+    width = 0.4
+    ax2.bar(positions - width/2, list(analysis['bet_counts'].values()), width, color=colors["martingale_bets"],
+            alpha=0.7, label='Sequences reaching the level')
+    ax2.bar(positions + width/2, [analysis['max_bet_distribution'].get(level, 0) for level in levels], width,
+            color=colors["flat"], alpha=0.7, label='Players whose maximum bet it was')
+    ax2.set_xticks(positions)
+    ax2.set_xticklabels([f'${level:,}' for level in levels], rotation=45, ha='right')
+    ax2.set_xlabel('Bet Level ($)')
+    ax2.set_ylabel('Count')
+    ax2.set_yscale('log')
+    ax2.set_title('Bet Levels Reached')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    return fig
+
 def create_strategy_comparison_bar_plot(all_results):
     """
     Creates a bar chart comparing Flat vs Martingale across all 3 wheels.
     """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
     wheel_types = list(all_results.keys()) # ['european', 'american', 'triple']
     
     # Extract data
@@ -170,4 +312,75 @@ def create_strategy_comparison_bar_plot(all_results):
     autolabel(rects2)
     
     plt.tight_layout()
-    return fig
\ No newline at end of file
+    return fig
+
+def create_pareto_front_plot(results, table_limit):
+    """
+    Expected loss vs ruin risk of every optimizer candidate, per wheel, with
+    the Pareto front of the final survivors joined by a line.
+    results: {wheel_type: successive_halving(...)}
+    """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
+    fig, ax = plt.subplots(figsize=(12, 8))
+    for wheel_type, result in results.items():
+        colors = STRATEGY_COLORS[wheel_type]
+        # Candidates dropped early are shown faintly (measured on fewer players)
+        ax.scatter([row['expected_loss'] for row in result['candidates']],
+                   [row['p_ruin'] for row in result['candidates']],
+                   color=colors["flat"], alpha=0.25, s=25)
+        front = result['front']
+        ax.plot([row['expected_loss'] for row in front], [row['p_ruin'] for row in front],
+                color=colors["martingale"], marker='o', linewidth=2,
+                label=f'{wheel_type.upper()} Pareto front ({len(front)} settings)')
+
+    ax.set_xlabel('Expected Loss per Session ($)')
+    ax.set_ylabel('Ruin Risk (bankroll reaches $0)')
+    ax.set_title(f'Strategy Optimizer: Loss vs Ruin Risk (table limit ${table_limit:,})')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    return fig
+
+
+def create_segment_plot(statistics_by_wheel):
+    """
+    Player segments side by side: mean result as a share of the starting
+    bankroll per wheel, and why players left the table (first wheel).
+    statistics_by_wheel: {wheel_type: segment_statistics(...)}
+    """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
+    fig, (ax_net, ax_quit) = plt.subplots(1, 2, figsize=(16, 7))
+    segments = list(next(iter(statistics_by_wheel.values())))
+    positions = np.arange(len(segments))
+    width = 0.8 / len(statistics_by_wheel)
+
+    for i, (wheel_type, statistics) in enumerate(statistics_by_wheel.items()):
+        returns = [statistics[name]['mean_net'] / statistics[name]['mean_initial'] * 100 for name in segments]
+        ax_net.bar(positions + i * width, returns, width, color=STRATEGY_COLORS[wheel_type]["flat"],
+                   label=wheel_type.title())
+    ax_net.axhline(0, color='black', linewidth=1)
+    ax_net.set_xticks(positions + width * (len(statistics_by_wheel) - 1) / 2)
+    ax_net.set_xticklabels(segments)
+    ax_net.set_ylabel('Mean Result (% of starting bankroll)')
+    ax_net.set_title('Result per Player Segment')
+    ax_net.legend()
+    ax_net.grid(True, axis='y', alpha=0.3)
+
+    wheel_type, statistics = next(iter(statistics_by_wheel.items()))
+    reasons = list(statistics[segments[0]]['quit_shares'])
+    bottom = np.zeros(len(segments))
+    for reason in reasons:
+        shares = np.array([statistics[name]['quit_shares'][reason] * 100 for name in segments])
+        ax_quit.bar(positions, shares, 0.6, bottom=bottom, label=reason)
+        bottom += shares
+    ax_quit.set_xticks(positions)
+    ax_quit.set_xticklabels(segments)
+    ax_quit.set_ylabel('Players (%)')
+    ax_quit.set_title(f'Why Players Left the Table ({wheel_type.title()})')
+    ax_quit.legend()
+
+    plt.tight_layout()
+    return fig
@@ -0,0 +1,248 @@
+import math
+
+import numpy as np
+
+from components.simulation import make_spec, spec_key
+from components.batch_engine import pocket_matrix, simulate_batch
+
+# Search Player/Game settings for the best risk / loss trade-off.
+# A candidate is a dict of spec overrides (base_bet, strategy, table_limit...)
+# plus two session rules the player follows on top of the Game:
+#   stop_loss -> walk away once the loss reaches this amount (None = never)
+#   win_goal  -> walk away once the profit reaches this amount (None = never)
+# Both are applied to the simulated bankroll paths: a player who walks away
+# places no further bets, so the stopped path is exactly the path up to then.
+#
+# Candidates are evaluated on blocks of players. Block b always uses the same
+# seeds, so every candidate sees the same spins (common random numbers) and
+# comparisons are not blurred by luck. Successive halving evaluates all
+# candidates on a small budget, keeps the best 1/eta (by Pareto layer) and
+# gives the survivors eta times more players, until the budget is spent.
+# Evaluated (candidate, block) pairs are cached, so repeated or overlapping
+# searches only simulate new points.
+
+# Summary sums kept per (candidate, block)
+SUM_FIELDS = ("players", "final", "final_sq", "ruined", "profit", "spins")
+
+# (candidate spec key, stop_loss, win_goal, ruin_level, block, block_players, seed) -> sums
+EVALUATION_CACHE = {}
+
+# Session rules that are not spec parameters
+SESSION_RULES = ("stop_loss", "win_goal")
+
+
+def split_candidate(candidate):
+    """(spec overrides, stop_loss, win_goal) of a candidate dict"""
+    overrides = {key: value for key, value in candidate.items() if key not in SESSION_RULES}
+    return overrides, candidate.get('stop_loss'), candidate.get('win_goal')
+
+
+def candidate_spec(candidate, base, num_players=1):
+    """Simulation spec of a candidate on top of the base settings"""
+    overrides = dict(base, **split_candidate(candidate)[0])
+    overrides.update(num_players=num_players, seed=None)
+    return make_spec(**overrides)
+
+
+def block_seeds(seed, block, block_players):
+    """Player seeds of one block; the same for every candidate (common random numbers)"""
+    return np.random.SeedSequence(seed, spawn_key=(block,)).spawn(block_players)
+
+
+def apply_session_rules(paths, initial_bankroll, stop_loss=None, win_goal=None, ruin_level=0):
+    """
+    Final bankroll, ruin flag and spins played of every player who walks away
+    at the stop-loss or win goal. paths: (players, spins + 1) bankrolls.
+    """
+    paths = np.asarray(paths)
+    num_players, width = paths.shape
+    num_spins = width - 1
+
+    # Step 1: First spin at which a session rule ends the session
+    stop = np.zeros(paths.shape, dtype=bool)
+    if stop_loss is not None:
+        stop |= paths <= initial_bankroll - stop_loss
+    if win_goal is not None:
+        stop |= paths >= initial_bankroll + win_goal
+    stop[:, 0] = False
+    played = np.where(stop.any(axis=1), stop.argmax(axis=1), num_spins)
+
+    # Step 2: Bankroll at that spin and the lowest bankroll before it
+    rows = np.arange(num_players)
+    final = paths[rows, played]
+    lowest = np.minimum.accumulate(paths, axis=1)[rows, played]
+    return final, lowest <= ruin_level, played
+
+
+def _evaluate_task(task):
+    """Worker: evaluate several candidates on one block of players (pockets drawn once)"""
+    candidates, base, block, block_players, seed, ruin_level, engine = task
+    simulate = simulate_batch
+    if engine == "numba":
+        from components.jit_engine import simulate_jit as simulate
+    first = candidate_spec(candidates[0], base)
+    pockets = pocket_matrix(first['wheel_type'], block_seeds(seed, block, block_players), first['num_spins'],
+                            first.get('wheel_weights'))
+
+    sums = []
+    for candidate in candidates:
+        _, stop_loss, win_goal = split_candidate(candidate)
+        spec = candidate_spec(candidate, base, block_players)
+        paths = simulate(spec, pockets, ("paths",))['paths']
+        final, ruined, played = apply_session_rules(paths, spec['initial_bankroll'], stop_loss, win_goal,
+                                                    ruin_level)
+        final = np.asarray(final, dtype=float)
+        sums.append((block_players, final.sum(), (final ** 2).sum(), int(ruined.sum()),
+                     int(np.sum(final > spec['initial_bankroll'])), int(played.sum())))
+    return sums
+
+
+def cache_key(candidate, base, block, block_players, seed, ruin_level):
+    _, stop_loss, win_goal = split_candidate(candidate)
+    spec = candidate_spec(candidate, base, block_players)
+    return (spec_key(spec), stop_loss, win_goal, ruin_level, block, block_players, seed)
+
+
+def evaluate_candidates(candidates, base, blocks, block_players, seed, ruin_level=0, workers=1, engine="numpy",
+                        pool=None):
+    """
+    Sums of SUM_FIELDS for every candidate over the given player blocks.
+    Cached pairs are reused; the rest run in parallel tasks that share one
+    pocket draw per (wheel, block). Pass an open executor as `pool` to reuse
+    its worker processes between calls.
+    """
+    # Step 1: Work out which (candidate, block) pairs are new
+    todo = {}
+    for index, candidate in enumerate(candidates):
+        for block in blocks:
+            key = cache_key(candidate, base, block, block_players, seed, ruin_level)
+            if key not in EVALUATION_CACHE:
+                spec = candidate_spec(candidate, base)
+                stream = (spec['wheel_type'], spec['wheel_weights'], spec['num_spins'], block)
+                todo.setdefault(stream, {})[key] = candidate
+
+    # Step 2: Split each stream into tasks so every worker gets work
+    tasks = []
+    for (_, _, _, block), pending in todo.items():
+        keys = list(pending)
+        size = max(1, math.ceil(len(keys) / max(1, workers)))
+        for start in range(0, len(keys), size):
+            chunk = keys[start:start + size]
+            tasks.append((chunk, ([pending[key] for key in chunk], base, block, block_players, seed,
+                                  ruin_level, engine)))
+
+    jobs = [job for _, job in tasks]
+    if pool is not None:
+        task_results = list(pool.map(_evaluate_task, jobs))
+    elif workers <= 1:
+        task_results = list(map(_evaluate_task, jobs))
+    else:
+        from components.process_pool import process_pool
+        with process_pool(workers) as executor:
+            task_results = list(executor.map(_evaluate_task, jobs))
+    for (keys, _), sums in zip(tasks, task_results):
+        EVALUATION_CACHE.update(zip(keys, sums))
+
+    # Step 3: Add up the blocks of every candidate
+    totals = []
+    for candidate in candidates:
+        rows = [EVALUATION_CACHE[cache_key(candidate, base, block, block_players, seed, ruin_level)]
+                for block in blocks]
+        totals.append(np.sum(rows, axis=0))
+    return totals
+
+
+def candidate_metrics(sums, initial_bankroll):
+    """Expected loss, ruin risk and their standard errors from the SUM_FIELDS sums"""
+    players, final, final_sq, ruined, profit, spins = sums
+    mean = final / players
+    variance = max(0.0, final_sq / players - mean ** 2)
+    p_ruin = ruined / players
+    return {
+        'players': int(players),
+        'expected_loss': float(initial_bankroll - mean),
+        'loss_std_error': float(math.sqrt(variance / players)),
+        'p_ruin': float(p_ruin),
+        'ruin_std_error': float(math.sqrt(p_ruin * (1 - p_ruin) / players)),
+        'p_survival': float(1 - p_ruin),
+        'p_profit': float(profit / players),
+        'mean_spins': float(spins / players),
+    }
+
+
+def pareto_layers(points):
+    """Non-dominated sorting (both objectives minimized): layer 0 is the Pareto front"""
+    points = np.asarray(points, dtype=float)
+    layers = np.full(len(points), -1)
+    layer = 0
+    while np.any(layers < 0):
+        remaining = np.flatnonzero(layers < 0)
+        for i in remaining:
+            others = points[remaining]
+            dominated = np.any(np.all(others <= points[i], axis=1) & np.any(others < points[i], axis=1))
+            if not dominated:
+                layers[i] = layer
+        layer += 1
+    return layers
+
+
+def successive_halving(candidates, base=None, block_players=200, eta=3, max_players=5400, seed=2024,
+                       ruin_level=0, workers=1, engine="numpy", verbose=True):
+    """
+    Race the candidates: every round evaluates the survivors on more player
+    blocks (the same blocks for all, common random numbers), then keeps the
+    best 1/eta by Pareto layer of (expected loss, ruin risk), ties broken by
+    ruin risk. The current Pareto front always survives, so the last round
+    ends with a front measured on the full budget.
+    Returns a dict with 'candidates' (every candidate with the metrics of its
+    last round), 'survivors' and 'front' (Pareto-optimal final survivors).
+    """
+    base = dict(base or {})
+    if block_players < 1 or eta < 2:
+        raise ValueError("Need block_players >= 1 and eta >= 2")
+    initial_bankroll = make_spec(**base)['initial_bankroll']
+    if any(candidate_spec(c, base)['initial_bankroll'] != initial_bankroll for c in candidates):
+        raise ValueError("All candidates must start with the base initial_bankroll")
+    rows = [dict(candidate) for candidate in candidates]
+    alive = list(range(len(candidates)))
+    num_blocks = 1
+    round_number = 0
+
+    pool = None
+    if workers > 1:
+        # One pool for every round, so workers (and compiled kernels) are reused
+        from components.process_pool import process_pool
+        pool = process_pool(workers)
+    try:
+        while True:
+            # --- Evaluate the survivors on the current budget ---
+            sums = evaluate_candidates([candidates[i] for i in alive], base, range(num_blocks), block_players,
+                                       seed, ruin_level, workers, engine, pool)
+            points = []
+            for i, total in zip(alive, sums):
+                rows[i].update(candidate_metrics(total, initial_bankroll), round=round_number)
+                points.append((rows[i]['expected_loss'], rows[i]['p_ruin']))
+            layers = pareto_layers(points)
+            if verbose:
+                print(f"  Round {round_number}: {len(alive)} candidates x {num_blocks * block_players:,} players")
+
+            # --- Stop when the budget is spent; otherwise keep the best 1/eta ---
+            next_blocks = num_blocks * eta
+            if len(alive) <= 1 or next_blocks * block_players > max_players:
+                break
+            keep = max(int(np.sum(layers == 0)), len(alive) // eta, 1)
+            order = sorted(range(len(alive)), key=lambda j: (layers[j], points[j][1], points[j][0]))
+            alive = [alive[j] for j in order[:keep]]
+            num_blocks = next_blocks
+            round_number += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    front = [rows[alive[j]] for j in np.flatnonzero(layers == 0)]
+    return {
+        'candidates': rows,
+        'survivors': [rows[i] for i in alive],
+        'front': sorted(front, key=lambda row: row['p_ruin']),
+        'rounds': round_number + 1,
+    }
@@ -0,0 +1,97 @@
+import numpy as np
+
+# Readable labels for the metrics of utils/parameter_sweep.py
+METRIC_LABELS = {
+    "mean_final": "Average Final Bankroll ($)",
+    "std_final": "Std Dev of Final Bankroll ($)",
+    "mean_loss": "Average Loss ($)",
+    "p_profit": "Probability of Profit",
+    "p_ruin": "Probability of Ruin",
+    "p_bankrupt": "Probability of Ending Bankrupt",
+}
+
+
+def _facet_groups(rows, facet):
+    """Split rows by the facet column (a single group if no facet)"""
+    if facet is None:
+        return {None: rows}
+    groups = {}
+    for row in rows:
+        groups.setdefault(row[facet], []).append(row)
+    return groups
+
+
+def _axis_label(value):
+    return "No limit" if value == float('inf') else f"{value:g}" if isinstance(value, float) else str(value)
+
+
+def create_sweep_heatmap(rows, x, y, metric="p_ruin", facet=None):
+    """
+    Heatmap of a metric over two swept parameters (one panel per facet value).
+    Cells that differ only in other parameters are averaged.
+    """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
+    groups = _facet_groups(rows, facet)
+    fig, axes = plt.subplots(1, len(groups), figsize=(6 * len(groups), 5.5), squeeze=False)
+
+    for ax, (facet_value, facet_rows) in zip(axes[0], groups.items()):
+        x_values = sorted({row[x] for row in facet_rows})
+        y_values = sorted({row[y] for row in facet_rows})
+
+        # Average the metric over any parameters not shown on the axes
+        totals = np.zeros((len(y_values), len(x_values)))
+        counts = np.zeros((len(y_values), len(x_values)))
+        for row in facet_rows:
+            i, j = y_values.index(row[y]), x_values.index(row[x])
+            totals[i, j] += row[metric]
+            counts[i, j] += 1
+        grid = np.divide(totals, counts, out=np.full_like(totals, np.nan), where=counts > 0)
+
+        image = ax.imshow(grid, origin='lower', aspect='auto', cmap='viridis')
+        for i in range(len(y_values)):
+            for j in range(len(x_values)):
+                if counts[i, j]:
+                    ax.text(j, i, f"{grid[i, j]:.2f}", ha='center', va='center', color='white', fontsize=8)
+
+        ax.set_xticks(range(len(x_values)))
+        ax.set_xticklabels([_axis_label(v) for v in x_values])
+        ax.set_yticks(range(len(y_values)))
+        ax.set_yticklabels([_axis_label(v) for v in y_values])
+        ax.set_xlabel(x.replace('_', ' ').title())
+        ax.set_ylabel(y.replace('_', ' ').title())
+        ax.set_title(str(facet_value).title() if facet else METRIC_LABELS.get(metric, metric))
+        fig.colorbar(image, ax=ax, label=METRIC_LABELS.get(metric, metric))
+
+    fig.suptitle(f'Parameter Sweep: {METRIC_LABELS.get(metric, metric)}')
+    plt.tight_layout()
+    return fig
+
+
+def create_sweep_contour(rows, x, y, metric="p_ruin", facet=None):
+    """
+    Filled contour of a metric over two numeric parameters.
+    Works for grid and Latin hypercube sweeps (scattered points are triangulated).
+    """
+    import matplotlib.pyplot as plt  # loaded only when a plot is made
+
+    groups = _facet_groups(rows, facet)
+    fig, axes = plt.subplots(1, len(groups), figsize=(6 * len(groups), 5.5), squeeze=False)
+
+    for ax, (facet_value, facet_rows) in zip(axes[0], groups.items()):
+        xs = np.array([row[x] for row in facet_rows], dtype=float)
+        ys = np.array([row[y] for row in facet_rows], dtype=float)
+        zs = np.array([row[metric] for row in facet_rows], dtype=float)
+
+        contour = ax.tricontourf(xs, ys, zs, levels=12, cmap='viridis')
+        ax.scatter(xs, ys, color='black', s=8, alpha=0.5, label='Simulated cells')
+
+        ax.set_xlabel(x.replace('_', ' ').title())
+        ax.set_ylabel(y.replace('_', ' ').title())
+        ax.set_title(str(facet_value).title() if facet else METRIC_LABELS.get(metric, metric))
+        ax.legend(loc='upper right')
+        fig.colorbar(contour, ax=ax, label=METRIC_LABELS.get(metric, metric))
+
+    fig.suptitle(f'Parameter Sweep: {METRIC_LABELS.get(metric, metric)}')
+    plt.tight_layout()
+    return fig